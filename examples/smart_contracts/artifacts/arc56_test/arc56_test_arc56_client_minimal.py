@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +65,108 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_FOO_METHOD = _AbiMethod("foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)", bytes.fromhex("396d550e"))
+_CREATE_APPLICATION_METHOD = _AbiMethod("createApplication()void", bytes.fromhex("b8447b36"))
+_OPT_IN_TO_APPLICATION_METHOD = _AbiMethod("optInToApplication()void", bytes.fromhex("01a3a3ff"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _FOO_METHOD.signature: _FOO_METHOD,
+    _CREATE_APPLICATION_METHOD.signature: _CREATE_APPLICATION_METHOD,
+    _OPT_IN_TO_APPLICATION_METHOD.signature: _OPT_IN_TO_APPLICATION_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class InputsAdd:
     """Struct for InputsAdd"""
@@ -115,10 +218,14 @@ class _Arc56TestOptIn:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OPT_IN_TO_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
 
 class Arc56TestParams:
@@ -136,11 +243,14 @@ class Arc56TestParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _FOO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -163,10 +273,15 @@ class _Arc56TestOptInTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_TO_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
 
 class Arc56TestCreateTransactionParams:
@@ -184,11 +299,15 @@ class Arc56TestCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _FOO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -212,10 +331,15 @@ class _Arc56TestOptInSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "optInToApplication()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_TO_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _OPT_IN_TO_APPLICATION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -236,12 +360,16 @@ class Arc56TestSend:
     ) -> algokit_utils.SendAppTransactionResult[Outputs]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Outputs, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _FOO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _FOO_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Outputs, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[Outputs], parsed_response)
 
     def clear_state(
@@ -332,7 +460,7 @@ class _GlobalState:
         return _MapState(
             self.app_client.state.global_state,
             "globalMap",
-            self._struct_classes.get("{ foo: uint16; bar: uint16 }")
+            self._struct_classes.get("{ foo: uint16; bar: uint16 }"),
         )
 
 class _LocalState:
@@ -372,7 +500,7 @@ class _LocalState:
         return _MapState(
             self.app_client.state.local_state(self.address),
             "localMap",
-            None
+            None,
         )
 
 class _BoxState:
@@ -414,7 +542,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "boxMap",
-            self._struct_classes.get("Outputs")
+            self._struct_classes.get("Outputs"),
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -629,7 +757,8 @@ class Arc56TestClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -650,17 +779,16 @@ class _Arc56TestOptInComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "Arc56TestComposer":
-        self.composer._composer.add_app_call_method_call(
-            self.composer.client.params.opt_in.opt_in_to_application(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.opt_in.opt_in_to_application(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.composer.client.decode_return_value(
                 "optInToApplication()void", v
-            )
+            ),
         )
         return self.composer
 
@@ -682,16 +810,15 @@ class Arc56TestComposer:
         args: tuple[Inputs] | FooArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "Arc56TestComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.foo(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.foo(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -702,22 +829,21 @@ class Arc56TestComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "Arc56TestComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "Arc56TestComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -733,7 +859,7 @@ class Arc56TestComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -747,4 +873,13 @@ class Arc56TestComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
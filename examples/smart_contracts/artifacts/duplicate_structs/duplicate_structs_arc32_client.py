@@ -6,7 +6,12 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +69,257 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_METHOD_A_THAT_USES_STRUCT_METHOD = _AbiMethod("method_a_that_uses_struct()(uint64,uint64)", bytes.fromhex("9f72ac0f"))
+_METHOD_B_THAT_USES_SAME_STRUCT_METHOD = _AbiMethod("method_b_that_uses_same_struct()(uint64,uint64)", bytes.fromhex("a8618449"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _METHOD_A_THAT_USES_STRUCT_METHOD.signature: _METHOD_A_THAT_USES_STRUCT_METHOD,
+    _METHOD_B_THAT_USES_SAME_STRUCT_METHOD.signature: _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `DuplicateStructsFactory(..., cache=cache)`
+    and `DuplicateStructsClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
 @dataclasses.dataclass(frozen=True)
 class SomeStruct:
     """Struct for SomeStruct"""
@@ -81,10 +337,14 @@ class DuplicateStructsParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def method_b_that_uses_same_struct(
         self,
@@ -92,10 +352,14 @@ class DuplicateStructsParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -109,8 +373,9 @@ class DuplicateStructsParams:
 
 
 class DuplicateStructsCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def method_a_that_uses_struct(
         self,
@@ -118,10 +383,17 @@ class DuplicateStructsCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def method_b_that_uses_same_struct(
         self,
@@ -129,16 +401,25 @@ class DuplicateStructsCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -146,8 +427,9 @@ class DuplicateStructsCreateTransactionParams:
 
 
 class DuplicateStructsSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def method_a_that_uses_struct(
         self,
@@ -156,11 +438,18 @@ class DuplicateStructsSend:
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _METHOD_A_THAT_USES_STRUCT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def method_b_that_uses_same_struct(
@@ -170,11 +459,18 @@ class DuplicateStructsSend:
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _METHOD_B_THAT_USES_SAME_STRUCT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def clear_state(
@@ -182,12 +478,30 @@ class DuplicateStructsSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
 
 
+class DuplicateStructsPrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def method_a_that_uses_struct(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, SomeStruct]:
+        return PreparedCall(self.app_client, _METHOD_A_THAT_USES_STRUCT_METHOD, params, result_struct=SomeStruct, cache=self.cache)
+
+    def method_b_that_uses_same_struct(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, SomeStruct]:
+        return PreparedCall(self.app_client, _METHOD_B_THAT_USES_SAME_STRUCT_METHOD, params, result_struct=SomeStruct, cache=self.cache)
+
+
 class DuplicateStructsState:
     """Methods to access state for the current DuplicateStructs app"""
 
@@ -198,7 +512,7 @@ class DuplicateStructsClient:
     """Client for interacting with DuplicateStructs smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -211,6 +525,7 @@ class DuplicateStructsClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -224,6 +539,7 @@ class DuplicateStructsClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -243,9 +559,11 @@ class DuplicateStructsClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = DuplicateStructsParams(self.app_client)
-        self.create_transaction = DuplicateStructsCreateTransactionParams(self.app_client)
-        self.send = DuplicateStructsSend(self.app_client)
+        self.create_transaction = DuplicateStructsCreateTransactionParams(self.app_client, cache)
+        self.send = DuplicateStructsSend(self.app_client, cache)
+        self.prepare = DuplicateStructsPrepare(self.app_client, cache)
         self.state = DuplicateStructsState(self.app_client)
 
     @staticmethod
@@ -259,7 +577,10 @@ class DuplicateStructsClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "DuplicateStructsClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return DuplicateStructsClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -272,7 +593,8 @@ class DuplicateStructsClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -283,6 +605,7 @@ class DuplicateStructsClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "DuplicateStructsClient":
         return DuplicateStructsClient(
             algokit_utils.AppClient.from_network(
@@ -293,7 +616,8 @@ class DuplicateStructsClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -331,7 +655,8 @@ class DuplicateStructsClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "DuplicateStructsComposer":
@@ -365,7 +690,8 @@ class DuplicateStructsClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -387,6 +713,37 @@ class DuplicateStructsBareCallCreateParams(algokit_utils.AppClientBareCallCreate
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
         return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
 
+class DuplicateStructsFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `DuplicateStructsFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: DuplicateStructsBareCallCreateParams | None
+    update_params: None
+    delete_params: None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class DuplicateStructsDeployManyError(Exception):
+    """Raised by `DuplicateStructsFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStructsBareCallCreateParams, None, None]):
     """Factory for deploying and managing DuplicateStructsClient smart contracts"""
 
@@ -399,6 +756,7 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -412,8 +770,10 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
             )
         )
         self.params = DuplicateStructsFactoryParams(self.app_factory)
-        self.create_transaction = DuplicateStructsFactoryCreateTransaction(self.app_factory)
-        self.send = DuplicateStructsFactorySend(self.app_factory)
+        self.create_transaction = DuplicateStructsFactoryCreateTransaction(self.app_factory, cache)
+        self.send = DuplicateStructsFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -442,6 +802,11 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -454,8 +819,81 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
+
+        return DuplicateStructsClient(deploy_response[0], cache=self.cache), deploy_response[1]
 
-        return DuplicateStructsClient(deploy_response[0]), deploy_response[1]
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[DuplicateStructsFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `DuplicateStructsDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[DuplicateStructsFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise DuplicateStructsDeployManyError(results)
+        return typing.cast(list[tuple[DuplicateStructsClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -469,6 +907,8 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
         clear_source_map: SourceMap | None = None,
     ) -> DuplicateStructsClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return DuplicateStructsClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -479,7 +919,8 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -500,7 +941,8 @@ class DuplicateStructsFactory(algokit_utils.TypedAppFactoryProtocol[DuplicateStr
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -609,16 +1051,17 @@ class DuplicateStructsFactoryDeleteParams:
 class DuplicateStructsFactoryCreateTransaction:
     """Create transactions for DuplicateStructs contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = DuplicateStructsFactoryCreateTransactionCreate(app_factory)
+        self.create = DuplicateStructsFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class DuplicateStructsFactoryCreateTransactionCreate:
     """Create new instances of DuplicateStructs contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -626,6 +1069,8 @@ class DuplicateStructsFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -634,16 +1079,17 @@ class DuplicateStructsFactoryCreateTransactionCreate:
 class DuplicateStructsFactorySend:
     """Send calls to DuplicateStructs contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = DuplicateStructsFactorySendCreate(app_factory)
+        self.create = DuplicateStructsFactorySendCreate(app_factory, cache)
 
 
 class DuplicateStructsFactorySendCreate:
     """Send create calls to DuplicateStructs contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -654,12 +1100,106 @@ class DuplicateStructsFactorySendCreate:
     ) -> tuple[DuplicateStructsClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return DuplicateStructsClient(result[0]), result[1]
+        return DuplicateStructsClient(result[0], cache=self.cache), result[1]
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
 
 
 class DuplicateStructsComposer:
@@ -667,23 +1207,26 @@ class DuplicateStructsComposer:
 
     def __init__(self, client: "DuplicateStructsClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     def method_a_that_uses_struct(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.method_a_that_uses_struct(
-                
-                params=params,
-            )
+        call_params = self.client.params.method_a_that_uses_struct(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "method_a_that_uses_struct()(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -691,16 +1234,18 @@ class DuplicateStructsComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.method_b_that_uses_same_struct(
-                
-                params=params,
-            )
+        call_params = self.client.params.method_b_that_uses_same_struct(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "method_b_that_uses_same_struct()(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -711,25 +1256,29 @@ class DuplicateStructsComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "DuplicateStructsComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -742,7 +1291,9 @@ class DuplicateStructsComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -756,4 +1307,93 @@ class DuplicateStructsComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +65,106 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_METHOD_A_THAT_USES_STRUCT_METHOD = _AbiMethod("method_a_that_uses_struct()(uint64,uint64)", bytes.fromhex("9f72ac0f"))
+_METHOD_B_THAT_USES_SAME_STRUCT_METHOD = _AbiMethod("method_b_that_uses_same_struct()(uint64,uint64)", bytes.fromhex("a8618449"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _METHOD_A_THAT_USES_STRUCT_METHOD.signature: _METHOD_A_THAT_USES_STRUCT_METHOD,
+    _METHOD_B_THAT_USES_SAME_STRUCT_METHOD.signature: _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class SomeStruct:
     """Struct for SomeStruct"""
@@ -81,10 +182,14 @@ class DuplicateStructsParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def method_b_that_uses_same_struct(
         self,
@@ -92,10 +197,14 @@ class DuplicateStructsParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -118,10 +227,15 @@ class DuplicateStructsCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def method_b_that_uses_same_struct(
         self,
@@ -129,10 +243,15 @@ class DuplicateStructsCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -156,11 +275,16 @@ class DuplicateStructsSend:
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_a_that_uses_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_A_THAT_USES_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _METHOD_A_THAT_USES_STRUCT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def method_b_that_uses_same_struct(
@@ -170,11 +294,16 @@ class DuplicateStructsSend:
     ) -> algokit_utils.SendAppTransactionResult[SomeStruct]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "method_b_that_uses_same_struct()(uint64,uint64)",
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _METHOD_B_THAT_USES_SAME_STRUCT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _METHOD_B_THAT_USES_SAME_STRUCT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SomeStruct, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[SomeStruct], parsed_response)
 
     def clear_state(
@@ -365,7 +494,8 @@ class DuplicateStructsClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -391,16 +521,15 @@ class DuplicateStructsComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.method_a_that_uses_struct(
-                
-                params=params,
-            )
+        call_params = self.client.params.method_a_that_uses_struct(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "method_a_that_uses_struct()(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -408,16 +537,15 @@ class DuplicateStructsComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.method_b_that_uses_same_struct(
-                
-                params=params,
-            )
+        call_params = self.client.params.method_b_that_uses_same_struct(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "method_b_that_uses_same_struct()(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -428,22 +556,21 @@ class DuplicateStructsComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "DuplicateStructsComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "DuplicateStructsComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -459,7 +586,7 @@ class DuplicateStructsComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -473,4 +600,13 @@ class DuplicateStructsComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
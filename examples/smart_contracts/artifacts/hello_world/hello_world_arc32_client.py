@@ -6,7 +6,12 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +69,257 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_HELLO_METHOD = _AbiMethod("hello(string)string", bytes.fromhex("02bece11"))
+_HELLO_WORLD_CHECK_METHOD = _AbiMethod("hello_world_check(string)void", bytes.fromhex("bf9c1edf"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _HELLO_METHOD.signature: _HELLO_METHOD,
+    _HELLO_WORLD_CHECK_METHOD.signature: _HELLO_WORLD_CHECK_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `HelloWorldFactory(..., cache=cache)`
+    and `HelloWorldClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class HelloArgs:
     """Dataclass for hello arguments"""
@@ -122,11 +378,14 @@ class HelloWorldParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def hello_world_check(
         self,
@@ -135,11 +394,14 @@ class HelloWorldParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello_world_check(string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_WORLD_CHECK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -153,32 +415,39 @@ class HelloWorldParams:
 
 
 class _HelloWorldUpdateTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.update(params)
 
 
 class _HelloWorldDeleteTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.delete(params)
 
 
 class HelloWorldCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_HelloWorldUpdateTransaction":
-        return _HelloWorldUpdateTransaction(self.app_client)
+        return _HelloWorldUpdateTransaction(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_HelloWorldDeleteTransaction":
-        return _HelloWorldDeleteTransaction(self.app_client)
+        return _HelloWorldDeleteTransaction(self.app_client, self.cache)
 
     def hello(
         self,
@@ -187,11 +456,17 @@ class HelloWorldCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def hello_world_check(
         self,
@@ -200,17 +475,25 @@ class HelloWorldCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello_world_check(string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_WORLD_CHECK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -218,8 +501,9 @@ class HelloWorldCreateTransactionParams:
 
 
 class _HelloWorldUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -227,6 +511,8 @@ class _HelloWorldUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
@@ -235,8 +521,9 @@ class _HelloWorldUpdateSend:
 
 
 class _HelloWorldDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -244,6 +531,8 @@ class _HelloWorldDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
@@ -252,16 +541,17 @@ class _HelloWorldDeleteSend:
 
 
 class HelloWorldSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_HelloWorldUpdateSend":
-        return _HelloWorldUpdateSend(self.app_client)
+        return _HelloWorldUpdateSend(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_HelloWorldDeleteSend":
-        return _HelloWorldDeleteSend(self.app_client)
+        return _HelloWorldDeleteSend(self.app_client, self.cache)
 
     def hello(
         self,
@@ -271,11 +561,17 @@ class HelloWorldSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _HELLO_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -287,11 +583,17 @@ class HelloWorldSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello_world_check(string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_WORLD_CHECK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _HELLO_WORLD_CHECK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -300,12 +602,30 @@ class HelloWorldSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
 
 
+class HelloWorldPrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def hello(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | HelloArgs, str]:
+        return PreparedCall(self.app_client, _HELLO_METHOD, params, cache=self.cache)
+
+    def hello_world_check(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | HelloWorldCheckArgs, None]:
+        return PreparedCall(self.app_client, _HELLO_WORLD_CHECK_METHOD, params, cache=self.cache)
+
+
 class HelloWorldState:
     """Methods to access state for the current HelloWorld app"""
 
@@ -316,7 +636,7 @@ class HelloWorldClient:
     """Client for interacting with HelloWorld smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -329,6 +649,7 @@ class HelloWorldClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -342,6 +663,7 @@ class HelloWorldClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -361,9 +683,11 @@ class HelloWorldClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = HelloWorldParams(self.app_client)
-        self.create_transaction = HelloWorldCreateTransactionParams(self.app_client)
-        self.send = HelloWorldSend(self.app_client)
+        self.create_transaction = HelloWorldCreateTransactionParams(self.app_client, cache)
+        self.send = HelloWorldSend(self.app_client, cache)
+        self.prepare = HelloWorldPrepare(self.app_client, cache)
         self.state = HelloWorldState(self.app_client)
 
     @staticmethod
@@ -377,7 +701,10 @@ class HelloWorldClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "HelloWorldClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return HelloWorldClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -390,7 +717,8 @@ class HelloWorldClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -401,6 +729,7 @@ class HelloWorldClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "HelloWorldClient":
         return HelloWorldClient(
             algokit_utils.AppClient.from_network(
@@ -411,7 +740,8 @@ class HelloWorldClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -449,7 +779,8 @@ class HelloWorldClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "HelloWorldComposer":
@@ -483,7 +814,8 @@ class HelloWorldClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -521,6 +853,37 @@ class HelloWorldBareCallDeleteParams(algokit_utils.AppClientBareCallParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
         return algokit_utils.AppClientBareCallParams(**self.__dict__)
 
+class HelloWorldFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `HelloWorldFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: HelloWorldBareCallCreateParams | None
+    update_params: HelloWorldBareCallUpdateParams | None
+    delete_params: HelloWorldBareCallDeleteParams | None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class HelloWorldDeployManyError(Exception):
+    """Raised by `HelloWorldFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCallCreateParams, HelloWorldBareCallUpdateParams, HelloWorldBareCallDeleteParams]):
     """Factory for deploying and managing HelloWorldClient smart contracts"""
 
@@ -533,6 +896,7 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -546,8 +910,10 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
             )
         )
         self.params = HelloWorldFactoryParams(self.app_factory)
-        self.create_transaction = HelloWorldFactoryCreateTransaction(self.app_factory)
-        self.send = HelloWorldFactorySend(self.app_factory)
+        self.create_transaction = HelloWorldFactoryCreateTransaction(self.app_factory, cache)
+        self.send = HelloWorldFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -576,6 +942,11 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -588,8 +959,81 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
 
-        return HelloWorldClient(deploy_response[0]), deploy_response[1]
+        return HelloWorldClient(deploy_response[0], cache=self.cache), deploy_response[1]
+
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[HelloWorldFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `HelloWorldDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[HelloWorldFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise HelloWorldDeployManyError(results)
+        return typing.cast(list[tuple[HelloWorldClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -603,6 +1047,8 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
         clear_source_map: SourceMap | None = None,
     ) -> HelloWorldClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return HelloWorldClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -613,7 +1059,8 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -634,7 +1081,8 @@ class HelloWorldFactory(algokit_utils.TypedAppFactoryProtocol[HelloWorldBareCall
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -745,16 +1193,17 @@ class HelloWorldFactoryDeleteParams:
 class HelloWorldFactoryCreateTransaction:
     """Create transactions for HelloWorld contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = HelloWorldFactoryCreateTransactionCreate(app_factory)
+        self.create = HelloWorldFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class HelloWorldFactoryCreateTransactionCreate:
     """Create new instances of HelloWorld contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -762,6 +1211,8 @@ class HelloWorldFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -770,16 +1221,17 @@ class HelloWorldFactoryCreateTransactionCreate:
 class HelloWorldFactorySend:
     """Send calls to HelloWorld contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = HelloWorldFactorySendCreate(app_factory)
+        self.create = HelloWorldFactorySendCreate(app_factory, cache)
 
 
 class HelloWorldFactorySendCreate:
     """Send create calls to HelloWorld contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -790,12 +1242,14 @@ class HelloWorldFactorySendCreate:
     ) -> tuple[HelloWorldClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return HelloWorldClient(result[0]), result[1]
+        return HelloWorldClient(result[0], cache=self.cache), result[1]
 
 
 class _HelloWorldUpdateComposer:
@@ -808,13 +1262,106 @@ class _HelloWorldDeleteComposer:
         self.composer = composer
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class HelloWorldComposer:
     """Composer for creating transaction groups for HelloWorld contract calls"""
 
     def __init__(self, client: "HelloWorldClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     @property
     def update(self) -> "_HelloWorldUpdateComposer":
@@ -829,16 +1376,18 @@ class HelloWorldComposer:
         args: tuple[str] | HelloArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "HelloWorldComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.hello(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "hello(string)string", v
-            )
+            ),
         )
         return self
 
@@ -847,16 +1396,18 @@ class HelloWorldComposer:
         args: tuple[str] | HelloWorldCheckArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "HelloWorldComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello_world_check(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.hello_world_check(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "hello_world_check(string)void", v
-            )
+            ),
         )
         return self
 
@@ -867,25 +1418,29 @@ class HelloWorldComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "HelloWorldComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "HelloWorldComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -898,7 +1453,9 @@ class HelloWorldComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -912,4 +1469,93 @@ class HelloWorldComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
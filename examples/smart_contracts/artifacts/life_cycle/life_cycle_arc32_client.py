@@ -6,7 +6,14 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import array
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import importlib
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +71,325 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_HELLO_STRING_STRING_METHOD = _AbiMethod("hello(string)string", bytes.fromhex("02bece11"))
+_HELLO_STRING_METHOD = _AbiMethod("hello()string", bytes.fromhex("ab06c1a8"))
+_CREATE_STRING_STRING_METHOD = _AbiMethod("create(string)string", bytes.fromhex("97f1fc11"))
+_CREATE_STRING_UINT32_VOID_METHOD = _AbiMethod("create(string,uint32)void", bytes.fromhex("60193264"))
+_UPDATE_TEST_METHOD = _AbiMethod("update_test()string", bytes.fromhex("53e6b8c7"))
+_DELETE_TEST_METHOD = _AbiMethod("delete_test()string", bytes.fromhex("1b3bf203"))
+_CLOSE_OUT_TEST_METHOD = _AbiMethod("close_out_test()string", bytes.fromhex("a026f8dd"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _HELLO_STRING_STRING_METHOD.signature: _HELLO_STRING_STRING_METHOD,
+    _HELLO_STRING_METHOD.signature: _HELLO_STRING_METHOD,
+    _CREATE_STRING_STRING_METHOD.signature: _CREATE_STRING_STRING_METHOD,
+    _CREATE_STRING_UINT32_VOID_METHOD.signature: _CREATE_STRING_UINT32_VOID_METHOD,
+    _UPDATE_TEST_METHOD.signature: _UPDATE_TEST_METHOD,
+    _DELETE_TEST_METHOD.signature: _DELETE_TEST_METHOD,
+    _CLOSE_OUT_TEST_METHOD.signature: _CLOSE_OUT_TEST_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `LifeCycleFactory(..., cache=cache)`
+    and `LifeCycleClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
+
+
+def _fetch_many(
+    keys: typing.Iterable[_KeyT],
+    fetch: typing.Callable[[_KeyT], _ValueT | None],
+    concurrency: int,
+    progress: typing.Callable[[int, int], None] | None,
+) -> dict[_KeyT, _ValueT]:
+    """Fetch the value for each key concurrently, omitting None values, in the order of `keys`"""
+    unique_keys = list(dict.fromkeys(keys))
+    results: dict[_KeyT, _ValueT | None] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {executor.submit(fetch, key): key for key in unique_keys}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(unique_keys))
+    finally:
+        # on failure, the keys that haven't been fetched yet are abandoned rather than waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {key: value for key in unique_keys if (value := results[key]) is not None}
+
+
+# The name of each column, the path to its value in each row, and its array typecode if it has a fixed size type
+_ColumnSpec = tuple[tuple[str, tuple[str, ...], str | None], ...]
+
+
+def _to_columns(rows: typing.Iterable[object], columns: _ColumnSpec) -> dict[str, typing.Any]:
+    """Collect the values of each column from rows, without keeping the rows
+
+    Columns with a typecode are `array.array`s, or NumPy arrays sharing their memory if NumPy is installed, unless
+    they have values that don't fit the typecode, and other columns are lists.
+    """
+    values: list[typing.Any] = [array.array(typecode) if typecode else [] for _, _, typecode in columns]
+    for row in rows:
+        for index, (_, path, _) in enumerate(columns):
+            value = row
+            for part in path:
+                if value is None:  # a struct key that isn't set has no fields
+                    break
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            try:
+                values[index].append(value)
+            except (TypeError, OverflowError):  # e.g. a key that isn't set, so the column can't be a typed array
+                values[index] = [*values[index], value]
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError:
+        return dict(zip((name for name, _, _ in columns), values, strict=True))
+    dtypes = {"Q": numpy.uint64, "B": numpy.bool_}
+    return {
+        name: numpy.frombuffer(column, dtype=dtypes[column.typecode]) if isinstance(column, array.array) else column
+        for (name, _, _), column in zip(columns, values, strict=True)
+    }
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class HelloStringStringArgs:
     """Dataclass for hello_string_string arguments"""
@@ -112,7 +438,7 @@ class _LifeCycleUpdate:
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
         return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_test()string",
+            "method": _UPDATE_TEST_METHOD.signature,
         }))
 
 
@@ -126,10 +452,14 @@ class _LifeCycleDelete:
     ) -> algokit_utils.AppDeleteMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DELETE_TEST_METHOD,
+            None,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
 
 
 class _LifeCycleCloseOut:
@@ -142,10 +472,14 @@ class _LifeCycleCloseOut:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
 
 class LifeCycleParams:
@@ -171,11 +505,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def hello_string(
         self,
@@ -183,10 +520,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def create_string_string(
         self,
@@ -195,11 +536,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CREATE_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def create_string_uint32_void(
         self,
@@ -208,11 +552,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CREATE_STRING_UINT32_VOID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -226,10 +573,13 @@ class LifeCycleParams:
 
 
 class _LifeCycleUpdateTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.update(params)
 
     def update_test(
@@ -240,15 +590,18 @@ class _LifeCycleUpdateTransaction:
     
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_test()string",
+            "method": _UPDATE_TEST_METHOD.signature,
         }))
 
 
 class _LifeCycleDeleteTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def delete_test(
         self,
@@ -256,15 +609,23 @@ class _LifeCycleDeleteTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_TEST_METHOD,
+            None,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_delete_method_call(call_params)
 
 
 class _LifeCycleCloseOutTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def close_out_test(
         self,
@@ -272,27 +633,35 @@ class _LifeCycleCloseOutTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
 
 class LifeCycleCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_LifeCycleUpdateTransaction":
-        return _LifeCycleUpdateTransaction(self.app_client)
+        return _LifeCycleUpdateTransaction(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_LifeCycleDeleteTransaction":
-        return _LifeCycleDeleteTransaction(self.app_client)
+        return _LifeCycleDeleteTransaction(self.app_client, self.cache)
 
     @property
     def close_out(self) -> "_LifeCycleCloseOutTransaction":
-        return _LifeCycleCloseOutTransaction(self.app_client)
+        return _LifeCycleCloseOutTransaction(self.app_client, self.cache)
 
     def hello_string_string(
         self,
@@ -301,11 +670,17 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def hello_string(
         self,
@@ -313,10 +688,17 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def create_string_string(
         self,
@@ -325,11 +707,17 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def create_string_uint32_void(
         self,
@@ -338,17 +726,25 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_STRING_UINT32_VOID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -356,8 +752,9 @@ class LifeCycleCreateTransactionParams:
 
 
 class _LifeCycleUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -365,6 +762,8 @@ class _LifeCycleUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
@@ -380,17 +779,20 @@ class _LifeCycleUpdateSend:
     
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_test()string",
+            "method": _UPDATE_TEST_METHOD.signature,
         }), send_params=send_params, compilation_params=compilation_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppUpdateTransactionResult[str], parsed_response)
 
 
 class _LifeCycleDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def delete_test(
         self,
@@ -399,17 +801,25 @@ class _LifeCycleDeleteSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_test()string",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_TEST_METHOD,
+            None,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _DELETE_TEST_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class _LifeCycleCloseOutSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def close_out_test(
         self,
@@ -418,29 +828,37 @@ class _LifeCycleCloseOutSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CLOSE_OUT_TEST_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class LifeCycleSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_LifeCycleUpdateSend":
-        return _LifeCycleUpdateSend(self.app_client)
+        return _LifeCycleUpdateSend(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_LifeCycleDeleteSend":
-        return _LifeCycleDeleteSend(self.app_client)
+        return _LifeCycleDeleteSend(self.app_client, self.cache)
 
     @property
     def close_out(self) -> "_LifeCycleCloseOutSend":
-        return _LifeCycleCloseOutSend(self.app_client)
+        return _LifeCycleCloseOutSend(self.app_client, self.cache)
 
     def hello_string_string(
         self,
@@ -450,11 +868,17 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _HELLO_STRING_STRING_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -465,10 +889,17 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _HELLO_STRING_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -480,11 +911,17 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CREATE_STRING_STRING_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -496,11 +933,17 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create(string,uint32)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_STRING_UINT32_VOID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CREATE_STRING_UINT32_VOID_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -509,12 +952,30 @@ class LifeCycleSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
 
 
+class LifeCyclePrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def hello_string_string(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | HelloStringStringArgs, str]:
+        return PreparedCall(self.app_client, _HELLO_STRING_STRING_METHOD, params, cache=self.cache)
+
+    def hello_string(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, str]:
+        return PreparedCall(self.app_client, _HELLO_STRING_METHOD, params, cache=self.cache)
+
+
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     greeting: bytes
@@ -533,6 +994,26 @@ class LifeCycleState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    def global_state_columns(
+        self,
+        app_ids: typing.Iterable[int],
+        *,
+        concurrency: int = 8,
+        progress: typing.Callable[[int, int], None] | None = None,
+    ) -> dict[str, typing.Any]:
+        """Get the global state of many instances of the app as columns, fetched concurrently
+    
+        Returns an `app_id` column and a column for each key, or for each field of keys with struct values, in the
+        order of `app_ids`, omitting apps that don't exist. Columns of uints up to 64 bits and bools are NumPy arrays
+        if NumPy is installed, or `array.array`s otherwise.
+        """
+        columns: _ColumnSpec = (
+            ("greeting", ("greeting",), None),
+            ("times", ("times",), "Q"),
+        )
+        states = _fetch_many(app_ids, _GlobalState(self.app_client)._get_all_of_app, concurrency, progress)
+        return {"app_id": list(states), **_to_columns(states.values(), columns)}
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -556,6 +1037,35 @@ class _GlobalState:
             )
         return typing.cast(GlobalStateValue, converted)
 
+    def _get_all_of_app(self, app_id: int) -> GlobalStateValue | None:
+        # reads the global state of an instance of the app in one request, and is None rather than an error if it
+        # doesn't exist
+        try:
+            app_info = self.app_client.algorand.client.algod.application_info(app_id)
+        except algosdk.error.AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return self._decode_all(typing.cast(dict, app_info)["params"].get("global-state", []))
+
+    def _decode_all(self, key_values: list[typing.Any]) -> GlobalStateValue:
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        converted = {}
+        for key, key_info in self.app_client.app_spec.state.keys.global_state.items():
+            value = state.get(key_info.key)
+            decoded = (
+                algokit_utils.applications.abi.get_abi_decoded_value(
+                    value.value_raw, key_info.value_type, self.app_client.app_spec.structs
+                )
+                if value and value.value_raw
+                else value.value if value else None
+            )
+            struct_class = self._struct_classes.get(key_info.value_type)
+            converted[key] = (
+                _init_dataclass(struct_class, decoded) if struct_class and isinstance(decoded, dict) else decoded
+            )
+        return typing.cast(GlobalStateValue, converted)
+
     @property
     def greeting(self) -> bytes:
         """Get the current value of the greeting key in global_state state"""
@@ -576,7 +1086,7 @@ class LifeCycleClient:
     """Client for interacting with LifeCycle smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -589,6 +1099,7 @@ class LifeCycleClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -602,6 +1113,7 @@ class LifeCycleClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -621,9 +1133,11 @@ class LifeCycleClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = LifeCycleParams(self.app_client)
-        self.create_transaction = LifeCycleCreateTransactionParams(self.app_client)
-        self.send = LifeCycleSend(self.app_client)
+        self.create_transaction = LifeCycleCreateTransactionParams(self.app_client, cache)
+        self.send = LifeCycleSend(self.app_client, cache)
+        self.prepare = LifeCyclePrepare(self.app_client, cache)
         self.state = LifeCycleState(self.app_client)
 
     @staticmethod
@@ -637,7 +1151,10 @@ class LifeCycleClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "LifeCycleClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return LifeCycleClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -650,7 +1167,8 @@ class LifeCycleClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -661,6 +1179,7 @@ class LifeCycleClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "LifeCycleClient":
         return LifeCycleClient(
             algokit_utils.AppClient.from_network(
@@ -671,7 +1190,8 @@ class LifeCycleClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -709,7 +1229,8 @@ class LifeCycleClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "LifeCycleComposer":
@@ -773,7 +1294,8 @@ class LifeCycleClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -866,6 +1388,37 @@ class LifeCycleMethodCallDeleteParams(
             }
         )
 
+class LifeCycleFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `LifeCycleFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: LifeCycleMethodCallCreateParams | LifeCycleBareCallCreateParams | None
+    update_params: LifeCycleMethodCallUpdateParams | LifeCycleBareCallUpdateParams | None
+    delete_params: LifeCycleMethodCallDeleteParams | None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class LifeCycleDeployManyError(Exception):
+    """Raised by `LifeCycleFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCallCreateParams | LifeCycleBareCallCreateParams, LifeCycleMethodCallUpdateParams | LifeCycleBareCallUpdateParams, LifeCycleMethodCallDeleteParams]):
     """Factory for deploying and managing LifeCycleClient smart contracts"""
 
@@ -878,6 +1431,7 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -891,8 +1445,10 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
             )
         )
         self.params = LifeCycleFactoryParams(self.app_factory)
-        self.create_transaction = LifeCycleFactoryCreateTransaction(self.app_factory)
-        self.send = LifeCycleFactorySend(self.app_factory)
+        self.create_transaction = LifeCycleFactoryCreateTransaction(self.app_factory, cache)
+        self.send = LifeCycleFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -921,6 +1477,11 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -933,8 +1494,81 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
+
+        return LifeCycleClient(deploy_response[0], cache=self.cache), deploy_response[1]
 
-        return LifeCycleClient(deploy_response[0]), deploy_response[1]
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[LifeCycleFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `LifeCycleDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[LifeCycleFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise LifeCycleDeployManyError(results)
+        return typing.cast(list[tuple[LifeCycleClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -948,6 +1582,8 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
         clear_source_map: SourceMap | None = None,
     ) -> LifeCycleClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return LifeCycleClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -958,7 +1594,8 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -979,7 +1616,8 @@ class LifeCycleFactory(algokit_utils.TypedAppFactoryProtocol[LifeCycleMethodCall
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -1186,16 +1824,17 @@ class LifeCycleFactoryDeleteParams:
 class LifeCycleFactoryCreateTransaction:
     """Create transactions for LifeCycle contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = LifeCycleFactoryCreateTransactionCreate(app_factory)
+        self.create = LifeCycleFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class LifeCycleFactoryCreateTransactionCreate:
     """Create new instances of LifeCycle contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -1203,6 +1842,8 @@ class LifeCycleFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -1211,16 +1852,17 @@ class LifeCycleFactoryCreateTransactionCreate:
 class LifeCycleFactorySend:
     """Send calls to LifeCycle contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = LifeCycleFactorySendCreate(app_factory)
+        self.create = LifeCycleFactorySendCreate(app_factory, cache)
 
 
 class LifeCycleFactorySendCreate:
     """Send create calls to LifeCycle contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -1231,12 +1873,14 @@ class LifeCycleFactorySendCreate:
     ) -> tuple[LifeCycleClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return LifeCycleClient(result[0]), result[1]
+        return LifeCycleClient(result[0], cache=self.cache), result[1]
 
     def create_string_string(
         self,
@@ -1248,6 +1892,8 @@ class LifeCycleFactorySendCreate:
     ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
             """Creates and sends a transaction using the create(string)string ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
+            if self.cache:
+                self.cache.seed_suggested_params(self.app_factory.algorand)
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
@@ -1261,7 +1907,7 @@ class LifeCycleFactorySendCreate:
             )
             return_value = None if result.abi_return is None else typing.cast(str, result.abi_return)
     
-            return LifeCycleClient(client), algokit_utils.AppFactoryCreateMethodCallResult[str](
+            return LifeCycleClient(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[str](
                 **{
                     **result.__dict__,
                     "app_id": result.app_id,
@@ -1286,6 +1932,8 @@ class LifeCycleFactorySendCreate:
     ) -> tuple[LifeCycleClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the create(string,uint32)void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
+            if self.cache:
+                self.cache.seed_suggested_params(self.app_factory.algorand)
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
@@ -1299,7 +1947,7 @@ class LifeCycleFactorySendCreate:
             )
             return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
     
-            return LifeCycleClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+            return LifeCycleClient(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[None](
                 **{
                     **result.__dict__,
                     "app_id": result.app_id,
@@ -1323,17 +1971,19 @@ class _LifeCycleUpdateComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "LifeCycleComposer":
-        self.composer._composer.add_app_update_method_call(
-            self.composer.client.params.update.update_test(
-                
-                params=params,
-                compilation_params=compilation_params
-            )
+        call_params = self.composer.client.params.update.update_test(
+            
+            params=params,
+            compilation_params=compilation_params
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_update_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "update_test()string", v
-            )
+            ),
         )
         return self.composer
 
@@ -1345,17 +1995,19 @@ class _LifeCycleDeleteComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self.composer._composer.add_app_delete_method_call(
-            self.composer.client.params.delete.delete_test(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.delete.delete_test(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_delete_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "delete_test()string", v
-            )
+            ),
         )
         return self.composer
 
@@ -1367,28 +2019,123 @@ class _LifeCycleCloseOutComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self.composer._composer.add_app_call_method_call(
-            self.composer.client.params.close_out.close_out_test(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.close_out.close_out_test(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "close_out_test()string", v
-            )
+            ),
         )
         return self.composer
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class LifeCycleComposer:
     """Composer for creating transaction groups for LifeCycle contract calls"""
 
     def __init__(self, client: "LifeCycleClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     @property
     def update(self) -> "_LifeCycleUpdateComposer":
@@ -1407,16 +2154,18 @@ class LifeCycleComposer:
         args: tuple[str] | HelloStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello_string_string(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.hello_string_string(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "hello(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1424,16 +2173,18 @@ class LifeCycleComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello_string(
-                
-                params=params,
-            )
+        call_params = self.client.params.hello_string(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "hello()string", v
-            )
+            ),
         )
         return self
 
@@ -1442,16 +2193,18 @@ class LifeCycleComposer:
         args: tuple[str] | CreateStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.create_string_string(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.create_string_string(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "create(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1460,16 +2213,18 @@ class LifeCycleComposer:
         args: tuple[str, int] | CreateStringUint32VoidArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.create_string_uint32_void(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.create_string_uint32_void(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "create(string,uint32)void", v
-            )
+            ),
         )
         return self
 
@@ -1480,25 +2235,29 @@ class LifeCycleComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "LifeCycleComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -1511,7 +2270,9 @@ class LifeCycleComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -1525,4 +2286,93 @@ class LifeCycleComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +65,116 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_HELLO_STRING_STRING_METHOD = _AbiMethod("hello(string)string", bytes.fromhex("02bece11"))
+_HELLO_STRING_METHOD = _AbiMethod("hello()string", bytes.fromhex("ab06c1a8"))
+_CREATE_STRING_STRING_METHOD = _AbiMethod("create(string)string", bytes.fromhex("97f1fc11"))
+_CREATE_STRING_UINT32_VOID_METHOD = _AbiMethod("create(string,uint32)void", bytes.fromhex("60193264"))
+_UPDATE_TEST_METHOD = _AbiMethod("update_test()string", bytes.fromhex("53e6b8c7"))
+_DELETE_TEST_METHOD = _AbiMethod("delete_test()string", bytes.fromhex("1b3bf203"))
+_CLOSE_OUT_TEST_METHOD = _AbiMethod("close_out_test()string", bytes.fromhex("a026f8dd"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _HELLO_STRING_STRING_METHOD.signature: _HELLO_STRING_STRING_METHOD,
+    _HELLO_STRING_METHOD.signature: _HELLO_STRING_METHOD,
+    _CREATE_STRING_STRING_METHOD.signature: _CREATE_STRING_STRING_METHOD,
+    _CREATE_STRING_UINT32_VOID_METHOD.signature: _CREATE_STRING_UINT32_VOID_METHOD,
+    _UPDATE_TEST_METHOD.signature: _UPDATE_TEST_METHOD,
+    _DELETE_TEST_METHOD.signature: _DELETE_TEST_METHOD,
+    _CLOSE_OUT_TEST_METHOD.signature: _CLOSE_OUT_TEST_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class HelloStringStringArgs:
     """Dataclass for hello_string_string arguments"""
@@ -103,10 +214,14 @@ class _LifeCycleCloseOut:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
 
 class LifeCycleParams:
@@ -124,11 +239,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def hello_string(
         self,
@@ -136,10 +254,14 @@ class LifeCycleParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -162,10 +284,15 @@ class _LifeCycleCloseOutTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
 
 class LifeCycleCreateTransactionParams:
@@ -183,11 +310,15 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def hello_string(
         self,
@@ -195,10 +326,15 @@ class LifeCycleCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -222,10 +358,15 @@ class _LifeCycleCloseOutSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.close_out(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_out_test()string",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_OUT_TEST_METHOD,
+            None,
+            params,
+            OnComplete.CloseOutOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CLOSE_OUT_TEST_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -246,11 +387,15 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_STRING_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _HELLO_STRING_STRING_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -261,10 +406,15 @@ class LifeCycleSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "hello()string",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _HELLO_STRING_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _HELLO_STRING_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -537,7 +687,8 @@ class LifeCycleClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -558,17 +709,16 @@ class _LifeCycleCloseOutComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self.composer._composer.add_app_call_method_call(
-            self.composer.client.params.close_out.close_out_test(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.close_out.close_out_test(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.composer.client.decode_return_value(
                 "close_out_test()string", v
-            )
+            ),
         )
         return self.composer
 
@@ -590,16 +740,15 @@ class LifeCycleComposer:
         args: tuple[str] | HelloStringStringArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello_string_string(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.hello_string_string(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "hello(string)string", v
-            )
+            ),
         )
         return self
 
@@ -607,16 +756,15 @@ class LifeCycleComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.hello_string(
-                
-                params=params,
-            )
+        call_params = self.client.params.hello_string(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "hello()string", v
-            )
+            ),
         )
         return self
 
@@ -627,22 +775,21 @@ class LifeCycleComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "LifeCycleComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "LifeCycleComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -658,7 +805,7 @@ class LifeCycleComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -672,4 +819,13 @@ class LifeCycleComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
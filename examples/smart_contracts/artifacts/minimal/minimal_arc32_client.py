@@ -6,7 +6,11 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import concurrent.futures
+import copy
 import dataclasses
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +68,77 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `MinimalFactory(..., cache=cache)`
+    and `MinimalClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
 class _MinimalUpdate:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -108,38 +183,47 @@ class MinimalParams:
 
 
 class _MinimalUpdateTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.update(params)
 
 
 class _MinimalDeleteTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.delete(params)
 
 
 class MinimalCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_MinimalUpdateTransaction":
-        return _MinimalUpdateTransaction(self.app_client)
+        return _MinimalUpdateTransaction(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_MinimalDeleteTransaction":
-        return _MinimalDeleteTransaction(self.app_client)
+        return _MinimalDeleteTransaction(self.app_client, self.cache)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -147,8 +231,9 @@ class MinimalCreateTransactionParams:
 
 
 class _MinimalUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -156,6 +241,8 @@ class _MinimalUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
@@ -164,8 +251,9 @@ class _MinimalUpdateSend:
 
 
 class _MinimalDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -173,6 +261,8 @@ class _MinimalDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
@@ -181,22 +271,25 @@ class _MinimalDeleteSend:
 
 
 class MinimalSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_MinimalUpdateSend":
-        return _MinimalUpdateSend(self.app_client)
+        return _MinimalUpdateSend(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_MinimalDeleteSend":
-        return _MinimalDeleteSend(self.app_client)
+        return _MinimalDeleteSend(self.app_client, self.cache)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
@@ -213,7 +306,7 @@ class MinimalClient:
     """Client for interacting with Minimal smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -226,6 +319,7 @@ class MinimalClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -239,6 +333,7 @@ class MinimalClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -258,9 +353,10 @@ class MinimalClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = MinimalParams(self.app_client)
-        self.create_transaction = MinimalCreateTransactionParams(self.app_client)
-        self.send = MinimalSend(self.app_client)
+        self.create_transaction = MinimalCreateTransactionParams(self.app_client, cache)
+        self.send = MinimalSend(self.app_client, cache)
         self.state = MinimalState(self.app_client)
 
     @staticmethod
@@ -274,7 +370,10 @@ class MinimalClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "MinimalClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return MinimalClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -287,7 +386,8 @@ class MinimalClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -298,6 +398,7 @@ class MinimalClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "MinimalClient":
         return MinimalClient(
             algokit_utils.AppClient.from_network(
@@ -308,7 +409,8 @@ class MinimalClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -346,7 +448,8 @@ class MinimalClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "MinimalComposer":
@@ -399,6 +502,37 @@ class MinimalBareCallDeleteParams(algokit_utils.AppClientBareCallParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
         return algokit_utils.AppClientBareCallParams(**self.__dict__)
 
+class MinimalFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `MinimalFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: MinimalBareCallCreateParams | None
+    update_params: MinimalBareCallUpdateParams | None
+    delete_params: MinimalBareCallDeleteParams | None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class MinimalDeployManyError(Exception):
+    """Raised by `MinimalFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[MinimalClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[MinimalClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreateParams, MinimalBareCallUpdateParams, MinimalBareCallDeleteParams]):
     """Factory for deploying and managing MinimalClient smart contracts"""
 
@@ -411,6 +545,7 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -424,8 +559,10 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
             )
         )
         self.params = MinimalFactoryParams(self.app_factory)
-        self.create_transaction = MinimalFactoryCreateTransaction(self.app_factory)
-        self.send = MinimalFactorySend(self.app_factory)
+        self.create_transaction = MinimalFactoryCreateTransaction(self.app_factory, cache)
+        self.send = MinimalFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -454,6 +591,11 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[MinimalClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -466,8 +608,81 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
 
-        return MinimalClient(deploy_response[0]), deploy_response[1]
+        return MinimalClient(deploy_response[0], cache=self.cache), deploy_response[1]
+
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[MinimalFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[MinimalClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `MinimalDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[MinimalFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[MinimalClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise MinimalDeployManyError(results)
+        return typing.cast(list[tuple[MinimalClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -481,6 +696,8 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
         clear_source_map: SourceMap | None = None,
     ) -> MinimalClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return MinimalClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -491,7 +708,8 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -512,7 +730,8 @@ class MinimalFactory(algokit_utils.TypedAppFactoryProtocol[MinimalBareCallCreate
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -583,16 +802,17 @@ class MinimalFactoryDeleteParams:
 class MinimalFactoryCreateTransaction:
     """Create transactions for Minimal contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = MinimalFactoryCreateTransactionCreate(app_factory)
+        self.create = MinimalFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class MinimalFactoryCreateTransactionCreate:
     """Create new instances of Minimal contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -600,6 +820,8 @@ class MinimalFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -608,16 +830,17 @@ class MinimalFactoryCreateTransactionCreate:
 class MinimalFactorySend:
     """Send calls to Minimal contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = MinimalFactorySendCreate(app_factory)
+        self.create = MinimalFactorySendCreate(app_factory, cache)
 
 
 class MinimalFactorySendCreate:
     """Send create calls to Minimal contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -628,12 +851,14 @@ class MinimalFactorySendCreate:
     ) -> tuple[MinimalClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return MinimalClient(result[0]), result[1]
+        return MinimalClient(result[0], cache=self.cache), result[1]
 
 
 class _MinimalUpdateComposer:
@@ -646,13 +871,106 @@ class _MinimalDeleteComposer:
         self.composer = composer
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class MinimalComposer:
     """Composer for creating transaction groups for Minimal contract calls"""
 
     def __init__(self, client: "MinimalClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     @property
     def update(self) -> "_MinimalUpdateComposer":
@@ -669,25 +987,29 @@ class MinimalComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "MinimalComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "MinimalComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -700,7 +1022,9 @@ class MinimalComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -714,4 +1038,93 @@ class MinimalComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
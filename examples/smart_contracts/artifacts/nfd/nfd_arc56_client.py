@@ -6,7 +6,16 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import array
+import base64
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import importlib
+import struct
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +73,433 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_GAS_METHOD = _AbiMethod("gas()void", bytes.fromhex("3172ca9d"))
+_MINT_ASA_METHOD = _AbiMethod("mintAsa(string,string)void", bytes.fromhex("06df2e5b"))
+_DELETE_FIELDS_METHOD = _AbiMethod("deleteFields(byte[][])void", bytes.fromhex("5132df75"))
+_UPDATE_SEGMENT_COUNT_METHOD = _AbiMethod("updateSegmentCount(string,uint64)void", bytes.fromhex("0d26c591"))
+_GET_FIELD_UPDATE_COST_METHOD = _AbiMethod("getFieldUpdateCost(byte[][])uint64", bytes.fromhex("7c5ae495"))
+_UPDATE_FIELDS_METHOD = _AbiMethod("updateFields(byte[][])void", bytes.fromhex("78f42711"))
+_READ_FIELD_METHOD = _AbiMethod("readField(byte[])byte[]", bytes.fromhex("6c13ede4"))
+_OFFER_FOR_SALE_METHOD = _AbiMethod("offerForSale(uint64,address)void", bytes.fromhex("5076d9ca"))
+_CANCEL_SALE_METHOD = _AbiMethod("cancelSale()void", bytes.fromhex("99f5d50d"))
+_POST_OFFER_METHOD = _AbiMethod("postOffer(uint64,string)void", bytes.fromhex("913112ef"))
+_MINT_PAYOUT_METHOD = _AbiMethod("mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)", bytes.fromhex("d85337c4"))
+_PURCHASE_METHOD = _AbiMethod("purchase(pay)void", bytes.fromhex("a392ae82"))
+_IS_ADDRESS_IN_FIELD_METHOD = _AbiMethod("isAddressInField(string,address)bool", bytes.fromhex("d443952a"))
+_GET_RENEW_PRICE_METHOD = _AbiMethod("getRenewPrice()uint64", bytes.fromhex("50f490c2"))
+_UPDATE_HASH_METHOD = _AbiMethod("updateHash(byte[])void", bytes.fromhex("762e82da"))
+_CONTRACT_LOCK_METHOD = _AbiMethod("contractLock(bool)void", bytes.fromhex("8ebc2c83"))
+_SEGMENT_LOCK_METHOD = _AbiMethod("segmentLock(bool,uint64)void", bytes.fromhex("cd5358a6"))
+_VAULT_OPT_IN_LOCK_METHOD = _AbiMethod("vaultOptInLock(bool)void", bytes.fromhex("3a657d77"))
+_VAULT_OPT_IN_METHOD = _AbiMethod("vaultOptIn(uint64[])void", bytes.fromhex("413d1523"))
+_VAULT_SEND_METHOD = _AbiMethod("vaultSend(uint64,address,string,uint64,uint64[])void", bytes.fromhex("66821c1a"))
+_RENEW_METHOD = _AbiMethod("renew(pay)void", bytes.fromhex("77fd5b74"))
+_SET_PRIMARY_ADDRESS_METHOD = _AbiMethod("setPrimaryAddress(string,address)void", bytes.fromhex("97b6d86c"))
+_REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD = _AbiMethod("registryAddingVerifiedAddress(string,string)bool", bytes.fromhex("85cced57"))
+_REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD = _AbiMethod("registryRemovingVerifiedAddress(string,address,address)bool", bytes.fromhex("b1890a75"))
+_CREATE_APPLICATION_METHOD = _AbiMethod("createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void", bytes.fromhex("0dca52c1"))
+_UPDATE_APPLICATION_METHOD = _AbiMethod("updateApplication(string)void", bytes.fromhex("1747405b"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _GAS_METHOD.signature: _GAS_METHOD,
+    _MINT_ASA_METHOD.signature: _MINT_ASA_METHOD,
+    _DELETE_FIELDS_METHOD.signature: _DELETE_FIELDS_METHOD,
+    _UPDATE_SEGMENT_COUNT_METHOD.signature: _UPDATE_SEGMENT_COUNT_METHOD,
+    _GET_FIELD_UPDATE_COST_METHOD.signature: _GET_FIELD_UPDATE_COST_METHOD,
+    _UPDATE_FIELDS_METHOD.signature: _UPDATE_FIELDS_METHOD,
+    _READ_FIELD_METHOD.signature: _READ_FIELD_METHOD,
+    _OFFER_FOR_SALE_METHOD.signature: _OFFER_FOR_SALE_METHOD,
+    _CANCEL_SALE_METHOD.signature: _CANCEL_SALE_METHOD,
+    _POST_OFFER_METHOD.signature: _POST_OFFER_METHOD,
+    _MINT_PAYOUT_METHOD.signature: _MINT_PAYOUT_METHOD,
+    _PURCHASE_METHOD.signature: _PURCHASE_METHOD,
+    _IS_ADDRESS_IN_FIELD_METHOD.signature: _IS_ADDRESS_IN_FIELD_METHOD,
+    _GET_RENEW_PRICE_METHOD.signature: _GET_RENEW_PRICE_METHOD,
+    _UPDATE_HASH_METHOD.signature: _UPDATE_HASH_METHOD,
+    _CONTRACT_LOCK_METHOD.signature: _CONTRACT_LOCK_METHOD,
+    _SEGMENT_LOCK_METHOD.signature: _SEGMENT_LOCK_METHOD,
+    _VAULT_OPT_IN_LOCK_METHOD.signature: _VAULT_OPT_IN_LOCK_METHOD,
+    _VAULT_OPT_IN_METHOD.signature: _VAULT_OPT_IN_METHOD,
+    _VAULT_SEND_METHOD.signature: _VAULT_SEND_METHOD,
+    _RENEW_METHOD.signature: _RENEW_METHOD,
+    _SET_PRIMARY_ADDRESS_METHOD.signature: _SET_PRIMARY_ADDRESS_METHOD,
+    _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD.signature: _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+    _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD.signature: _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+    _CREATE_APPLICATION_METHOD.signature: _CREATE_APPLICATION_METHOD,
+    _UPDATE_APPLICATION_METHOD.signature: _UPDATE_APPLICATION_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `NfdInstanceFactory(..., cache=cache)`
+    and `NfdInstanceClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_T = typing.TypeVar("_T")
+
+
+class ReadonlyCallCache:
+    """Caches the results of read-only method calls for a round
+
+    Read-only methods are simulated, so need no signing or fees, but still call algod. Set `round` whenever a new
+    round is seen, e.g. by a block subscriber, so repeated calls within the round are answered from the cache.
+    Results are keyed by method signature, ABI encoded args, sender and round, are only cached while `round` is set
+    and are dropped when it changes. Cached results are shared by every call that hits them, so shouldn't be
+    modified. Use with `client.send.readonly_cache = ReadonlyCallCache()`.
+    """
+
+    def __init__(self, round: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._round = round
+        self._results: dict[tuple[object, ...], object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def round(self) -> int | None:
+        return self._round
+
+    @round.setter
+    def round(self, value: int | None) -> None:
+        with self._lock:
+            if value != self._round:
+                self._results.clear()
+                self._round = value
+
+    def get_or_send(
+        self, method: _AbiMethod, args: list[object] | None, sender: str | None, send: typing.Callable[[], _T]
+    ) -> _T:
+        """Get the cached result of a call for the current round, or send it and cache the result"""
+        current_round = self._round
+        encoded_args = self._encode_args(method, args) if current_round is not None else None
+        if encoded_args is None:
+            return send()
+        key = (method.signature, encoded_args, sender, current_round)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return typing.cast(_T, self._results[key])
+            self.misses += 1
+        result = send()
+        with self._lock:
+            if self._round == current_round:
+                self._results[key] = result
+        return result
+
+    def _encode_args(self, method: _AbiMethod, args: list[object] | None) -> tuple[bytes, ...] | None:
+        # None if the args can't be part of a key, e.g. transactions, so the call isn't cached
+        encoded_args = []
+        try:
+            for arg_type, value in zip(method.arg_types, args or [], strict=False):
+                if isinstance(arg_type, algosdk.abi.ABIType):
+                    encoded_args.append(arg_type.encode(value))
+                elif isinstance(value, int | str):  # reference types, e.g. an account or asset
+                    encoded_args.append(repr(value).encode())
+                else:
+                    return None
+        except Exception:
+            return None
+        return tuple(encoded_args)
+
+
+# Used when no cache is set, as a cache without a round sends every call
+_NO_READONLY_CACHE = ReadonlyCallCache()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
+
+
+def _fetch_many(
+    keys: typing.Iterable[_KeyT],
+    fetch: typing.Callable[[_KeyT], _ValueT | None],
+    concurrency: int,
+    progress: typing.Callable[[int, int], None] | None,
+) -> dict[_KeyT, _ValueT]:
+    """Fetch the value for each key concurrently, omitting None values, in the order of `keys`"""
+    unique_keys = list(dict.fromkeys(keys))
+    results: dict[_KeyT, _ValueT | None] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {executor.submit(fetch, key): key for key in unique_keys}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(unique_keys))
+    finally:
+        # on failure, the keys that haven't been fetched yet are abandoned rather than waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {key: value for key in unique_keys if (value := results[key]) is not None}
+
+
+# The name of each column, the path to its value in each row, and its array typecode if it has a fixed size type
+_ColumnSpec = tuple[tuple[str, tuple[str, ...], str | None], ...]
+
+
+def _to_columns(rows: typing.Iterable[object], columns: _ColumnSpec) -> dict[str, typing.Any]:
+    """Collect the values of each column from rows, without keeping the rows
+
+    Columns with a typecode are `array.array`s, or NumPy arrays sharing their memory if NumPy is installed, unless
+    they have values that don't fit the typecode, and other columns are lists.
+    """
+    values: list[typing.Any] = [array.array(typecode) if typecode else [] for _, _, typecode in columns]
+    for row in rows:
+        for index, (_, path, _) in enumerate(columns):
+            value = row
+            for part in path:
+                if value is None:  # a struct key that isn't set has no fields
+                    break
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            try:
+                values[index].append(value)
+            except (TypeError, OverflowError):  # e.g. a key that isn't set, so the column can't be a typed array
+                values[index] = [*values[index], value]
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError:
+        return dict(zip((name for name, _, _ in columns), values, strict=True))
+    dtypes = {"Q": numpy.uint64, "B": numpy.bool_}
+    return {
+        name: numpy.frombuffer(column, dtype=dtypes[column.typecode]) if isinstance(column, array.array) else column
+        for (name, _, _), column in zip(columns, values, strict=True)
+    }
+
 @dataclasses.dataclass(frozen=True)
 class PayoutInfo:
     """Struct for PayoutInfo"""
@@ -322,7 +758,7 @@ class _NfdInstanceUpdate:
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
         return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "updateApplication(string)void",
+            "method": _UPDATE_APPLICATION_METHOD.signature,
             "args": method_args,
         }))
 
@@ -341,10 +777,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def mint_asa(
         self,
@@ -353,11 +793,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def delete_fields(
         self,
@@ -366,11 +809,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_segment_count(
         self,
@@ -379,11 +825,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_field_update_cost(
         self,
@@ -392,11 +841,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_FIELD_UPDATE_COST_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_fields(
         self,
@@ -405,11 +857,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def read_field(
         self,
@@ -418,11 +873,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _READ_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def offer_for_sale(
         self,
@@ -431,11 +889,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def cancel_sale(
         self,
@@ -443,10 +904,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def post_offer(
         self,
@@ -455,11 +920,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def mint_payout(
         self,
@@ -468,11 +936,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def purchase(
         self,
@@ -481,11 +952,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def is_address_in_field(
         self,
@@ -494,11 +968,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _IS_ADDRESS_IN_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_renew_price(
         self,
@@ -506,10 +983,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_RENEW_PRICE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_hash(
         self,
@@ -518,11 +999,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def contract_lock(
         self,
@@ -531,11 +1015,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def segment_lock(
         self,
@@ -544,11 +1031,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_opt_in_lock(
         self,
@@ -557,11 +1047,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_opt_in(
         self,
@@ -570,11 +1063,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_send(
         self,
@@ -583,11 +1079,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def renew(
         self,
@@ -596,11 +1095,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_primary_address(
         self,
@@ -609,11 +1111,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def registry_adding_verified_address(
         self,
@@ -622,11 +1127,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def registry_removing_verified_address(
         self,
@@ -635,11 +1143,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def create_application(
         self,
@@ -648,11 +1159,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -666,8 +1180,9 @@ class NfdInstanceParams:
 
 
 class _NfdInstanceUpdateTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def update_application(
         self,
@@ -678,20 +1193,23 @@ class _NfdInstanceUpdateTransaction:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "updateApplication(string)void",
+            "method": _UPDATE_APPLICATION_METHOD.signature,
             "args": method_args,
         }))
 
 
 class NfdInstanceCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_NfdInstanceUpdateTransaction":
-        return _NfdInstanceUpdateTransaction(self.app_client)
+        return _NfdInstanceUpdateTransaction(self.app_client, self.cache)
 
     def gas(
         self,
@@ -699,10 +1217,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def mint_asa(
         self,
@@ -711,11 +1236,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def delete_fields(
         self,
@@ -724,11 +1255,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_segment_count(
         self,
@@ -737,11 +1274,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_field_update_cost(
         self,
@@ -750,11 +1293,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_FIELD_UPDATE_COST_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_fields(
         self,
@@ -763,11 +1312,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def read_field(
         self,
@@ -776,11 +1331,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _READ_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def offer_for_sale(
         self,
@@ -789,11 +1350,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def cancel_sale(
         self,
@@ -801,10 +1368,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def post_offer(
         self,
@@ -813,11 +1387,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def mint_payout(
         self,
@@ -826,11 +1406,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def purchase(
         self,
@@ -839,11 +1425,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def is_address_in_field(
         self,
@@ -852,11 +1444,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _IS_ADDRESS_IN_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_renew_price(
         self,
@@ -864,10 +1462,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_RENEW_PRICE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_hash(
         self,
@@ -876,11 +1481,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def contract_lock(
         self,
@@ -889,11 +1500,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def segment_lock(
         self,
@@ -902,11 +1519,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_opt_in_lock(
         self,
@@ -915,11 +1538,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_opt_in(
         self,
@@ -928,11 +1557,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_send(
         self,
@@ -941,11 +1576,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def renew(
         self,
@@ -954,11 +1595,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_primary_address(
         self,
@@ -967,11 +1614,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def registry_adding_verified_address(
         self,
@@ -980,11 +1633,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def registry_removing_verified_address(
         self,
@@ -993,11 +1652,17 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def create_application(
         self,
@@ -1006,17 +1671,25 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -1024,8 +1697,9 @@ class NfdInstanceCreateTransactionParams:
 
 
 class _NfdInstanceUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def update_application(
         self,
@@ -1037,9 +1711,11 @@ class _NfdInstanceUpdateSend:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "updateApplication(string)void",
+            "method": _UPDATE_APPLICATION_METHOD.signature,
             "args": method_args,
         }), send_params=send_params, compilation_params=compilation_params)
         parsed_response = response
@@ -1047,12 +1723,15 @@ class _NfdInstanceUpdateSend:
 
 
 class NfdInstanceSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
+        self.readonly_cache: ReadonlyCallCache | None = None
+        """Answers repeated read-only calls within a round, see `ReadonlyCallCache`"""
 
     @property
     def update(self) -> "_NfdInstanceUpdateSend":
-        return _NfdInstanceUpdateSend(self.app_client)
+        return _NfdInstanceUpdateSend(self.app_client, self.cache)
 
     def gas(
         self,
@@ -1061,10 +1740,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _GAS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1076,11 +1762,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _MINT_ASA_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1092,11 +1784,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _DELETE_FIELDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1108,11 +1806,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _UPDATE_SEGMENT_COUNT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1124,11 +1828,18 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_FIELD_UPDATE_COST_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
+            "method": _GET_FIELD_UPDATE_COST_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1140,11 +1851,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _UPDATE_FIELDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1156,11 +1873,18 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bytes]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _READ_FIELD_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
+            "method": _READ_FIELD_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
 
@@ -1172,11 +1896,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _OFFER_FOR_SALE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1187,10 +1917,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CANCEL_SALE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1202,11 +1939,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _POST_OFFER_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1218,12 +1961,18 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[PayoutInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PayoutInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _MINT_PAYOUT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PayoutInfo, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[PayoutInfo], parsed_response)
 
     def purchase(
@@ -1234,11 +1983,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _PURCHASE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1250,11 +2005,18 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _IS_ADDRESS_IN_FIELD_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
+            "method": _IS_ADDRESS_IN_FIELD_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1265,10 +2027,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_RENEW_PRICE_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
-        }), send_params=send_params)
+            "method": _GET_RENEW_PRICE_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1280,11 +2049,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _UPDATE_HASH_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1296,11 +2071,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CONTRACT_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1312,11 +2093,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SEGMENT_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1328,11 +2115,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _VAULT_OPT_IN_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1344,11 +2137,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _VAULT_OPT_IN_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1360,11 +2159,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _VAULT_SEND_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1376,11 +2181,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _RENEW_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1392,11 +2203,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SET_PRIMARY_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1408,11 +2225,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1424,11 +2247,17 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1440,23 +2269,157 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CREATE_APPLICATION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def clear_state(
-        self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
-        return self.app_client.send.bare.clear_state(
-            params,
-            send_params=send_params,
-        )
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class NfdInstancePrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def gas(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, None]:
+        return PreparedCall(self.app_client, _GAS_METHOD, params, cache=self.cache)
+
+    def mint_asa(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, str] | MintAsaArgs, None]:
+        return PreparedCall(self.app_client, _MINT_ASA_METHOD, params, cache=self.cache)
+
+    def delete_fields(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[list[bytes | str]] | DeleteFieldsArgs, None]:
+        return PreparedCall(self.app_client, _DELETE_FIELDS_METHOD, params, cache=self.cache)
+
+    def update_segment_count(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, int] | UpdateSegmentCountArgs, None]:
+        return PreparedCall(self.app_client, _UPDATE_SEGMENT_COUNT_METHOD, params, cache=self.cache)
+
+    def get_field_update_cost(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[list[bytes | str]] | GetFieldUpdateCostArgs, int]:
+        return PreparedCall(self.app_client, _GET_FIELD_UPDATE_COST_METHOD, params, cache=self.cache)
+
+    def update_fields(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[list[bytes | str]] | UpdateFieldsArgs, None]:
+        return PreparedCall(self.app_client, _UPDATE_FIELDS_METHOD, params, cache=self.cache)
+
+    def read_field(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bytes | str] | ReadFieldArgs, bytes]:
+        return PreparedCall(self.app_client, _READ_FIELD_METHOD, params, cache=self.cache)
+
+    def offer_for_sale(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str] | OfferForSaleArgs, None]:
+        return PreparedCall(self.app_client, _OFFER_FOR_SALE_METHOD, params, cache=self.cache)
+
+    def cancel_sale(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, None]:
+        return PreparedCall(self.app_client, _CANCEL_SALE_METHOD, params, cache=self.cache)
+
+    def post_offer(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str] | PostOfferArgs, None]:
+        return PreparedCall(self.app_client, _POST_OFFER_METHOD, params, cache=self.cache)
+
+    def mint_payout(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int] | MintPayoutArgs, PayoutInfo]:
+        return PreparedCall(self.app_client, _MINT_PAYOUT_METHOD, params, result_struct=PayoutInfo, cache=self.cache)
+
+    def purchase(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument] | PurchaseArgs, None]:
+        return PreparedCall(self.app_client, _PURCHASE_METHOD, params, cache=self.cache)
+
+    def is_address_in_field(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, str] | IsAddressInFieldArgs, bool]:
+        return PreparedCall(self.app_client, _IS_ADDRESS_IN_FIELD_METHOD, params, cache=self.cache)
+
+    def get_renew_price(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, int]:
+        return PreparedCall(self.app_client, _GET_RENEW_PRICE_METHOD, params, cache=self.cache)
+
+    def update_hash(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bytes | str] | UpdateHashArgs, None]:
+        return PreparedCall(self.app_client, _UPDATE_HASH_METHOD, params, cache=self.cache)
+
+    def contract_lock(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bool] | ContractLockArgs, None]:
+        return PreparedCall(self.app_client, _CONTRACT_LOCK_METHOD, params, cache=self.cache)
+
+    def segment_lock(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bool, int] | SegmentLockArgs, None]:
+        return PreparedCall(self.app_client, _SEGMENT_LOCK_METHOD, params, cache=self.cache)
+
+    def vault_opt_in_lock(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bool] | VaultOptInLockArgs, None]:
+        return PreparedCall(self.app_client, _VAULT_OPT_IN_LOCK_METHOD, params, cache=self.cache)
+
+    def vault_opt_in(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[list[int]] | VaultOptInArgs, None]:
+        return PreparedCall(self.app_client, _VAULT_OPT_IN_METHOD, params, cache=self.cache)
+
+    def vault_send(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str, str, int, list[int]] | VaultSendArgs, None]:
+        return PreparedCall(self.app_client, _VAULT_SEND_METHOD, params, cache=self.cache)
+
+    def renew(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument] | RenewArgs, None]:
+        return PreparedCall(self.app_client, _RENEW_METHOD, params, cache=self.cache)
+
+    def set_primary_address(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, str] | SetPrimaryAddressArgs, None]:
+        return PreparedCall(self.app_client, _SET_PRIMARY_ADDRESS_METHOD, params, cache=self.cache)
+
+    def registry_adding_verified_address(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, str] | RegistryAddingVerifiedAddressArgs, bool]:
+        return PreparedCall(self.app_client, _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD, params, cache=self.cache)
+
+    def registry_removing_verified_address(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str, str, str] | RegistryRemovingVerifiedAddressArgs, bool]:
+        return PreparedCall(self.app_client, _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD, params, cache=self.cache)
 
 
 class NfdInstanceState:
@@ -1508,7 +2471,7 @@ class _GlobalState:
         return _MapState(
             self.app_client.state.global_state,
             "globalState",
-            None
+            None,
         )
 
 class _BoxState:
@@ -1540,7 +2503,8 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "boxes",
-            None
+            None,
+            box_app_client=self.app_client,
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1556,10 +2520,16 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
     """Generic class for accessing state maps with strongly typed keys and values"""
 
     def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
+                struct_class: typing.Type[_ValueType] | None = None,
+                box_app_client: algokit_utils.AppClient | None = None,
+                key_struct_class: typing.Type[typing.Any] | None = None,
+                value_columns: _ColumnSpec = (("value", (), None),)):
         self._state_accessor = state_accessor
         self._map_name = map_name
         self._struct_class = struct_class
+        self._box_app_client = box_app_client
+        self._key_struct_class = key_struct_class
+        self._value_columns = value_columns
 
     def get_map(self) -> dict[_KeyType, _ValueType]:
         """Get all current values in the map"""
@@ -1577,12 +2547,107 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
             return _init_dataclass(self._struct_class, value)  # type: ignore
         return typing.cast(_ValueType | None, value)
 
+    def iter_items(self, page_size: int = 1000, prefetch: int = 8) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """Iterate over the keys and values in the map
+
+        Box maps are streamed: box names are fetched `page_size` at a time and up to `prefetch` values are fetched
+        concurrently ahead of the item being consumed, so memory use is bounded and the first items are available
+        straight away. Boxes created or deleted during iteration may or may not be included. Other maps are read
+        in one call, as their state is.
+        """
+        if self._box_app_client is None:
+            yield from self.get_map().items()
+            return
+        for key, value in self._iter_decoded(page_size, prefetch):
+            if self._key_struct_class and isinstance(key, dict):
+                key = _init_dataclass(self._key_struct_class, key)
+            if self._struct_class and isinstance(value, dict):
+                value = _init_dataclass(self._struct_class, value)
+            yield typing.cast(_KeyType, key), typing.cast(_ValueType, value)
+
+    def get_columns(self, page_size: int = 1000, prefetch: int = 8) -> dict[str, typing.Any]:
+        """Get the keys and values in the map as columns, without creating an object for each value
+
+        Returns a `key` column and a column for each field of the map's struct values, or a `value` column for
+        other values. Columns of uints up to 64 bits and bools are NumPy arrays if NumPy is installed, or
+        `array.array`s otherwise, and other columns are lists. Box maps are streamed, as with `iter_items`.
+        """
+        keys: list[typing.Any] = []
+
+        def values() -> typing.Iterator[typing.Any]:
+            for key, value in self._iter_decoded(page_size, prefetch):
+                keys.append(key)
+                yield value
+
+        columns = _to_columns(values(), self._value_columns)
+        return {"key": keys, **columns}
+
+    def _iter_decoded(self, page_size: int, prefetch: int) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        # the decoded ABI keys and values, with structs as dicts
+        if self._box_app_client is None:
+            yield from self._state_accessor.get_map(self._map_name).items()
+            return
+
+        app_client = self._box_app_client
+        metadata = app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            pending: list[tuple[bytes, concurrent.futures.Future[bytes]]] = []
+            try:
+                for name in self._iter_box_names(prefix, page_size):
+                    value = executor.submit(app_client.algorand.app.get_box_value, app_client.app_id, name)
+                    pending.append((name, value))
+                    if len(pending) > prefetch:
+                        name, value = pending.pop(0)
+                        yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+                while pending:
+                    name, value = pending.pop(0)
+                    yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+            finally:
+                for _, value in pending:
+                    value.cancel()
+
+    def _iter_box_names(self, prefix: bytes, page_size: int) -> typing.Iterator[bytes]:
+        # algod versions without paging of box names ignore `next` and `prefix`, and may truncate to `max` names
+        assert self._box_app_client is not None
+        algod = self._box_app_client.algorand.client.algod
+        path = f"/applications/{self._box_app_client.app_id}/boxes"
+        params: dict[str, typing.Any] = {"max": page_size}
+        if prefix:
+            params["prefix"] = "b64:" + base64.b64encode(prefix).decode()
+        seen: set[bytes] | None = None
+        while True:
+            response = typing.cast(dict[str, typing.Any], algod.algod_request("GET", path, params=params))
+            page = [base64.b64decode(box["name"]) for box in response.get("boxes", [])]
+            names = page if seen is None else [name for name in page if name not in seen]
+            yield from (name for name in names if name.startswith(prefix))
+            next_token = response.get("next-token")
+            if next_token:
+                params["next"] = next_token
+            elif "next" not in params and "next-token" not in response and len(page) == params["max"]:
+                # a full first page without a next token may have been truncated by a node that doesn't page, so
+                # list the names again with a larger `max`, until a page isn't full
+                seen = (seen or set()).union(page)
+                params["max"] *= 2
+            else:
+                return
+
+    def _decode_box(
+        self, key: bytes, value: bytes, metadata: algokit_utils.applications.app_spec.arc56.StorageMap
+    ) -> tuple[typing.Any, typing.Any]:
+        assert self._box_app_client is not None
+        structs = self._box_app_client.app_spec.structs
+        return (
+            algokit_utils.applications.abi.get_abi_decoded_value(key, metadata.key_type, structs),
+            algokit_utils.applications.abi.get_abi_decoded_value(value, metadata.value_type, structs),
+        )
+
 
 class NfdInstanceClient:
     """Client for interacting with NFDInstance smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -1595,6 +2660,7 @@ class NfdInstanceClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -1608,6 +2674,7 @@ class NfdInstanceClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -1627,9 +2694,11 @@ class NfdInstanceClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = NfdInstanceParams(self.app_client)
-        self.create_transaction = NfdInstanceCreateTransactionParams(self.app_client)
-        self.send = NfdInstanceSend(self.app_client)
+        self.create_transaction = NfdInstanceCreateTransactionParams(self.app_client, cache)
+        self.send = NfdInstanceSend(self.app_client, cache)
+        self.prepare = NfdInstancePrepare(self.app_client, cache)
         self.state = NfdInstanceState(self.app_client)
 
     @staticmethod
@@ -1643,7 +2712,10 @@ class NfdInstanceClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "NfdInstanceClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return NfdInstanceClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -1656,7 +2728,8 @@ class NfdInstanceClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -1667,6 +2740,7 @@ class NfdInstanceClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "NfdInstanceClient":
         return NfdInstanceClient(
             algokit_utils.AppClient.from_network(
@@ -1677,7 +2751,8 @@ class NfdInstanceClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -1715,7 +2790,8 @@ class NfdInstanceClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "NfdInstanceComposer":
@@ -1893,7 +2969,8 @@ class NfdInstanceClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -1949,6 +3026,37 @@ class NfdInstanceMethodCallUpdateParams(
             }
         )
 
+class NfdInstanceFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `NfdInstanceFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: NfdInstanceMethodCallCreateParams | None
+    update_params: NfdInstanceMethodCallUpdateParams | None
+    delete_params: None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class NfdInstanceDeployManyError(Exception):
+    """Raised by `NfdInstanceFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethodCallCreateParams, NfdInstanceMethodCallUpdateParams, None]):
     """Factory for deploying and managing NfdInstanceClient smart contracts"""
 
@@ -1961,6 +3069,7 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -1974,8 +3083,10 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
             )
         )
         self.params = NfdInstanceFactoryParams(self.app_factory)
-        self.create_transaction = NfdInstanceFactoryCreateTransaction(self.app_factory)
-        self.send = NfdInstanceFactorySend(self.app_factory)
+        self.create_transaction = NfdInstanceFactoryCreateTransaction(self.app_factory, cache)
+        self.send = NfdInstanceFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -2004,6 +3115,11 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -2016,8 +3132,81 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
+
+        return NfdInstanceClient(deploy_response[0], cache=self.cache), deploy_response[1]
 
-        return NfdInstanceClient(deploy_response[0]), deploy_response[1]
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[NfdInstanceFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `NfdInstanceDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[NfdInstanceFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise NfdInstanceDeployManyError(results)
+        return typing.cast(list[tuple[NfdInstanceClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -2031,6 +3220,8 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
         clear_source_map: SourceMap | None = None,
     ) -> NfdInstanceClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return NfdInstanceClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -2041,7 +3232,8 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -2062,7 +3254,8 @@ class NfdInstanceFactory(algokit_utils.TypedAppFactoryProtocol[NfdInstanceMethod
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -2650,16 +3843,17 @@ class NfdInstanceFactoryDeleteParams:
 class NfdInstanceFactoryCreateTransaction:
     """Create transactions for NfdInstance contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = NfdInstanceFactoryCreateTransactionCreate(app_factory)
+        self.create = NfdInstanceFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class NfdInstanceFactoryCreateTransactionCreate:
     """Create new instances of NfdInstance contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -2667,6 +3861,8 @@ class NfdInstanceFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -2675,16 +3871,17 @@ class NfdInstanceFactoryCreateTransactionCreate:
 class NfdInstanceFactorySend:
     """Send calls to NfdInstance contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = NfdInstanceFactorySendCreate(app_factory)
+        self.create = NfdInstanceFactorySendCreate(app_factory, cache)
 
 
 class NfdInstanceFactorySendCreate:
     """Send create calls to NfdInstance contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -2695,12 +3892,14 @@ class NfdInstanceFactorySendCreate:
     ) -> tuple[NfdInstanceClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return NfdInstanceClient(result[0]), result[1]
+        return NfdInstanceClient(result[0], cache=self.cache), result[1]
 
     def create_application(
         self,
@@ -2712,6 +3911,8 @@ class NfdInstanceFactorySendCreate:
     ) -> tuple[NfdInstanceClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
+            if self.cache:
+                self.cache.seed_suggested_params(self.app_factory.algorand)
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
@@ -2725,7 +3926,7 @@ class NfdInstanceFactorySendCreate:
             )
             return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
     
-            return NfdInstanceClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+            return NfdInstanceClient(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[None](
                 **{
                     **result.__dict__,
                     "app_id": result.app_id,
@@ -2750,28 +3951,123 @@ class _NfdInstanceUpdateComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self.composer._composer.add_app_update_method_call(
-            self.composer.client.params.update.update_application(
-                args=args,
-                params=params,
-                compilation_params=compilation_params
-            )
+        call_params = self.composer.client.params.update.update_application(
+            args=args,
+            params=params,
+            compilation_params=compilation_params
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_update_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "updateApplication(string)void", v
-            )
+            ),
         )
         return self.composer
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class NfdInstanceComposer:
     """Composer for creating transaction groups for NfdInstance contract calls"""
 
     def __init__(self, client: "NfdInstanceClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     @property
     def update(self) -> "_NfdInstanceUpdateComposer":
@@ -2782,16 +4078,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.gas(
-                
-                params=params,
-            )
+        call_params = self.client.params.gas(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "gas()void", v
-            )
+            ),
         )
         return self
 
@@ -2801,16 +4099,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.mint_asa(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.mint_asa(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "mintAsa(string,string)void", v
-            )
+            ),
         )
         return self
 
@@ -2820,16 +4120,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.delete_fields(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.delete_fields(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "deleteFields(byte[][])void", v
-            )
+            ),
         )
         return self
 
@@ -2839,16 +4141,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_segment_count(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_segment_count(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "updateSegmentCount(string,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2858,16 +4162,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_field_update_cost(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_field_update_cost(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getFieldUpdateCost(byte[][])uint64", v
-            )
+            ),
         )
         return self
 
@@ -2877,16 +4183,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_fields(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_fields(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "updateFields(byte[][])void", v
-            )
+            ),
         )
         return self
 
@@ -2896,16 +4204,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.read_field(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.read_field(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "readField(byte[])byte[]", v
-            )
+            ),
         )
         return self
 
@@ -2915,16 +4225,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.offer_for_sale(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.offer_for_sale(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "offerForSale(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -2933,16 +4245,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.cancel_sale(
-                
-                params=params,
-            )
+        call_params = self.client.params.cancel_sale(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "cancelSale()void", v
-            )
+            ),
         )
         return self
 
@@ -2952,16 +4266,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.post_offer(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.post_offer(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "postOffer(uint64,string)void", v
-            )
+            ),
         )
         return self
 
@@ -2971,16 +4287,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.mint_payout(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.mint_payout(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2990,16 +4308,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.purchase(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.purchase(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "purchase(pay)void", v
-            )
+            ),
         )
         return self
 
@@ -3009,16 +4329,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.is_address_in_field(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.is_address_in_field(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "isAddressInField(string,address)bool", v
-            )
+            ),
         )
         return self
 
@@ -3027,16 +4349,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_renew_price(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_renew_price(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getRenewPrice()uint64", v
-            )
+            ),
         )
         return self
 
@@ -3046,16 +4370,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_hash(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_hash(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "updateHash(byte[])void", v
-            )
+            ),
         )
         return self
 
@@ -3065,16 +4391,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.contract_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.contract_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "contractLock(bool)void", v
-            )
+            ),
         )
         return self
 
@@ -3084,16 +4412,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.segment_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.segment_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "segmentLock(bool,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -3103,16 +4433,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_opt_in_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_opt_in_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "vaultOptInLock(bool)void", v
-            )
+            ),
         )
         return self
 
@@ -3122,16 +4454,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_opt_in(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_opt_in(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "vaultOptIn(uint64[])void", v
-            )
+            ),
         )
         return self
 
@@ -3141,16 +4475,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_send(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_send(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "vaultSend(uint64,address,string,uint64,uint64[])void", v
-            )
+            ),
         )
         return self
 
@@ -3160,16 +4496,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.renew(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.renew(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "renew(pay)void", v
-            )
+            ),
         )
         return self
 
@@ -3179,16 +4517,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_primary_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_primary_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "setPrimaryAddress(string,address)void", v
-            )
+            ),
         )
         return self
 
@@ -3198,16 +4538,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.registry_adding_verified_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.registry_adding_verified_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "registryAddingVerifiedAddress(string,string)bool", v
-            )
+            ),
         )
         return self
 
@@ -3217,16 +4559,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.registry_removing_verified_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.registry_removing_verified_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "registryRemovingVerifiedAddress(string,address,address)bool", v
-            )
+            ),
         )
         return self
 
@@ -3236,16 +4580,18 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.create_application(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.create_application(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -3256,25 +4602,29 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "NfdInstanceComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -3287,7 +4637,9 @@ class NfdInstanceComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -3301,4 +4653,340 @@ class NfdInstanceComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdOfferForSaleEvent:
+    """ARC-28 event nfd_offerForSale(uint64,string,address,uint64,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("c24b5ad6")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32sQ32s")
+
+    app_id: int
+    name: str
+    seller: str
+    amount: int
+    reserved_for: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdOfferForSaleEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            values[3],
+            _encode_address(values[4]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdSaleCancelledEvent:
+    """ARC-28 event nfd_saleCancelled(uint64,string)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("4365ed90")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH")
+
+    app_id: int
+    name: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdSaleCancelledEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdPostedOfferEvent:
+    """ARC-28 event nfd_postedOffer(uint64,string,address,uint64,string)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("52532b70")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32sQH")
+
+    app_id: int
+    name: str
+    sender: str
+    amount: int
+    note: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdPostedOfferEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            values[3],
+            _decode_abi_bytes(data, values[4]).decode("utf-8"),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdPurchasedEvent:
+    """ARC-28 event nfd_purchased(uint64,string,address,address,uint64,uint64,uint64,address,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("78dc89e3")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s32sQQQ32sQ")
+
+    app_id: int
+    name: str
+    seller: str
+    buyer: str
+    sell_amount: int
+    offer_amount: int
+    overpayment_refund: int
+    conv_fee_addr: str
+    conv_fee_amount: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdPurchasedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+            _encode_address(values[7]),
+            values[8],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdRenewedEvent:
+    """ARC-28 event nfd_renewed(uint64,string,address,address,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("14a76a3e")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s32sQQQ")
+
+    app_id: int
+    name: str
+    orig_owner: str
+    buyer: str
+    price_one_year: int
+    renew_amount: int
+    exp_time: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdRenewedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdAddressLinkedEvent:
+    """ARC-28 event nfd_addressLinked(uint64,string,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("cf9d1e24")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s")
+
+    app_id: int
+    name: str
+    address: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdAddressLinkedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdAddressUnlinkedEvent:
+    """ARC-28 event nfd_addressUnlinked(uint64,string,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("a4d3b9a7")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s")
+
+    app_id: int
+    name: str
+    address: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdAddressUnlinkedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+        )
+
+
+# Encoding an address hashes it, and the same addresses are usually logged many times, e.g. by a busy account
+_encode_address = functools.lru_cache(maxsize=4096)(algosdk.encoding.encode_address)
+
+
+def _decode_abi_bytes(data: bytes, offset: int) -> bytes:
+    """Decode a dynamic byte array or string at offset in data"""
+    return data[offset + 2 : offset + 2 + int.from_bytes(data[offset : offset + 2], "big")]
+
+
+NfdInstanceEvent: typing.TypeAlias = NfdOfferForSaleEvent | NfdSaleCancelledEvent | NfdPostedOfferEvent | NfdPurchasedEvent | NfdRenewedEvent | NfdAddressLinkedEvent | NfdAddressUnlinkedEvent
+
+# Decoders for each event, by the 4 byte selector that prefixes its logs
+EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], NfdInstanceEvent]] = {
+    NfdOfferForSaleEvent.SELECTOR: NfdOfferForSaleEvent.decode,
+    NfdSaleCancelledEvent.SELECTOR: NfdSaleCancelledEvent.decode,
+    NfdPostedOfferEvent.SELECTOR: NfdPostedOfferEvent.decode,
+    NfdPurchasedEvent.SELECTOR: NfdPurchasedEvent.decode,
+    NfdRenewedEvent.SELECTOR: NfdRenewedEvent.decode,
+    NfdAddressLinkedEvent.SELECTOR: NfdAddressLinkedEvent.decode,
+    NfdAddressUnlinkedEvent.SELECTOR: NfdAddressUnlinkedEvent.decode,
+}
+
+
+def decode_event(log: bytes | str) -> NfdInstanceEvent | None:
+    """Decode an event from a log, which is base64 encoded if a str, or None if the log isn't one of the events"""
+    data = base64.b64decode(log) if isinstance(log, str) else log
+    decoder = EVENT_DECODERS.get(data[:4])
+    return decoder(data[4:]) if decoder else None
+
+
+def decode_events(logs: typing.Iterable[bytes | str]) -> list[NfdInstanceEvent]:
+    """Decode the events from logs, e.g. all the logs of a block, skipping logs that aren't events
+
+    Logs are base64 encoded if a str, as returned by algod and indexer
+    """
+    decoders = EVENT_DECODERS
+    events = []
+    for log in logs:
+        data = base64.b64decode(log) if isinstance(log, str) else log
+        decoder = decoders.get(data[:4])
+        if decoder is not None:
+            events.append(decoder(data[4:]))
+    return events
+
+
+def decode_transaction_events(
+    transactions: typing.Iterable[typing.Mapping[str, typing.Any]], app_id: int | None = None
+) -> list[NfdInstanceEvent]:
+    """Decode the events from the logs of transactions, each followed by those of its inner transactions
+
+    :param transactions: Transactions as returned by indexer, e.g. a page of transactions from a search
+    :param app_id: If set, only decode the events logged by this app
+    """
+    events: list[NfdInstanceEvent] = []
+    pending = list(reversed(list(transactions)))
+    while pending:
+        transaction = pending.pop()
+        logs = transaction.get("logs")
+        app_transaction = transaction.get("application-transaction") or {}
+        # indexer reports an application-id of 0 for app creates, the created app is reported separately
+        logged_by = app_transaction.get("application-id") or transaction.get("created-application-index")
+        if logs and (app_id is None or logged_by == app_id):
+            events.extend(decode_events(logs))
+        pending.extend(reversed(transaction.get("inner-txns") or []))
+    return events
@@ -6,7 +6,10 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import base64
 import dataclasses
+import functools
+import struct
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +67,154 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_GAS_METHOD = _AbiMethod("gas()void", bytes.fromhex("3172ca9d"))
+_MINT_ASA_METHOD = _AbiMethod("mintAsa(string,string)void", bytes.fromhex("06df2e5b"))
+_DELETE_FIELDS_METHOD = _AbiMethod("deleteFields(byte[][])void", bytes.fromhex("5132df75"))
+_UPDATE_SEGMENT_COUNT_METHOD = _AbiMethod("updateSegmentCount(string,uint64)void", bytes.fromhex("0d26c591"))
+_GET_FIELD_UPDATE_COST_METHOD = _AbiMethod("getFieldUpdateCost(byte[][])uint64", bytes.fromhex("7c5ae495"))
+_UPDATE_FIELDS_METHOD = _AbiMethod("updateFields(byte[][])void", bytes.fromhex("78f42711"))
+_READ_FIELD_METHOD = _AbiMethod("readField(byte[])byte[]", bytes.fromhex("6c13ede4"))
+_OFFER_FOR_SALE_METHOD = _AbiMethod("offerForSale(uint64,address)void", bytes.fromhex("5076d9ca"))
+_CANCEL_SALE_METHOD = _AbiMethod("cancelSale()void", bytes.fromhex("99f5d50d"))
+_POST_OFFER_METHOD = _AbiMethod("postOffer(uint64,string)void", bytes.fromhex("913112ef"))
+_MINT_PAYOUT_METHOD = _AbiMethod("mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)", bytes.fromhex("d85337c4"))
+_PURCHASE_METHOD = _AbiMethod("purchase(pay)void", bytes.fromhex("a392ae82"))
+_IS_ADDRESS_IN_FIELD_METHOD = _AbiMethod("isAddressInField(string,address)bool", bytes.fromhex("d443952a"))
+_GET_RENEW_PRICE_METHOD = _AbiMethod("getRenewPrice()uint64", bytes.fromhex("50f490c2"))
+_UPDATE_HASH_METHOD = _AbiMethod("updateHash(byte[])void", bytes.fromhex("762e82da"))
+_CONTRACT_LOCK_METHOD = _AbiMethod("contractLock(bool)void", bytes.fromhex("8ebc2c83"))
+_SEGMENT_LOCK_METHOD = _AbiMethod("segmentLock(bool,uint64)void", bytes.fromhex("cd5358a6"))
+_VAULT_OPT_IN_LOCK_METHOD = _AbiMethod("vaultOptInLock(bool)void", bytes.fromhex("3a657d77"))
+_VAULT_OPT_IN_METHOD = _AbiMethod("vaultOptIn(uint64[])void", bytes.fromhex("413d1523"))
+_VAULT_SEND_METHOD = _AbiMethod("vaultSend(uint64,address,string,uint64,uint64[])void", bytes.fromhex("66821c1a"))
+_RENEW_METHOD = _AbiMethod("renew(pay)void", bytes.fromhex("77fd5b74"))
+_SET_PRIMARY_ADDRESS_METHOD = _AbiMethod("setPrimaryAddress(string,address)void", bytes.fromhex("97b6d86c"))
+_REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD = _AbiMethod("registryAddingVerifiedAddress(string,string)bool", bytes.fromhex("85cced57"))
+_REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD = _AbiMethod("registryRemovingVerifiedAddress(string,address,address)bool", bytes.fromhex("b1890a75"))
+_CREATE_APPLICATION_METHOD = _AbiMethod("createApplication(string,address,address,uint64,uint64,address,uint64,address,uint64,uint64,address)void", bytes.fromhex("0dca52c1"))
+_UPDATE_APPLICATION_METHOD = _AbiMethod("updateApplication(string)void", bytes.fromhex("1747405b"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _GAS_METHOD.signature: _GAS_METHOD,
+    _MINT_ASA_METHOD.signature: _MINT_ASA_METHOD,
+    _DELETE_FIELDS_METHOD.signature: _DELETE_FIELDS_METHOD,
+    _UPDATE_SEGMENT_COUNT_METHOD.signature: _UPDATE_SEGMENT_COUNT_METHOD,
+    _GET_FIELD_UPDATE_COST_METHOD.signature: _GET_FIELD_UPDATE_COST_METHOD,
+    _UPDATE_FIELDS_METHOD.signature: _UPDATE_FIELDS_METHOD,
+    _READ_FIELD_METHOD.signature: _READ_FIELD_METHOD,
+    _OFFER_FOR_SALE_METHOD.signature: _OFFER_FOR_SALE_METHOD,
+    _CANCEL_SALE_METHOD.signature: _CANCEL_SALE_METHOD,
+    _POST_OFFER_METHOD.signature: _POST_OFFER_METHOD,
+    _MINT_PAYOUT_METHOD.signature: _MINT_PAYOUT_METHOD,
+    _PURCHASE_METHOD.signature: _PURCHASE_METHOD,
+    _IS_ADDRESS_IN_FIELD_METHOD.signature: _IS_ADDRESS_IN_FIELD_METHOD,
+    _GET_RENEW_PRICE_METHOD.signature: _GET_RENEW_PRICE_METHOD,
+    _UPDATE_HASH_METHOD.signature: _UPDATE_HASH_METHOD,
+    _CONTRACT_LOCK_METHOD.signature: _CONTRACT_LOCK_METHOD,
+    _SEGMENT_LOCK_METHOD.signature: _SEGMENT_LOCK_METHOD,
+    _VAULT_OPT_IN_LOCK_METHOD.signature: _VAULT_OPT_IN_LOCK_METHOD,
+    _VAULT_OPT_IN_METHOD.signature: _VAULT_OPT_IN_METHOD,
+    _VAULT_SEND_METHOD.signature: _VAULT_SEND_METHOD,
+    _RENEW_METHOD.signature: _RENEW_METHOD,
+    _SET_PRIMARY_ADDRESS_METHOD.signature: _SET_PRIMARY_ADDRESS_METHOD,
+    _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD.signature: _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+    _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD.signature: _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+    _CREATE_APPLICATION_METHOD.signature: _CREATE_APPLICATION_METHOD,
+    _UPDATE_APPLICATION_METHOD.signature: _UPDATE_APPLICATION_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class PayoutInfo:
     """Struct for PayoutInfo"""
@@ -317,10 +468,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def mint_asa(
         self,
@@ -329,11 +484,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def delete_fields(
         self,
@@ -342,11 +500,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_segment_count(
         self,
@@ -355,11 +516,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_field_update_cost(
         self,
@@ -368,11 +532,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_FIELD_UPDATE_COST_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_fields(
         self,
@@ -381,11 +548,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def read_field(
         self,
@@ -394,11 +564,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _READ_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def offer_for_sale(
         self,
@@ -407,11 +580,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def cancel_sale(
         self,
@@ -419,10 +595,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def post_offer(
         self,
@@ -431,11 +611,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def mint_payout(
         self,
@@ -444,11 +627,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def purchase(
         self,
@@ -457,11 +643,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def is_address_in_field(
         self,
@@ -470,11 +659,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _IS_ADDRESS_IN_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_renew_price(
         self,
@@ -482,10 +674,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_RENEW_PRICE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def update_hash(
         self,
@@ -494,11 +690,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def contract_lock(
         self,
@@ -507,11 +706,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def segment_lock(
         self,
@@ -520,11 +722,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_opt_in_lock(
         self,
@@ -533,11 +738,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_opt_in(
         self,
@@ -546,11 +754,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def vault_send(
         self,
@@ -559,11 +770,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def renew(
         self,
@@ -572,11 +786,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_primary_address(
         self,
@@ -585,11 +802,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def registry_adding_verified_address(
         self,
@@ -598,11 +818,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def registry_removing_verified_address(
         self,
@@ -611,11 +834,14 @@ class NfdInstanceParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -638,10 +864,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def mint_asa(
         self,
@@ -650,11 +881,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def delete_fields(
         self,
@@ -663,11 +898,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_segment_count(
         self,
@@ -676,11 +915,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_field_update_cost(
         self,
@@ -689,11 +932,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_FIELD_UPDATE_COST_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_fields(
         self,
@@ -702,11 +949,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def read_field(
         self,
@@ -715,11 +966,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _READ_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def offer_for_sale(
         self,
@@ -728,11 +983,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def cancel_sale(
         self,
@@ -740,10 +999,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def post_offer(
         self,
@@ -752,11 +1016,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def mint_payout(
         self,
@@ -765,11 +1033,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def purchase(
         self,
@@ -778,11 +1050,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def is_address_in_field(
         self,
@@ -791,11 +1067,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _IS_ADDRESS_IN_FIELD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_renew_price(
         self,
@@ -803,10 +1083,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_RENEW_PRICE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def update_hash(
         self,
@@ -815,11 +1100,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def contract_lock(
         self,
@@ -828,11 +1117,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def segment_lock(
         self,
@@ -841,11 +1134,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_opt_in_lock(
         self,
@@ -854,11 +1151,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_opt_in(
         self,
@@ -867,11 +1168,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def vault_send(
         self,
@@ -880,11 +1185,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def renew(
         self,
@@ -893,11 +1202,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_primary_address(
         self,
@@ -906,11 +1219,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def registry_adding_verified_address(
         self,
@@ -919,11 +1236,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def registry_removing_verified_address(
         self,
@@ -932,11 +1253,15 @@ class NfdInstanceCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -960,10 +1285,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _GAS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -975,11 +1305,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintAsa(string,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_ASA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _MINT_ASA_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -991,11 +1325,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "deleteFields(byte[][])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _DELETE_FIELDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1007,11 +1345,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateSegmentCount(string,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_SEGMENT_COUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _UPDATE_SEGMENT_COUNT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1025,7 +1367,7 @@ class NfdInstanceSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getFieldUpdateCost(byte[][])uint64",
+            "method": _GET_FIELD_UPDATE_COST_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1039,11 +1381,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateFields(byte[][])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_FIELDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _UPDATE_FIELDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1057,7 +1403,7 @@ class NfdInstanceSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "readField(byte[])byte[]",
+            "method": _READ_FIELD_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1071,11 +1417,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "offerForSale(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OFFER_FOR_SALE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _OFFER_FOR_SALE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1086,10 +1436,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "cancelSale()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CANCEL_SALE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CANCEL_SALE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1101,11 +1456,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "postOffer(uint64,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _POST_OFFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _POST_OFFER_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1117,12 +1476,16 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[PayoutInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PayoutInfo, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _MINT_PAYOUT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _MINT_PAYOUT_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PayoutInfo, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[PayoutInfo], parsed_response)
 
     def purchase(
@@ -1133,11 +1496,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "purchase(pay)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _PURCHASE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _PURCHASE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1151,7 +1518,7 @@ class NfdInstanceSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "isAddressInField(string,address)bool",
+            "method": _IS_ADDRESS_IN_FIELD_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1166,7 +1533,7 @@ class NfdInstanceSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getRenewPrice()uint64",
+            "method": _GET_RENEW_PRICE_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
@@ -1179,11 +1546,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "updateHash(byte[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _UPDATE_HASH_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _UPDATE_HASH_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1195,11 +1566,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "contractLock(bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CONTRACT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CONTRACT_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1211,11 +1586,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "segmentLock(bool,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SEGMENT_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SEGMENT_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1227,11 +1606,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptInLock(bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_LOCK_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _VAULT_OPT_IN_LOCK_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1243,11 +1626,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultOptIn(uint64[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_OPT_IN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _VAULT_OPT_IN_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1259,11 +1646,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "vaultSend(uint64,address,string,uint64,uint64[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _VAULT_SEND_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _VAULT_SEND_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1275,11 +1666,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "renew(pay)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _RENEW_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _RENEW_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1291,11 +1686,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setPrimaryAddress(string,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_PRIMARY_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_PRIMARY_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1307,11 +1706,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryAddingVerifiedAddress(string,string)bool",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _REGISTRY_ADDING_VERIFIED_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1323,11 +1726,15 @@ class NfdInstanceSend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "registryRemovingVerifiedAddress(string,address,address)bool",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _REGISTRY_REMOVING_VERIFIED_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1391,7 +1798,7 @@ class _GlobalState:
         return _MapState(
             self.app_client.state.global_state,
             "globalState",
-            None
+            None,
         )
 
 class _BoxState:
@@ -1423,7 +1830,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "boxes",
-            None
+            None,
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1776,7 +2183,8 @@ class NfdInstanceClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -1802,16 +2210,15 @@ class NfdInstanceComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.gas(
-                
-                params=params,
-            )
+        call_params = self.client.params.gas(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "gas()void", v
-            )
+            ),
         )
         return self
 
@@ -1820,16 +2227,15 @@ class NfdInstanceComposer:
         args: tuple[str, str] | MintAsaArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.mint_asa(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.mint_asa(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "mintAsa(string,string)void", v
-            )
+            ),
         )
         return self
 
@@ -1838,16 +2244,15 @@ class NfdInstanceComposer:
         args: tuple[list[bytes | str]] | DeleteFieldsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.delete_fields(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.delete_fields(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "deleteFields(byte[][])void", v
-            )
+            ),
         )
         return self
 
@@ -1856,16 +2261,15 @@ class NfdInstanceComposer:
         args: tuple[str, int] | UpdateSegmentCountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_segment_count(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_segment_count(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "updateSegmentCount(string,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -1874,16 +2278,15 @@ class NfdInstanceComposer:
         args: tuple[list[bytes | str]] | GetFieldUpdateCostArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_field_update_cost(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_field_update_cost(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getFieldUpdateCost(byte[][])uint64", v
-            )
+            ),
         )
         return self
 
@@ -1892,16 +2295,15 @@ class NfdInstanceComposer:
         args: tuple[list[bytes | str]] | UpdateFieldsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_fields(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_fields(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "updateFields(byte[][])void", v
-            )
+            ),
         )
         return self
 
@@ -1910,16 +2312,15 @@ class NfdInstanceComposer:
         args: tuple[bytes | str] | ReadFieldArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.read_field(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.read_field(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "readField(byte[])byte[]", v
-            )
+            ),
         )
         return self
 
@@ -1928,16 +2329,15 @@ class NfdInstanceComposer:
         args: tuple[int, str] | OfferForSaleArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.offer_for_sale(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.offer_for_sale(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "offerForSale(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -1945,16 +2345,15 @@ class NfdInstanceComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.cancel_sale(
-                
-                params=params,
-            )
+        call_params = self.client.params.cancel_sale(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "cancelSale()void", v
-            )
+            ),
         )
         return self
 
@@ -1963,16 +2362,15 @@ class NfdInstanceComposer:
         args: tuple[int, str] | PostOfferArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.post_offer(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.post_offer(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "postOffer(uint64,string)void", v
-            )
+            ),
         )
         return self
 
@@ -1981,16 +2379,15 @@ class NfdInstanceComposer:
         args: tuple[int, int] | MintPayoutArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.mint_payout(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.mint_payout(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "mintPayout(uint64,uint64)(uint64,address,uint64,address,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -1999,16 +2396,15 @@ class NfdInstanceComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | PurchaseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.purchase(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.purchase(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "purchase(pay)void", v
-            )
+            ),
         )
         return self
 
@@ -2017,16 +2413,15 @@ class NfdInstanceComposer:
         args: tuple[str, str] | IsAddressInFieldArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.is_address_in_field(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.is_address_in_field(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "isAddressInField(string,address)bool", v
-            )
+            ),
         )
         return self
 
@@ -2034,16 +2429,15 @@ class NfdInstanceComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_renew_price(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_renew_price(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getRenewPrice()uint64", v
-            )
+            ),
         )
         return self
 
@@ -2052,16 +2446,15 @@ class NfdInstanceComposer:
         args: tuple[bytes | str] | UpdateHashArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.update_hash(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.update_hash(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "updateHash(byte[])void", v
-            )
+            ),
         )
         return self
 
@@ -2070,16 +2463,15 @@ class NfdInstanceComposer:
         args: tuple[bool] | ContractLockArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.contract_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.contract_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "contractLock(bool)void", v
-            )
+            ),
         )
         return self
 
@@ -2088,16 +2480,15 @@ class NfdInstanceComposer:
         args: tuple[bool, int] | SegmentLockArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.segment_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.segment_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "segmentLock(bool,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2106,16 +2497,15 @@ class NfdInstanceComposer:
         args: tuple[bool] | VaultOptInLockArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_opt_in_lock(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_opt_in_lock(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "vaultOptInLock(bool)void", v
-            )
+            ),
         )
         return self
 
@@ -2124,16 +2514,15 @@ class NfdInstanceComposer:
         args: tuple[list[int]] | VaultOptInArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_opt_in(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_opt_in(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "vaultOptIn(uint64[])void", v
-            )
+            ),
         )
         return self
 
@@ -2142,16 +2531,15 @@ class NfdInstanceComposer:
         args: tuple[int, str, str, int, list[int]] | VaultSendArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.vault_send(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.vault_send(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "vaultSend(uint64,address,string,uint64,uint64[])void", v
-            )
+            ),
         )
         return self
 
@@ -2160,16 +2548,15 @@ class NfdInstanceComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument] | RenewArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.renew(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.renew(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "renew(pay)void", v
-            )
+            ),
         )
         return self
 
@@ -2178,16 +2565,15 @@ class NfdInstanceComposer:
         args: tuple[str, str] | SetPrimaryAddressArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_primary_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_primary_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "setPrimaryAddress(string,address)void", v
-            )
+            ),
         )
         return self
 
@@ -2196,16 +2582,15 @@ class NfdInstanceComposer:
         args: tuple[str, str] | RegistryAddingVerifiedAddressArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.registry_adding_verified_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.registry_adding_verified_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "registryAddingVerifiedAddress(string,string)bool", v
-            )
+            ),
         )
         return self
 
@@ -2214,16 +2599,15 @@ class NfdInstanceComposer:
         args: tuple[str, str, str] | RegistryRemovingVerifiedAddressArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.registry_removing_verified_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.registry_removing_verified_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "registryRemovingVerifiedAddress(string,address,address)bool", v
-            )
+            ),
         )
         return self
 
@@ -2234,22 +2618,21 @@ class NfdInstanceComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "NfdInstanceComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "NfdInstanceComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -2265,7 +2648,7 @@ class NfdInstanceComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -2279,4 +2662,260 @@ class NfdInstanceComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdOfferForSaleEvent:
+    """ARC-28 event nfd_offerForSale(uint64,string,address,uint64,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("c24b5ad6")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32sQ32s")
+
+    app_id: int
+    name: str
+    seller: str
+    amount: int
+    reserved_for: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdOfferForSaleEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            values[3],
+            _encode_address(values[4]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdSaleCancelledEvent:
+    """ARC-28 event nfd_saleCancelled(uint64,string)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("4365ed90")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH")
+
+    app_id: int
+    name: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdSaleCancelledEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdPostedOfferEvent:
+    """ARC-28 event nfd_postedOffer(uint64,string,address,uint64,string)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("52532b70")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32sQH")
+
+    app_id: int
+    name: str
+    sender: str
+    amount: int
+    note: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdPostedOfferEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            values[3],
+            _decode_abi_bytes(data, values[4]).decode("utf-8"),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdPurchasedEvent:
+    """ARC-28 event nfd_purchased(uint64,string,address,address,uint64,uint64,uint64,address,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("78dc89e3")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s32sQQQ32sQ")
+
+    app_id: int
+    name: str
+    seller: str
+    buyer: str
+    sell_amount: int
+    offer_amount: int
+    overpayment_refund: int
+    conv_fee_addr: str
+    conv_fee_amount: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdPurchasedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+            _encode_address(values[7]),
+            values[8],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdRenewedEvent:
+    """ARC-28 event nfd_renewed(uint64,string,address,address,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("14a76a3e")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s32sQQQ")
+
+    app_id: int
+    name: str
+    orig_owner: str
+    buyer: str
+    price_one_year: int
+    renew_amount: int
+    exp_time: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdRenewedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdAddressLinkedEvent:
+    """ARC-28 event nfd_addressLinked(uint64,string,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("cf9d1e24")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s")
+
+    app_id: int
+    name: str
+    address: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdAddressLinkedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class NfdAddressUnlinkedEvent:
+    """ARC-28 event nfd_addressUnlinked(uint64,string,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("a4d3b9a7")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QH32s")
+
+    app_id: int
+    name: str
+    address: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "NfdAddressUnlinkedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _decode_abi_bytes(data, values[1]).decode("utf-8"),
+            _encode_address(values[2]),
+        )
+
+
+# Encoding an address hashes it, and the same addresses are usually logged many times, e.g. by a busy account
+_encode_address = functools.lru_cache(maxsize=4096)(algosdk.encoding.encode_address)
+
+
+def _decode_abi_bytes(data: bytes, offset: int) -> bytes:
+    """Decode a dynamic byte array or string at offset in data"""
+    return data[offset + 2 : offset + 2 + int.from_bytes(data[offset : offset + 2], "big")]
+
+
+NfdInstanceEvent: typing.TypeAlias = NfdOfferForSaleEvent | NfdSaleCancelledEvent | NfdPostedOfferEvent | NfdPurchasedEvent | NfdRenewedEvent | NfdAddressLinkedEvent | NfdAddressUnlinkedEvent
+
+# Decoders for each event, by the 4 byte selector that prefixes its logs
+EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], NfdInstanceEvent]] = {
+    NfdOfferForSaleEvent.SELECTOR: NfdOfferForSaleEvent.decode,
+    NfdSaleCancelledEvent.SELECTOR: NfdSaleCancelledEvent.decode,
+    NfdPostedOfferEvent.SELECTOR: NfdPostedOfferEvent.decode,
+    NfdPurchasedEvent.SELECTOR: NfdPurchasedEvent.decode,
+    NfdRenewedEvent.SELECTOR: NfdRenewedEvent.decode,
+    NfdAddressLinkedEvent.SELECTOR: NfdAddressLinkedEvent.decode,
+    NfdAddressUnlinkedEvent.SELECTOR: NfdAddressUnlinkedEvent.decode,
+}
+
+
+def decode_event(log: bytes | str) -> NfdInstanceEvent | None:
+    """Decode an event from a log, which is base64 encoded if a str, or None if the log isn't one of the events"""
+    data = base64.b64decode(log) if isinstance(log, str) else log
+    decoder = EVENT_DECODERS.get(data[:4])
+    return decoder(data[4:]) if decoder else None
+
+
+def decode_events(logs: typing.Iterable[bytes | str]) -> list[NfdInstanceEvent]:
+    """Decode the events from logs, e.g. all the logs of a block, skipping logs that aren't events
+
+    Logs are base64 encoded if a str, as returned by algod and indexer
+    """
+    decoders = EVENT_DECODERS
+    events = []
+    for log in logs:
+        data = base64.b64decode(log) if isinstance(log, str) else log
+        decoder = decoders.get(data[:4])
+        if decoder is not None:
+            events.append(decoder(data[4:]))
+    return events
+
+
+def decode_transaction_events(
+    transactions: typing.Iterable[typing.Mapping[str, typing.Any]], app_id: int | None = None
+) -> list[NfdInstanceEvent]:
+    """Decode the events from the logs of transactions, each followed by those of its inner transactions
+
+    :param transactions: Transactions as returned by indexer, e.g. a page of transactions from a search
+    :param app_id: If set, only decode the events logged by this app
+    """
+    events: list[NfdInstanceEvent] = []
+    pending = list(reversed(list(transactions)))
+    while pending:
+        transaction = pending.pop()
+        logs = transaction.get("logs")
+        app_transaction = transaction.get("application-transaction") or {}
+        # indexer reports an application-id of 0 for app creates, the created app is reported separately
+        logged_by = app_transaction.get("application-id") or transaction.get("created-application-index")
+        if logs and (app_id is None or logged_by == app_id):
+            events.extend(decode_events(logs))
+        pending.extend(reversed(transaction.get("inner-txns") or []))
+    return events
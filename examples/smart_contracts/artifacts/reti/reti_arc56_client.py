@@ -6,7 +6,16 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import array
+import base64
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import importlib
+import struct
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +73,449 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_INIT_STAKING_CONTRACT_METHOD = _AbiMethod("initStakingContract(uint64)void", bytes.fromhex("1b5e82c6"))
+_LOAD_STAKING_CONTRACT_DATA_METHOD = _AbiMethod("loadStakingContractData(uint64,byte[])void", bytes.fromhex("79472d83"))
+_FINALIZE_STAKING_CONTRACT_METHOD = _AbiMethod("finalizeStakingContract()void", bytes.fromhex("5f7acfd9"))
+_GAS_METHOD = _AbiMethod("gas()void", bytes.fromhex("3172ca9d"))
+_GET_MBR_AMOUNTS_METHOD = _AbiMethod("getMbrAmounts()(uint64,uint64,uint64,uint64)", bytes.fromhex("8a87142d"))
+_GET_PROTOCOL_CONSTRAINTS_METHOD = _AbiMethod("getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)", bytes.fromhex("d1366cc3"))
+_GET_NUM_VALIDATORS_METHOD = _AbiMethod("getNumValidators()uint64", bytes.fromhex("3b045c5c"))
+_GET_VALIDATOR_CONFIG_METHOD = _AbiMethod("getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)", bytes.fromhex("75aff61d"))
+_GET_VALIDATOR_STATE_METHOD = _AbiMethod("getValidatorState(uint64)(uint16,uint64,uint64,uint64)", bytes.fromhex("1f2f0109"))
+_GET_VALIDATOR_OWNER_AND_MANAGER_METHOD = _AbiMethod("getValidatorOwnerAndManager(uint64)(address,address)", bytes.fromhex("2fa22c4b"))
+_GET_POOLS_METHOD = _AbiMethod("getPools(uint64)(uint64,uint16,uint64)[]", bytes.fromhex("910e94ac"))
+_GET_POOL_APP_ID_METHOD = _AbiMethod("getPoolAppId(uint64,uint64)uint64", bytes.fromhex("572767d1"))
+_GET_POOL_INFO_METHOD = _AbiMethod("getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)", bytes.fromhex("9b504aaf"))
+_GET_CUR_MAX_STAKE_PER_POOL_METHOD = _AbiMethod("getCurMaxStakePerPool(uint64)uint64", bytes.fromhex("fbc63178"))
+_DOES_STAKER_NEED_TO_PAY_MBR_METHOD = _AbiMethod("doesStakerNeedToPayMBR(address)bool", bytes.fromhex("24498cf4"))
+_GET_STAKED_POOLS_FOR_ACCOUNT_METHOD = _AbiMethod("getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]", bytes.fromhex("f846dd7a"))
+_GET_TOKEN_PAYOUT_RATIO_METHOD = _AbiMethod("getTokenPayoutRatio(uint64)(uint64[24],uint64)", bytes.fromhex("83050501"))
+_GET_NODE_POOL_ASSIGNMENTS_METHOD = _AbiMethod("getNodePoolAssignments(uint64)((uint64[3])[8])", bytes.fromhex("7bbb6c8d"))
+_GET_NFD_REGISTRY_ID_METHOD = _AbiMethod("getNFDRegistryID()uint64", bytes.fromhex("f839414a"))
+_ADD_VALIDATOR_METHOD = _AbiMethod("addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64", bytes.fromhex("0c317cfb"))
+_CHANGE_VALIDATOR_MANAGER_METHOD = _AbiMethod("changeValidatorManager(uint64,address)void", bytes.fromhex("3e288972"))
+_CHANGE_VALIDATOR_SUNSET_INFO_METHOD = _AbiMethod("changeValidatorSunsetInfo(uint64,uint64,uint64)void", bytes.fromhex("dd5faada"))
+_CHANGE_VALIDATOR_NFD_METHOD = _AbiMethod("changeValidatorNFD(uint64,uint64,string)void", bytes.fromhex("18aac7a7"))
+_CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD = _AbiMethod("changeValidatorCommissionAddress(uint64,address)void", bytes.fromhex("f99ef54d"))
+_CHANGE_VALIDATOR_REWARD_INFO_METHOD = _AbiMethod("changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void", bytes.fromhex("10809d4d"))
+_ADD_POOL_METHOD = _AbiMethod("addPool(pay,uint64,uint64)(uint64,uint64,uint64)", bytes.fromhex("e778dd5a"))
+_ADD_STAKE_METHOD = _AbiMethod("addStake(pay,uint64,uint64)(uint64,uint64,uint64)", bytes.fromhex("bf5259d0"))
+_SET_TOKEN_PAYOUT_RATIO_METHOD = _AbiMethod("setTokenPayoutRatio(uint64)(uint64[24],uint64)", bytes.fromhex("4df8d86e"))
+_STAKE_UPDATED_VIA_REWARDS_METHOD = _AbiMethod("stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void", bytes.fromhex("418fcefc"))
+_STAKE_REMOVED_METHOD = _AbiMethod("stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void", bytes.fromhex("a2dc51b5"))
+_FIND_POOL_FOR_STAKER_METHOD = _AbiMethod("findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)", bytes.fromhex("2873f504"))
+_MOVE_POOL_TO_NODE_METHOD = _AbiMethod("movePoolToNode(uint64,uint64,uint64)void", bytes.fromhex("0547f4fe"))
+_EMPTY_TOKEN_REWARDS_METHOD = _AbiMethod("emptyTokenRewards(uint64,address)uint64", bytes.fromhex("cb668358"))
+_CREATE_APPLICATION_METHOD = _AbiMethod("createApplication()void", bytes.fromhex("b8447b36"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _INIT_STAKING_CONTRACT_METHOD.signature: _INIT_STAKING_CONTRACT_METHOD,
+    _LOAD_STAKING_CONTRACT_DATA_METHOD.signature: _LOAD_STAKING_CONTRACT_DATA_METHOD,
+    _FINALIZE_STAKING_CONTRACT_METHOD.signature: _FINALIZE_STAKING_CONTRACT_METHOD,
+    _GAS_METHOD.signature: _GAS_METHOD,
+    _GET_MBR_AMOUNTS_METHOD.signature: _GET_MBR_AMOUNTS_METHOD,
+    _GET_PROTOCOL_CONSTRAINTS_METHOD.signature: _GET_PROTOCOL_CONSTRAINTS_METHOD,
+    _GET_NUM_VALIDATORS_METHOD.signature: _GET_NUM_VALIDATORS_METHOD,
+    _GET_VALIDATOR_CONFIG_METHOD.signature: _GET_VALIDATOR_CONFIG_METHOD,
+    _GET_VALIDATOR_STATE_METHOD.signature: _GET_VALIDATOR_STATE_METHOD,
+    _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD.signature: _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+    _GET_POOLS_METHOD.signature: _GET_POOLS_METHOD,
+    _GET_POOL_APP_ID_METHOD.signature: _GET_POOL_APP_ID_METHOD,
+    _GET_POOL_INFO_METHOD.signature: _GET_POOL_INFO_METHOD,
+    _GET_CUR_MAX_STAKE_PER_POOL_METHOD.signature: _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+    _DOES_STAKER_NEED_TO_PAY_MBR_METHOD.signature: _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+    _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD.signature: _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+    _GET_TOKEN_PAYOUT_RATIO_METHOD.signature: _GET_TOKEN_PAYOUT_RATIO_METHOD,
+    _GET_NODE_POOL_ASSIGNMENTS_METHOD.signature: _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+    _GET_NFD_REGISTRY_ID_METHOD.signature: _GET_NFD_REGISTRY_ID_METHOD,
+    _ADD_VALIDATOR_METHOD.signature: _ADD_VALIDATOR_METHOD,
+    _CHANGE_VALIDATOR_MANAGER_METHOD.signature: _CHANGE_VALIDATOR_MANAGER_METHOD,
+    _CHANGE_VALIDATOR_SUNSET_INFO_METHOD.signature: _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+    _CHANGE_VALIDATOR_NFD_METHOD.signature: _CHANGE_VALIDATOR_NFD_METHOD,
+    _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD.signature: _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+    _CHANGE_VALIDATOR_REWARD_INFO_METHOD.signature: _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+    _ADD_POOL_METHOD.signature: _ADD_POOL_METHOD,
+    _ADD_STAKE_METHOD.signature: _ADD_STAKE_METHOD,
+    _SET_TOKEN_PAYOUT_RATIO_METHOD.signature: _SET_TOKEN_PAYOUT_RATIO_METHOD,
+    _STAKE_UPDATED_VIA_REWARDS_METHOD.signature: _STAKE_UPDATED_VIA_REWARDS_METHOD,
+    _STAKE_REMOVED_METHOD.signature: _STAKE_REMOVED_METHOD,
+    _FIND_POOL_FOR_STAKER_METHOD.signature: _FIND_POOL_FOR_STAKER_METHOD,
+    _MOVE_POOL_TO_NODE_METHOD.signature: _MOVE_POOL_TO_NODE_METHOD,
+    _EMPTY_TOKEN_REWARDS_METHOD.signature: _EMPTY_TOKEN_REWARDS_METHOD,
+    _CREATE_APPLICATION_METHOD.signature: _CREATE_APPLICATION_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `ValidatorRegistryFactory(..., cache=cache)`
+    and `ValidatorRegistryClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_T = typing.TypeVar("_T")
+
+
+class ReadonlyCallCache:
+    """Caches the results of read-only method calls for a round
+
+    Read-only methods are simulated, so need no signing or fees, but still call algod. Set `round` whenever a new
+    round is seen, e.g. by a block subscriber, so repeated calls within the round are answered from the cache.
+    Results are keyed by method signature, ABI encoded args, sender and round, are only cached while `round` is set
+    and are dropped when it changes. Cached results are shared by every call that hits them, so shouldn't be
+    modified. Use with `client.send.readonly_cache = ReadonlyCallCache()`.
+    """
+
+    def __init__(self, round: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._round = round
+        self._results: dict[tuple[object, ...], object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def round(self) -> int | None:
+        return self._round
+
+    @round.setter
+    def round(self, value: int | None) -> None:
+        with self._lock:
+            if value != self._round:
+                self._results.clear()
+                self._round = value
+
+    def get_or_send(
+        self, method: _AbiMethod, args: list[object] | None, sender: str | None, send: typing.Callable[[], _T]
+    ) -> _T:
+        """Get the cached result of a call for the current round, or send it and cache the result"""
+        current_round = self._round
+        encoded_args = self._encode_args(method, args) if current_round is not None else None
+        if encoded_args is None:
+            return send()
+        key = (method.signature, encoded_args, sender, current_round)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return typing.cast(_T, self._results[key])
+            self.misses += 1
+        result = send()
+        with self._lock:
+            if self._round == current_round:
+                self._results[key] = result
+        return result
+
+    def _encode_args(self, method: _AbiMethod, args: list[object] | None) -> tuple[bytes, ...] | None:
+        # None if the args can't be part of a key, e.g. transactions, so the call isn't cached
+        encoded_args = []
+        try:
+            for arg_type, value in zip(method.arg_types, args or [], strict=False):
+                if isinstance(arg_type, algosdk.abi.ABIType):
+                    encoded_args.append(arg_type.encode(value))
+                elif isinstance(value, int | str):  # reference types, e.g. an account or asset
+                    encoded_args.append(repr(value).encode())
+                else:
+                    return None
+        except Exception:
+            return None
+        return tuple(encoded_args)
+
+
+# Used when no cache is set, as a cache without a round sends every call
+_NO_READONLY_CACHE = ReadonlyCallCache()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
+
+
+def _fetch_many(
+    keys: typing.Iterable[_KeyT],
+    fetch: typing.Callable[[_KeyT], _ValueT | None],
+    concurrency: int,
+    progress: typing.Callable[[int, int], None] | None,
+) -> dict[_KeyT, _ValueT]:
+    """Fetch the value for each key concurrently, omitting None values, in the order of `keys`"""
+    unique_keys = list(dict.fromkeys(keys))
+    results: dict[_KeyT, _ValueT | None] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {executor.submit(fetch, key): key for key in unique_keys}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(unique_keys))
+    finally:
+        # on failure, the keys that haven't been fetched yet are abandoned rather than waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {key: value for key in unique_keys if (value := results[key]) is not None}
+
+
+# The name of each column, the path to its value in each row, and its array typecode if it has a fixed size type
+_ColumnSpec = tuple[tuple[str, tuple[str, ...], str | None], ...]
+
+
+def _to_columns(rows: typing.Iterable[object], columns: _ColumnSpec) -> dict[str, typing.Any]:
+    """Collect the values of each column from rows, without keeping the rows
+
+    Columns with a typecode are `array.array`s, or NumPy arrays sharing their memory if NumPy is installed, unless
+    they have values that don't fit the typecode, and other columns are lists.
+    """
+    values: list[typing.Any] = [array.array(typecode) if typecode else [] for _, _, typecode in columns]
+    for row in rows:
+        for index, (_, path, _) in enumerate(columns):
+            value = row
+            for part in path:
+                if value is None:  # a struct key that isn't set has no fields
+                    break
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            try:
+                values[index].append(value)
+            except (TypeError, OverflowError):  # e.g. a key that isn't set, so the column can't be a typed array
+                values[index] = [*values[index], value]
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError:
+        return dict(zip((name for name, _, _ in columns), values, strict=True))
+    dtypes = {"Q": numpy.uint64, "B": numpy.bool_}
+    return {
+        name: numpy.frombuffer(column, dtype=dtypes[column.typecode]) if isinstance(column, array.array) else column
+        for (name, _, _), column in zip(columns, values, strict=True)
+    }
+
 @dataclasses.dataclass(frozen=True)
 class Constraints:
     """Struct for Constraints"""
@@ -480,11 +932,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def load_staking_contract_data(
         self,
@@ -493,11 +948,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def finalize_staking_contract(
         self,
@@ -505,10 +963,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def gas(
         self,
@@ -516,10 +978,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_mbr_amounts(
         self,
@@ -527,10 +993,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_MBR_AMOUNTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_protocol_constraints(
         self,
@@ -538,10 +1008,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_PROTOCOL_CONSTRAINTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_num_validators(
         self,
@@ -549,10 +1023,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NUM_VALIDATORS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_config(
         self,
@@ -561,11 +1039,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_state(
         self,
@@ -574,11 +1055,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_owner_and_manager(
         self,
@@ -587,11 +1071,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pools(
         self,
@@ -600,11 +1087,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOLS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pool_app_id(
         self,
@@ -613,11 +1103,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOL_APP_ID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pool_info(
         self,
@@ -626,11 +1119,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOL_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_cur_max_stake_per_pool(
         self,
@@ -639,11 +1135,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def does_staker_need_to_pay_mbr(
         self,
@@ -652,11 +1151,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_staked_pools_for_account(
         self,
@@ -665,11 +1167,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_token_payout_ratio(
         self,
@@ -678,11 +1183,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_node_pool_assignments(
         self,
@@ -691,11 +1199,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_nfd_registry_id(
         self,
@@ -703,10 +1214,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NFD_REGISTRY_ID_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_validator(
         self,
@@ -715,11 +1230,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_manager(
         self,
@@ -728,11 +1246,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_sunset_info(
         self,
@@ -741,11 +1262,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_nfd(
         self,
@@ -754,11 +1278,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_commission_address(
         self,
@@ -767,11 +1294,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_reward_info(
         self,
@@ -780,11 +1310,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_pool(
         self,
@@ -793,11 +1326,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_stake(
         self,
@@ -806,11 +1342,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_token_payout_ratio(
         self,
@@ -819,11 +1358,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def stake_updated_via_rewards(
         self,
@@ -832,11 +1374,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def stake_removed(
         self,
@@ -845,11 +1390,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def find_pool_for_staker(
         self,
@@ -858,11 +1406,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _FIND_POOL_FOR_STAKER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def move_pool_to_node(
         self,
@@ -871,11 +1422,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def empty_token_rewards(
         self,
@@ -884,11 +1438,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def create_application(
         self,
@@ -896,10 +1453,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -913,8 +1474,9 @@ class ValidatorRegistryParams:
 
 
 class ValidatorRegistryCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def init_staking_contract(
         self,
@@ -923,11 +1485,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def load_staking_contract_data(
         self,
@@ -936,11 +1504,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def finalize_staking_contract(
         self,
@@ -948,10 +1522,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def gas(
         self,
@@ -959,10 +1540,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_mbr_amounts(
         self,
@@ -970,10 +1558,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_MBR_AMOUNTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_protocol_constraints(
         self,
@@ -981,10 +1576,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_PROTOCOL_CONSTRAINTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_num_validators(
         self,
@@ -992,10 +1594,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NUM_VALIDATORS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_config(
         self,
@@ -1004,11 +1613,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_state(
         self,
@@ -1017,11 +1632,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_owner_and_manager(
         self,
@@ -1030,11 +1651,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pools(
         self,
@@ -1043,11 +1670,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOLS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pool_app_id(
         self,
@@ -1056,11 +1689,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOL_APP_ID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pool_info(
         self,
@@ -1069,11 +1708,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOL_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_cur_max_stake_per_pool(
         self,
@@ -1082,11 +1727,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def does_staker_need_to_pay_mbr(
         self,
@@ -1095,11 +1746,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_staked_pools_for_account(
         self,
@@ -1108,11 +1765,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_token_payout_ratio(
         self,
@@ -1121,11 +1784,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_node_pool_assignments(
         self,
@@ -1134,11 +1803,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_nfd_registry_id(
         self,
@@ -1146,10 +1821,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NFD_REGISTRY_ID_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_validator(
         self,
@@ -1158,11 +1840,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_manager(
         self,
@@ -1171,11 +1859,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_sunset_info(
         self,
@@ -1184,11 +1878,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_nfd(
         self,
@@ -1197,11 +1897,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_commission_address(
         self,
@@ -1210,11 +1916,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_reward_info(
         self,
@@ -1223,11 +1935,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_pool(
         self,
@@ -1236,11 +1954,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_stake(
         self,
@@ -1249,11 +1973,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_token_payout_ratio(
         self,
@@ -1262,11 +1992,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def stake_updated_via_rewards(
         self,
@@ -1275,11 +2011,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def stake_removed(
         self,
@@ -1288,11 +2030,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def find_pool_for_staker(
         self,
@@ -1301,11 +2049,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _FIND_POOL_FOR_STAKER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def move_pool_to_node(
         self,
@@ -1314,11 +2068,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def empty_token_rewards(
         self,
@@ -1327,11 +2087,17 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def create_application(
         self,
@@ -1339,16 +2105,25 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -1356,8 +2131,11 @@ class ValidatorRegistryCreateTransactionParams:
 
 
 class ValidatorRegistrySend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
+        self.readonly_cache: ReadonlyCallCache | None = None
+        """Answers repeated read-only calls within a round, see `ReadonlyCallCache`"""
 
     def init_staking_contract(
         self,
@@ -1367,11 +2145,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _INIT_STAKING_CONTRACT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1383,11 +2167,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _LOAD_STAKING_CONTRACT_DATA_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1398,10 +2188,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _FINALIZE_STAKING_CONTRACT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1412,10 +2209,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _GAS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1426,10 +2230,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[MbrAmounts]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_MBR_AMOUNTS_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
-        }), send_params=send_params)
+            "method": _GET_MBR_AMOUNTS_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MbrAmounts, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[MbrAmounts], parsed_response)
 
@@ -1440,10 +2251,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[Constraints]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_PROTOCOL_CONSTRAINTS_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
-        }), send_params=send_params)
+            "method": _GET_PROTOCOL_CONSTRAINTS_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Constraints, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[Constraints], parsed_response)
 
@@ -1454,10 +2272,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_NUM_VALIDATORS_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
-        }), send_params=send_params)
+            "method": _GET_NUM_VALIDATORS_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1469,11 +2294,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorConfig]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_VALIDATOR_CONFIG_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
+            "method": _GET_VALIDATOR_CONFIG_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorConfig, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorConfig], parsed_response)
 
@@ -1485,11 +2317,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorCurState]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_VALIDATOR_STATE_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
+            "method": _GET_VALIDATOR_STATE_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorCurState, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorCurState], parsed_response)
 
@@ -1501,11 +2340,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[tuple[str, str]]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
+            "method": _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str]], parsed_response)
 
@@ -1517,11 +2363,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, int]]]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_POOLS_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
+            "method": _GET_POOLS_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, int]]], parsed_response)
 
@@ -1533,11 +2386,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_POOL_APP_ID_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
+            "method": _GET_POOL_APP_ID_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1549,11 +2409,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[PoolInfo]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_POOL_INFO_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
+            "method": _GET_POOL_INFO_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolInfo, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[PoolInfo], parsed_response)
 
@@ -1565,11 +2432,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
+            "method": _GET_CUR_MAX_STAKE_PER_POOL_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1581,11 +2455,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[bool]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
+            "method": _DOES_STAKER_NEED_TO_PAY_MBR_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
 
@@ -1597,11 +2478,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, int, int]]]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
+            "method": _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, int, int]]], parsed_response)
 
@@ -1613,11 +2501,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
+            "method": _GET_TOKEN_PAYOUT_RATIO_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio], parsed_response)
 
@@ -1629,11 +2524,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[NodePoolAssignmentConfig]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
+            "method": _GET_NODE_POOL_ASSIGNMENTS_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(NodePoolAssignmentConfig, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[NodePoolAssignmentConfig], parsed_response)
 
@@ -1644,10 +2546,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _GET_NFD_REGISTRY_ID_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
-        }), send_params=send_params)
+            "method": _GET_NFD_REGISTRY_ID_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1659,11 +2568,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _ADD_VALIDATOR_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1675,11 +2590,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_MANAGER_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1691,11 +2612,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_SUNSET_INFO_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1707,11 +2634,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_NFD_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1723,11 +2656,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1739,11 +2678,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_REWARD_INFO_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1755,12 +2700,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorPoolKey]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _ADD_POOL_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorPoolKey], parsed_response)
 
     def add_stake(
@@ -1771,12 +2722,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorPoolKey]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _ADD_STAKE_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorPoolKey], parsed_response)
 
     def set_token_payout_ratio(
@@ -1787,12 +2744,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SET_TOKEN_PAYOUT_RATIO_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio], parsed_response)
 
     def stake_updated_via_rewards(
@@ -1803,11 +2766,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _STAKE_UPDATED_VIA_REWARDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1819,11 +2788,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _STAKE_REMOVED_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1835,11 +2810,18 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[tuple[tuple[int, int, int], bool, bool]]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _FIND_POOL_FOR_STAKER_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
+            "method": _FIND_POOL_FOR_STAKER_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[int, int, int], bool, bool]], parsed_response)
 
@@ -1851,11 +2833,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _MOVE_POOL_TO_NODE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1867,11 +2855,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _EMPTY_TOKEN_REWARDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1882,10 +2876,17 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "createApplication()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_APPLICATION_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CREATE_APPLICATION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1894,12 +2895,185 @@ class ValidatorRegistrySend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
 
 
+class ValidatorRegistryPrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def init_staking_contract(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | InitStakingContractArgs, None]:
+        return PreparedCall(self.app_client, _INIT_STAKING_CONTRACT_METHOD, params, cache=self.cache)
+
+    def load_staking_contract_data(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, bytes | str] | LoadStakingContractDataArgs, None]:
+        return PreparedCall(self.app_client, _LOAD_STAKING_CONTRACT_DATA_METHOD, params, cache=self.cache)
+
+    def finalize_staking_contract(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, None]:
+        return PreparedCall(self.app_client, _FINALIZE_STAKING_CONTRACT_METHOD, params, cache=self.cache)
+
+    def gas(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, None]:
+        return PreparedCall(self.app_client, _GAS_METHOD, params, cache=self.cache)
+
+    def get_mbr_amounts(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, MbrAmounts]:
+        return PreparedCall(self.app_client, _GET_MBR_AMOUNTS_METHOD, params, result_struct=MbrAmounts, cache=self.cache)
+
+    def get_protocol_constraints(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, Constraints]:
+        return PreparedCall(self.app_client, _GET_PROTOCOL_CONSTRAINTS_METHOD, params, result_struct=Constraints, cache=self.cache)
+
+    def get_num_validators(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, int]:
+        return PreparedCall(self.app_client, _GET_NUM_VALIDATORS_METHOD, params, cache=self.cache)
+
+    def get_validator_config(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetValidatorConfigArgs, ValidatorConfig]:
+        return PreparedCall(self.app_client, _GET_VALIDATOR_CONFIG_METHOD, params, result_struct=ValidatorConfig, cache=self.cache)
+
+    def get_validator_state(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetValidatorStateArgs, ValidatorCurState]:
+        return PreparedCall(self.app_client, _GET_VALIDATOR_STATE_METHOD, params, result_struct=ValidatorCurState, cache=self.cache)
+
+    def get_validator_owner_and_manager(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetValidatorOwnerAndManagerArgs, tuple[str, str]]:
+        return PreparedCall(self.app_client, _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD, params, cache=self.cache)
+
+    def get_pools(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetPoolsArgs, list[tuple[int, int, int]]]:
+        return PreparedCall(self.app_client, _GET_POOLS_METHOD, params, cache=self.cache)
+
+    def get_pool_app_id(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int] | GetPoolAppIdArgs, int]:
+        return PreparedCall(self.app_client, _GET_POOL_APP_ID_METHOD, params, cache=self.cache)
+
+    def get_pool_info(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[ValidatorPoolKey] | GetPoolInfoArgs, PoolInfo]:
+        return PreparedCall(self.app_client, _GET_POOL_INFO_METHOD, params, result_struct=PoolInfo, cache=self.cache)
+
+    def get_cur_max_stake_per_pool(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetCurMaxStakePerPoolArgs, int]:
+        return PreparedCall(self.app_client, _GET_CUR_MAX_STAKE_PER_POOL_METHOD, params, cache=self.cache)
+
+    def does_staker_need_to_pay_mbr(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | DoesStakerNeedToPayMbrArgs, bool]:
+        return PreparedCall(self.app_client, _DOES_STAKER_NEED_TO_PAY_MBR_METHOD, params, cache=self.cache)
+
+    def get_staked_pools_for_account(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | GetStakedPoolsForAccountArgs, list[tuple[int, int, int]]]:
+        return PreparedCall(self.app_client, _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD, params, cache=self.cache)
+
+    def get_token_payout_ratio(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetTokenPayoutRatioArgs, PoolTokenPayoutRatio]:
+        return PreparedCall(self.app_client, _GET_TOKEN_PAYOUT_RATIO_METHOD, params, result_struct=PoolTokenPayoutRatio, cache=self.cache)
+
+    def get_node_pool_assignments(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | GetNodePoolAssignmentsArgs, NodePoolAssignmentConfig]:
+        return PreparedCall(self.app_client, _GET_NODE_POOL_ASSIGNMENTS_METHOD, params, result_struct=NodePoolAssignmentConfig, cache=self.cache)
+
+    def get_nfd_registry_id(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, int]:
+        return PreparedCall(self.app_client, _GET_NFD_REGISTRY_ID_METHOD, params, cache=self.cache)
+
+    def add_validator(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument, str, ValidatorConfig] | AddValidatorArgs, int]:
+        return PreparedCall(self.app_client, _ADD_VALIDATOR_METHOD, params, cache=self.cache)
+
+    def change_validator_manager(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str] | ChangeValidatorManagerArgs, None]:
+        return PreparedCall(self.app_client, _CHANGE_VALIDATOR_MANAGER_METHOD, params, cache=self.cache)
+
+    def change_validator_sunset_info(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, int] | ChangeValidatorSunsetInfoArgs, None]:
+        return PreparedCall(self.app_client, _CHANGE_VALIDATOR_SUNSET_INFO_METHOD, params, cache=self.cache)
+
+    def change_validator_nfd(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, str] | ChangeValidatorNfdArgs, None]:
+        return PreparedCall(self.app_client, _CHANGE_VALIDATOR_NFD_METHOD, params, cache=self.cache)
+
+    def change_validator_commission_address(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str] | ChangeValidatorCommissionAddressArgs, None]:
+        return PreparedCall(self.app_client, _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD, params, cache=self.cache)
+
+    def change_validator_reward_info(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, str, tuple[int, int, int, int], int, int] | ChangeValidatorRewardInfoArgs, None]:
+        return PreparedCall(self.app_client, _CHANGE_VALIDATOR_REWARD_INFO_METHOD, params, cache=self.cache)
+
+    def add_pool(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddPoolArgs, ValidatorPoolKey]:
+        return PreparedCall(self.app_client, _ADD_POOL_METHOD, params, result_struct=ValidatorPoolKey, cache=self.cache)
+
+    def add_stake(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddStakeArgs, ValidatorPoolKey]:
+        return PreparedCall(self.app_client, _ADD_STAKE_METHOD, params, result_struct=ValidatorPoolKey, cache=self.cache)
+
+    def set_token_payout_ratio(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int] | SetTokenPayoutRatioArgs, PoolTokenPayoutRatio]:
+        return PreparedCall(self.app_client, _SET_TOKEN_PAYOUT_RATIO_METHOD, params, result_struct=PoolTokenPayoutRatio, cache=self.cache)
+
+    def stake_updated_via_rewards(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[ValidatorPoolKey, int, int, int, int] | StakeUpdatedViaRewardsArgs, None]:
+        return PreparedCall(self.app_client, _STAKE_UPDATED_VIA_REWARDS_METHOD, params, cache=self.cache)
+
+    def stake_removed(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[ValidatorPoolKey, str, int, int, bool] | StakeRemovedArgs, None]:
+        return PreparedCall(self.app_client, _STAKE_REMOVED_METHOD, params, cache=self.cache)
+
+    def find_pool_for_staker(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str, int] | FindPoolForStakerArgs, tuple[tuple[int, int, int], bool, bool]]:
+        return PreparedCall(self.app_client, _FIND_POOL_FOR_STAKER_METHOD, params, cache=self.cache)
+
+    def move_pool_to_node(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, int] | MovePoolToNodeArgs, None]:
+        return PreparedCall(self.app_client, _MOVE_POOL_TO_NODE_METHOD, params, cache=self.cache)
+
+    def empty_token_rewards(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str] | EmptyTokenRewardsArgs, int]:
+        return PreparedCall(self.app_client, _EMPTY_TOKEN_REWARDS_METHOD, params, cache=self.cache)
+
+
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     stakingPoolInitialized: bool
@@ -1924,6 +3098,28 @@ class ValidatorRegistryState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    def global_state_columns(
+        self,
+        app_ids: typing.Iterable[int],
+        *,
+        concurrency: int = 8,
+        progress: typing.Callable[[int, int], None] | None = None,
+    ) -> dict[str, typing.Any]:
+        """Get the global state of many instances of the app as columns, fetched concurrently
+    
+        Returns an `app_id` column and a column for each key, or for each field of keys with struct values, in the
+        order of `app_ids`, omitting apps that don't exist. Columns of uints up to 64 bits and bools are NumPy arrays
+        if NumPy is installed, or `array.array`s otherwise.
+        """
+        columns: _ColumnSpec = (
+            ("stakingPoolInitialized", ("stakingPoolInitialized",), "B"),
+            ("numValidators", ("numValidators",), "Q"),
+            ("numStakers", ("numStakers",), "Q"),
+            ("totalAlgoStaked", ("totalAlgoStaked",), "Q"),
+        )
+        states = _fetch_many(app_ids, _GlobalState(self.app_client)._get_all_of_app, concurrency, progress)
+        return {"app_id": list(states), **_to_columns(states.values(), columns)}
+
     @property
     def box(
         self
@@ -1954,6 +3150,35 @@ class _GlobalState:
             )
         return typing.cast(GlobalStateValue, converted)
 
+    def _get_all_of_app(self, app_id: int) -> GlobalStateValue | None:
+        # reads the global state of an instance of the app in one request, and is None rather than an error if it
+        # doesn't exist
+        try:
+            app_info = self.app_client.algorand.client.algod.application_info(app_id)
+        except algosdk.error.AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return self._decode_all(typing.cast(dict, app_info)["params"].get("global-state", []))
+
+    def _decode_all(self, key_values: list[typing.Any]) -> GlobalStateValue:
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        converted = {}
+        for key, key_info in self.app_client.app_spec.state.keys.global_state.items():
+            value = state.get(key_info.key)
+            decoded = (
+                algokit_utils.applications.abi.get_abi_decoded_value(
+                    value.value_raw, key_info.value_type, self.app_client.app_spec.structs
+                )
+                if value and value.value_raw
+                else value.value if value else None
+            )
+            struct_class = self._struct_classes.get(key_info.value_type)
+            converted[key] = (
+                _init_dataclass(struct_class, decoded) if struct_class and isinstance(decoded, dict) else decoded
+            )
+        return typing.cast(GlobalStateValue, converted)
+
     @property
     def staking_pool_initialized(self) -> bool:
         """Get the current value of the stakingPoolInitialized key in global_state state"""
@@ -2025,7 +3250,36 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "validatorList",
-            self._struct_classes.get("ValidatorInfo")
+            self._struct_classes.get("ValidatorInfo"),
+            box_app_client=self.app_client,
+            value_columns=(
+                ("config.id", ("config", "id",), "Q"),
+                ("config.owner", ("config", "owner",), None),
+                ("config.manager", ("config", "manager",), None),
+                ("config.nfdForInfo", ("config", "nfdForInfo",), "Q"),
+                ("config.entryGatingType", ("config", "entryGatingType",), "Q"),
+                ("config.entryGatingAddress", ("config", "entryGatingAddress",), None),
+                ("config.entryGatingAssets", ("config", "entryGatingAssets",), None),
+                ("config.gatingAssetMinBalance", ("config", "gatingAssetMinBalance",), "Q"),
+                ("config.rewardTokenId", ("config", "rewardTokenId",), "Q"),
+                ("config.rewardPerPayout", ("config", "rewardPerPayout",), "Q"),
+                ("config.epochRoundLength", ("config", "epochRoundLength",), "Q"),
+                ("config.percentToValidator", ("config", "percentToValidator",), "Q"),
+                ("config.validatorCommissionAddress", ("config", "validatorCommissionAddress",), None),
+                ("config.minEntryStake", ("config", "minEntryStake",), "Q"),
+                ("config.maxAlgoPerPool", ("config", "maxAlgoPerPool",), "Q"),
+                ("config.poolsPerNode", ("config", "poolsPerNode",), "Q"),
+                ("config.sunsettingOn", ("config", "sunsettingOn",), "Q"),
+                ("config.sunsettingTo", ("config", "sunsettingTo",), "Q"),
+                ("state.numPools", ("state", "numPools",), "Q"),
+                ("state.totalStakers", ("state", "totalStakers",), "Q"),
+                ("state.totalAlgoStaked", ("state", "totalAlgoStaked",), "Q"),
+                ("state.rewardTokenHeldBack", ("state", "rewardTokenHeldBack",), "Q"),
+                ("pools", ("pools",), None),
+                ("tokenPayoutRatio.poolPctOfWhole", ("tokenPayoutRatio", "poolPctOfWhole",), None),
+                ("tokenPayoutRatio.updatedForPayout", ("tokenPayoutRatio", "updatedForPayout",), "Q"),
+                ("nodePoolAssignments.nodes", ("nodePoolAssignments", "nodes",), None),
+            ),
         )
 
     @property
@@ -2034,7 +3288,8 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "stakerPoolSet",
-            None
+            None,
+            box_app_client=self.app_client,
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -2050,10 +3305,16 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
     """Generic class for accessing state maps with strongly typed keys and values"""
 
     def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                struct_class: typing.Type[_ValueType] | None = None):
+                struct_class: typing.Type[_ValueType] | None = None,
+                box_app_client: algokit_utils.AppClient | None = None,
+                key_struct_class: typing.Type[typing.Any] | None = None,
+                value_columns: _ColumnSpec = (("value", (), None),)):
         self._state_accessor = state_accessor
         self._map_name = map_name
         self._struct_class = struct_class
+        self._box_app_client = box_app_client
+        self._key_struct_class = key_struct_class
+        self._value_columns = value_columns
 
     def get_map(self) -> dict[_KeyType, _ValueType]:
         """Get all current values in the map"""
@@ -2071,12 +3332,107 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
             return _init_dataclass(self._struct_class, value)  # type: ignore
         return typing.cast(_ValueType | None, value)
 
+    def iter_items(self, page_size: int = 1000, prefetch: int = 8) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        """Iterate over the keys and values in the map
+
+        Box maps are streamed: box names are fetched `page_size` at a time and up to `prefetch` values are fetched
+        concurrently ahead of the item being consumed, so memory use is bounded and the first items are available
+        straight away. Boxes created or deleted during iteration may or may not be included. Other maps are read
+        in one call, as their state is.
+        """
+        if self._box_app_client is None:
+            yield from self.get_map().items()
+            return
+        for key, value in self._iter_decoded(page_size, prefetch):
+            if self._key_struct_class and isinstance(key, dict):
+                key = _init_dataclass(self._key_struct_class, key)
+            if self._struct_class and isinstance(value, dict):
+                value = _init_dataclass(self._struct_class, value)
+            yield typing.cast(_KeyType, key), typing.cast(_ValueType, value)
+
+    def get_columns(self, page_size: int = 1000, prefetch: int = 8) -> dict[str, typing.Any]:
+        """Get the keys and values in the map as columns, without creating an object for each value
+
+        Returns a `key` column and a column for each field of the map's struct values, or a `value` column for
+        other values. Columns of uints up to 64 bits and bools are NumPy arrays if NumPy is installed, or
+        `array.array`s otherwise, and other columns are lists. Box maps are streamed, as with `iter_items`.
+        """
+        keys: list[typing.Any] = []
+
+        def values() -> typing.Iterator[typing.Any]:
+            for key, value in self._iter_decoded(page_size, prefetch):
+                keys.append(key)
+                yield value
+
+        columns = _to_columns(values(), self._value_columns)
+        return {"key": keys, **columns}
+
+    def _iter_decoded(self, page_size: int, prefetch: int) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        # the decoded ABI keys and values, with structs as dicts
+        if self._box_app_client is None:
+            yield from self._state_accessor.get_map(self._map_name).items()
+            return
+
+        app_client = self._box_app_client
+        metadata = app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            pending: list[tuple[bytes, concurrent.futures.Future[bytes]]] = []
+            try:
+                for name in self._iter_box_names(prefix, page_size):
+                    value = executor.submit(app_client.algorand.app.get_box_value, app_client.app_id, name)
+                    pending.append((name, value))
+                    if len(pending) > prefetch:
+                        name, value = pending.pop(0)
+                        yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+                while pending:
+                    name, value = pending.pop(0)
+                    yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+            finally:
+                for _, value in pending:
+                    value.cancel()
+
+    def _iter_box_names(self, prefix: bytes, page_size: int) -> typing.Iterator[bytes]:
+        # algod versions without paging of box names ignore `next` and `prefix`, and may truncate to `max` names
+        assert self._box_app_client is not None
+        algod = self._box_app_client.algorand.client.algod
+        path = f"/applications/{self._box_app_client.app_id}/boxes"
+        params: dict[str, typing.Any] = {"max": page_size}
+        if prefix:
+            params["prefix"] = "b64:" + base64.b64encode(prefix).decode()
+        seen: set[bytes] | None = None
+        while True:
+            response = typing.cast(dict[str, typing.Any], algod.algod_request("GET", path, params=params))
+            page = [base64.b64decode(box["name"]) for box in response.get("boxes", [])]
+            names = page if seen is None else [name for name in page if name not in seen]
+            yield from (name for name in names if name.startswith(prefix))
+            next_token = response.get("next-token")
+            if next_token:
+                params["next"] = next_token
+            elif "next" not in params and "next-token" not in response and len(page) == params["max"]:
+                # a full first page without a next token may have been truncated by a node that doesn't page, so
+                # list the names again with a larger `max`, until a page isn't full
+                seen = (seen or set()).union(page)
+                params["max"] *= 2
+            else:
+                return
+
+    def _decode_box(
+        self, key: bytes, value: bytes, metadata: algokit_utils.applications.app_spec.arc56.StorageMap
+    ) -> tuple[typing.Any, typing.Any]:
+        assert self._box_app_client is not None
+        structs = self._box_app_client.app_spec.structs
+        return (
+            algokit_utils.applications.abi.get_abi_decoded_value(key, metadata.key_type, structs),
+            algokit_utils.applications.abi.get_abi_decoded_value(value, metadata.value_type, structs),
+        )
+
 
 class ValidatorRegistryClient:
     """Client for interacting with ValidatorRegistry smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -2089,6 +3445,7 @@ class ValidatorRegistryClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -2102,6 +3459,7 @@ class ValidatorRegistryClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -2121,9 +3479,11 @@ class ValidatorRegistryClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = ValidatorRegistryParams(self.app_client)
-        self.create_transaction = ValidatorRegistryCreateTransactionParams(self.app_client)
-        self.send = ValidatorRegistrySend(self.app_client)
+        self.create_transaction = ValidatorRegistryCreateTransactionParams(self.app_client, cache)
+        self.send = ValidatorRegistrySend(self.app_client, cache)
+        self.prepare = ValidatorRegistryPrepare(self.app_client, cache)
         self.state = ValidatorRegistryState(self.app_client)
 
     @staticmethod
@@ -2137,7 +3497,10 @@ class ValidatorRegistryClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "ValidatorRegistryClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return ValidatorRegistryClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -2150,7 +3513,8 @@ class ValidatorRegistryClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -2161,6 +3525,7 @@ class ValidatorRegistryClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "ValidatorRegistryClient":
         return ValidatorRegistryClient(
             algokit_utils.AppClient.from_network(
@@ -2171,7 +3536,8 @@ class ValidatorRegistryClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -2209,7 +3575,8 @@ class ValidatorRegistryClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "ValidatorRegistryComposer":
@@ -2435,7 +3802,8 @@ class ValidatorRegistryClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -2470,6 +3838,37 @@ class ValidatorRegistryMethodCallCreateParams(
             }
         )
 
+class ValidatorRegistryFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `ValidatorRegistryFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: ValidatorRegistryMethodCallCreateParams | None
+    update_params: None
+    delete_params: None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class ValidatorRegistryDeployManyError(Exception):
+    """Raised by `ValidatorRegistryFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRegistryMethodCallCreateParams, None, None]):
     """Factory for deploying and managing ValidatorRegistryClient smart contracts"""
 
@@ -2482,6 +3881,7 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -2495,8 +3895,10 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
             )
         )
         self.params = ValidatorRegistryFactoryParams(self.app_factory)
-        self.create_transaction = ValidatorRegistryFactoryCreateTransaction(self.app_factory)
-        self.send = ValidatorRegistryFactorySend(self.app_factory)
+        self.create_transaction = ValidatorRegistryFactoryCreateTransaction(self.app_factory, cache)
+        self.send = ValidatorRegistryFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -2525,6 +3927,11 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -2537,8 +3944,81 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
+
+        return ValidatorRegistryClient(deploy_response[0], cache=self.cache), deploy_response[1]
 
-        return ValidatorRegistryClient(deploy_response[0]), deploy_response[1]
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[ValidatorRegistryFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `ValidatorRegistryDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[ValidatorRegistryFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise ValidatorRegistryDeployManyError(results)
+        return typing.cast(list[tuple[ValidatorRegistryClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -2552,6 +4032,8 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
         clear_source_map: SourceMap | None = None,
     ) -> ValidatorRegistryClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return ValidatorRegistryClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -2562,7 +4044,8 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -2583,7 +4066,8 @@ class ValidatorRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ValidatorRe
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -3327,16 +4811,17 @@ class ValidatorRegistryFactoryDeleteParams:
 class ValidatorRegistryFactoryCreateTransaction:
     """Create transactions for ValidatorRegistry contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = ValidatorRegistryFactoryCreateTransactionCreate(app_factory)
+        self.create = ValidatorRegistryFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class ValidatorRegistryFactoryCreateTransactionCreate:
     """Create new instances of ValidatorRegistry contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -3344,6 +4829,8 @@ class ValidatorRegistryFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -3352,16 +4839,17 @@ class ValidatorRegistryFactoryCreateTransactionCreate:
 class ValidatorRegistryFactorySend:
     """Send calls to ValidatorRegistry contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = ValidatorRegistryFactorySendCreate(app_factory)
+        self.create = ValidatorRegistryFactorySendCreate(app_factory, cache)
 
 
 class ValidatorRegistryFactorySendCreate:
     """Send create calls to ValidatorRegistry contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -3372,12 +4860,14 @@ class ValidatorRegistryFactorySendCreate:
     ) -> tuple[ValidatorRegistryClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return ValidatorRegistryClient(result[0]), result[1]
+        return ValidatorRegistryClient(result[0], cache=self.cache), result[1]
 
     def create_application(
         self,
@@ -3388,6 +4878,8 @@ class ValidatorRegistryFactorySendCreate:
     ) -> tuple[ValidatorRegistryClient, algokit_utils.AppFactoryCreateMethodCallResult[None]]:
             """Creates and sends a transaction using the createApplication()void ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
+            if self.cache:
+                self.cache.seed_suggested_params(self.app_factory.algorand)
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
@@ -3401,7 +4893,7 @@ class ValidatorRegistryFactorySendCreate:
             )
             return_value = None if result.abi_return is None else typing.cast(None, result.abi_return)
     
-            return ValidatorRegistryClient(client), algokit_utils.AppFactoryCreateMethodCallResult[None](
+            return ValidatorRegistryClient(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[None](
                 **{
                     **result.__dict__,
                     "app_id": result.app_id,
@@ -3417,29 +4909,124 @@ class ValidatorRegistryFactorySendCreate:
             )
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class ValidatorRegistryComposer:
     """Composer for creating transaction groups for ValidatorRegistry contract calls"""
 
     def __init__(self, client: "ValidatorRegistryClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     def init_staking_contract(
         self,
         args: tuple[int] | InitStakingContractArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.init_staking_contract(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.init_staking_contract(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "initStakingContract(uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -3448,16 +5035,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, bytes | str] | LoadStakingContractDataArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.load_staking_contract_data(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.load_staking_contract_data(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "loadStakingContractData(uint64,byte[])void", v
-            )
+            ),
         )
         return self
 
@@ -3465,16 +5054,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.finalize_staking_contract(
-                
-                params=params,
-            )
+        call_params = self.client.params.finalize_staking_contract(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "finalizeStakingContract()void", v
-            )
+            ),
         )
         return self
 
@@ -3482,16 +5073,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.gas(
-                
-                params=params,
-            )
+        call_params = self.client.params.gas(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "gas()void", v
-            )
+            ),
         )
         return self
 
@@ -3499,16 +5092,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_mbr_amounts(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_mbr_amounts(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getMbrAmounts()(uint64,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3516,16 +5111,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_protocol_constraints(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_protocol_constraints(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3533,16 +5130,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_num_validators(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_num_validators(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getNumValidators()uint64", v
-            )
+            ),
         )
         return self
 
@@ -3551,16 +5150,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorConfigArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_config(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_config(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3569,16 +5170,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorStateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getValidatorState(uint64)(uint16,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3587,16 +5190,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorOwnerAndManagerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_owner_and_manager(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_owner_and_manager(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getValidatorOwnerAndManager(uint64)(address,address)", v
-            )
+            ),
         )
         return self
 
@@ -3605,16 +5210,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetPoolsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pools(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pools(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getPools(uint64)(uint64,uint16,uint64)[]", v
-            )
+            ),
         )
         return self
 
@@ -3623,16 +5230,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, int] | GetPoolAppIdArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pool_app_id(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pool_app_id(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getPoolAppId(uint64,uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -3641,16 +5250,18 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey] | GetPoolInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pool_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pool_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3659,16 +5270,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetCurMaxStakePerPoolArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_cur_max_stake_per_pool(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_cur_max_stake_per_pool(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getCurMaxStakePerPool(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -3677,16 +5290,18 @@ class ValidatorRegistryComposer:
         args: tuple[str] | DoesStakerNeedToPayMbrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.does_staker_need_to_pay_mbr(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.does_staker_need_to_pay_mbr(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "doesStakerNeedToPayMBR(address)bool", v
-            )
+            ),
         )
         return self
 
@@ -3695,16 +5310,18 @@ class ValidatorRegistryComposer:
         args: tuple[str] | GetStakedPoolsForAccountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_staked_pools_for_account(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_staked_pools_for_account(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]", v
-            )
+            ),
         )
         return self
 
@@ -3713,16 +5330,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetTokenPayoutRatioArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_token_payout_ratio(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_token_payout_ratio(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getTokenPayoutRatio(uint64)(uint64[24],uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3731,16 +5350,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetNodePoolAssignmentsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_node_pool_assignments(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_node_pool_assignments(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getNodePoolAssignments(uint64)((uint64[3])[8])", v
-            )
+            ),
         )
         return self
 
@@ -3748,16 +5369,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_nfd_registry_id(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_nfd_registry_id(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "getNFDRegistryID()uint64", v
-            )
+            ),
         )
         return self
 
@@ -3766,16 +5389,18 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, ValidatorConfig] | AddValidatorArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_validator(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_validator(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64", v
-            )
+            ),
         )
         return self
 
@@ -3784,16 +5409,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | ChangeValidatorManagerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_manager(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_manager(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "changeValidatorManager(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -3802,16 +5429,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, int] | ChangeValidatorSunsetInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_sunset_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_sunset_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "changeValidatorSunsetInfo(uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -3820,16 +5449,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, str] | ChangeValidatorNfdArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_nfd(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_nfd(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "changeValidatorNFD(uint64,uint64,string)void", v
-            )
+            ),
         )
         return self
 
@@ -3838,16 +5469,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | ChangeValidatorCommissionAddressArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_commission_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_commission_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "changeValidatorCommissionAddress(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -3856,16 +5489,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, str, tuple[int, int, int, int], int, int] | ChangeValidatorRewardInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_reward_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_reward_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -3874,16 +5509,18 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddPoolArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_pool(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_pool(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "addPool(pay,uint64,uint64)(uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3892,16 +5529,18 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddStakeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_stake(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_stake(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "addStake(pay,uint64,uint64)(uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3910,16 +5549,18 @@ class ValidatorRegistryComposer:
         args: tuple[int] | SetTokenPayoutRatioArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_token_payout_ratio(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_token_payout_ratio(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "setTokenPayoutRatio(uint64)(uint64[24],uint64)", v
-            )
+            ),
         )
         return self
 
@@ -3928,16 +5569,18 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey, int, int, int, int] | StakeUpdatedViaRewardsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.stake_updated_via_rewards(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.stake_updated_via_rewards(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -3946,16 +5589,18 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey, str, int, int, bool] | StakeRemovedArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.stake_removed(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.stake_removed(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void", v
-            )
+            ),
         )
         return self
 
@@ -3964,16 +5609,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, str, int] | FindPoolForStakerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.find_pool_for_staker(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.find_pool_for_staker(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)", v
-            )
+            ),
         )
         return self
 
@@ -3982,16 +5629,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, int] | MovePoolToNodeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.move_pool_to_node(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.move_pool_to_node(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "movePoolToNode(uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -4000,16 +5649,18 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | EmptyTokenRewardsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.empty_token_rewards(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.empty_token_rewards(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "emptyTokenRewards(uint64,address)uint64", v
-            )
+            ),
         )
         return self
 
@@ -4017,16 +5668,18 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.create_application(
-                
-                params=params,
-            )
+        call_params = self.client.params.create_application(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "createApplication()void", v
-            )
+            ),
         )
         return self
 
@@ -4037,25 +5690,29 @@ class ValidatorRegistryComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "ValidatorRegistryComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -4068,7 +5725,9 @@ class ValidatorRegistryComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -4082,4 +5741,274 @@ class ValidatorRegistryComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpAddedValidatorEvent:
+    """ARC-28 event retiOP_addedValidator(uint64,address,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("a8dd21cb")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">Q32s32s")
+
+    id: int
+    owner: str
+    manager: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpAddedValidatorEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _encode_address(values[1]),
+            _encode_address(values[2]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpValidatorAddedPoolEvent:
+    """ARC-28 event retiOP_validatorAddedPool(uint64,uint16,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("fbcc0f6b")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ")
+
+    id: int
+    num: int
+    pool_app_id: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpValidatorAddedPoolEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        return cls(*cls._HEAD.unpack_from(data))
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpStakeAddedEvent:
+    """ARC-28 event retiOP_stakeAdded(uint64,uint16,uint64,address,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("962b4143")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ32sQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    staker: str
+    amount_staked: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpStakeAddedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            values[1],
+            values[2],
+            _encode_address(values[3]),
+            values[4],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpEpochRewardUpdateEvent:
+    """ARC-28 event retiOP_epochRewardUpdate(uint64,uint16,uint64,uint64,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("b3e47c3d")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQQQQQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    validator_commission: int
+    saturated_burn_to_fee_sink: int
+    algo_added: int
+    reward_token_held_back: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpEpochRewardUpdateEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        return cls(*cls._HEAD.unpack_from(data))
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpStakeRemovedEvent:
+    """ARC-28 event retiOP_stakeRemoved(uint64,uint16,uint64,address,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("12f4bd4b")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ32sQQQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    staker: str
+    amount_unstaked: int
+    reward_tokens_received: int
+    reward_token_asset_id: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpStakeRemovedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            values[1],
+            values[2],
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+        )
+
+
+# Encoding an address hashes it, and the same addresses are usually logged many times, e.g. by a busy account
+_encode_address = functools.lru_cache(maxsize=4096)(algosdk.encoding.encode_address)
+
+
+def _decode_abi_bytes(data: bytes, offset: int) -> bytes:
+    """Decode a dynamic byte array or string at offset in data"""
+    return data[offset + 2 : offset + 2 + int.from_bytes(data[offset : offset + 2], "big")]
+
+
+ValidatorRegistryEvent: typing.TypeAlias = RetiOpAddedValidatorEvent | RetiOpValidatorAddedPoolEvent | RetiOpStakeAddedEvent | RetiOpEpochRewardUpdateEvent | RetiOpStakeRemovedEvent
+
+# Decoders for each event, by the 4 byte selector that prefixes its logs
+EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], ValidatorRegistryEvent]] = {
+    RetiOpAddedValidatorEvent.SELECTOR: RetiOpAddedValidatorEvent.decode,
+    RetiOpValidatorAddedPoolEvent.SELECTOR: RetiOpValidatorAddedPoolEvent.decode,
+    RetiOpStakeAddedEvent.SELECTOR: RetiOpStakeAddedEvent.decode,
+    RetiOpEpochRewardUpdateEvent.SELECTOR: RetiOpEpochRewardUpdateEvent.decode,
+    RetiOpStakeRemovedEvent.SELECTOR: RetiOpStakeRemovedEvent.decode,
+}
+
+
+def decode_event(log: bytes | str) -> ValidatorRegistryEvent | None:
+    """Decode an event from a log, which is base64 encoded if a str, or None if the log isn't one of the events"""
+    data = base64.b64decode(log) if isinstance(log, str) else log
+    decoder = EVENT_DECODERS.get(data[:4])
+    return decoder(data[4:]) if decoder else None
+
+
+def decode_events(logs: typing.Iterable[bytes | str]) -> list[ValidatorRegistryEvent]:
+    """Decode the events from logs, e.g. all the logs of a block, skipping logs that aren't events
+
+    Logs are base64 encoded if a str, as returned by algod and indexer
+    """
+    decoders = EVENT_DECODERS
+    events = []
+    for log in logs:
+        data = base64.b64decode(log) if isinstance(log, str) else log
+        decoder = decoders.get(data[:4])
+        if decoder is not None:
+            events.append(decoder(data[4:]))
+    return events
+
+
+def decode_transaction_events(
+    transactions: typing.Iterable[typing.Mapping[str, typing.Any]], app_id: int | None = None
+) -> list[ValidatorRegistryEvent]:
+    """Decode the events from the logs of transactions, each followed by those of its inner transactions
+
+    :param transactions: Transactions as returned by indexer, e.g. a page of transactions from a search
+    :param app_id: If set, only decode the events logged by this app
+    """
+    events: list[ValidatorRegistryEvent] = []
+    pending = list(reversed(list(transactions)))
+    while pending:
+        transaction = pending.pop()
+        logs = transaction.get("logs")
+        app_transaction = transaction.get("application-transaction") or {}
+        # indexer reports an application-id of 0 for app creates, the created app is reported separately
+        logged_by = app_transaction.get("application-id") or transaction.get("created-application-index")
+        if logs and (app_id is None or logged_by == app_id):
+            events.extend(decode_events(logs))
+        pending.extend(reversed(transaction.get("inner-txns") or []))
+    return events
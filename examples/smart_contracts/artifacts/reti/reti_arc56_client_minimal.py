@@ -6,7 +6,10 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import base64
 import dataclasses
+import functools
+import struct
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +67,170 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_INIT_STAKING_CONTRACT_METHOD = _AbiMethod("initStakingContract(uint64)void", bytes.fromhex("1b5e82c6"))
+_LOAD_STAKING_CONTRACT_DATA_METHOD = _AbiMethod("loadStakingContractData(uint64,byte[])void", bytes.fromhex("79472d83"))
+_FINALIZE_STAKING_CONTRACT_METHOD = _AbiMethod("finalizeStakingContract()void", bytes.fromhex("5f7acfd9"))
+_GAS_METHOD = _AbiMethod("gas()void", bytes.fromhex("3172ca9d"))
+_GET_MBR_AMOUNTS_METHOD = _AbiMethod("getMbrAmounts()(uint64,uint64,uint64,uint64)", bytes.fromhex("8a87142d"))
+_GET_PROTOCOL_CONSTRAINTS_METHOD = _AbiMethod("getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)", bytes.fromhex("d1366cc3"))
+_GET_NUM_VALIDATORS_METHOD = _AbiMethod("getNumValidators()uint64", bytes.fromhex("3b045c5c"))
+_GET_VALIDATOR_CONFIG_METHOD = _AbiMethod("getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)", bytes.fromhex("75aff61d"))
+_GET_VALIDATOR_STATE_METHOD = _AbiMethod("getValidatorState(uint64)(uint16,uint64,uint64,uint64)", bytes.fromhex("1f2f0109"))
+_GET_VALIDATOR_OWNER_AND_MANAGER_METHOD = _AbiMethod("getValidatorOwnerAndManager(uint64)(address,address)", bytes.fromhex("2fa22c4b"))
+_GET_POOLS_METHOD = _AbiMethod("getPools(uint64)(uint64,uint16,uint64)[]", bytes.fromhex("910e94ac"))
+_GET_POOL_APP_ID_METHOD = _AbiMethod("getPoolAppId(uint64,uint64)uint64", bytes.fromhex("572767d1"))
+_GET_POOL_INFO_METHOD = _AbiMethod("getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)", bytes.fromhex("9b504aaf"))
+_GET_CUR_MAX_STAKE_PER_POOL_METHOD = _AbiMethod("getCurMaxStakePerPool(uint64)uint64", bytes.fromhex("fbc63178"))
+_DOES_STAKER_NEED_TO_PAY_MBR_METHOD = _AbiMethod("doesStakerNeedToPayMBR(address)bool", bytes.fromhex("24498cf4"))
+_GET_STAKED_POOLS_FOR_ACCOUNT_METHOD = _AbiMethod("getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]", bytes.fromhex("f846dd7a"))
+_GET_TOKEN_PAYOUT_RATIO_METHOD = _AbiMethod("getTokenPayoutRatio(uint64)(uint64[24],uint64)", bytes.fromhex("83050501"))
+_GET_NODE_POOL_ASSIGNMENTS_METHOD = _AbiMethod("getNodePoolAssignments(uint64)((uint64[3])[8])", bytes.fromhex("7bbb6c8d"))
+_GET_NFD_REGISTRY_ID_METHOD = _AbiMethod("getNFDRegistryID()uint64", bytes.fromhex("f839414a"))
+_ADD_VALIDATOR_METHOD = _AbiMethod("addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64", bytes.fromhex("0c317cfb"))
+_CHANGE_VALIDATOR_MANAGER_METHOD = _AbiMethod("changeValidatorManager(uint64,address)void", bytes.fromhex("3e288972"))
+_CHANGE_VALIDATOR_SUNSET_INFO_METHOD = _AbiMethod("changeValidatorSunsetInfo(uint64,uint64,uint64)void", bytes.fromhex("dd5faada"))
+_CHANGE_VALIDATOR_NFD_METHOD = _AbiMethod("changeValidatorNFD(uint64,uint64,string)void", bytes.fromhex("18aac7a7"))
+_CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD = _AbiMethod("changeValidatorCommissionAddress(uint64,address)void", bytes.fromhex("f99ef54d"))
+_CHANGE_VALIDATOR_REWARD_INFO_METHOD = _AbiMethod("changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void", bytes.fromhex("10809d4d"))
+_ADD_POOL_METHOD = _AbiMethod("addPool(pay,uint64,uint64)(uint64,uint64,uint64)", bytes.fromhex("e778dd5a"))
+_ADD_STAKE_METHOD = _AbiMethod("addStake(pay,uint64,uint64)(uint64,uint64,uint64)", bytes.fromhex("bf5259d0"))
+_SET_TOKEN_PAYOUT_RATIO_METHOD = _AbiMethod("setTokenPayoutRatio(uint64)(uint64[24],uint64)", bytes.fromhex("4df8d86e"))
+_STAKE_UPDATED_VIA_REWARDS_METHOD = _AbiMethod("stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void", bytes.fromhex("418fcefc"))
+_STAKE_REMOVED_METHOD = _AbiMethod("stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void", bytes.fromhex("a2dc51b5"))
+_FIND_POOL_FOR_STAKER_METHOD = _AbiMethod("findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)", bytes.fromhex("2873f504"))
+_MOVE_POOL_TO_NODE_METHOD = _AbiMethod("movePoolToNode(uint64,uint64,uint64)void", bytes.fromhex("0547f4fe"))
+_EMPTY_TOKEN_REWARDS_METHOD = _AbiMethod("emptyTokenRewards(uint64,address)uint64", bytes.fromhex("cb668358"))
+_CREATE_APPLICATION_METHOD = _AbiMethod("createApplication()void", bytes.fromhex("b8447b36"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _INIT_STAKING_CONTRACT_METHOD.signature: _INIT_STAKING_CONTRACT_METHOD,
+    _LOAD_STAKING_CONTRACT_DATA_METHOD.signature: _LOAD_STAKING_CONTRACT_DATA_METHOD,
+    _FINALIZE_STAKING_CONTRACT_METHOD.signature: _FINALIZE_STAKING_CONTRACT_METHOD,
+    _GAS_METHOD.signature: _GAS_METHOD,
+    _GET_MBR_AMOUNTS_METHOD.signature: _GET_MBR_AMOUNTS_METHOD,
+    _GET_PROTOCOL_CONSTRAINTS_METHOD.signature: _GET_PROTOCOL_CONSTRAINTS_METHOD,
+    _GET_NUM_VALIDATORS_METHOD.signature: _GET_NUM_VALIDATORS_METHOD,
+    _GET_VALIDATOR_CONFIG_METHOD.signature: _GET_VALIDATOR_CONFIG_METHOD,
+    _GET_VALIDATOR_STATE_METHOD.signature: _GET_VALIDATOR_STATE_METHOD,
+    _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD.signature: _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+    _GET_POOLS_METHOD.signature: _GET_POOLS_METHOD,
+    _GET_POOL_APP_ID_METHOD.signature: _GET_POOL_APP_ID_METHOD,
+    _GET_POOL_INFO_METHOD.signature: _GET_POOL_INFO_METHOD,
+    _GET_CUR_MAX_STAKE_PER_POOL_METHOD.signature: _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+    _DOES_STAKER_NEED_TO_PAY_MBR_METHOD.signature: _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+    _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD.signature: _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+    _GET_TOKEN_PAYOUT_RATIO_METHOD.signature: _GET_TOKEN_PAYOUT_RATIO_METHOD,
+    _GET_NODE_POOL_ASSIGNMENTS_METHOD.signature: _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+    _GET_NFD_REGISTRY_ID_METHOD.signature: _GET_NFD_REGISTRY_ID_METHOD,
+    _ADD_VALIDATOR_METHOD.signature: _ADD_VALIDATOR_METHOD,
+    _CHANGE_VALIDATOR_MANAGER_METHOD.signature: _CHANGE_VALIDATOR_MANAGER_METHOD,
+    _CHANGE_VALIDATOR_SUNSET_INFO_METHOD.signature: _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+    _CHANGE_VALIDATOR_NFD_METHOD.signature: _CHANGE_VALIDATOR_NFD_METHOD,
+    _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD.signature: _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+    _CHANGE_VALIDATOR_REWARD_INFO_METHOD.signature: _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+    _ADD_POOL_METHOD.signature: _ADD_POOL_METHOD,
+    _ADD_STAKE_METHOD.signature: _ADD_STAKE_METHOD,
+    _SET_TOKEN_PAYOUT_RATIO_METHOD.signature: _SET_TOKEN_PAYOUT_RATIO_METHOD,
+    _STAKE_UPDATED_VIA_REWARDS_METHOD.signature: _STAKE_UPDATED_VIA_REWARDS_METHOD,
+    _STAKE_REMOVED_METHOD.signature: _STAKE_REMOVED_METHOD,
+    _FIND_POOL_FOR_STAKER_METHOD.signature: _FIND_POOL_FOR_STAKER_METHOD,
+    _MOVE_POOL_TO_NODE_METHOD.signature: _MOVE_POOL_TO_NODE_METHOD,
+    _EMPTY_TOKEN_REWARDS_METHOD.signature: _EMPTY_TOKEN_REWARDS_METHOD,
+    _CREATE_APPLICATION_METHOD.signature: _CREATE_APPLICATION_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class Constraints:
     """Struct for Constraints"""
@@ -480,11 +647,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def load_staking_contract_data(
         self,
@@ -493,11 +663,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def finalize_staking_contract(
         self,
@@ -505,10 +678,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def gas(
         self,
@@ -516,10 +693,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_mbr_amounts(
         self,
@@ -527,10 +708,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_MBR_AMOUNTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_protocol_constraints(
         self,
@@ -538,10 +723,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_PROTOCOL_CONSTRAINTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_num_validators(
         self,
@@ -549,10 +738,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NUM_VALIDATORS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_config(
         self,
@@ -561,11 +754,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_state(
         self,
@@ -574,11 +770,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_validator_owner_and_manager(
         self,
@@ -587,11 +786,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pools(
         self,
@@ -600,11 +802,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOLS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pool_app_id(
         self,
@@ -613,11 +818,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOL_APP_ID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_pool_info(
         self,
@@ -626,11 +834,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_POOL_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_cur_max_stake_per_pool(
         self,
@@ -639,11 +850,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def does_staker_need_to_pay_mbr(
         self,
@@ -652,11 +866,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_staked_pools_for_account(
         self,
@@ -665,11 +882,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_token_payout_ratio(
         self,
@@ -678,11 +898,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_node_pool_assignments(
         self,
@@ -691,11 +914,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_nfd_registry_id(
         self,
@@ -703,10 +929,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_NFD_REGISTRY_ID_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_validator(
         self,
@@ -715,11 +945,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_manager(
         self,
@@ -728,11 +961,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_sunset_info(
         self,
@@ -741,11 +977,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_nfd(
         self,
@@ -754,11 +993,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_commission_address(
         self,
@@ -767,11 +1009,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def change_validator_reward_info(
         self,
@@ -780,11 +1025,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_pool(
         self,
@@ -793,11 +1041,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def add_stake(
         self,
@@ -806,11 +1057,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_token_payout_ratio(
         self,
@@ -819,11 +1073,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def stake_updated_via_rewards(
         self,
@@ -832,11 +1089,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def stake_removed(
         self,
@@ -845,11 +1105,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def find_pool_for_staker(
         self,
@@ -858,11 +1121,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _FIND_POOL_FOR_STAKER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def move_pool_to_node(
         self,
@@ -871,11 +1137,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def empty_token_rewards(
         self,
@@ -884,11 +1153,14 @@ class ValidatorRegistryParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -912,11 +1184,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def load_staking_contract_data(
         self,
@@ -925,11 +1201,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def finalize_staking_contract(
         self,
@@ -937,10 +1217,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def gas(
         self,
@@ -948,10 +1233,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_mbr_amounts(
         self,
@@ -959,10 +1249,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_MBR_AMOUNTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_protocol_constraints(
         self,
@@ -970,10 +1265,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_PROTOCOL_CONSTRAINTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_num_validators(
         self,
@@ -981,10 +1281,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NUM_VALIDATORS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_config(
         self,
@@ -993,11 +1298,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_state(
         self,
@@ -1006,11 +1315,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_validator_owner_and_manager(
         self,
@@ -1019,11 +1332,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pools(
         self,
@@ -1032,11 +1349,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOLS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pool_app_id(
         self,
@@ -1045,11 +1366,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOL_APP_ID_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_pool_info(
         self,
@@ -1058,11 +1383,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_POOL_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_cur_max_stake_per_pool(
         self,
@@ -1071,11 +1400,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_CUR_MAX_STAKE_PER_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def does_staker_need_to_pay_mbr(
         self,
@@ -1084,11 +1417,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DOES_STAKER_NEED_TO_PAY_MBR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_staked_pools_for_account(
         self,
@@ -1097,11 +1434,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_token_payout_ratio(
         self,
@@ -1110,11 +1451,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_node_pool_assignments(
         self,
@@ -1123,11 +1468,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NODE_POOL_ASSIGNMENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_nfd_registry_id(
         self,
@@ -1135,10 +1484,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_NFD_REGISTRY_ID_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_validator(
         self,
@@ -1147,11 +1501,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_manager(
         self,
@@ -1160,11 +1518,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_sunset_info(
         self,
@@ -1173,11 +1535,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_nfd(
         self,
@@ -1186,11 +1552,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_commission_address(
         self,
@@ -1199,11 +1569,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def change_validator_reward_info(
         self,
@@ -1212,11 +1586,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_pool(
         self,
@@ -1225,11 +1603,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def add_stake(
         self,
@@ -1238,11 +1620,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_token_payout_ratio(
         self,
@@ -1251,11 +1637,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def stake_updated_via_rewards(
         self,
@@ -1264,11 +1654,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def stake_removed(
         self,
@@ -1277,11 +1671,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def find_pool_for_staker(
         self,
@@ -1290,11 +1688,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _FIND_POOL_FOR_STAKER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def move_pool_to_node(
         self,
@@ -1303,11 +1705,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def empty_token_rewards(
         self,
@@ -1316,11 +1722,15 @@ class ValidatorRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -1345,11 +1755,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "initStakingContract(uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _INIT_STAKING_CONTRACT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _INIT_STAKING_CONTRACT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1361,11 +1775,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "loadStakingContractData(uint64,byte[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _LOAD_STAKING_CONTRACT_DATA_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _LOAD_STAKING_CONTRACT_DATA_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1376,10 +1794,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "finalizeStakingContract()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _FINALIZE_STAKING_CONTRACT_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _FINALIZE_STAKING_CONTRACT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1390,10 +1813,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "gas()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _GAS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _GAS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1406,7 +1834,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getMbrAmounts()(uint64,uint64,uint64,uint64)",
+            "method": _GET_MBR_AMOUNTS_METHOD.signature,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(MbrAmounts, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[MbrAmounts], parsed_response)
@@ -1420,7 +1848,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)",
+            "method": _GET_PROTOCOL_CONSTRAINTS_METHOD.signature,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Constraints, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[Constraints], parsed_response)
@@ -1434,7 +1862,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNumValidators()uint64",
+            "method": _GET_NUM_VALIDATORS_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
@@ -1449,7 +1877,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)",
+            "method": _GET_VALIDATOR_CONFIG_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorConfig, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1465,7 +1893,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorState(uint64)(uint16,uint64,uint64,uint64)",
+            "method": _GET_VALIDATOR_STATE_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorCurState, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1481,7 +1909,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getValidatorOwnerAndManager(uint64)(address,address)",
+            "method": _GET_VALIDATOR_OWNER_AND_MANAGER_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1497,7 +1925,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPools(uint64)(uint64,uint16,uint64)[]",
+            "method": _GET_POOLS_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1513,7 +1941,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPoolAppId(uint64,uint64)uint64",
+            "method": _GET_POOL_APP_ID_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1529,7 +1957,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)",
+            "method": _GET_POOL_INFO_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolInfo, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1545,7 +1973,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getCurMaxStakePerPool(uint64)uint64",
+            "method": _GET_CUR_MAX_STAKE_PER_POOL_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1561,7 +1989,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "doesStakerNeedToPayMBR(address)bool",
+            "method": _DOES_STAKER_NEED_TO_PAY_MBR_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1577,7 +2005,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]",
+            "method": _GET_STAKED_POOLS_FOR_ACCOUNT_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1593,7 +2021,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getTokenPayoutRatio(uint64)(uint64[24],uint64)",
+            "method": _GET_TOKEN_PAYOUT_RATIO_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1609,7 +2037,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNodePoolAssignments(uint64)((uint64[3])[8])",
+            "method": _GET_NODE_POOL_ASSIGNMENTS_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(NodePoolAssignmentConfig, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1624,7 +2052,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "getNFDRegistryID()uint64",
+            "method": _GET_NFD_REGISTRY_ID_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
@@ -1637,11 +2065,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_VALIDATOR_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ADD_VALIDATOR_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1653,11 +2085,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorManager(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_MANAGER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_MANAGER_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1669,11 +2105,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorSunsetInfo(uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_SUNSET_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_SUNSET_INFO_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1685,11 +2125,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorNFD(uint64,uint64,string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_NFD_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_NFD_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1701,11 +2145,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorCommissionAddress(uint64,address)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_COMMISSION_ADDRESS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1717,11 +2165,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CHANGE_VALIDATOR_REWARD_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CHANGE_VALIDATOR_REWARD_INFO_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1733,12 +2185,16 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorPoolKey]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addPool(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_POOL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ADD_POOL_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorPoolKey], parsed_response)
 
     def add_stake(
@@ -1749,12 +2205,16 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[ValidatorPoolKey]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "addStake(pay,uint64,uint64)(uint64,uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _ADD_STAKE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ADD_STAKE_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ValidatorPoolKey, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[ValidatorPoolKey], parsed_response)
 
     def set_token_payout_ratio(
@@ -1765,12 +2225,16 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "setTokenPayoutRatio(uint64)(uint64[24],uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_TOKEN_PAYOUT_RATIO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_TOKEN_PAYOUT_RATIO_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PoolTokenPayoutRatio, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[PoolTokenPayoutRatio], parsed_response)
 
     def stake_updated_via_rewards(
@@ -1781,11 +2245,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_UPDATED_VIA_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _STAKE_UPDATED_VIA_REWARDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1797,11 +2265,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _STAKE_REMOVED_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _STAKE_REMOVED_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1815,7 +2287,7 @@ class ValidatorRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)",
+            "method": _FIND_POOL_FOR_STAKER_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -1829,11 +2301,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "movePoolToNode(uint64,uint64,uint64)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _MOVE_POOL_TO_NODE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _MOVE_POOL_TO_NODE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1845,11 +2321,15 @@ class ValidatorRegistrySend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "emptyTokenRewards(uint64,address)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _EMPTY_TOKEN_REWARDS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _EMPTY_TOKEN_REWARDS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1989,7 +2469,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "validatorList",
-            self._struct_classes.get("ValidatorInfo")
+            self._struct_classes.get("ValidatorInfo"),
         )
 
     @property
@@ -1998,7 +2478,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "stakerPoolSet",
-            None
+            None,
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -2399,7 +2879,8 @@ class ValidatorRegistryClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -2426,16 +2907,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | InitStakingContractArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.init_staking_contract(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.init_staking_contract(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "initStakingContract(uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2444,16 +2924,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, bytes | str] | LoadStakingContractDataArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.load_staking_contract_data(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.load_staking_contract_data(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "loadStakingContractData(uint64,byte[])void", v
-            )
+            ),
         )
         return self
 
@@ -2461,16 +2940,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.finalize_staking_contract(
-                
-                params=params,
-            )
+        call_params = self.client.params.finalize_staking_contract(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "finalizeStakingContract()void", v
-            )
+            ),
         )
         return self
 
@@ -2478,16 +2956,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.gas(
-                
-                params=params,
-            )
+        call_params = self.client.params.gas(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "gas()void", v
-            )
+            ),
         )
         return self
 
@@ -2495,16 +2972,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_mbr_amounts(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_mbr_amounts(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getMbrAmounts()(uint64,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2512,16 +2988,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_protocol_constraints(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_protocol_constraints(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getProtocolConstraints()(uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2529,16 +3004,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_num_validators(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_num_validators(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getNumValidators()uint64", v
-            )
+            ),
         )
         return self
 
@@ -2547,16 +3021,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorConfigArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_config(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_config(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getValidatorConfig(uint64)(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2565,16 +3038,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorStateArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getValidatorState(uint64)(uint16,uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2583,16 +3055,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetValidatorOwnerAndManagerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_validator_owner_and_manager(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_validator_owner_and_manager(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getValidatorOwnerAndManager(uint64)(address,address)", v
-            )
+            ),
         )
         return self
 
@@ -2601,16 +3072,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetPoolsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pools(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pools(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getPools(uint64)(uint64,uint16,uint64)[]", v
-            )
+            ),
         )
         return self
 
@@ -2619,16 +3089,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, int] | GetPoolAppIdArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pool_app_id(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pool_app_id(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getPoolAppId(uint64,uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2637,16 +3106,15 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey] | GetPoolInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_pool_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_pool_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getPoolInfo((uint64,uint64,uint64))(uint64,uint16,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2655,16 +3123,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetCurMaxStakePerPoolArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_cur_max_stake_per_pool(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_cur_max_stake_per_pool(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getCurMaxStakePerPool(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2673,16 +3140,15 @@ class ValidatorRegistryComposer:
         args: tuple[str] | DoesStakerNeedToPayMbrArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.does_staker_need_to_pay_mbr(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.does_staker_need_to_pay_mbr(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "doesStakerNeedToPayMBR(address)bool", v
-            )
+            ),
         )
         return self
 
@@ -2691,16 +3157,15 @@ class ValidatorRegistryComposer:
         args: tuple[str] | GetStakedPoolsForAccountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_staked_pools_for_account(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_staked_pools_for_account(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getStakedPoolsForAccount(address)(uint64,uint64,uint64)[]", v
-            )
+            ),
         )
         return self
 
@@ -2709,16 +3174,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetTokenPayoutRatioArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_token_payout_ratio(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_token_payout_ratio(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getTokenPayoutRatio(uint64)(uint64[24],uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2727,16 +3191,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | GetNodePoolAssignmentsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_node_pool_assignments(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_node_pool_assignments(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getNodePoolAssignments(uint64)((uint64[3])[8])", v
-            )
+            ),
         )
         return self
 
@@ -2744,16 +3207,15 @@ class ValidatorRegistryComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_nfd_registry_id(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_nfd_registry_id(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "getNFDRegistryID()uint64", v
-            )
+            ),
         )
         return self
 
@@ -2762,16 +3224,15 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str, ValidatorConfig] | AddValidatorArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_validator(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_validator(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "addValidator(pay,string,(uint64,address,address,uint64,uint8,address,uint64[4],uint64,uint64,uint64,uint32,uint32,address,uint64,uint64,uint8,uint64,uint64))uint64", v
-            )
+            ),
         )
         return self
 
@@ -2780,16 +3241,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | ChangeValidatorManagerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_manager(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_manager(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "changeValidatorManager(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -2798,16 +3258,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, int] | ChangeValidatorSunsetInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_sunset_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_sunset_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "changeValidatorSunsetInfo(uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2816,16 +3275,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, str] | ChangeValidatorNfdArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_nfd(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_nfd(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "changeValidatorNFD(uint64,uint64,string)void", v
-            )
+            ),
         )
         return self
 
@@ -2834,16 +3292,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | ChangeValidatorCommissionAddressArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_commission_address(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_commission_address(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "changeValidatorCommissionAddress(uint64,address)void", v
-            )
+            ),
         )
         return self
 
@@ -2852,16 +3309,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, str, tuple[int, int, int, int], int, int] | ChangeValidatorRewardInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.change_validator_reward_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.change_validator_reward_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "changeValidatorRewardInfo(uint64,uint8,address,uint64[4],uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2870,16 +3326,15 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddPoolArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_pool(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_pool(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "addPool(pay,uint64,uint64)(uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2888,16 +3343,15 @@ class ValidatorRegistryComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | AddStakeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.add_stake(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.add_stake(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "addStake(pay,uint64,uint64)(uint64,uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2906,16 +3360,15 @@ class ValidatorRegistryComposer:
         args: tuple[int] | SetTokenPayoutRatioArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_token_payout_ratio(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_token_payout_ratio(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "setTokenPayoutRatio(uint64)(uint64[24],uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2924,16 +3377,15 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey, int, int, int, int] | StakeUpdatedViaRewardsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.stake_updated_via_rewards(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.stake_updated_via_rewards(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "stakeUpdatedViaRewards((uint64,uint64,uint64),uint64,uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2942,16 +3394,15 @@ class ValidatorRegistryComposer:
         args: tuple[ValidatorPoolKey, str, int, int, bool] | StakeRemovedArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.stake_removed(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.stake_removed(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "stakeRemoved((uint64,uint64,uint64),address,uint64,uint64,bool)void", v
-            )
+            ),
         )
         return self
 
@@ -2960,16 +3411,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, str, int] | FindPoolForStakerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.find_pool_for_staker(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.find_pool_for_staker(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "findPoolForStaker(uint64,address,uint64)((uint64,uint64,uint64),bool,bool)", v
-            )
+            ),
         )
         return self
 
@@ -2978,16 +3428,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, int, int] | MovePoolToNodeArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.move_pool_to_node(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.move_pool_to_node(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "movePoolToNode(uint64,uint64,uint64)void", v
-            )
+            ),
         )
         return self
 
@@ -2996,16 +3445,15 @@ class ValidatorRegistryComposer:
         args: tuple[int, str] | EmptyTokenRewardsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.empty_token_rewards(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.empty_token_rewards(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "emptyTokenRewards(uint64,address)uint64", v
-            )
+            ),
         )
         return self
 
@@ -3016,22 +3464,21 @@ class ValidatorRegistryComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "ValidatorRegistryComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "ValidatorRegistryComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -3047,7 +3494,7 @@ class ValidatorRegistryComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -3061,4 +3508,194 @@ class ValidatorRegistryComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpAddedValidatorEvent:
+    """ARC-28 event retiOP_addedValidator(uint64,address,address)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("a8dd21cb")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">Q32s32s")
+
+    id: int
+    owner: str
+    manager: str
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpAddedValidatorEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            _encode_address(values[1]),
+            _encode_address(values[2]),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpValidatorAddedPoolEvent:
+    """ARC-28 event retiOP_validatorAddedPool(uint64,uint16,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("fbcc0f6b")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ")
+
+    id: int
+    num: int
+    pool_app_id: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpValidatorAddedPoolEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        return cls(*cls._HEAD.unpack_from(data))
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpStakeAddedEvent:
+    """ARC-28 event retiOP_stakeAdded(uint64,uint16,uint64,address,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("962b4143")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ32sQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    staker: str
+    amount_staked: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpStakeAddedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            values[1],
+            values[2],
+            _encode_address(values[3]),
+            values[4],
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpEpochRewardUpdateEvent:
+    """ARC-28 event retiOP_epochRewardUpdate(uint64,uint16,uint64,uint64,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("b3e47c3d")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQQQQQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    validator_commission: int
+    saturated_burn_to_fee_sink: int
+    algo_added: int
+    reward_token_held_back: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpEpochRewardUpdateEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        return cls(*cls._HEAD.unpack_from(data))
+
+
+@dataclasses.dataclass(frozen=True)
+class RetiOpStakeRemovedEvent:
+    """ARC-28 event retiOP_stakeRemoved(uint64,uint16,uint64,address,uint64,uint64,uint64)"""
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("12f4bd4b")
+    _HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">QHQ32sQQQ")
+
+    id: int
+    pool_num: int
+    pool_app_id: int
+    staker: str
+    amount_unstaked: int
+    reward_tokens_received: int
+    reward_token_asset_id: int
+
+    @classmethod
+    def decode(cls, data: bytes) -> "RetiOpStakeRemovedEvent":
+        """Decode the event from its ABI encoded args, i.e. a log without its selector"""
+        values = cls._HEAD.unpack_from(data)
+        return cls(
+            values[0],
+            values[1],
+            values[2],
+            _encode_address(values[3]),
+            values[4],
+            values[5],
+            values[6],
+        )
+
+
+# Encoding an address hashes it, and the same addresses are usually logged many times, e.g. by a busy account
+_encode_address = functools.lru_cache(maxsize=4096)(algosdk.encoding.encode_address)
+
+
+def _decode_abi_bytes(data: bytes, offset: int) -> bytes:
+    """Decode a dynamic byte array or string at offset in data"""
+    return data[offset + 2 : offset + 2 + int.from_bytes(data[offset : offset + 2], "big")]
+
+
+ValidatorRegistryEvent: typing.TypeAlias = RetiOpAddedValidatorEvent | RetiOpValidatorAddedPoolEvent | RetiOpStakeAddedEvent | RetiOpEpochRewardUpdateEvent | RetiOpStakeRemovedEvent
+
+# Decoders for each event, by the 4 byte selector that prefixes its logs
+EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], ValidatorRegistryEvent]] = {
+    RetiOpAddedValidatorEvent.SELECTOR: RetiOpAddedValidatorEvent.decode,
+    RetiOpValidatorAddedPoolEvent.SELECTOR: RetiOpValidatorAddedPoolEvent.decode,
+    RetiOpStakeAddedEvent.SELECTOR: RetiOpStakeAddedEvent.decode,
+    RetiOpEpochRewardUpdateEvent.SELECTOR: RetiOpEpochRewardUpdateEvent.decode,
+    RetiOpStakeRemovedEvent.SELECTOR: RetiOpStakeRemovedEvent.decode,
+}
+
+
+def decode_event(log: bytes | str) -> ValidatorRegistryEvent | None:
+    """Decode an event from a log, which is base64 encoded if a str, or None if the log isn't one of the events"""
+    data = base64.b64decode(log) if isinstance(log, str) else log
+    decoder = EVENT_DECODERS.get(data[:4])
+    return decoder(data[4:]) if decoder else None
+
+
+def decode_events(logs: typing.Iterable[bytes | str]) -> list[ValidatorRegistryEvent]:
+    """Decode the events from logs, e.g. all the logs of a block, skipping logs that aren't events
+
+    Logs are base64 encoded if a str, as returned by algod and indexer
+    """
+    decoders = EVENT_DECODERS
+    events = []
+    for log in logs:
+        data = base64.b64decode(log) if isinstance(log, str) else log
+        decoder = decoders.get(data[:4])
+        if decoder is not None:
+            events.append(decoder(data[4:]))
+    return events
+
+
+def decode_transaction_events(
+    transactions: typing.Iterable[typing.Mapping[str, typing.Any]], app_id: int | None = None
+) -> list[ValidatorRegistryEvent]:
+    """Decode the events from the logs of transactions, each followed by those of its inner transactions
+
+    :param transactions: Transactions as returned by indexer, e.g. a page of transactions from a search
+    :param app_id: If set, only decode the events logged by this app
+    """
+    events: list[ValidatorRegistryEvent] = []
+    pending = list(reversed(list(transactions)))
+    while pending:
+        transaction = pending.pop()
+        logs = transaction.get("logs")
+        app_transaction = transaction.get("application-transaction") or {}
+        # indexer reports an application-id of 0 for app creates, the created app is reported separately
+        logged_by = app_transaction.get("application-id") or transaction.get("created-application-index")
+        if logs and (app_id is None or logged_by == app_id):
+            events.extend(decode_events(logs))
+        pending.extend(reversed(transaction.get("inner-txns") or []))
+    return events
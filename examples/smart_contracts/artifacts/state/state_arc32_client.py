@@ -6,7 +6,14 @@
 # requires: algokit-utils@^3.0.0
 
 # common
+import array
+import concurrent.futures
+import copy
 import dataclasses
+import functools
+import importlib
+import threading
+import time
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +71,415 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_ERROR_METHOD = _AbiMethod("error()void", bytes.fromhex("44d0da0d"))
+_CALL_ABI_METHOD = _AbiMethod("call_abi(string)string", bytes.fromhex("f17e80a5"))
+_CALL_ABI_TXN_METHOD = _AbiMethod("call_abi_txn(pay,string)string", bytes.fromhex("0a92a81e"))
+_CALL_WITH_REFERENCES_METHOD = _AbiMethod("call_with_references(asset,account,application)uint64", bytes.fromhex("fefdf11e"))
+_DEFAULT_VALUE_METHOD = _AbiMethod("default_value(string)string", bytes.fromhex("574b55c8"))
+_DEFAULT_VALUE_INT_METHOD = _AbiMethod("default_value_int(uint64)uint64", bytes.fromhex("360362e9"))
+_DEFAULT_VALUE_FROM_ABI_METHOD = _AbiMethod("default_value_from_abi(string)string", bytes.fromhex("46d211a3"))
+_DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD = _AbiMethod("default_value_from_global_state(uint64)uint64", bytes.fromhex("0cfcbb00"))
+_DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD = _AbiMethod("default_value_from_local_state(string)string", bytes.fromhex("d0f0baf8"))
+_STRUCTS_METHOD = _AbiMethod("structs((string,uint64))(string,uint64)", bytes.fromhex("246beb83"))
+_SET_GLOBAL_METHOD = _AbiMethod("set_global(uint64,uint64,string,byte[4])void", bytes.fromhex("a4cf8dea"))
+_SET_LOCAL_METHOD = _AbiMethod("set_local(uint64,uint64,string,byte[4])void", bytes.fromhex("cec2834a"))
+_SET_BOX_METHOD = _AbiMethod("set_box(byte[4],string)void", bytes.fromhex("a4b4a230"))
+_CREATE_ABI_METHOD = _AbiMethod("create_abi(string)string", bytes.fromhex("9d523040"))
+_UPDATE_ABI_METHOD = _AbiMethod("update_abi(string)string", bytes.fromhex("3ca5ceb7"))
+_DELETE_ABI_METHOD = _AbiMethod("delete_abi(string)string", bytes.fromhex("271b4ee9"))
+_OPT_IN_METHOD = _AbiMethod("opt_in()void", bytes.fromhex("30c6d58a"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _ERROR_METHOD.signature: _ERROR_METHOD,
+    _CALL_ABI_METHOD.signature: _CALL_ABI_METHOD,
+    _CALL_ABI_TXN_METHOD.signature: _CALL_ABI_TXN_METHOD,
+    _CALL_WITH_REFERENCES_METHOD.signature: _CALL_WITH_REFERENCES_METHOD,
+    _DEFAULT_VALUE_METHOD.signature: _DEFAULT_VALUE_METHOD,
+    _DEFAULT_VALUE_INT_METHOD.signature: _DEFAULT_VALUE_INT_METHOD,
+    _DEFAULT_VALUE_FROM_ABI_METHOD.signature: _DEFAULT_VALUE_FROM_ABI_METHOD,
+    _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD.signature: _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+    _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD.signature: _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+    _STRUCTS_METHOD.signature: _STRUCTS_METHOD,
+    _SET_GLOBAL_METHOD.signature: _SET_GLOBAL_METHOD,
+    _SET_LOCAL_METHOD.signature: _SET_LOCAL_METHOD,
+    _SET_BOX_METHOD.signature: _SET_BOX_METHOD,
+    _CREATE_ABI_METHOD.signature: _CREATE_ABI_METHOD,
+    _UPDATE_ABI_METHOD.signature: _UPDATE_ABI_METHOD,
+    _DELETE_ABI_METHOD.signature: _DELETE_ABI_METHOD,
+    _OPT_IN_METHOD.signature: _OPT_IN_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
+class NetworkCache:
+    """Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `StateFactory(..., cache=cache)`
+    and `StateClient(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    """
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        """Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached"""
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        """Get the apps created by `creator_address` by name, looking them up if not cached"""
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        """Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires"""
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+
+_T = typing.TypeVar("_T")
+
+
+class ReadonlyCallCache:
+    """Caches the results of read-only method calls for a round
+
+    Read-only methods are simulated, so need no signing or fees, but still call algod. Set `round` whenever a new
+    round is seen, e.g. by a block subscriber, so repeated calls within the round are answered from the cache.
+    Results are keyed by method signature, ABI encoded args, sender and round, are only cached while `round` is set
+    and are dropped when it changes. Cached results are shared by every call that hits them, so shouldn't be
+    modified. Use with `client.send.readonly_cache = ReadonlyCallCache()`.
+    """
+
+    def __init__(self, round: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._round = round
+        self._results: dict[tuple[object, ...], object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def round(self) -> int | None:
+        return self._round
+
+    @round.setter
+    def round(self, value: int | None) -> None:
+        with self._lock:
+            if value != self._round:
+                self._results.clear()
+                self._round = value
+
+    def get_or_send(
+        self, method: _AbiMethod, args: list[object] | None, sender: str | None, send: typing.Callable[[], _T]
+    ) -> _T:
+        """Get the cached result of a call for the current round, or send it and cache the result"""
+        current_round = self._round
+        encoded_args = self._encode_args(method, args) if current_round is not None else None
+        if encoded_args is None:
+            return send()
+        key = (method.signature, encoded_args, sender, current_round)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return typing.cast(_T, self._results[key])
+            self.misses += 1
+        result = send()
+        with self._lock:
+            if self._round == current_round:
+                self._results[key] = result
+        return result
+
+    def _encode_args(self, method: _AbiMethod, args: list[object] | None) -> tuple[bytes, ...] | None:
+        # None if the args can't be part of a key, e.g. transactions, so the call isn't cached
+        encoded_args = []
+        try:
+            for arg_type, value in zip(method.arg_types, args or [], strict=False):
+                if isinstance(arg_type, algosdk.abi.ABIType):
+                    encoded_args.append(arg_type.encode(value))
+                elif isinstance(value, int | str):  # reference types, e.g. an account or asset
+                    encoded_args.append(repr(value).encode())
+                else:
+                    return None
+        except Exception:
+            return None
+        return tuple(encoded_args)
+
+
+# Used when no cache is set, as a cache without a round sends every call
+_NO_READONLY_CACHE = ReadonlyCallCache()
+
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    """A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,
+        cache: NetworkCache | None = None,
+    ) -> None:
+        self.app_client = app_client
+        self.cache = cache
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        """Get the params for a call with the given args"""
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        """Build the transactions for a call with the given args"""
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        """Send a call with the given args, or simulate it if the method is read-only"""
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
+
+
+def _fetch_many(
+    keys: typing.Iterable[_KeyT],
+    fetch: typing.Callable[[_KeyT], _ValueT | None],
+    concurrency: int,
+    progress: typing.Callable[[int, int], None] | None,
+) -> dict[_KeyT, _ValueT]:
+    """Fetch the value for each key concurrently, omitting None values, in the order of `keys`"""
+    unique_keys = list(dict.fromkeys(keys))
+    results: dict[_KeyT, _ValueT | None] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {executor.submit(fetch, key): key for key in unique_keys}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(unique_keys))
+    finally:
+        # on failure, the keys that haven't been fetched yet are abandoned rather than waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {key: value for key in unique_keys if (value := results[key]) is not None}
+
+
+# The name of each column, the path to its value in each row, and its array typecode if it has a fixed size type
+_ColumnSpec = tuple[tuple[str, tuple[str, ...], str | None], ...]
+
+
+def _to_columns(rows: typing.Iterable[object], columns: _ColumnSpec) -> dict[str, typing.Any]:
+    """Collect the values of each column from rows, without keeping the rows
+
+    Columns with a typecode are `array.array`s, or NumPy arrays sharing their memory if NumPy is installed, unless
+    they have values that don't fit the typecode, and other columns are lists.
+    """
+    values: list[typing.Any] = [array.array(typecode) if typecode else [] for _, _, typecode in columns]
+    for row in rows:
+        for index, (_, path, _) in enumerate(columns):
+            value = row
+            for part in path:
+                if value is None:  # a struct key that isn't set has no fields
+                    break
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            try:
+                values[index].append(value)
+            except (TypeError, OverflowError):  # e.g. a key that isn't set, so the column can't be a typed array
+                values[index] = [*values[index], value]
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError:
+        return dict(zip((name for name, _, _ in columns), values, strict=True))
+    dtypes = {"Q": numpy.uint64, "B": numpy.bool_}
+    return {
+        name: numpy.frombuffer(column, dtype=dtypes[column.typecode]) if isinstance(column, array.array) else column
+        for (name, _, _), column in zip(columns, values, strict=True)
+    }
+
 @dataclasses.dataclass(frozen=True)
 class Input:
     """Struct for Input"""
@@ -243,7 +659,7 @@ class _StateUpdate:
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
         return self.app_client.params.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
+            "method": _UPDATE_ABI_METHOD.signature,
             "args": method_args,
         }))
 
@@ -264,11 +680,14 @@ class _StateDelete:
     ) -> algokit_utils.AppDeleteMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DELETE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
 
 
 class _StateOptIn:
@@ -281,10 +700,14 @@ class _StateOptIn:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
 
 class StateParams:
@@ -309,10 +732,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ERROR_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_abi(
         self,
@@ -321,11 +748,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_abi_txn(
         self,
@@ -334,11 +764,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_ABI_TXN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_with_references(
         self,
@@ -347,11 +780,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value(
         self,
@@ -360,11 +796,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_int(
         self,
@@ -373,11 +812,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_INT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_abi(
         self,
@@ -386,11 +828,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_global_state(
         self,
@@ -399,11 +844,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_local_state(
         self,
@@ -412,11 +860,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def structs(
         self,
@@ -425,11 +876,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_global(
         self,
@@ -438,11 +892,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_local(
         self,
@@ -451,11 +908,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_box(
         self,
@@ -464,11 +924,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def create_abi(
         self,
@@ -477,11 +940,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CREATE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -495,10 +961,13 @@ class StateParams:
 
 
 class _StateUpdateTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.update(params)
 
     def update_abi(
@@ -510,18 +979,23 @@ class _StateUpdateTransaction:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
+            "method": _UPDATE_ABI_METHOD.signature,
             "args": method_args,
         }))
 
 
 class _StateDeleteTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.delete(params)
 
     def delete_abi(
@@ -531,16 +1005,23 @@ class _StateDeleteTransaction:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_delete_method_call(call_params)
 
 
 class _StateOptInTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def opt_in(
         self,
@@ -548,27 +1029,35 @@ class _StateOptInTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
 
 class StateCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     @property
     def update(self) -> "_StateUpdateTransaction":
-        return _StateUpdateTransaction(self.app_client)
+        return _StateUpdateTransaction(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_StateDeleteTransaction":
-        return _StateDeleteTransaction(self.app_client)
+        return _StateDeleteTransaction(self.app_client, self.cache)
 
     @property
     def opt_in(self) -> "_StateOptInTransaction":
-        return _StateOptInTransaction(self.app_client)
+        return _StateOptInTransaction(self.app_client, self.cache)
 
     def error(
         self,
@@ -576,10 +1065,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ERROR_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_abi(
         self,
@@ -588,11 +1084,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_abi_txn(
         self,
@@ -601,11 +1103,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_ABI_TXN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_with_references(
         self,
@@ -614,11 +1122,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value(
         self,
@@ -627,11 +1141,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_int(
         self,
@@ -640,11 +1160,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_INT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_abi(
         self,
@@ -653,11 +1179,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_global_state(
         self,
@@ -666,11 +1198,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_local_state(
         self,
@@ -679,11 +1217,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def structs(
         self,
@@ -692,11 +1236,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_global(
         self,
@@ -705,11 +1255,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_local(
         self,
@@ -718,11 +1274,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_box(
         self,
@@ -731,11 +1293,17 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def create_abi(
         self,
@@ -744,17 +1312,25 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
         
     ) -> Transaction:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.create_transaction.bare.clear_state(
             params,
             
@@ -762,8 +1338,9 @@ class StateCreateTransactionParams:
 
 
 class _StateUpdateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -771,6 +1348,8 @@ class _StateUpdateSend:
         send_params: algokit_utils.SendParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.update(
             params=params,
             send_params=send_params,
@@ -787,9 +1366,11 @@ class _StateUpdateSend:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         response = self.app_client.send.update(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "update_abi(string)string",
+            "method": _UPDATE_ABI_METHOD.signature,
             "args": method_args,
         }), send_params=send_params, compilation_params=compilation_params)
         parsed_response = response
@@ -797,8 +1378,9 @@ class _StateUpdateSend:
 
 
 class _StateDeleteSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def bare(
         self,
@@ -806,6 +1388,8 @@ class _StateDeleteSend:
         send_params: algokit_utils.SendParams | None = None,
         
     ) -> algokit_utils.SendAppTransactionResult:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.delete(
             params=params,
             send_params=send_params,
@@ -820,18 +1404,25 @@ class _StateDeleteSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "delete_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _DELETE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.DeleteApplicationOC,
+            algokit_utils.AppDeleteMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _DELETE_ABI_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
 
 class _StateOptInSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
 
     def opt_in(
         self,
@@ -840,29 +1431,39 @@ class _StateOptInSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _OPT_IN_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
 
 class StateSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
         self.app_client = app_client
+        self.cache = cache
+        self.readonly_cache: ReadonlyCallCache | None = None
+        """Answers repeated read-only calls within a round, see `ReadonlyCallCache`"""
 
     @property
     def update(self) -> "_StateUpdateSend":
-        return _StateUpdateSend(self.app_client)
+        return _StateUpdateSend(self.app_client, self.cache)
 
     @property
     def delete(self) -> "_StateDeleteSend":
-        return _StateDeleteSend(self.app_client)
+        return _StateDeleteSend(self.app_client, self.cache)
 
     @property
     def opt_in(self) -> "_StateOptInSend":
-        return _StateOptInSend(self.app_client)
+        return _StateOptInSend(self.app_client, self.cache)
 
     def error(
         self,
@@ -871,10 +1472,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _ERROR_METHOD,
+            None,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "error()void",
-        }), send_params=send_params)
+            "method": _ERROR_METHOD.signature,
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -886,11 +1494,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _CALL_ABI_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
+            "method": _CALL_ABI_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -902,11 +1517,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _CALL_ABI_TXN_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
+            "method": _CALL_ABI_TXN_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -918,11 +1540,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CALL_WITH_REFERENCES_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -934,11 +1562,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DEFAULT_VALUE_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value(string)string",
+            "method": _DEFAULT_VALUE_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -950,11 +1585,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DEFAULT_VALUE_INT_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
+            "method": _DEFAULT_VALUE_INT_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -966,11 +1608,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DEFAULT_VALUE_FROM_ABI_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
+            "method": _DEFAULT_VALUE_FROM_ABI_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -982,11 +1631,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
+            "method": _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -998,11 +1654,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+            _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+            method_args,
+            params.sender,
+            lambda: self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
+            "method": _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD.signature,
             "args": method_args,
-        }), send_params=send_params)
+        }), send_params=send_params),
+        )
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -1014,12 +1677,18 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[Output]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Output, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _STRUCTS_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Output, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[Output], parsed_response)
 
     def set_global(
@@ -1030,11 +1699,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SET_GLOBAL_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1046,11 +1721,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SET_LOCAL_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1062,11 +1743,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _SET_BOX_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1078,11 +1765,17 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[str]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "create_abi(string)string",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CREATE_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
+        response = _send_method_call(self.app_client, _CREATE_ABI_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
@@ -1091,12 +1784,85 @@ class StateSend:
         params: algokit_utils.AppClientBareCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)
         return self.app_client.send.bare.clear_state(
             params,
             send_params=send_params,
         )
 
 
+class StatePrepare:
+    def __init__(self, app_client: algokit_utils.AppClient, cache: NetworkCache | None = None):
+        self.app_client = app_client
+        self.cache = cache
+
+    def error(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[None, None]:
+        return PreparedCall(self.app_client, _ERROR_METHOD, params, cache=self.cache)
+
+    def call_abi(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str] | CallAbiArgs, str]:
+        return PreparedCall(self.app_client, _CALL_ABI_METHOD, params, cache=self.cache)
+
+    def call_abi_txn(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs, str]:
+        return PreparedCall(self.app_client, _CALL_ABI_TXN_METHOD, params, cache=self.cache)
+
+    def call_with_references(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, str | bytes, int] | CallWithReferencesArgs, int]:
+        return PreparedCall(self.app_client, _CALL_WITH_REFERENCES_METHOD, params, cache=self.cache)
+
+    def default_value(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str | None] | DefaultValueArgs, str]:
+        return PreparedCall(self.app_client, _DEFAULT_VALUE_METHOD, params, cache=self.cache)
+
+    def default_value_int(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int | None] | DefaultValueIntArgs, int]:
+        return PreparedCall(self.app_client, _DEFAULT_VALUE_INT_METHOD, params, cache=self.cache)
+
+    def default_value_from_abi(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str | None] | DefaultValueFromAbiArgs, str]:
+        return PreparedCall(self.app_client, _DEFAULT_VALUE_FROM_ABI_METHOD, params, cache=self.cache)
+
+    def default_value_from_global_state(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int | None] | DefaultValueFromGlobalStateArgs, int]:
+        return PreparedCall(self.app_client, _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD, params, cache=self.cache)
+
+    def default_value_from_local_state(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[str | None] | DefaultValueFromLocalStateArgs, str]:
+        return PreparedCall(self.app_client, _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD, params, cache=self.cache)
+
+    def structs(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[Input] | StructsArgs, Output]:
+        return PreparedCall(self.app_client, _STRUCTS_METHOD, params, result_struct=Output, cache=self.cache)
+
+    def set_global(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs, None]:
+        return PreparedCall(self.app_client, _SET_GLOBAL_METHOD, params, cache=self.cache)
+
+    def set_local(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs, None]:
+        return PreparedCall(self.app_client, _SET_LOCAL_METHOD, params, cache=self.cache)
+
+    def set_box(
+        self, params: algokit_utils.CommonAppCallParams | None = None
+    ) -> PreparedCall[tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs, None]:
+        return PreparedCall(self.app_client, _SET_BOX_METHOD, params, cache=self.cache)
+
+
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     bytes1: bytes
@@ -1127,12 +1893,78 @@ class StateState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    def global_state_columns(
+        self,
+        app_ids: typing.Iterable[int],
+        *,
+        concurrency: int = 8,
+        progress: typing.Callable[[int, int], None] | None = None,
+    ) -> dict[str, typing.Any]:
+        """Get the global state of many instances of the app as columns, fetched concurrently
+    
+        Returns an `app_id` column and a column for each key, or for each field of keys with struct values, in the
+        order of `app_ids`, omitting apps that don't exist. Columns of uints up to 64 bits and bools are NumPy arrays
+        if NumPy is installed, or `array.array`s otherwise.
+        """
+        columns: _ColumnSpec = (
+            ("bytes1", ("bytes1",), None),
+            ("bytes2", ("bytes2",), None),
+            ("bytesNotInSnakeCase", ("bytesNotInSnakeCase",), None),
+            ("int1", ("int1",), "Q"),
+            ("int2", ("int2",), "Q"),
+            ("value", ("value",), "Q"),
+        )
+        states = _fetch_many(app_ids, _GlobalState(self.app_client)._get_all_of_app, concurrency, progress)
+        return {"app_id": list(states), **_to_columns(states.values(), columns)}
+
     def local_state(
         self, address: str
     ) -> "_LocalState":
             """Methods to access local_state for the current app"""
             return _LocalState(self.app_client, address)
 
+    def local_state_many(
+        self,
+        addresses: typing.Iterable[str],
+        *,
+        concurrency: int = 8,
+        progress: typing.Callable[[int, int], None] | None = None,
+    ) -> dict[str, LocalStateValue]:
+        """Get the local state of many accounts, fetched concurrently
+    
+        Returns the local state of each account by address, in the order of `addresses`, omitting accounts that aren't
+        opted in to the app. `progress` is called with the number of accounts fetched so far and the total number of
+        accounts as each account is fetched.
+        """
+        return _fetch_many(
+            addresses,
+            lambda address: _LocalState(self.app_client, address)._get_all_if_opted_in(),
+            concurrency,
+            progress,
+        )
+    
+    def local_state_columns(
+        self,
+        addresses: typing.Iterable[str],
+        *,
+        concurrency: int = 8,
+        progress: typing.Callable[[int, int], None] | None = None,
+    ) -> dict[str, typing.Any]:
+        """Get the local state of many accounts as columns, see `local_state_many`
+    
+        Returns an `address` column and a column for each key, or for each field of keys with struct values. Columns
+        of uints up to 64 bits and bools are NumPy arrays if NumPy is installed, or `array.array`s otherwise.
+        """
+        columns: _ColumnSpec = (
+            ("localBytesNotInSnakeCase", ("localBytesNotInSnakeCase",), None),
+            ("local_bytes1", ("local_bytes1",), None),
+            ("local_bytes2", ("local_bytes2",), None),
+            ("local_int1", ("local_int1",), "Q"),
+            ("local_int2", ("local_int2",), "Q"),
+        )
+        states = self.local_state_many(addresses, concurrency=concurrency, progress=progress)
+        return {"address": list(states), **_to_columns(states.values(), columns)}
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -1156,6 +1988,35 @@ class _GlobalState:
             )
         return typing.cast(GlobalStateValue, converted)
 
+    def _get_all_of_app(self, app_id: int) -> GlobalStateValue | None:
+        # reads the global state of an instance of the app in one request, and is None rather than an error if it
+        # doesn't exist
+        try:
+            app_info = self.app_client.algorand.client.algod.application_info(app_id)
+        except algosdk.error.AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return self._decode_all(typing.cast(dict, app_info)["params"].get("global-state", []))
+
+    def _decode_all(self, key_values: list[typing.Any]) -> GlobalStateValue:
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        converted = {}
+        for key, key_info in self.app_client.app_spec.state.keys.global_state.items():
+            value = state.get(key_info.key)
+            decoded = (
+                algokit_utils.applications.abi.get_abi_decoded_value(
+                    value.value_raw, key_info.value_type, self.app_client.app_spec.structs
+                )
+                if value and value.value_raw
+                else value.value if value else None
+            )
+            struct_class = self._struct_classes.get(key_info.value_type)
+            converted[key] = (
+                _init_dataclass(struct_class, decoded) if struct_class and isinstance(decoded, dict) else decoded
+            )
+        return typing.cast(GlobalStateValue, converted)
+
     @property
     def bytes1(self) -> bytes:
         """Get the current value of the bytes1 key in global_state state"""
@@ -1227,6 +2088,36 @@ class _LocalState:
             )
         return typing.cast(LocalStateValue, converted)
 
+    def _get_all_if_opted_in(self) -> LocalStateValue | None:
+        # reads the account's local state in one request, and is None rather than an error if it isn't opted in
+        try:
+            app_info = self.app_client.algorand.client.algod.account_application_info(
+                self.address, self.app_client.app_id
+            )
+        except algosdk.error.AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return self._decode_all(typing.cast(dict, app_info).get("app-local-state", {}).get("key-value", []))
+
+    def _decode_all(self, key_values: list[typing.Any]) -> LocalStateValue:
+        state = {value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}
+        converted = {}
+        for key, key_info in self.app_client.app_spec.state.keys.local_state.items():
+            value = state.get(key_info.key)
+            decoded = (
+                algokit_utils.applications.abi.get_abi_decoded_value(
+                    value.value_raw, key_info.value_type, self.app_client.app_spec.structs
+                )
+                if value and value.value_raw
+                else value.value if value else None
+            )
+            struct_class = self._struct_classes.get(key_info.value_type)
+            converted[key] = (
+                _init_dataclass(struct_class, decoded) if struct_class and isinstance(decoded, dict) else decoded
+            )
+        return typing.cast(LocalStateValue, converted)
+
     @property
     def local_bytes_not_in_snake_case(self) -> bytes:
         """Get the current value of the localBytesNotInSnakeCase key in local_state state"""
@@ -1271,7 +2162,7 @@ class StateClient:
     """Client for interacting with State smart contract"""
 
     @typing.overload
-    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    def __init__(self, app_client: algokit_utils.AppClient, *, cache: NetworkCache | None = None) -> None: ...
     
     @typing.overload
     def __init__(
@@ -1284,6 +2175,7 @@ class StateClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None: ...
 
     def __init__(
@@ -1297,6 +2189,7 @@ class StateClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> None:
         if app_client:
             self.app_client = app_client
@@ -1316,9 +2209,11 @@ class StateClient:
         else:
             raise ValueError("Either app_client or algorand and app_id must be provided")
     
+        self.cache = cache
         self.params = StateParams(self.app_client)
-        self.create_transaction = StateCreateTransactionParams(self.app_client)
-        self.send = StateSend(self.app_client)
+        self.create_transaction = StateCreateTransactionParams(self.app_client, cache)
+        self.send = StateSend(self.app_client, cache)
+        self.prepare = StatePrepare(self.app_client, cache)
         self.state = StateState(self.app_client)
 
     @staticmethod
@@ -1332,7 +2227,10 @@ class StateClient:
         clear_source_map: SourceMap | None = None,
         ignore_cache: bool | None = None,
         app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        cache: NetworkCache | None = None,
     ) -> "StateClient":
+        if cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)
         return StateClient(
             algokit_utils.AppClient.from_creator_and_name(
                 creator_address=creator_address,
@@ -1345,7 +2243,8 @@ class StateClient:
                 clear_source_map=clear_source_map,
                 ignore_cache=ignore_cache,
                 app_lookup_cache=app_lookup_cache,
-            )
+            ),
+            cache=cache,
         )
     
     @staticmethod
@@ -1356,6 +2255,7 @@ class StateClient:
         default_signer: TransactionSigner | None = None,
         approval_source_map: SourceMap | None = None,
         clear_source_map: SourceMap | None = None,
+        cache: NetworkCache | None = None,
     ) -> "StateClient":
         return StateClient(
             algokit_utils.AppClient.from_network(
@@ -1366,7 +2266,8 @@ class StateClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=cache,
         )
 
     @property
@@ -1404,7 +2305,8 @@ class StateClient:
                 default_signer=default_signer,
                 approval_source_map=approval_source_map,
                 clear_source_map=clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def new_group(self) -> "StateComposer":
@@ -1528,7 +2430,8 @@ class StateClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -1629,6 +2532,37 @@ class StateBareCallDeleteParams(algokit_utils.AppClientBareCallParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallParams:
         return algokit_utils.AppClientBareCallParams(**self.__dict__)
 
+class StateFactoryDeployKwargs(typing.TypedDict, total=False):
+    """Keyword arguments of `StateFactory.deploy`, e.g. for `deploy_many`"""
+    on_update: algokit_utils.OnUpdate | None
+    on_schema_break: algokit_utils.OnSchemaBreak | None
+    create_params: StateMethodCallCreateParams | StateBareCallCreateParams | None
+    update_params: StateMethodCallUpdateParams | StateBareCallUpdateParams | None
+    delete_params: StateMethodCallDeleteParams | StateBareCallDeleteParams | None
+    existing_deployments: algokit_utils.ApplicationLookup | None
+    ignore_cache: bool
+    app_name: str | None
+    compilation_params: algokit_utils.AppClientCompilationParams | None
+    send_params: algokit_utils.SendParams | None
+
+
+class StateDeployManyError(Exception):
+    """Raised by `StateFactory.deploy_many` when any of the deploys fail"""
+
+    def __init__(
+        self, outcomes: list[tuple[StateClient, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        """The client and deploy result of each deployment in order, or the exception it raised"""
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{len(errors)} of {len(outcomes)} deploys failed, the first with: {errors[0]!r}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[StateClient, algokit_utils.AppFactoryDeployResult]]:
+        """The client and deploy result of each deployment that succeeded, by its index"""
+        return {idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}
+
+
 class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreateParams | StateBareCallCreateParams, StateMethodCallUpdateParams | StateBareCallUpdateParams, StateMethodCallDeleteParams | StateBareCallDeleteParams]):
     """Factory for deploying and managing StateClient smart contracts"""
 
@@ -1641,6 +2575,7 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
         default_signer: TransactionSigner | None = None,
         version: str | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        cache: NetworkCache | None = None,
     ):
         self.app_factory = algokit_utils.AppFactory(
             params=algokit_utils.AppFactoryParams(
@@ -1654,8 +2589,10 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
             )
         )
         self.params = StateFactoryParams(self.app_factory)
-        self.create_transaction = StateFactoryCreateTransaction(self.app_factory)
-        self.send = StateFactorySend(self.app_factory)
+        self.create_transaction = StateFactoryCreateTransaction(self.app_factory, cache)
+        self.send = StateFactorySend(self.app_factory, cache)
+        self.cache = cache
+        self._default_sender = default_sender
 
     @property
     def app_name(self) -> str:
@@ -1684,6 +2621,11 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
         send_params: algokit_utils.SendParams | None = None,
     ) -> tuple[StateClient, algokit_utils.AppFactoryDeployResult]:
         """Deploy the application"""
+        creator_address = (create_params.sender if create_params else None) or self._default_sender
+        if self.cache:
+            self.cache.seed_suggested_params(self.algorand)
+            if creator_address and not existing_deployments and not ignore_cache:
+                existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         deploy_response = self.app_factory.deploy(
             on_update=on_update,
             on_schema_break=on_schema_break,
@@ -1696,8 +2638,81 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
             compilation_params=compilation_params,
             send_params=send_params,
         )
+        if self.cache and creator_address:
+            self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)
+
+        return StateClient(deploy_response[0], cache=self.cache), deploy_response[1]
 
-        return StateClient(deploy_response[0]), deploy_response[1]
+    def deploy_many(
+        self,
+        deployments: typing.Sequence[StateFactoryDeployKwargs],
+        *,
+        max_concurrency: int = 4,
+    ) -> list[tuple[StateClient, algokit_utils.AppFactoryDeployResult]]:
+        """Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+    
+        Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+        once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+        the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+        creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+        `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+    
+        If any deploy fails, the deploys that haven't started are cancelled and a `StateDeployManyError`
+        is raised with the outcome of each deployment, so the apps that were deployed are known.
+        """
+        first_indexes: dict[str, int] = {}
+        deployed_names: set[tuple[str, str | None]] = set()
+        creator_addresses: list[str | None] = []
+        for idx, deployment in enumerate(deployments):
+            first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+            create_params = deployment.get("create_params")
+            creator_address = (create_params.sender if create_params else None) or self._default_sender
+            name = (deployment.get("app_name") or self.app_name, creator_address)
+            if name in deployed_names:
+                raise ValueError(f"App {name[0]} is deployed more than once by {creator_address}")
+            deployed_names.add(name)
+            creator_addresses.append(creator_address)
+    
+        app_lookups: dict[str, algokit_utils.ApplicationLookup] = {}
+        deploy_kwargs: list[StateFactoryDeployKwargs] = []
+        for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+            if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+                deploy_kwargs.append(deployment)
+                continue
+            if creator_address not in app_lookups:
+                app_lookups[creator_address] = (
+                    self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                    if self.cache
+                    else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+                )
+            # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+            app_lookup = app_lookups[creator_address]
+            deploy_kwargs.append(
+                {**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}
+            )
+    
+        first = set(first_indexes.values())
+        outcomes: dict[int, tuple[StateClient, algokit_utils.AppFactoryDeployResult] | BaseException] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+                futures = {executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future, idx in futures.items():
+                    outcomes[idx] = (
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+                if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                    break
+    
+        results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+        if any(isinstance(outcome, BaseException) for outcome in results):
+            raise StateDeployManyError(results)
+        return typing.cast(list[tuple[StateClient, algokit_utils.AppFactoryDeployResult]], results)
 
     def get_app_client_by_creator_and_name(
         self,
@@ -1711,6 +2726,8 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
         clear_source_map: SourceMap | None = None,
     ) -> StateClient:
         """Get an app client by creator address and name"""
+        if self.cache and not app_lookup_cache and not ignore_cache:
+            app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
         return StateClient(
             self.app_factory.get_app_client_by_creator_and_name(
                 creator_address,
@@ -1721,7 +2738,8 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
                 app_lookup_cache,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
     def get_app_client_by_id(
@@ -1742,7 +2760,8 @@ class StateFactory(algokit_utils.TypedAppFactoryProtocol[StateMethodCallCreatePa
                 default_signer,
                 approval_source_map,
                 clear_source_map,
-            )
+            ),
+            cache=self.cache,
         )
 
 
@@ -2151,16 +3170,17 @@ class StateFactoryDeleteParams:
 class StateFactoryCreateTransaction:
     """Create transactions for State contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = StateFactoryCreateTransactionCreate(app_factory)
+        self.create = StateFactoryCreateTransactionCreate(app_factory, cache)
 
 
 class StateFactoryCreateTransactionCreate:
     """Create new instances of State contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -2168,6 +3188,8 @@ class StateFactoryCreateTransactionCreate:
     ) -> Transaction:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -2176,16 +3198,17 @@ class StateFactoryCreateTransactionCreate:
 class StateFactorySend:
     """Send calls to State contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = StateFactorySendCreate(app_factory)
+        self.create = StateFactorySendCreate(app_factory, cache)
 
 
 class StateFactorySendCreate:
     """Send create calls to State contract"""
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -2196,12 +3219,14 @@ class StateFactorySendCreate:
     ) -> tuple[StateClient, algokit_utils.SendAppCreateTransactionResult]:
         """Creates a new instance using a bare call"""
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return StateClient(result[0]), result[1]
+        return StateClient(result[0], cache=self.cache), result[1]
 
     def create_abi(
         self,
@@ -2213,6 +3238,8 @@ class StateFactorySendCreate:
     ) -> tuple[StateClient, algokit_utils.AppFactoryCreateMethodCallResult[str]]:
             """Creates and sends a transaction using the create_abi(string)string ABI method"""
             params = params or algokit_utils.CommonAppCallCreateParams()
+            if self.cache:
+                self.cache.seed_suggested_params(self.app_factory.algorand)
             client, result = self.app_factory.send.create(
                 algokit_utils.AppFactoryCreateMethodCallParams(
                     **{
@@ -2226,7 +3253,7 @@ class StateFactorySendCreate:
             )
             return_value = None if result.abi_return is None else typing.cast(str, result.abi_return)
     
-            return StateClient(client), algokit_utils.AppFactoryCreateMethodCallResult[str](
+            return StateClient(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[str](
                 **{
                     **result.__dict__,
                     "app_id": result.app_id,
@@ -2251,17 +3278,19 @@ class _StateUpdateComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> "StateComposer":
-        self.composer._composer.add_app_update_method_call(
-            self.composer.client.params.update.update_abi(
-                args=args,
-                params=params,
-                compilation_params=compilation_params
-            )
+        call_params = self.composer.client.params.update.update_abi(
+            args=args,
+            params=params,
+            compilation_params=compilation_params
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_update_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "update_abi(string)string", v
-            )
+            ),
         )
         return self.composer
 
@@ -2274,17 +3303,19 @@ class _StateDeleteComposer:
         args: tuple[str] | DeleteAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self.composer._composer.add_app_delete_method_call(
-            self.composer.client.params.delete.delete_abi(
-                args=args,
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.delete.delete_abi(
+            args=args,
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_delete_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "delete_abi(string)string", v
-            )
+            ),
         )
         return self.composer
 
@@ -2296,28 +3327,123 @@ class _StateOptInComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self.composer._composer.add_app_call_method_call(
-            self.composer.client.params.opt_in.opt_in(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.opt_in.opt_in(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.composer.client.decode_return_value(
                 "opt_in()void", v
-            )
+            ),
         )
         return self.composer
 
 
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    """Results of sending queued calls in as many groups as needed"""
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    """The results of each group, in the order their calls were queued"""
+    returns: list[typing.Any]
+    """The decoded return value of each queued call, in the order they were queued, or None if it has none"""
+
+
+class BulkSendError(Exception):
+    """Raised when any group of a bulk send fails, with the outcomes of the groups that were committed"""
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        """The results of each group in order, or the exception it raised, cancelled if it wasn't sent"""
+        self.returns = returns
+        """The decoded return value of each call in a group that was committed, by the index it was queued at"""
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    """Adds the call to a composer"""
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    """Copy the transactions in params, as composers assign a group to the transactions added to them"""
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    """Count the transactions and method calls that params add to a group, including those passed as args"""
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    """Pack consecutive calls into as few groups as possible"""
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+
+
 class StateComposer:
     """Composer for creating transaction groups for State contract calls"""
 
     def __init__(self, client: "StateClient"):
         self.client = client
-        self._composer = client.algorand.new_group()
+        self._composer: algokit_utils.TransactionComposer | None = None
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []
 
     @property
     def update(self) -> "_StateUpdateComposer":
@@ -2335,16 +3461,18 @@ class StateComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.error(
-                
-                params=params,
-            )
+        call_params = self.client.params.error(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "error()void", v
-            )
+            ),
         )
         return self
 
@@ -2353,16 +3481,18 @@ class StateComposer:
         args: tuple[str] | CallAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_abi(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_abi(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "call_abi(string)string", v
-            )
+            ),
         )
         return self
 
@@ -2371,16 +3501,18 @@ class StateComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_abi_txn(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_abi_txn(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "call_abi_txn(pay,string)string", v
-            )
+            ),
         )
         return self
 
@@ -2389,16 +3521,18 @@ class StateComposer:
         args: tuple[int, str | bytes, int] | CallWithReferencesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_with_references(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_with_references(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "call_with_references(asset,account,application)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2407,16 +3541,18 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "default_value(string)string", v
-            )
+            ),
         )
         return self
 
@@ -2425,16 +3561,18 @@ class StateComposer:
         args: tuple[int | None] | DefaultValueIntArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_int(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_int(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "default_value_int(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2443,16 +3581,18 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueFromAbiArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_abi(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_abi(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "default_value_from_abi(string)string", v
-            )
+            ),
         )
         return self
 
@@ -2461,16 +3601,18 @@ class StateComposer:
         args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_global_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_global_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "default_value_from_global_state(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2479,16 +3621,18 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueFromLocalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_local_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_local_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "default_value_from_local_state(string)string", v
-            )
+            ),
         )
         return self
 
@@ -2497,16 +3641,18 @@ class StateComposer:
         args: tuple[Input] | StructsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.structs(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.structs(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "structs((string,uint64))(string,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -2515,16 +3661,18 @@ class StateComposer:
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_global(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_global(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "set_global(uint64,uint64,string,byte[4])void", v
-            )
+            ),
         )
         return self
 
@@ -2533,16 +3681,18 @@ class StateComposer:
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_local(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_local(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "set_local(uint64,uint64,string,byte[4])void", v
-            )
+            ),
         )
         return self
 
@@ -2551,16 +3701,18 @@ class StateComposer:
         args: tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_box(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_box(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "set_box(byte[4],string)void", v
-            )
+            ),
         )
         return self
 
@@ -2569,16 +3721,18 @@ class StateComposer:
         args: tuple[str] | CreateAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.create_abi(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.create_abi(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(
+                _copy_call_params(call_params)
+            ),
+            call_params,
             lambda v: self.client.decode_return_value(
                 "create_abi(string)string", v
-            )
+            ),
         )
         return self
 
@@ -2589,25 +3743,29 @@ class StateComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "StateComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "StateComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
+        if self._composer is None:
+            # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+            self._composer = self.client.algorand.new_group()
+            for call in self._calls:
+                call.add(self._composer)
         return self._composer
     
     def simulate(
@@ -2620,7 +3778,9 @@ class StateComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -2634,4 +3794,93 @@ class StateComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        return self.composer().send(send_params)
+    
+    def send_bulk(
+        self,
+        send_params: algokit_utils.SendParams | None = None,
+        *,
+        max_concurrency: int = 1,
+        max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+    ) -> BulkSendResults:
+        """Send the queued calls in as many groups as needed, rather than as a single group
+    
+        Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+        passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+        max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+        in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+        groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+        were committed.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        groups = _group_calls(self._calls, max_group_size)
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+        if max_concurrency == 1:
+            for group in groups:
+                if outcomes and isinstance(outcomes[-1], BaseException):
+                    outcomes.append(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    outcomes.append(self._send_group(group, send_params))
+                except Exception as ex:
+                    outcomes.append(ex)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+                _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+                for future in not_done:
+                    future.cancel()
+                concurrent.futures.wait(not_done)
+                for future in futures:
+                    outcomes.append(
+                        concurrent.futures.CancelledError()
+                        if future.cancelled()
+                        else future.exception() or future.result()
+                    )
+    
+        returns: dict[int, object] = {}
+        call_idx = 0
+        for group, outcome in zip(groups, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                call_idx += len(group)
+                continue
+            abi_returns = iter(outcome.returns)
+            for call in group:
+                # the returns of method calls passed as args precede the return of the call itself
+                call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+                returns[call_idx] = (
+                    call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+                )
+                call_idx += 1
+        if any(isinstance(outcome, BaseException) for outcome in outcomes):
+            raise BulkSendError(outcomes, returns)
+        return BulkSendResults(
+            groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+            returns=list(returns.values()),
+        )
+    
+    def _send_group(
+        self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        if self.client.cache:
+            self.client.cache.seed_suggested_params(self.client.algorand)
+        composer = self.client.algorand.new_group()
+        for call in calls:
+            call.add(composer)
+        return composer.send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        params: _CallParams | None = None,
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        if self._composer is not None:
+            add(self._composer)
+        transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+        self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
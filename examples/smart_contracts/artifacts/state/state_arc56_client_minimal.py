@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +65,136 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_ERROR_METHOD = _AbiMethod("error()void", bytes.fromhex("44d0da0d"))
+_CALL_ABI_METHOD = _AbiMethod("call_abi(string)string", bytes.fromhex("f17e80a5"))
+_CALL_ABI_TXN_METHOD = _AbiMethod("call_abi_txn(pay,string)string", bytes.fromhex("0a92a81e"))
+_CALL_WITH_REFERENCES_METHOD = _AbiMethod("call_with_references(asset,account,application)uint64", bytes.fromhex("fefdf11e"))
+_DEFAULT_VALUE_METHOD = _AbiMethod("default_value(string)string", bytes.fromhex("574b55c8"))
+_DEFAULT_VALUE_INT_METHOD = _AbiMethod("default_value_int(uint64)uint64", bytes.fromhex("360362e9"))
+_DEFAULT_VALUE_FROM_ABI_METHOD = _AbiMethod("default_value_from_abi(string)string", bytes.fromhex("46d211a3"))
+_DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD = _AbiMethod("default_value_from_global_state(uint64)uint64", bytes.fromhex("0cfcbb00"))
+_DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD = _AbiMethod("default_value_from_local_state(string)string", bytes.fromhex("d0f0baf8"))
+_STRUCTS_METHOD = _AbiMethod("structs((string,uint64))(string,uint64)", bytes.fromhex("246beb83"))
+_SET_GLOBAL_METHOD = _AbiMethod("set_global(uint64,uint64,string,byte[4])void", bytes.fromhex("a4cf8dea"))
+_SET_LOCAL_METHOD = _AbiMethod("set_local(uint64,uint64,string,byte[4])void", bytes.fromhex("cec2834a"))
+_SET_BOX_METHOD = _AbiMethod("set_box(byte[4],string)void", bytes.fromhex("a4b4a230"))
+_CREATE_ABI_METHOD = _AbiMethod("create_abi(string)string", bytes.fromhex("9d523040"))
+_UPDATE_ABI_METHOD = _AbiMethod("update_abi(string)string", bytes.fromhex("3ca5ceb7"))
+_DELETE_ABI_METHOD = _AbiMethod("delete_abi(string)string", bytes.fromhex("271b4ee9"))
+_OPT_IN_METHOD = _AbiMethod("opt_in()void", bytes.fromhex("30c6d58a"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _ERROR_METHOD.signature: _ERROR_METHOD,
+    _CALL_ABI_METHOD.signature: _CALL_ABI_METHOD,
+    _CALL_ABI_TXN_METHOD.signature: _CALL_ABI_TXN_METHOD,
+    _CALL_WITH_REFERENCES_METHOD.signature: _CALL_WITH_REFERENCES_METHOD,
+    _DEFAULT_VALUE_METHOD.signature: _DEFAULT_VALUE_METHOD,
+    _DEFAULT_VALUE_INT_METHOD.signature: _DEFAULT_VALUE_INT_METHOD,
+    _DEFAULT_VALUE_FROM_ABI_METHOD.signature: _DEFAULT_VALUE_FROM_ABI_METHOD,
+    _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD.signature: _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+    _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD.signature: _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+    _STRUCTS_METHOD.signature: _STRUCTS_METHOD,
+    _SET_GLOBAL_METHOD.signature: _SET_GLOBAL_METHOD,
+    _SET_LOCAL_METHOD.signature: _SET_LOCAL_METHOD,
+    _SET_BOX_METHOD.signature: _SET_BOX_METHOD,
+    _CREATE_ABI_METHOD.signature: _CREATE_ABI_METHOD,
+    _UPDATE_ABI_METHOD.signature: _UPDATE_ABI_METHOD,
+    _DELETE_ABI_METHOD.signature: _DELETE_ABI_METHOD,
+    _OPT_IN_METHOD.signature: _OPT_IN_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class Input:
     """Struct for Input"""
@@ -233,10 +364,14 @@ class _StateOptIn:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
 
 class StateParams:
@@ -253,10 +388,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ERROR_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_abi(
         self,
@@ -265,11 +404,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_abi_txn(
         self,
@@ -278,11 +420,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_ABI_TXN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def call_with_references(
         self,
@@ -291,11 +436,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value(
         self,
@@ -304,11 +452,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_int(
         self,
@@ -317,11 +468,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_INT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_abi(
         self,
@@ -330,11 +484,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_global_state(
         self,
@@ -343,11 +500,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def default_value_from_local_state(
         self,
@@ -356,11 +516,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def structs(
         self,
@@ -369,11 +532,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_global(
         self,
@@ -382,11 +548,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_local(
         self,
@@ -395,11 +564,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_box(
         self,
@@ -408,11 +580,14 @@ class StateParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -435,10 +610,15 @@ class _StateOptInTransaction:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
 
 class StateCreateTransactionParams:
@@ -455,10 +635,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "error()void",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ERROR_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_abi(
         self,
@@ -467,11 +652,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_abi_txn(
         self,
@@ -480,11 +669,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_ABI_TXN_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def call_with_references(
         self,
@@ -493,11 +686,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value(
         self,
@@ -506,11 +703,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_int(
         self,
@@ -519,11 +720,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_INT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_abi(
         self,
@@ -532,11 +737,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_ABI_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_global_state(
         self,
@@ -545,11 +754,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def default_value_from_local_state(
         self,
@@ -558,11 +771,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def structs(
         self,
@@ -571,11 +788,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_global(
         self,
@@ -584,11 +805,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_local(
         self,
@@ -597,11 +822,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_box(
         self,
@@ -610,11 +839,15 @@ class StateCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -638,10 +871,15 @@ class _StateOptInSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
     
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "opt_in()void",
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OPT_IN_METHOD,
+            None,
+            params,
+            OnComplete.OptInOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _OPT_IN_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -663,7 +901,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "error()void",
+            "method": _ERROR_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
@@ -678,7 +916,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "call_abi(string)string",
+            "method": _CALL_ABI_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -694,7 +932,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "call_abi_txn(pay,string)string",
+            "method": _CALL_ABI_TXN_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -708,11 +946,15 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "call_with_references(asset,account,application)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CALL_WITH_REFERENCES_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CALL_WITH_REFERENCES_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -726,7 +968,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value(string)string",
+            "method": _DEFAULT_VALUE_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -742,7 +984,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_int(uint64)uint64",
+            "method": _DEFAULT_VALUE_INT_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -758,7 +1000,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_abi(string)string",
+            "method": _DEFAULT_VALUE_FROM_ABI_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -774,7 +1016,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_global_state(uint64)uint64",
+            "method": _DEFAULT_VALUE_FROM_GLOBAL_STATE_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -790,7 +1032,7 @@ class StateSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "default_value_from_local_state(string)string",
+            "method": _DEFAULT_VALUE_FROM_LOCAL_STATE_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
@@ -804,12 +1046,16 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[Output]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "structs((string,uint64))(string,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Output, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _STRUCTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _STRUCTS_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Output, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[Output], parsed_response)
 
     def set_global(
@@ -820,11 +1066,15 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_global(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_GLOBAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_GLOBAL_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -836,11 +1086,15 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_local(uint64,uint64,string,byte[4])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_LOCAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_LOCAL_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -852,11 +1106,15 @@ class StateSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_box(byte[4],string)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_BOX_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_BOX_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1089,7 +1347,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "box",
-            None
+            None,
         )
 
     @property
@@ -1098,7 +1356,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "boxMapNotInSnakeCase",
-            None
+            None,
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1397,7 +1655,8 @@ class StateClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -1418,17 +1677,16 @@ class _StateOptInComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self.composer._composer.add_app_call_method_call(
-            self.composer.client.params.opt_in.opt_in(
-                
-                params=params,
-                
-            )
+        call_params = self.composer.client.params.opt_in.opt_in(
+            
+            params=params,
+            
         )
-        self.composer._result_mappers.append(
+        self.composer._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.composer.client.decode_return_value(
                 "opt_in()void", v
-            )
+            ),
         )
         return self.composer
 
@@ -1449,16 +1707,15 @@ class StateComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.error(
-                
-                params=params,
-            )
+        call_params = self.client.params.error(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "error()void", v
-            )
+            ),
         )
         return self
 
@@ -1467,16 +1724,15 @@ class StateComposer:
         args: tuple[str] | CallAbiArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_abi(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_abi(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "call_abi(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1485,16 +1741,15 @@ class StateComposer:
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, str] | CallAbiTxnArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_abi_txn(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_abi_txn(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "call_abi_txn(pay,string)string", v
-            )
+            ),
         )
         return self
 
@@ -1503,16 +1758,15 @@ class StateComposer:
         args: tuple[int, str | bytes, int] | CallWithReferencesArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.call_with_references(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.call_with_references(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "call_with_references(asset,account,application)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1521,16 +1775,15 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "default_value(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1539,16 +1792,15 @@ class StateComposer:
         args: tuple[int | None] | DefaultValueIntArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_int(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_int(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "default_value_int(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1557,16 +1809,15 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueFromAbiArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_abi(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_abi(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "default_value_from_abi(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1575,16 +1826,15 @@ class StateComposer:
         args: tuple[int | None] | DefaultValueFromGlobalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_global_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_global_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "default_value_from_global_state(uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1593,16 +1843,15 @@ class StateComposer:
         args: tuple[str | None] | DefaultValueFromLocalStateArgs | None = None,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.default_value_from_local_state(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.default_value_from_local_state(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "default_value_from_local_state(string)string", v
-            )
+            ),
         )
         return self
 
@@ -1611,16 +1860,15 @@ class StateComposer:
         args: tuple[Input] | StructsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.structs(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.structs(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "structs((string,uint64))(string,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -1629,16 +1877,15 @@ class StateComposer:
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetGlobalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_global(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_global(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_global(uint64,uint64,string,byte[4])void", v
-            )
+            ),
         )
         return self
 
@@ -1647,16 +1894,15 @@ class StateComposer:
         args: tuple[int, int, str, bytes | str | tuple[int, int, int, int]] | SetLocalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_local(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_local(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_local(uint64,uint64,string,byte[4])void", v
-            )
+            ),
         )
         return self
 
@@ -1665,16 +1911,15 @@ class StateComposer:
         args: tuple[bytes | str | tuple[int, int, int, int], str] | SetBoxArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "StateComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_box(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_box(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_box(byte[4],string)void", v
-            )
+            ),
         )
         return self
 
@@ -1685,22 +1930,21 @@ class StateComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "StateComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "StateComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -1716,7 +1960,7 @@ class StateComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -1730,4 +1974,13 @@ class StateComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
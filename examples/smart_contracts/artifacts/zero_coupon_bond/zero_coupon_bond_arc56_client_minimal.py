@@ -7,6 +7,7 @@
 
 # common
 import dataclasses
+import functools
 import typing
 # core algosdk
 import algosdk
@@ -64,6 +65,142 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    """An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    """
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        """The ABI type of each arg, or the name of its transaction or reference type"""
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+
+
+_ASSET_TRANSFER_METHOD = _AbiMethod("asset_transfer(address,address,uint64)uint64", bytes.fromhex("4fd6a3cc"))
+_PAY_PRINCIPAL_METHOD = _AbiMethod("pay_principal(address,byte[])(uint64,uint64,byte[])", bytes.fromhex("9c76b6a3"))
+_GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD = _AbiMethod("get_account_units_current_value(address,uint64)(uint64,uint64,(uint64,uint64))", bytes.fromhex("44363d49"))
+_GET_PAYMENT_AMOUNT_METHOD = _AbiMethod("get_payment_amount(address)(uint64,uint64)", bytes.fromhex("67db4f20"))
+_ASSET_CONFIG_METHOD = _AbiMethod("asset_config(uint64,uint64,uint64,uint64,uint8,uint16,uint16[],uint64[],(uint64,uint64)[])void", bytes.fromhex("d3a4d6ab"))
+_SET_SECONDARY_TIME_EVENTS_METHOD = _AbiMethod("set_secondary_time_events(uint64[])(uint64,uint64)", bytes.fromhex("1d6fc255"))
+_ASSIGN_ROLE_METHOD = _AbiMethod("assign_role(address,uint8,byte[])uint64", bytes.fromhex("fef74567"))
+_REVOKE_ROLE_METHOD = _AbiMethod("revoke_role(address,uint8)uint64", bytes.fromhex("b8fc1390"))
+_OPEN_ACCOUNT_METHOD = _AbiMethod("open_account(address,address)uint64", bytes.fromhex("3d43d1f0"))
+_CLOSE_ACCOUNT_METHOD = _AbiMethod("close_account(address)(uint64,uint64)", bytes.fromhex("ebd96b2f"))
+_PRIMARY_DISTRIBUTION_METHOD = _AbiMethod("primary_distribution(address,uint64)uint64", bytes.fromhex("6c85e3ee"))
+_SET_ASSET_SUSPENSION_METHOD = _AbiMethod("set_asset_suspension(bool)uint64", bytes.fromhex("f63ace8d"))
+_SET_ACCOUNT_SUSPENSION_METHOD = _AbiMethod("set_account_suspension(address,bool)uint64", bytes.fromhex("bbcca18a"))
+_SET_DEFAULT_STATUS_METHOD = _AbiMethod("set_default_status(bool)void", bytes.fromhex("1a7babb4"))
+_GET_ASSET_INFO_METHOD = _AbiMethod("get_asset_info()(uint64,uint64,uint64,uint64,uint8,uint16,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint8)", bytes.fromhex("1460a966"))
+_GET_ACCOUNT_INFO_METHOD = _AbiMethod("get_account_info(address)(address,uint64,uint64,uint64,bool)", bytes.fromhex("ed02759f"))
+_GET_TIME_EVENTS_METHOD = _AbiMethod("get_time_events()uint64[]", bytes.fromhex("fad2173e"))
+_GET_SECONDARY_MARKET_SCHEDULE_METHOD = _AbiMethod("get_secondary_market_schedule()uint64[]", bytes.fromhex("08efea35"))
+_GET_ASSET_METADATA_METHOD = _AbiMethod("get_asset_metadata()(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string)", bytes.fromhex("e4a5ab54"))
+_ASSET_CREATE_METHOD = _AbiMethod("asset_create(address,(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string))void", bytes.fromhex("3f0efc6c"))
+
+_ABI_METHODS: dict[str, _AbiMethod] = {
+    _ASSET_TRANSFER_METHOD.signature: _ASSET_TRANSFER_METHOD,
+    _PAY_PRINCIPAL_METHOD.signature: _PAY_PRINCIPAL_METHOD,
+    _GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD.signature: _GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD,
+    _GET_PAYMENT_AMOUNT_METHOD.signature: _GET_PAYMENT_AMOUNT_METHOD,
+    _ASSET_CONFIG_METHOD.signature: _ASSET_CONFIG_METHOD,
+    _SET_SECONDARY_TIME_EVENTS_METHOD.signature: _SET_SECONDARY_TIME_EVENTS_METHOD,
+    _ASSIGN_ROLE_METHOD.signature: _ASSIGN_ROLE_METHOD,
+    _REVOKE_ROLE_METHOD.signature: _REVOKE_ROLE_METHOD,
+    _OPEN_ACCOUNT_METHOD.signature: _OPEN_ACCOUNT_METHOD,
+    _CLOSE_ACCOUNT_METHOD.signature: _CLOSE_ACCOUNT_METHOD,
+    _PRIMARY_DISTRIBUTION_METHOD.signature: _PRIMARY_DISTRIBUTION_METHOD,
+    _SET_ASSET_SUSPENSION_METHOD.signature: _SET_ASSET_SUSPENSION_METHOD,
+    _SET_ACCOUNT_SUSPENSION_METHOD.signature: _SET_ACCOUNT_SUSPENSION_METHOD,
+    _SET_DEFAULT_STATUS_METHOD.signature: _SET_DEFAULT_STATUS_METHOD,
+    _GET_ASSET_INFO_METHOD.signature: _GET_ASSET_INFO_METHOD,
+    _GET_ACCOUNT_INFO_METHOD.signature: _GET_ACCOUNT_INFO_METHOD,
+    _GET_TIME_EVENTS_METHOD.signature: _GET_TIME_EVENTS_METHOD,
+    _GET_SECONDARY_MARKET_SCHEDULE_METHOD.signature: _GET_SECONDARY_MARKET_SCHEDULE_METHOD,
+    _GET_ASSET_METADATA_METHOD.signature: _GET_ASSET_METADATA_METHOD,
+    _ASSET_CREATE_METHOD.signature: _ASSET_CREATE_METHOD,
+}
+
+
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    """Get the params for a call to an ABI method with its parsed method rather than looking it up by signature"""
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    """Send a call to an ABI method and decode its return value, as with `client.send`"""
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+
 @dataclasses.dataclass(frozen=True)
 class AccountInfo:
     """Struct for AccountInfo"""
@@ -317,11 +454,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_transfer(address,address,uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ASSET_TRANSFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def pay_principal(
         self,
@@ -330,11 +470,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "pay_principal(address,byte[])(uint64,uint64,byte[])",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _PAY_PRINCIPAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_account_units_current_value(
         self,
@@ -343,11 +486,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_account_units_current_value(address,uint64)(uint64,uint64,(uint64,uint64))",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_payment_amount(
         self,
@@ -356,11 +502,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_payment_amount(address)(uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_PAYMENT_AMOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def asset_config(
         self,
@@ -369,11 +518,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_config(uint64,uint64,uint64,uint64,uint8,uint16,uint16[],uint64[],(uint64,uint64)[])void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ASSET_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_secondary_time_events(
         self,
@@ -382,11 +534,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_secondary_time_events(uint64[])(uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_SECONDARY_TIME_EVENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def assign_role(
         self,
@@ -395,11 +550,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "assign_role(address,uint8,byte[])uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _ASSIGN_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def revoke_role(
         self,
@@ -408,11 +566,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "revoke_role(address,uint8)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _REVOKE_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def open_account(
         self,
@@ -421,11 +582,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "open_account(address,address)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _OPEN_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def close_account(
         self,
@@ -434,11 +598,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_account(address)(uint64,uint64)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _CLOSE_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def primary_distribution(
         self,
@@ -447,11 +614,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "primary_distribution(address,uint64)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _PRIMARY_DISTRIBUTION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_asset_suspension(
         self,
@@ -460,11 +630,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_asset_suspension(bool)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_ASSET_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_account_suspension(
         self,
@@ -473,11 +646,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_account_suspension(address,bool)uint64",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_ACCOUNT_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def set_default_status(
         self,
@@ -486,11 +662,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_default_status(bool)void",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _SET_DEFAULT_STATUS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_asset_info(
         self,
@@ -498,10 +677,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_asset_info()(uint64,uint64,uint64,uint64,uint8,uint16,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint8)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_ASSET_INFO_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_account_info(
         self,
@@ -510,11 +693,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_account_info(address)(address,uint64,uint64,uint64,bool)",
-            "args": method_args,
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_ACCOUNT_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_time_events(
         self,
@@ -522,10 +708,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_time_events()uint64[]",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_TIME_EVENTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_secondary_market_schedule(
         self,
@@ -533,10 +723,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_secondary_market_schedule()uint64[]",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_SECONDARY_MARKET_SCHEDULE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def get_asset_metadata(
         self,
@@ -544,10 +738,14 @@ class ZeroCouponBondParams:
     ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_asset_metadata()(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string)",
-        }))
+        return _method_call_params(
+            self.app_client,
+            _GET_ASSET_METADATA_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
 
     def clear_state(
         self,
@@ -571,11 +769,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_transfer(address,address,uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSET_TRANSFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def pay_principal(
         self,
@@ -584,11 +786,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "pay_principal(address,byte[])(uint64,uint64,byte[])",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _PAY_PRINCIPAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_account_units_current_value(
         self,
@@ -597,11 +803,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_account_units_current_value(address,uint64)(uint64,uint64,(uint64,uint64))",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_payment_amount(
         self,
@@ -610,11 +820,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_payment_amount(address)(uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_PAYMENT_AMOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def asset_config(
         self,
@@ -623,11 +837,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_config(uint64,uint64,uint64,uint64,uint8,uint16,uint16[],uint64[],(uint64,uint64)[])void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSET_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_secondary_time_events(
         self,
@@ -636,11 +854,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_secondary_time_events(uint64[])(uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_SECONDARY_TIME_EVENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def assign_role(
         self,
@@ -649,11 +871,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "assign_role(address,uint8,byte[])uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSIGN_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def revoke_role(
         self,
@@ -662,11 +888,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "revoke_role(address,uint8)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _REVOKE_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def open_account(
         self,
@@ -675,11 +905,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "open_account(address,address)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _OPEN_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def close_account(
         self,
@@ -688,11 +922,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_account(address)(uint64,uint64)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def primary_distribution(
         self,
@@ -701,11 +939,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "primary_distribution(address,uint64)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _PRIMARY_DISTRIBUTION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_asset_suspension(
         self,
@@ -714,11 +956,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_asset_suspension(bool)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_ASSET_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_account_suspension(
         self,
@@ -727,11 +973,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_account_suspension(address,bool)uint64",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_ACCOUNT_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def set_default_status(
         self,
@@ -740,11 +990,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_default_status(bool)void",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_DEFAULT_STATUS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_asset_info(
         self,
@@ -752,10 +1006,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_asset_info()(uint64,uint64,uint64,uint64,uint8,uint16,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint8)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_ASSET_INFO_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_account_info(
         self,
@@ -764,11 +1023,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_account_info(address)(address,uint64,uint64,uint64,bool)",
-            "args": method_args,
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_ACCOUNT_INFO_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_time_events(
         self,
@@ -776,10 +1039,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_time_events()uint64[]",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_TIME_EVENTS_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_secondary_market_schedule(
         self,
@@ -787,10 +1055,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_secondary_market_schedule()uint64[]",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_SECONDARY_MARKET_SCHEDULE_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def get_asset_metadata(
         self,
@@ -798,10 +1071,15 @@ class ZeroCouponBondCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "get_asset_metadata()(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string)",
-        }))
+        call_params = _method_call_params(
+            self.app_client,
+            _GET_ASSET_METADATA_METHOD,
+            None,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        return self.app_client.algorand.create_transaction.app_call_method_call(call_params)
 
     def clear_state(
         self,
@@ -826,11 +1104,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_transfer(address,address,uint64)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSET_TRANSFER_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ASSET_TRANSFER_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -842,12 +1124,16 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[PaymentResult]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "pay_principal(address,byte[])(uint64,uint64,byte[])",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PaymentResult, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _PAY_PRINCIPAL_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _PAY_PRINCIPAL_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PaymentResult, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[PaymentResult], parsed_response)
 
     def get_account_units_current_value(
@@ -860,7 +1146,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_account_units_current_value(address,uint64)(uint64,uint64,(uint64,uint64))",
+            "method": _GET_ACCOUNT_UNITS_CURRENT_VALUE_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CurrentUnitsValue, typing.cast(dict, response.abi_return))) # type: ignore
@@ -876,7 +1162,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_payment_amount(address)(uint64,uint64)",
+            "method": _GET_PAYMENT_AMOUNT_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(PaymentAmounts, typing.cast(dict, response.abi_return))) # type: ignore
@@ -890,11 +1176,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "asset_config(uint64,uint64,uint64,uint64,uint8,uint16,uint16[],uint64[],(uint64,uint64)[])void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSET_CONFIG_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ASSET_CONFIG_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -906,12 +1196,16 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[SecondaryMarketSchedule]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_secondary_time_events(uint64[])(uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
-        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SecondaryMarketSchedule, typing.cast(dict, response.abi_return))) # type: ignore
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_SECONDARY_TIME_EVENTS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_SECONDARY_TIME_EVENTS_METHOD, call_params, send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(SecondaryMarketSchedule, typing.cast(dict, response.abi_return)))
         return typing.cast(algokit_utils.SendAppTransactionResult[SecondaryMarketSchedule], parsed_response)
 
     def assign_role(
@@ -922,11 +1216,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "assign_role(address,uint8,byte[])uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _ASSIGN_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _ASSIGN_ROLE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -938,11 +1236,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "revoke_role(address,uint8)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _REVOKE_ROLE_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _REVOKE_ROLE_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -954,11 +1256,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "open_account(address,address)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _OPEN_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _OPEN_ACCOUNT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -970,11 +1276,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[tuple[int, int]]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "close_account(address)(uint64,uint64)",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _CLOSE_ACCOUNT_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _CLOSE_ACCOUNT_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
 
@@ -986,11 +1296,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "primary_distribution(address,uint64)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _PRIMARY_DISTRIBUTION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _PRIMARY_DISTRIBUTION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1002,11 +1316,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_asset_suspension(bool)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_ASSET_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_ASSET_SUSPENSION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1018,11 +1336,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_account_suspension(address,bool)uint64",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_ACCOUNT_SUSPENSION_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_ACCOUNT_SUSPENSION_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
@@ -1034,11 +1356,15 @@ class ZeroCouponBondSend:
     ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
-            **dataclasses.asdict(params),
-            "method": "set_default_status(bool)void",
-            "args": method_args,
-        }), send_params=send_params)
+        call_params = _method_call_params(
+            self.app_client,
+            _SET_DEFAULT_STATUS_METHOD,
+            method_args,
+            params,
+            OnComplete.NoOpOC,
+            algokit_utils.AppCallMethodCallParams,
+        )
+        response = _send_method_call(self.app_client, _SET_DEFAULT_STATUS_METHOD, call_params, send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
@@ -1051,7 +1377,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_asset_info()(uint64,uint64,uint64,uint64,uint8,uint16,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint8)",
+            "method": _GET_ASSET_INFO_METHOD.signature,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(AssetInfo, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[AssetInfo], parsed_response)
@@ -1066,7 +1392,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_account_info(address)(address,uint64,uint64,uint64,bool)",
+            "method": _GET_ACCOUNT_INFO_METHOD.signature,
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(AccountInfo, typing.cast(dict, response.abi_return))) # type: ignore
@@ -1081,7 +1407,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_time_events()uint64[]",
+            "method": _GET_TIME_EVENTS_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
@@ -1095,7 +1421,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_secondary_market_schedule()uint64[]",
+            "method": _GET_SECONDARY_MARKET_SCHEDULE_METHOD.signature,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
@@ -1109,7 +1435,7 @@ class ZeroCouponBondSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_asset_metadata()(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string)",
+            "method": _GET_ASSET_METADATA_METHOD.signature,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(AssetMetadata, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[AssetMetadata], parsed_response)
@@ -1404,7 +1730,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "account_manager",
-            self._struct_classes.get("RoleConfig")
+            self._struct_classes.get("RoleConfig"),
         )
 
     @property
@@ -1413,7 +1739,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "primary_dealer",
-            self._struct_classes.get("RoleConfig")
+            self._struct_classes.get("RoleConfig"),
         )
 
     @property
@@ -1422,7 +1748,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "trustee",
-            self._struct_classes.get("RoleConfig")
+            self._struct_classes.get("RoleConfig"),
         )
 
     @property
@@ -1431,7 +1757,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "authority",
-            self._struct_classes.get("RoleConfig")
+            self._struct_classes.get("RoleConfig"),
         )
 
     @property
@@ -1440,7 +1766,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "interest_oracle",
-            self._struct_classes.get("RoleConfig")
+            self._struct_classes.get("RoleConfig"),
         )
 
     @property
@@ -1449,7 +1775,7 @@ class _BoxState:
         return _MapState(
             self.app_client.state.box,
             "account",
-            self._struct_classes.get("AccountInfo")
+            self._struct_classes.get("AccountInfo"),
         )
 
 _KeyType = typing.TypeVar("_KeyType")
@@ -1766,7 +2092,8 @@ class ZeroCouponBondClient:
         if return_value is None:
             return None
     
-        arc56_method = self.app_spec.get_arc56_method(method)
+        abi_method = _ABI_METHODS.get(method)
+        arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)
         decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
     
         # If method returns a struct, convert the dict to appropriate dataclass
@@ -1793,16 +2120,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, str, int] | AssetTransferArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.asset_transfer(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.asset_transfer(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "asset_transfer(address,address,uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1811,16 +2137,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, bytes | str] | PayPrincipalArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.pay_principal(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.pay_principal(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "pay_principal(address,byte[])(uint64,uint64,byte[])", v
-            )
+            ),
         )
         return self
 
@@ -1829,16 +2154,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, int] | GetAccountUnitsCurrentValueArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_account_units_current_value(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_account_units_current_value(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_account_units_current_value(address,uint64)(uint64,uint64,(uint64,uint64))", v
-            )
+            ),
         )
         return self
 
@@ -1847,16 +2171,15 @@ class ZeroCouponBondComposer:
         args: tuple[str] | GetPaymentAmountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_payment_amount(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_payment_amount(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_payment_amount(address)(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -1865,16 +2188,15 @@ class ZeroCouponBondComposer:
         args: tuple[int, int, int, int, int, int, list[int], list[int], list[tuple[int, int]]] | AssetConfigArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.asset_config(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.asset_config(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "asset_config(uint64,uint64,uint64,uint64,uint8,uint16,uint16[],uint64[],(uint64,uint64)[])void", v
-            )
+            ),
         )
         return self
 
@@ -1883,16 +2205,15 @@ class ZeroCouponBondComposer:
         args: tuple[list[int]] | SetSecondaryTimeEventsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_secondary_time_events(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_secondary_time_events(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_secondary_time_events(uint64[])(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -1901,16 +2222,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, int, bytes | str] | AssignRoleArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.assign_role(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.assign_role(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "assign_role(address,uint8,byte[])uint64", v
-            )
+            ),
         )
         return self
 
@@ -1919,16 +2239,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, int] | RevokeRoleArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.revoke_role(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.revoke_role(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "revoke_role(address,uint8)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1937,16 +2256,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, str] | OpenAccountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.open_account(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.open_account(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "open_account(address,address)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1955,16 +2273,15 @@ class ZeroCouponBondComposer:
         args: tuple[str] | CloseAccountArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.close_account(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.close_account(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "close_account(address)(uint64,uint64)", v
-            )
+            ),
         )
         return self
 
@@ -1973,16 +2290,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, int] | PrimaryDistributionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.primary_distribution(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.primary_distribution(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "primary_distribution(address,uint64)uint64", v
-            )
+            ),
         )
         return self
 
@@ -1991,16 +2307,15 @@ class ZeroCouponBondComposer:
         args: tuple[bool] | SetAssetSuspensionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_asset_suspension(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_asset_suspension(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_asset_suspension(bool)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2009,16 +2324,15 @@ class ZeroCouponBondComposer:
         args: tuple[str, bool] | SetAccountSuspensionArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_account_suspension(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_account_suspension(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_account_suspension(address,bool)uint64", v
-            )
+            ),
         )
         return self
 
@@ -2027,16 +2341,15 @@ class ZeroCouponBondComposer:
         args: tuple[bool] | SetDefaultStatusArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.set_default_status(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.set_default_status(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "set_default_status(bool)void", v
-            )
+            ),
         )
         return self
 
@@ -2044,16 +2357,15 @@ class ZeroCouponBondComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_asset_info(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_asset_info(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_asset_info()(uint64,uint64,uint64,uint64,uint8,uint16,uint64,uint64,uint64,uint64,uint64,uint64,bool,uint8)", v
-            )
+            ),
         )
         return self
 
@@ -2062,16 +2374,15 @@ class ZeroCouponBondComposer:
         args: tuple[str] | GetAccountInfoArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_account_info(
-                args=args,
-                params=params,
-            )
+        call_params = self.client.params.get_account_info(
+            args=args,
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_account_info(address)(address,uint64,uint64,uint64,bool)", v
-            )
+            ),
         )
         return self
 
@@ -2079,16 +2390,15 @@ class ZeroCouponBondComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_time_events(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_time_events(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_time_events()uint64[]", v
-            )
+            ),
         )
         return self
 
@@ -2096,16 +2406,15 @@ class ZeroCouponBondComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_secondary_market_schedule(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_secondary_market_schedule(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_secondary_market_schedule()uint64[]", v
-            )
+            ),
         )
         return self
 
@@ -2113,16 +2422,15 @@ class ZeroCouponBondComposer:
         self,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_app_call_method_call(
-            self.client.params.get_asset_metadata(
-                
-                params=params,
-            )
+        call_params = self.client.params.get_asset_metadata(
+            
+            params=params,
         )
-        self._result_mappers.append(
+        self._add_call(
+            lambda composer: composer.add_app_call_method_call(call_params),
             lambda v: self.client.decode_return_value(
                 "get_asset_metadata()(uint8,uint8,uint8,uint8,uint8,uint8,byte[32],string)", v
-            )
+            ),
         )
         return self
 
@@ -2133,22 +2441,21 @@ class ZeroCouponBondComposer:
         params: algokit_utils.CommonAppCallParams | None = None,
     ) -> "ZeroCouponBondComposer":
         params=params or algokit_utils.CommonAppCallParams()
-        self._composer.add_app_call(
-            self.client.params.clear_state(
-                algokit_utils.AppClientBareCallParams(
-                    **{
-                        **dataclasses.asdict(params),
-                        "args": args
-                    }
-                )
+        call_params = self.client.params.clear_state(
+            algokit_utils.AppClientBareCallParams(
+                **{
+                    **dataclasses.asdict(params),
+                    "args": args
+                }
             )
         )
+        self._add_call(lambda composer: composer.add_app_call(call_params))
         return self
     
     def add_transaction(
         self, txn: Transaction, signer: TransactionSigner | None = None
     ) -> "ZeroCouponBondComposer":
-        self._composer.add_transaction(txn, signer)
+        self._add_call(lambda composer: composer.add_transaction(txn, signer))
         return self
     
     def composer(self) -> algokit_utils.TransactionComposer:
@@ -2164,7 +2471,7 @@ class ZeroCouponBondComposer:
         simulation_round: int | None = None,
         skip_signatures: bool | None = None,
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.simulate(
+        return self.composer().simulate(
             allow_more_logs=allow_more_logs,
             allow_empty_signatures=allow_empty_signatures,
             allow_unnamed_resources=allow_unnamed_resources,
@@ -2178,4 +2485,13 @@ class ZeroCouponBondComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
+        return self.composer().send(send_params)
+    
+    def _add_call(
+        self,
+        add: typing.Callable[[algokit_utils.TransactionComposer], object],
+        result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+    ) -> None:
+        add(self._composer)
+        if result_mapper:
+            self._result_mappers.append(result_mapper)
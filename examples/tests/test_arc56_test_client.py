@@ -134,3 +134,9 @@ def test_arc56_demo(
         sum=3,
         difference=1,
     )
+    assert list(client.state.box.box_map.iter_items(page_size=1)) == [
+        (Inputs(add=InputsAdd(a=1, b=2), subtract=InputsSubtract(a=4, b=3)), Outputs(sum=3, difference=1))
+    ]
+    columns = client.state.box.box_map.get_columns()
+    assert list(columns["sum"]) == [3]
+    assert list(columns["difference"]) == [1]
@@ -1,14 +1,20 @@
+import concurrent.futures
+import typing
+
 import algokit_utils
+import algosdk
 import pytest
 from algokit_utils import AlgorandClient, CommonAppCallParams
-from algokit_utils.applications import OnUpdate
+from algokit_utils.applications import OnUpdate, OperationPerformed
 from algokit_utils.models import AlgoAmount
 
 from examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client import (
+    BulkSendError,
     HelloArgs,
     HelloWorldCheckArgs,
     HelloWorldClient,
     HelloWorldFactory,
+    NetworkCache,
 )
 
 
@@ -84,6 +90,95 @@ def test_composer_with_manual_transaction(
     assert len(result.tx_ids) == 4
 
 
+def test_composer_send_bulk(helloworld_factory: HelloWorldFactory) -> None:
+    client, _ = helloworld_factory.deploy()
+    composer = client.new_group()
+    for idx in range(40):
+        composer.hello(args=(f"World {idx}",))
+
+    result = composer.send_bulk(max_concurrency=2)
+
+    assert [len(group.tx_ids) for group in result.groups] == [16, 16, 8]
+    assert result.returns == [f"Hello, World {idx}" for idx in range(40)]
+
+
+def test_composer_send_bulk_reports_committed_groups(helloworld_factory: HelloWorldFactory) -> None:
+    client, _ = helloworld_factory.deploy()
+    composer = client.new_group()
+    for idx in range(4):
+        composer.hello(args=(f"World {idx}",))
+    composer.hello_world_check(args=HelloWorldCheckArgs(name="Not World"))
+    for idx in range(4):
+        composer.hello(args=(f"World {idx}",))
+
+    with pytest.raises(BulkSendError) as exc_info:
+        composer.send_bulk(max_group_size=4)
+
+    assert isinstance(exc_info.value.outcomes[0], algokit_utils.SendAtomicTransactionComposerResults)
+    assert isinstance(exc_info.value.outcomes[1], Exception)
+    assert isinstance(exc_info.value.outcomes[2], concurrent.futures.CancelledError)
+    assert exc_info.value.returns == {idx: f"Hello, World {idx}" for idx in range(4)}
+
+
+def test_prepared_calls(helloworld_factory: HelloWorldFactory) -> None:
+    client, _ = helloworld_factory.deploy()
+    hello = client.prepare.hello()
+
+    responses = [hello.send(args=(f"World {idx}",)) for idx in range(3)]
+    transactions = hello.create_transaction(args=HelloArgs(name="World"))
+
+    assert [response.abi_return for response in responses] == [f"Hello, World {idx}" for idx in range(3)]
+    assert len({response.tx_id for response in responses}) == 3
+    assert len(transactions.transactions) == 1
+
+
+def test_repeated_sends_use_the_parsed_method(
+    helloworld_factory: HelloWorldFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client, _ = helloworld_factory.deploy()
+    client.send.hello(args=("World",))
+
+    def fail(*_: object) -> typing.NoReturn:
+        raise AssertionError("the method was parsed again")
+
+    monkeypatch.setattr(algosdk.abi.Method, "from_signature", fail)
+    monkeypatch.setattr(algokit_utils.Arc56Contract, "get_arc56_method", fail)
+    responses = [client.send.hello(args=(f"World {idx}",)) for idx in range(2)]
+
+    assert [response.abi_return for response in responses] == ["Hello, World 0", "Hello, World 1"]
+
+
+def test_network_cache(algorand: AlgorandClient, default_deployer: algokit_utils.SigningAccount) -> None:
+    cache = NetworkCache(suggested_params_ttl=60)
+    factory = HelloWorldFactory(algorand, default_sender=default_deployer.address, cache=cache)
+    client, result = factory.deploy()
+    _, redeploy_result = factory.deploy()
+    client2 = factory.get_app_client_by_creator_and_name(default_deployer.address, client.app_name)
+    client3 = HelloWorldClient.from_creator_and_name(
+        default_deployer.address, client.app_name, algorand, default_sender=default_deployer.address, cache=cache
+    )
+    client3.send.hello(args=("World",))
+
+    assert redeploy_result.operation_performed == OperationPerformed.Nothing
+    assert redeploy_result.app.app_id == result.app.app_id == client2.app_id
+    assert redeploy_result.app.app_id == client3.app_id
+    # suggested params are fetched by the first deploy, and the apps of the deployer are looked up once
+    assert (cache.hits, cache.misses) == (5, 2)
+
+
+def test_deploy_many(helloworld_factory: HelloWorldFactory) -> None:
+    results = helloworld_factory.deploy_many(
+        [{"app_name": f"HelloWorld{idx}", "compilation_params": {"updatable": idx % 2 == 0}} for idx in range(4)],
+        max_concurrency=2,
+    )
+
+    assert [client.app_name for client, _ in results] == [f"HelloWorld{idx}" for idx in range(4)]
+    assert len({client.app_id for client, _ in results}) == 4
+    assert all(result.operation_performed == OperationPerformed.Create for _, result in results)
+    with pytest.raises(ValueError, match="more than once"):
+        helloworld_factory.deploy_many([{"app_name": "HelloWorld0"}, {"app_name": "HelloWorld0"}])
+
+
 def test_simulate_hello(helloworld_factory: HelloWorldFactory) -> None:
     client, _ = helloworld_factory.deploy()
 
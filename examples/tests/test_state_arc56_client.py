@@ -15,6 +15,7 @@ from examples.smart_contracts.artifacts.state.state_arc56_client import (
     DefaultValueFromGlobalStateArgs,
     DefaultValueFromLocalStateArgs,
     DefaultValueIntArgs,
+    ReadonlyCallCache,
     SetGlobalArgs,
     SetLocalArgs,
     StateClient,
@@ -69,6 +70,22 @@ def test_exposes_state_correctly(
     assert local_state["local_bytes1"] == b"asdf"
     assert local_state["local_bytes2"] == b"\x01\x02\x03\x04"
 
+    # accounts that aren't opted in are omitted
+    not_opted_in = client.algorand.account.random().address
+    progress: list[tuple[int, int]] = []
+    many = client.state.local_state_many(
+        [not_opted_in, default_deployer.address], progress=lambda done, total: progress.append((done, total))
+    )
+    assert many == {default_deployer.address: local_state}
+    assert progress[-1] == (2, 2)
+
+    local_columns = client.state.local_state_columns([default_deployer.address])
+    assert local_columns["address"] == [default_deployer.address]
+    assert list(local_columns["local_int2"]) == [2]
+    global_columns = client.state.global_state_columns([client.app_id])
+    assert global_columns["app_id"] == [client.app_id]
+    assert list(global_columns["int1"]) == [1]
+
     # NOTE: Accessors are normalized to snake case, raw keys in the loaded app spec aren't
     client.state.global_state.bytes_not_in_snake_case  # Should not throw KeyError
     client.state.local_state(default_deployer.address).local_bytes_not_in_snake_case  # Should not throw KeyError
@@ -102,6 +119,24 @@ def test_readonly_methods_dont_consume_algos(state_factory_arc56: StateFactory)
     assert result2.abi_return == "Hello, oh hi 2"
 
 
+def test_readonly_call_cache(state_factory_arc56: StateFactory) -> None:
+    client, _ = state_factory_arc56.deploy(
+        compilation_params={"deploy_time_params": {"VALUE": 1}},
+    )
+    cache = ReadonlyCallCache(round=1)
+    client.send.readonly_cache = cache
+
+    result = client.send.call_abi(args=CallAbiArgs(value="oh hi"))
+    assert client.send.call_abi(args=("oh hi",)) is result
+    assert client.send.call_abi(args=CallAbiArgs(value="oh hi 2")).abi_return == "Hello, oh hi 2"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.round = 2
+    result2 = client.send.call_abi(args=CallAbiArgs(value="oh hi"))
+    assert result2 is not result
+    assert result2.abi_return == "Hello, oh hi"
+
+
 def test_arguments_with_defaults(state_factory_arc56: StateFactory) -> None:
     client, _ = state_factory_arc56.deploy(
         compilation_params={"deploy_time_params": {"VALUE": 1}},
@@ -1,7 +1,7 @@
 import pathlib
-from itertools import chain, product
+from itertools import chain
 
-from algokit_client_generator import generate_client
+from algokit_client_generator import generate_client_modes
 from algokit_client_generator.utils import to_pascal_case, to_snake_case
 from scripts._helpers import enable_mypy
 
@@ -26,24 +26,21 @@ def update_approvals() -> None:
         "zero_coupon_bond",
     ]
 
-    # Generate both full and minimal clients for each app
-    modes = ["full", "minimal"]
-
-    for app, extension, mode in chain(product(arc32_apps, ["arc32"], modes), product(arc56_apps, ["arc56"], modes)):
+    # Generate both full and minimal clients for each app, from a single load of its app spec
+    for app, extension in chain(((app, "arc32") for app in arc32_apps), ((app, "arc56") for app in arc56_apps)):
         app_path = artifacts / app
         app_spec = app_path / f"{to_pascal_case(app)}.{extension}.json"
-
-        # Generate filename based on mode
-        if mode == "minimal":
-            approved_path = app_path / f"{to_snake_case(app)}_{extension}_client_minimal.py"
-        else:
-            approved_path = app_path / f"{to_snake_case(app)}_{extension}_client.py"
+        approved_paths = {
+            "full": app_path / f"{to_snake_case(app)}_{extension}_client.py",
+            "minimal": app_path / f"{to_snake_case(app)}_{extension}_client_minimal.py",
+        }
 
         try:
-            generate_client(app_spec, approved_path, mode=mode)
-            enable_mypy(approved_path)
+            generate_client_modes(app_spec, approved_paths)
+            for approved_path in approved_paths.values():
+                enable_mypy(approved_path)
         except Exception as e:
-            print(f"Error generating {mode} client for {app}: {e}")
+            print(f"Error generating clients for {app}: {e}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,27 @@
-from algokit_client_generator.writer import generate_client
+import typing
 
-__all__ = ["generate_client"]
+if typing.TYPE_CHECKING:
+    from algokit_client_generator.writer import (
+        generate_client,
+        generate_client_modes,
+        generate_client_package,
+        generate_clients,
+        generate_manifest_clients,
+    )
+
+__all__ = [
+    "generate_client",
+    "generate_client_modes",
+    "generate_client_package",
+    "generate_clients",
+    "generate_manifest_clients",
+]
+
+
+def __getattr__(name: str) -> object:
+    # The writer is imported on first use, so importing the package (e.g. for the CLI) stays fast
+    if name in __all__:
+        from algokit_client_generator import writer  # noqa: PLC0415
+
+        return getattr(writer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
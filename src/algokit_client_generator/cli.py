@@ -1,9 +1,20 @@
 import argparse
 import logging
 import sys
+import typing
+from collections.abc import Sequence
 from pathlib import Path
 
-from algokit_client_generator.writer import generate_client
+from algokit_client_generator import server
+from algokit_client_generator.filters import ON_COMPLETE_ACTIONS, MethodFilter
+from algokit_client_generator.modes import get_mode_output_paths, parse_modes
+from algokit_client_generator.watch import watch
+
+if typing.TYPE_CHECKING:
+    from algokit_client_generator.report import ClientReport
+
+# algokit_client_generator.writer imports algokit_utils and algosdk, which are slow to import, so it is imported
+# where it is needed rather than here, which keeps e.g. --help, --serve and --connect fast
 
 logger = logging.getLogger(__name__)
 
@@ -43,47 +54,404 @@ def get_args_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-m",
         "--mode",
-        choices=["full", "minimal"],
+        type=_parse_modes_arg,
         default="full",
+        metavar="{full,minimal}",
         help="Generate client in specified mode. The 'full' mode includes all features, "
-        "'minimal' generates a smaller client without deployment features",
+        "'minimal' generates a smaller client without deployment features. Several comma separated modes, "
+        "e.g. 'full,minimal', generate a client for each from a single load of the application specification, "
+        "with the minimal client written alongside the output with a '_minimal' suffix",
+    )
+    parser.add_argument(
+        "-s",
+        "--shared-structs",
+        metavar="MODULE",
+        help="When using --walk, generate structs that are identical across application specifications once, "
+        "in the given module (a dotted path relative to the input directory, e.g. 'clients.structs'), "
+        "and import them in each client",
+    )
+    parser.add_argument(
+        "--include-method",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only generate the methods whose name or signature matches the pattern, which can be a glob such as "
+        "'get_*'. Can be given more than once",
+    )
+    parser.add_argument(
+        "--exclude-method",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Don't generate the methods whose name or signature matches the pattern, which can be a glob such as "
+        "'admin_*'. Can be given more than once",
+    )
+    parser.add_argument(
+        "--on-complete",
+        action="append",
+        default=[],
+        choices=ON_COMPLETE_ACTIONS,
+        help="Only generate the methods that can be called with the on-complete action. Can be given more than once",
+    )
+    parser.add_argument(
+        "--package",
+        action="store_true",
+        help="Output the client as a package of modules (structs, state, client, composer, factory and spec) in "
+        "the --output directory, which are only imported when used",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Reduce peak memory usage at the cost of speed, e.g. for very large application specifications in "
+        "constrained environments, and report the peak memory usage once done",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["json"],
+        help="Write a report of each generated client to stdout, with the time spent in each phase of generation, "
+        "the size of the output and application specification, and the number of methods, structs, state keys and maps",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate clients whenever their application specification changes",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Generate the clients listed in a JSON or TOML manifest file, instead of --app_spec and --output. "
+        "Each entry in its 'clients' list has 'app_spec' and 'output' paths (relative to the manifest) and "
+        "optional 'mode' and 'preserve_names' values",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The number of processes used to generate the clients in a --manifest. Defaults to 1",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=server.STDIO,
+        metavar="SOCKET",
+        help="Run as a long-lived generation server, accepting JSON-lines requests on the given Unix socket, "
+        "or on stdin (responding on stdout) if no socket is given",
+    )
+    parser.add_argument(
+        "--connect",
+        type=Path,
+        metavar="SOCKET",
+        help="Send the generation request(s) to a server started with --serve SOCKET instead of generating locally",
     )
     return parser
 
 
+def _parse_modes_arg(value: str) -> tuple[str, ...]:
+    try:
+        return parse_modes(value)
+    except ValueError as ex:
+        raise argparse.ArgumentTypeError(str(ex)) from ex
+
+
 def configure_logging() -> None:
     logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
-def walk_dir(path: Path, output: Path, *, preserve_names: bool = False, mode: str = "full") -> None:
+def find_app_specs(path: Path) -> list[Path]:
+    app_specs = []
     for child in path.iterdir():
         if child.is_dir():
-            walk_dir(child, output, preserve_names=preserve_names, mode=mode)
+            app_specs.extend(find_app_specs(child))
         elif child.name.lower() == "application.json":
-            generate_client(child, child.parent / output, preserve_names=preserve_names, mode=mode)
+            app_specs.append(child)
+    return app_specs
+
+
+def walk_dir(  # noqa: PLR0913
+    path: Path,
+    output: Path,
+    *,
+    preserve_names: bool = False,
+    modes: Sequence[str] = ("full",),
+    shared_structs_module: str | None = None,
+    low_memory: bool = False,
+    method_filter: MethodFilter | None = None,
+    reports: "list[ClientReport] | None" = None,
+) -> None:
+    from algokit_client_generator.writer import generate_clients  # noqa: PLC0415
+
+    generate_clients(
+        ((app_spec, app_spec.parent / output) for app_spec in find_app_specs(path)),
+        preserve_names=preserve_names,
+        mode=modes,
+        shared_structs_path=get_shared_structs_path(path, shared_structs_module),
+        shared_structs_module=shared_structs_module,
+        low_memory=low_memory,
+        method_filter=method_filter,
+        reports=reports,
+    )
+
+
+def get_shared_structs_path(path: Path, shared_structs_module: str | None) -> Path | None:
+    if not shared_structs_module:
+        return None
+    return path.joinpath(*shared_structs_module.split(".")).with_suffix(".py")
+
+
+def log_peak_memory_usage() -> None:
+    from algokit_client_generator.writer import get_peak_memory_usage  # noqa: PLC0415
+
+    peak = get_peak_memory_usage()
+    if peak is None:
+        logger.info("Peak memory usage is not available on this platform")
+    else:
+        logger.info(f"Peak memory usage: {peak / (1024 * 1024):.1f} MiB")
+
+
+def write_reports(reports: "list[ClientReport] | None") -> None:
+    if reports is None:
+        return
+    from algokit_client_generator.report import format_reports  # noqa: PLC0415
+
+    sys.stdout.write(format_reports(reports) + "\n")
+
+
+def watch_dir(  # noqa: PLR0913
+    path: Path,
+    output: Path,
+    *,
+    preserve_names: bool = False,
+    modes: Sequence[str] = ("full",),
+    shared_structs_module: str | None = None,
+    method_filter: MethodFilter | None = None,
+) -> None:
+    def get_targets() -> dict[Path, Path]:
+        return {app_spec: app_spec.parent / output for app_spec in find_app_specs(path)}
+
+    from algokit_client_generator.writer import WatchedClients  # noqa: PLC0415
+
+    clients = WatchedClients(
+        get_targets,
+        preserve_names=preserve_names,
+        modes=modes,
+        shared_structs_path=get_shared_structs_path(path, shared_structs_module),
+        shared_structs_module=shared_structs_module,
+        method_filter=method_filter,
+    )
+    watch(get_targets, clients.regenerate)
+
+
+def watch_file(
+    app_spec: Path,
+    output: Path,
+    *,
+    preserve_names: bool = False,
+    modes: Sequence[str] = ("full",),
+    method_filter: MethodFilter | None = None,
+) -> None:
+    from algokit_client_generator.writer import generate_clients  # noqa: PLC0415
+
+    watch(
+        lambda: {app_spec: output},
+        lambda targets: generate_clients(
+            targets.items(), preserve_names=preserve_names, mode=modes, method_filter=method_filter
+        ),
+    )
+
+
+def connect(
+    socket_path: Path,
+    clients: list[tuple[Path, Path]],
+    *,
+    preserve_names: bool = False,
+    modes: Sequence[str] = ("full",),
+) -> None:
+    mode_clients = [
+        (app_spec, output, mode)
+        for app_spec, client_output in clients
+        for mode, output in get_mode_output_paths(client_output, modes).items()
+    ]
+    requests = (
+        {
+            "app_spec": str(app_spec.resolve()),
+            "output": str(output.resolve()),
+            "preserve_names": preserve_names,
+            "mode": mode,
+        }
+        for app_spec, output, mode in mode_clients
+    )
+    try:
+        responses = server.send_requests(socket_path, requests)
+    except OSError as ex:
+        raise ArgumentError(f"Could not connect to generation server on {socket_path}: {ex}") from ex
+    failed = False
+    for (app_spec, output, _), response in zip(mode_clients, responses, strict=True):
+        if response["ok"]:
+            logger.info(f"Output typed client for {app_spec} to {output}")
+        else:
+            logger.error(f"Failed to generate client for {app_spec}: {response['error']}")
+            failed = True
+    # fail the build rather than leave a stale client in place
+    if failed:
+        sys.exit(1)
 
 
 def process(parser: argparse.ArgumentParser) -> None:
     args = parser.parse_args()
     app_spec: Path = args.app_spec
-    output: Path = args.output
+    if args.serve:
+        if args.serve == server.STDIO:
+            server.serve_stdio()
+        else:
+            server.serve_socket(Path(args.serve))
+        return
+    if args.manifest:
+        process_manifest(args)
+        return
+    check_combined_options(args)
     if not app_spec.exists():
         raise ArgumentError(f"Application Specification not found: {app_spec}")
 
     if args.walk:
-        if not app_spec.is_dir():
-            raise ArgumentError(
-                f"Application specification must be a path to a directory, when using the --walk option: {app_spec}"
-            )
-        if output.is_absolute():
-            raise ArgumentError(f"Output must be a relative path when using the --walk option: {output}")
-        walk_dir(args.app_spec, args.output, preserve_names=args.preserve_names, mode=args.mode)
+        process_walk(args)
+    elif args.shared_structs:
+        raise ArgumentError("The --shared-structs option can only be used with the --walk option")
     elif len(sys.argv) == 1:  # if user invokes with no arguments display help
         parser.print_usage()
     else:
-        if not app_spec.is_file():
-            raise ArgumentError(f"Application Specification must be a path to an application.json: {app_spec}")
-        generate_client(app_spec, output, preserve_names=args.preserve_names, mode=args.mode)
+        process_file(args)
+
+
+def get_method_filter(args: argparse.Namespace) -> MethodFilter | None:
+    method_filter = MethodFilter(
+        include=tuple(args.include_method), exclude=tuple(args.exclude_method), on_complete=tuple(args.on_complete)
+    )
+    return method_filter or None
+
+
+def check_combined_options(args: argparse.Namespace) -> None:
+    if args.jobs is not None:
+        raise ArgumentError("The --jobs option can only be used with the --manifest option")
+    if args.connect and (args.watch or args.shared_structs):
+        raise ArgumentError("The --connect option can't be combined with the --watch or --shared-structs options")
+    if args.connect and get_method_filter(args):
+        raise ArgumentError(
+            "The --connect option can't be combined with the --include-method, --exclude-method or --on-complete "
+            "options"
+        )
+    # these only apply to generating once, in this process
+    for option, value in (("--low-memory", args.low_memory), ("--report", args.report), ("--package", args.package)):
+        if value and (args.watch or args.connect):
+            raise ArgumentError(f"The {option} option can't be combined with the --watch or --connect options")
+    if args.package and (args.walk or args.low_memory or args.report):
+        raise ArgumentError("The --package option can't be combined with the --walk, --low-memory or --report options")
+
+
+def process_manifest(args: argparse.Namespace) -> None:
+    from algokit_client_generator.manifest import load_manifest  # noqa: PLC0415
+    from algokit_client_generator.writer import generate_manifest_clients  # noqa: PLC0415
+
+    if (
+        args.walk
+        or args.watch
+        or args.connect
+        or args.shared_structs
+        or args.low_memory
+        or args.package
+        or get_method_filter(args)
+    ):
+        raise ArgumentError(
+            "The --manifest option can't be combined with the --walk, --watch, --connect, --shared-structs, "
+            "--low-memory, --package, --include-method, --exclude-method or --on-complete options"
+        )
+    jobs = 1 if args.jobs is None else args.jobs
+    if jobs < 1:
+        raise ArgumentError(f"The number of jobs must be at least 1: {jobs}")
+    try:
+        entries = load_manifest(args.manifest)
+    except ValueError as ex:
+        raise ArgumentError(str(ex)) from ex
+    reports: list[ClientReport] | None = [] if args.report else None
+    generate_manifest_clients(entries, jobs=jobs, reports=reports)
+    write_reports(reports)
+
+
+def process_walk(args: argparse.Namespace) -> None:
+    app_spec: Path = args.app_spec
+    output: Path = args.output
+    if not app_spec.is_dir():
+        raise ArgumentError(
+            f"Application specification must be a path to a directory, when using the --walk option: {app_spec}"
+        )
+    if output.is_absolute():
+        raise ArgumentError(f"Output must be a relative path when using the --walk option: {output}")
+    if args.connect:
+        clients = [(spec, spec.parent / output) for spec in find_app_specs(app_spec)]
+        connect(args.connect, clients, preserve_names=args.preserve_names, modes=args.mode)
+        return
+    if args.watch:
+        watch_dir(
+            app_spec,
+            output,
+            preserve_names=args.preserve_names,
+            modes=args.mode,
+            shared_structs_module=args.shared_structs,
+            method_filter=get_method_filter(args),
+        )
+        return
+    reports: list[ClientReport] | None = [] if args.report else None
+    walk_dir(
+        app_spec,
+        output,
+        preserve_names=args.preserve_names,
+        modes=args.mode,
+        shared_structs_module=args.shared_structs,
+        low_memory=args.low_memory,
+        method_filter=get_method_filter(args),
+        reports=reports,
+    )
+    if args.low_memory:
+        log_peak_memory_usage()
+    write_reports(reports)
+
+
+def process_file(args: argparse.Namespace) -> None:
+    app_spec: Path = args.app_spec
+    output: Path = args.output
+    if not app_spec.is_file():
+        raise ArgumentError(f"Application Specification must be a path to an application.json: {app_spec}")
+    if args.connect:
+        connect(args.connect, [(app_spec, output)], preserve_names=args.preserve_names, modes=args.mode)
+    elif args.watch:
+        watch_file(
+            app_spec, output, preserve_names=args.preserve_names, modes=args.mode, method_filter=get_method_filter(args)
+        )
+    elif args.package:
+        from algokit_client_generator.writer import generate_client_package  # noqa: PLC0415
+
+        for mode, output_dir in get_mode_output_paths(output, args.mode).items():
+            generate_client_package(
+                app_spec,
+                output_dir,
+                preserve_names=args.preserve_names,
+                mode=mode,
+                method_filter=get_method_filter(args),
+            )
+    else:
+        from algokit_client_generator.writer import generate_client_modes  # noqa: PLC0415
+
+        reports: list[ClientReport] | None = [] if args.report else None
+        generate_client_modes(
+            app_spec,
+            get_mode_output_paths(output, args.mode),
+            preserve_names=args.preserve_names,
+            low_memory=args.low_memory,
+            method_filter=get_method_filter(args),
+            reports=reports,
+        )
+        if args.low_memory:
+            log_peak_memory_usage()
+        write_reports(reports)
 
 
 def main() -> None:
@@ -1,14 +1,28 @@
 import copy
+import dataclasses
 
 import algokit_utils
 
 from algokit_client_generator import utils
-from algokit_client_generator.spec import ABIStruct, get_all_structs, get_contract_methods
-
-
-def _shrink_app_spec(app_spec: algokit_utils.Arc56Contract, mode: str) -> algokit_utils.Arc56Contract:
-    """Shrink the app spec by removing unnecessary data for minimal mode"""
-    stripped_app_spec = copy.deepcopy(app_spec)
+from algokit_client_generator.filters import MethodFilter
+from algokit_client_generator.spec import (
+    ABIStruct,
+    ContractMethod,
+    SharedStructs,
+    filter_methods,
+    get_all_structs,
+    get_contract_events,
+    get_contract_methods,
+    get_overloaded_method_names,
+    group_methods_by_action,
+)
+
+
+def _shrink_common_data(
+    app_spec: algokit_utils.Arc56Contract, *, in_place: bool = False
+) -> algokit_utils.Arc56Contract:
+    """Shrink the app spec by removing data that isn't needed in any mode"""
+    stripped_app_spec = app_spec if in_place else copy.deepcopy(app_spec)
 
     # Keep only source info entries that can be used for approval and clear program error mapping
     if (
@@ -30,15 +44,17 @@ def _shrink_app_spec(app_spec: algokit_utils.Arc56Contract, mode: str) -> algoki
         )
 
     stripped_app_spec.compiler_info = None
+    return stripped_app_spec
 
+
+def _strip_mode_data(app_spec: algokit_utils.Arc56Contract, mode: str) -> algokit_utils.Arc56Contract:
+    """Remove data from an already shrunk app spec that isn't needed for the given mode"""
     # These are used for deploying but not for calling deployed apps
     if mode == "minimal":
-        stripped_app_spec.source = None
-        stripped_app_spec.byte_code = None
-        stripped_app_spec.template_variables = None
-        stripped_app_spec.scratch_variables = None
-
-    return stripped_app_spec
+        return dataclasses.replace(
+            app_spec, source=None, byte_code=None, template_variables=None, scratch_variables=None
+        )
+    return app_spec
 
 
 def _shrink_source_info(source_info: list[algokit_utils.SourceInfo]) -> list[algokit_utils.SourceInfo]:
@@ -58,45 +74,125 @@ def _shrink_source_info(source_info: list[algokit_utils.SourceInfo]) -> list[alg
 
 
 class GeneratorContext:
-    def __init__(self, app_spec: algokit_utils.Arc56Contract, *, preserve_names: bool = False, mode: str = "full"):
+    def __init__(
+        self,
+        app_spec: algokit_utils.Arc56Contract,
+        *,
+        preserve_names: bool = False,
+        mode: str = "full",
+        low_memory: bool = False,
+        method_filter: MethodFilter | None = None,
+    ):
+        """Create the context for generating a typed client for an app spec
+
+        :param app_spec: The app spec to generate a client for
+        :param bool preserve_names: Preserve original names for structs and methods
+        :param str mode: Generation mode - "full" or "minimal"
+        :param bool low_memory: Reduce peak memory usage at the cost of speed. The app spec is shrunk in place rather
+            than copied, so it shouldn't be used by the caller afterwards, and it is encoded into the client in chunks
+        :param MethodFilter | None method_filter: If provided, only the selected methods are generated, and the other
+            methods and the structs only they use are removed from the app spec embedded in the client
+        """
         self.mode = mode
-        self.app_spec = _shrink_app_spec(app_spec, mode)
+        self.low_memory = low_memory
+        # Kept so contexts for other modes can be derived without shrinking the app spec again
+        self._common_app_spec = _shrink_common_data(app_spec, in_place=low_memory)
+        # Overloaded methods keep their signature based names when filtered, so clients with different filters have
+        # the same API
+        overloaded_method_names: set[str] = set()
+        if method_filter:
+            overloaded_method_names = get_overloaded_method_names(self._common_app_spec.methods)
+            filter_methods(self._common_app_spec, method_filter)
+        self.app_spec = _strip_mode_data(self._common_app_spec, mode)
         self.structs: dict[str, ABIStruct] = {}
         self.sanitizer = utils.get_sanitizer(preserve_names=preserve_names)
 
-        # Reserved module-level symbols to avoid naming conflicts
-        self.used_module_symbols = {
-            "_APP_SPEC_JSON",  # Used in app_spec.py to store raw JSON
-            "APP_SPEC",  # Used throughout as algokit_utils.Arc56Contract instance
-            "DeployCreate",  # Used in typed_factory.py for deployment types
-            "Deploy",  # Used in typed_factory.py for deployment types
-            "Composer",  # Used in composer.py for transaction composition
-        }
-
-        # Reserved client method/property names to avoid naming conflicts
-        self.used_client_symbols = {
-            "__init__",  # Constructor in typed_client.py
-            "app_spec",  # Property in typed_client.py returning algokit_utils.Arc56Contract
-            "app_client",  # Internal algokit_utils.AppClient instance in typed_client.py
-            "app_id",  # Property in typed_client.py returning application ID
-            "app_address",  # Property in typed_client.py returning application address
-            "no_op",  # Used for no-op transaction methods
-            "clear_state",  # Used for clear state transaction methods in typed_client.py
-            "deploy",  # Used in typed_factory.py for deployment
-            "compose",  # Used for transaction composition in composer.py
-            "from_creator_and_name",  # Static factory method in typed_client.py
-            "from_network",  # Static factory method in typed_client.py
-            "clone",  # Method in typed_client.py for cloning client instance
-            "decode_return_value",  # Method in typed_client.py for ABI return value decoding
-            "new_group",  # Method in typed_client.py for creating transaction groups
-        }
+        self.symbols = utils.SymbolAllocator(
+            # Reserved module-level symbols to avoid naming conflicts
+            module_symbols={
+                "_APP_SPEC_JSON",  # Used in app_spec.py to store raw JSON
+                "APP_SPEC",  # Used throughout as algokit_utils.Arc56Contract instance
+                "DeployCreate",  # Used in typed_factory.py for deployment types
+                "Deploy",  # Used in typed_factory.py for deployment types
+                "Composer",  # Used in composer.py for transaction composition
+                "BulkSendResults",  # Used in composer.py for the results of sending calls in several groups
+                "BulkSendError",  # Used in composer.py when a group of calls sent in several groups fails
+                "_QueuedCall",  # Used in composer.py for calls queued for bulk sending
+                "_CallParams",  # Used in composer.py for the params of a queued call
+                "NetworkCache",  # Used in helpers.py for network data shared by factories and clients
+                "PreparedCall",  # Used in helpers.py for calls with their static params resolved once
+                "ReadonlyCallCache",  # Used in helpers.py for the results of read-only calls within a round
+                "_NO_READONLY_CACHE",  # Used in helpers.py when no read-only call cache is set
+                "_T",  # Used in helpers.py as the type of a read-only call result
+                "_AbiMethod",  # Used in helpers.py for the selector and parsed types of an ABI method
+                "_ABI_METHODS",  # Used in helpers.py to look up ABI methods by signature
+                "_method_call_params",  # Used in helpers.py to build calls with the parsed method of an ABI method
+                "_send_method_call",  # Used in helpers.py to send calls built with the parsed method of an ABI method
+            },
+            # Reserved client method/property names to avoid naming conflicts
+            client_symbols={
+                "__init__",  # Constructor in typed_client.py
+                "app_spec",  # Property in typed_client.py returning algokit_utils.Arc56Contract
+                "app_client",  # Internal algokit_utils.AppClient instance in typed_client.py
+                "app_id",  # Property in typed_client.py returning application ID
+                "app_address",  # Property in typed_client.py returning application address
+                "cache",  # NetworkCache of the client and its send classes in typed_client.py
+                "no_op",  # Used for no-op transaction methods
+                "clear_state",  # Used for clear state transaction methods in typed_client.py
+                "deploy",  # Used in typed_factory.py for deployment
+                "compose",  # Used for transaction composition in composer.py
+                "from_creator_and_name",  # Static factory method in typed_client.py
+                "from_network",  # Static factory method in typed_client.py
+                "clone",  # Method in typed_client.py for cloning client instance
+                "decode_return_value",  # Method in typed_client.py for ABI return value decoding
+                "new_group",  # Method in typed_client.py for creating transaction groups
+            },
+        )
+        self.used_module_symbols = self.symbols.module
+        self.used_client_symbols = self.symbols.client
 
         self.contract_name = utils.get_unique_symbol_by_incrementing(
             self.used_module_symbols, utils.get_class_name(self.app_spec.name)
         )
 
+        # TypedDict of the factory deploy arguments and the error of deploy_many, named after the contract
+        self.used_module_symbols.add(f"{self.contract_name}FactoryDeployKwargs")
+        self.used_module_symbols.add(f"{self.contract_name}DeployManyError")
+
         self.structs = get_all_structs(self.app_spec, self.used_module_symbols, self.sanitizer)
         self.methods = get_contract_methods(
-            self.app_spec, self.structs, self.used_module_symbols, self.used_client_symbols
+            self.app_spec,
+            self.structs,
+            self.used_module_symbols,
+            self.used_client_symbols,
+            self.sanitizer,
+            overloaded_method_names=overloaded_method_names,
+        )
+        # Shared by all generators so methods are only classified once per context
+        self.methods_by_action: dict[tuple[str, str], list[ContractMethod]] = group_methods_by_action(self.methods)
+        self.events = get_contract_events(self.app_spec, self.structs, self.used_module_symbols, self.sanitizer)
+        # Union of the event classes, named after the contract
+        self.event_type_name = (
+            utils.get_unique_symbol_by_incrementing(self.used_module_symbols, f"{self.contract_name}Event")
+            if self.events
+            else None
         )
         self.disable_linting = True
+        self.shared_structs: SharedStructs | None = None
+
+    def with_mode(self, mode: str) -> "GeneratorContext":
+        """Get a context for generating the same app spec in another mode.
+
+        Structs, methods and symbols don't depend on the mode, so they are shared with this context rather than
+        rebuilt from the app spec
+        """
+        if mode == self.mode:
+            return self
+        context = copy.copy(self)
+        context.mode = mode
+        context.app_spec = _strip_mode_data(self._common_app_spec, mode)
+        return context
+
+    def is_shared_struct(self, struct: ABIStruct) -> bool:
+        """Whether the struct is imported from a shared structs module rather than generated in the client"""
+        return self.shared_structs is not None and struct in self.shared_structs
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from enum import Enum
 
 
@@ -85,7 +85,11 @@ def expand_parts(parts: DocumentParts) -> Iterable[DocumentPart]:
 
 
 def convert_part(parts: DocumentParts, context: RenderContext) -> list[str]:
-    results = []
+    return list(iter_converted_parts(parts, context))
+
+
+def iter_converted_parts(parts: DocumentParts, context: RenderContext) -> Iterator[str]:
+    """Convert parts lazily, so a document can be written out without holding all of it in memory"""
     for part in expand_parts(parts):
         result = convert_part_inner(part, context)
         context.last_part = part
@@ -94,5 +98,4 @@ def convert_part(parts: DocumentParts, context: RenderContext) -> list[str]:
                 context.last_rendered_part = result
             else:  # if last render was small then combine
                 context.last_rendered_part += result
-            results.append(result)
-    return results
+            yield result
@@ -0,0 +1,49 @@
+import dataclasses
+import fnmatch
+from collections.abc import Iterable
+
+# On-complete actions that ABI methods can be called with
+ON_COMPLETE_ACTIONS = ("no_op", "opt_in", "close_out", "update_application", "delete_application")
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class MethodFilter:
+    """Selects the ABI methods to generate a client for, so clients that only need a few methods stay small
+
+    A method is selected if it matches any include pattern (or there are none), doesn't match any exclude pattern,
+    and can be called with any of the on-complete actions (or there are none). Patterns match either the method
+    name or its signature, exactly or as a glob, e.g. "get_*", "transfer(address,uint64)void" or "*(uint64)void"
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    on_complete: tuple[str, ...] = ()
+    """Names from ON_COMPLETE_ACTIONS, e.g. "no_op" or "opt_in" """
+
+    def __post_init__(self) -> None:
+        invalid_actions = [action for action in self.on_complete if action not in ON_COMPLETE_ACTIONS]
+        if invalid_actions:
+            raise ValueError(
+                f"on_complete actions must be one of {', '.join(ON_COMPLETE_ACTIONS)}: {', '.join(invalid_actions)}"
+            )
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude or self.on_complete)
+
+    def matches(self, name: str, signature: str, actions: Iterable[str]) -> bool:
+        """Whether a method is selected by this filter
+
+        :param str name: The method name
+        :param str signature: The method signature, e.g. "transfer(address,uint64)void"
+        :param actions: The on-complete actions the method can be called or created with, e.g. "no_op"
+        """
+        if self.include and not any(match_method(pattern, name, signature) for pattern in self.include):
+            return False
+        if any(match_method(pattern, name, signature) for pattern in self.exclude):
+            return False
+        return not self.on_complete or not set(self.on_complete).isdisjoint(actions)
+
+
+def match_method(pattern: str, name: str, signature: str) -> bool:
+    # Exact matches are checked first, as the [] of array types in signatures have a special meaning in globs
+    return pattern in (name, signature) or fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(signature, pattern)
@@ -4,6 +4,7 @@ from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
 from algokit_client_generator.generators.app_spec import generate_app_spec
 from algokit_client_generator.generators.composer import generate_composer
+from algokit_client_generator.generators.events import generate_events
 from algokit_client_generator.generators.header_comments import generate_header_comments
 from algokit_client_generator.generators.helpers import generate_helpers
 from algokit_client_generator.generators.imports import generate_imports
@@ -37,3 +38,4 @@ def generate(context: GeneratorContext) -> DocumentParts:
         yield generate_typed_factory(context)
     yield Part.Gap2
     yield generate_composer(context)
+    yield generate_events(context)
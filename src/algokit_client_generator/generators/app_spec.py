@@ -1,3 +1,5 @@
+import json
+
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
 
@@ -5,7 +7,11 @@ from algokit_client_generator.document import DocumentParts, Part
 def generate_app_spec(context: GeneratorContext) -> DocumentParts:
     yield Part.InlineMode
     yield '_APP_SPEC_JSON = r"""'
-    yield context.app_spec.to_json(indent=None)
+    if context.low_memory:
+        # Encode the spec in chunks rather than as one large string, the output is identical to to_json
+        yield json.JSONEncoder(indent=None).iterencode(context.app_spec.dictify())
+    else:
+        yield context.app_spec.to_json(indent=None)
     yield '"""'
     yield Part.RestoreLineMode
     yield "APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)"
@@ -3,7 +3,7 @@ from collections.abc import Generator
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
-from algokit_client_generator.generators.helpers import get_abi_method_operations
+from algokit_client_generator.generators.helpers import get_abi_method_operations, get_no_op_abi_methods
 from algokit_client_generator.generators.typed_client import PropertyType, _generate_common_method_params
 from algokit_client_generator.spec import ContractMethod
 
@@ -53,24 +53,262 @@ class {class_name}:
 
         yield utils.indented(f"""
 {method_params}
-    self.composer._composer.add_app_{OPERATION_TO_METHOD_CALL_PREFIX[operation]}_method_call(
-        self.composer.client.params.{operation}.{method.abi.client_method_name}(
-            {"args=args," if method.abi.args else ""}
-            params=params,
-            {compilation_params}
-        )
-    )
-    self.composer._result_mappers.append(
-        lambda v: self.composer.client.decode_return_value(
-            "{method.abi.method.get_signature()}", v
-        )
+    call_params = self.composer.client.params.{operation}.{method.abi.client_method_name}(
+        {"args=args," if method.abi.args else ""}
+        params=params,
+        {compilation_params}
     )
+    {_generate_add_method_call(context, "self.composer", OPERATION_TO_METHOD_CALL_PREFIX[operation], method)}
     return self.composer
 """)
 
     yield Part.DecIndent
 
 
+def _generate_add_method_call(context: GeneratorContext, composer: str, prefix: str, method: ContractMethod) -> str:
+    """Generate the code that adds a method call to the composer, and queues it for bulk sends in full mode"""
+    assert method.abi
+    add = f"composer.add_app_{prefix}_method_call"
+    decode = f'{composer}.client.decode_return_value(\n            "{method.abi.signature}", v\n        )'
+    if context.mode == "full":
+        # queued calls are added to each group they're sent in, so each group gets its own copy
+        return f"""{composer}._add_call(
+        lambda composer: {add}(
+            _copy_call_params(call_params)
+        ),
+        call_params,
+        lambda v: {decode},
+    )"""
+    return f"""{composer}._add_call(
+        lambda composer: {add}(call_params),
+        lambda v: {decode},
+    )"""
+
+
+def generate_bulk_send_helpers() -> DocumentParts:
+    """Generate the helpers the composer uses to send its calls in several groups"""
+    yield utils.indented("""
+@dataclasses.dataclass(frozen=True)
+class BulkSendResults:
+    \"\"\"Results of sending queued calls in as many groups as needed\"\"\"
+
+    groups: list[algokit_utils.SendAtomicTransactionComposerResults]
+    \"\"\"The results of each group, in the order their calls were queued\"\"\"
+    returns: list[typing.Any]
+    \"\"\"The decoded return value of each queued call, in the order they were queued, or None if it has none\"\"\"
+
+
+class BulkSendError(Exception):
+    \"\"\"Raised when any group of a bulk send fails, with the outcomes of the groups that were committed\"\"\"
+
+    def __init__(
+        self,
+        outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException],
+        returns: dict[int, typing.Any],
+    ):
+        self.outcomes = outcomes
+        \"\"\"The results of each group in order, or the exception it raised, cancelled if it wasn't sent\"\"\"
+        self.returns = returns
+        \"\"\"The decoded return value of each call in a group that was committed, by the index it was queued at\"\"\"
+        errors = [
+            outcome
+            for outcome in outcomes
+            if isinstance(outcome, BaseException) and not isinstance(outcome, concurrent.futures.CancelledError)
+        ]
+        super().__init__(f"{len(errors)} of {len(outcomes)} groups failed, the first with: {errors[0]!r}")
+
+
+@dataclasses.dataclass(frozen=True)
+class _QueuedCall:
+    add: typing.Callable[[algokit_utils.TransactionComposer], object]
+    \"\"\"Adds the call to a composer\"\"\"
+    transaction_count: int
+    method_call_count: int
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None
+
+
+# The params of a queued call, delete method calls can be queued but can't be passed as args
+_CallParams = algokit_utils.AppMethodCallTransactionArgument | algokit_utils.AppDeleteMethodCallParams
+_CallParamsT = typing.TypeVar("_CallParamsT", bound=_CallParams)
+
+
+def _copy_call_params(params: _CallParamsT) -> _CallParamsT:
+    \"\"\"Copy the transactions in params, as composers assign a group to the transactions added to them\"\"\"
+    if isinstance(params, Transaction):
+        return typing.cast(_CallParamsT, copy.deepcopy(params))
+    if isinstance(params, algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return typing.cast(
+            _CallParamsT,
+            algosdk.atomic_transaction_composer.TransactionWithSigner(copy.deepcopy(params.txn), params.signer),
+        )
+    if not params.args:
+        return params
+    args = [
+        _copy_call_params(arg) if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in params.args
+    ]
+    return dataclasses.replace(params, args=args)
+
+
+def _count_transactions(params: _CallParams) -> tuple[int, int]:
+    \"\"\"Count the transactions and method calls that params add to a group, including those passed as args\"\"\"
+    if isinstance(params, Transaction | algosdk.atomic_transaction_composer.TransactionWithSigner):
+        return 1, 0
+    transaction_count, method_call_count = 1, 1
+    for arg in params.args or []:
+        if isinstance(arg, algokit_utils.AppMethodCallTransactionArgument):
+            arg_transaction_count, arg_method_call_count = _count_transactions(arg)
+            transaction_count += arg_transaction_count
+            method_call_count += arg_method_call_count
+    return transaction_count, method_call_count
+
+
+def _group_calls(calls: list[_QueuedCall], max_group_size: int) -> list[list[_QueuedCall]]:
+    \"\"\"Pack consecutive calls into as few groups as possible\"\"\"
+    groups: list[list[_QueuedCall]] = []
+    group_size = max_group_size
+    for call in calls:
+        if call.transaction_count > max_group_size:
+            raise ValueError(
+                f"A call with {call.transaction_count} transactions doesn't fit in a group of {max_group_size}"
+            )
+        if group_size + call.transaction_count > max_group_size:
+            groups.append([])
+            group_size = 0
+        groups[-1].append(call)
+        group_size += call.transaction_count
+    return groups
+""")
+
+
+def _generate_call_methods(context: GeneratorContext, seed_suggested_params: str) -> tuple[str, str]:
+    """Generate the methods that add calls to the composer, and in full mode queue them to be sent in bulk"""
+    if context.mode != "full":
+        return (
+            f"""def add_transaction(
+    self, txn: Transaction, signer: TransactionSigner | None = None
+) -> \"{context.contract_name}Composer\":
+    self._add_call(lambda composer: composer.add_transaction(txn, signer))
+    return self
+
+def composer(self) -> algokit_utils.TransactionComposer:
+    return self._composer
+
+""",
+            """def _add_call(
+    self,
+    add: typing.Callable[[algokit_utils.TransactionComposer], object],
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+) -> None:
+    add(self._composer)
+    if result_mapper:
+        self._result_mappers.append(result_mapper)
+""",
+        )
+    return (
+        f"""def add_transaction(
+    self, txn: Transaction, signer: TransactionSigner | None = None
+) -> \"{context.contract_name}Composer\":
+    self._add_call(lambda composer: composer.add_transaction(copy.deepcopy(txn), signer))
+    return self
+
+def composer(self) -> algokit_utils.TransactionComposer:
+    if self._composer is None:
+        # the calls are only added to a single group when it's used, as send_bulk adds them to groups of its own
+        self._composer = self.client.algorand.new_group()
+        for call in self._calls:
+            call.add(self._composer)
+    return self._composer
+
+""",
+        f"""def send_bulk(
+    self,
+    send_params: algokit_utils.SendParams | None = None,
+    *,
+    max_concurrency: int = 1,
+    max_group_size: int = algosdk.constants.TX_GROUP_LIMIT,
+) -> BulkSendResults:
+    \"\"\"Send the queued calls in as many groups as needed, rather than as a single group
+
+    Consecutive calls are packed into groups of up to max_group_size transactions, including the transactions
+    passed as args. By default the groups are sent one at a time, in the order their calls were queued. With a
+    max_concurrency above 1, up to that many groups are sent at once, so groups may be committed in any order and
+    in different rounds. Each group is atomic, but groups aren't atomic with each other, so if a group fails, the
+    groups that haven't been sent are cancelled and a BulkSendError is raised with the results of the groups that
+    were committed.
+    \"\"\"
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {{max_concurrency}}")
+    groups = _group_calls(self._calls, max_group_size)
+    outcomes: list[algokit_utils.SendAtomicTransactionComposerResults | BaseException] = []
+    if max_concurrency == 1:
+        for group in groups:
+            if outcomes and isinstance(outcomes[-1], BaseException):
+                outcomes.append(concurrent.futures.CancelledError())
+                continue
+            try:
+                outcomes.append(self._send_group(group, send_params))
+            except Exception as ex:
+                outcomes.append(ex)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(self._send_group, group, send_params) for group in groups]
+            _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            concurrent.futures.wait(not_done)
+            for future in futures:
+                outcomes.append(
+                    concurrent.futures.CancelledError()
+                    if future.cancelled()
+                    else future.exception() or future.result()
+                )
+
+    returns: dict[int, object] = {{}}
+    call_idx = 0
+    for group, outcome in zip(groups, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            call_idx += len(group)
+            continue
+        abi_returns = iter(outcome.returns)
+        for call in group:
+            # the returns of method calls passed as args precede the return of the call itself
+            call_returns = [next(abi_returns) for _ in range(call.method_call_count)]
+            returns[call_idx] = (
+                call.result_mapper(call_returns[-1]) if call.result_mapper and call_returns else None
+            )
+            call_idx += 1
+    if any(isinstance(outcome, BaseException) for outcome in outcomes):
+        raise BulkSendError(outcomes, returns)
+    return BulkSendResults(
+        groups=typing.cast(list[algokit_utils.SendAtomicTransactionComposerResults], outcomes),
+        returns=list(returns.values()),
+    )
+
+def _send_group(
+    self, calls: list[_QueuedCall], send_params: algokit_utils.SendParams | None
+) -> algokit_utils.SendAtomicTransactionComposerResults:{seed_suggested_params}
+    composer = self.client.algorand.new_group()
+    for call in calls:
+        call.add(composer)
+    return composer.send(send_params)
+
+def _add_call(
+    self,
+    add: typing.Callable[[algokit_utils.TransactionComposer], object],
+    params: _CallParams | None = None,
+    result_mapper: typing.Callable[[algokit_utils.ABIReturn | None], object] | None = None,
+) -> None:
+    if self._composer is not None:
+        add(self._composer)
+    transaction_count, method_call_count = _count_transactions(params) if params else (1, 0)
+    self._calls.append(_QueuedCall(add, transaction_count, method_call_count, result_mapper))
+    if result_mapper:
+        self._result_mappers.append(result_mapper)
+""",
+    )
+
+
 def generate_composer(context: GeneratorContext) -> DocumentParts:
     """Generate the composer class for creating transaction groups"""
 
@@ -87,15 +325,29 @@ def generate_composer(context: GeneratorContext) -> DocumentParts:
                 yield from class_name_gen
                 yield Part.Gap2
 
+    # calls are only sent in several groups in full mode
+    full = context.mode == "full"
+    if full:
+        yield generate_bulk_send_helpers()
+        yield Part.Gap2
+
     # Then generate main composer class
+    composer_attributes = (
+        """
+        self._composer: algokit_utils.TransactionComposer | None = None
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self._calls: list[_QueuedCall] = []"""
+        if full
+        else """
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []"""
+    )
     yield utils.indented(f"""
 class {context.contract_name}Composer:
     \"\"\"Composer for creating transaction groups for {context.contract_name} contract calls\"\"\"
 
     def __init__(self, client: "{context.contract_name}Client"):
-        self.client = client
-        self._composer = client.algorand.new_group()
-        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+        self.client = client{composer_attributes}
 """)
     yield Part.IncIndent
 
@@ -109,8 +361,8 @@ def {operation}(self) -> "{class_name}":
 """)
 
     # Generate methods for no_op ABI calls
-    for method in context.methods.all_abi_methods:
-        if not method.abi or "no_op" not in method.on_complete:
+    for method in get_no_op_abi_methods(context):
+        if not method.abi:
             continue
 
         if context.mode == "minimal" and (
@@ -128,21 +380,23 @@ def {operation}(self) -> "{class_name}":
         yield Part.Gap1
         yield utils.indented(f"""
 {method_params}
-    self._composer.add_app_call_method_call(
-        self.client.params.{method.abi.client_method_name}(
-            {"args=args, " if method.abi.args else ""}
-            params=params,
-        )
-    )
-    self._result_mappers.append(
-        lambda v: self.client.decode_return_value(
-            "{method.abi.method.get_signature()}", v
-        )
+    call_params = self.client.params.{method.abi.client_method_name}(
+        {"args=args, " if method.abi.args else ""}
+        params=params,
     )
+    {_generate_add_method_call(context, "self", "call", method)}
     return self
 """)
 
-    # Add utility methods
+    # Add utility methods, sends seed suggested params from the client's network cache, which is only in full mode
+    seed_suggested_params = (
+        """
+    if self.client.cache:
+        self.client.cache.seed_suggested_params(self.client.algorand)"""
+        if context.mode == "full"
+        else ""
+    )
+    add_methods, bulk_send_methods = _generate_call_methods(context, seed_suggested_params)
     yield Part.Gap1
     yield utils.indented(f"""
 def clear_state(
@@ -152,28 +406,18 @@ def clear_state(
     params: algokit_utils.CommonAppCallParams | None = None,
 ) -> \"{context.contract_name}Composer\":
     params=params or algokit_utils.CommonAppCallParams()
-    self._composer.add_app_call(
-        self.client.params.clear_state(
-            algokit_utils.AppClientBareCallParams(
-                **{{
-                    **dataclasses.asdict(params),
-                    "args": args
-                }}
-            )
+    call_params = self.client.params.clear_state(
+        algokit_utils.AppClientBareCallParams(
+            **{{
+                **dataclasses.asdict(params),
+                "args": args
+            }}
         )
     )
+    self._add_call(lambda composer: composer.add_app_call(call_params))
     return self
 
-def add_transaction(
-    self, txn: Transaction, signer: TransactionSigner | None = None
-) -> \"{context.contract_name}Composer\":
-    self._composer.add_transaction(txn, signer)
-    return self
-
-def composer(self) -> algokit_utils.TransactionComposer:
-    return self._composer
-
-def simulate(
+{add_methods}def simulate(
     self,
     allow_more_logs: bool | None = None,
     allow_empty_signatures: bool | None = None,
@@ -182,8 +426,8 @@ def simulate(
     exec_trace_config: SimulateTraceConfig | None = None,
     simulation_round: int | None = None,
     skip_signatures: bool | None = None,
-) -> algokit_utils.SendAtomicTransactionComposerResults:
-    return self._composer.simulate(
+) -> algokit_utils.SendAtomicTransactionComposerResults:{seed_suggested_params}
+    return self.composer().simulate(
         allow_more_logs=allow_more_logs,
         allow_empty_signatures=allow_empty_signatures,
         allow_unnamed_resources=allow_unnamed_resources,
@@ -196,7 +440,8 @@ def simulate(
 def send(
     self,
     send_params: algokit_utils.SendParams | None = None
-) -> algokit_utils.SendAtomicTransactionComposerResults:
-    return self._composer.send(send_params)
-""")
+) -> algokit_utils.SendAtomicTransactionComposerResults:{seed_suggested_params}
+    return self.composer().send(send_params)
+
+{bulk_send_methods}""")
     yield Part.DecIndent
@@ -0,0 +1,175 @@
+import re
+from collections.abc import Iterator
+
+from algokit_client_generator import utils
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.spec import ContractEvent, ContractEventArg
+
+# struct formats for the head of the ABI encoding of types that can be unpacked directly
+_HEAD_FORMATS = {"uint8": "B", "uint16": "H", "uint32": "I", "uint64": "Q", "byte": "B", "address": "32s"}
+_STATIC_BYTES = re.compile(r"byte\[(\d+)\]")
+# Dynamic types have a 2 byte offset of their value in the head
+_DYNAMIC_TYPES = ("string", "byte[]")
+
+
+def generate_events(context: GeneratorContext) -> Iterator[DocumentParts]:
+    """Generate a dataclass for each ARC-28 event, and functions to decode them from logs"""
+    if not context.events:
+        return
+    for event in context.events:
+        yield Part.Gap2
+        yield _generate_event_class(event)
+
+    event_type = context.event_type_name
+    yield Part.Gap2
+    yield utils.indented("""
+# Encoding an address hashes it, and the same addresses are usually logged many times, e.g. by a busy account
+_encode_address = functools.lru_cache(maxsize=4096)(algosdk.encoding.encode_address)
+
+
+def _decode_abi_bytes(data: bytes, offset: int) -> bytes:
+    \"\"\"Decode a dynamic byte array or string at offset in data\"\"\"
+    return data[offset + 2 : offset + 2 + int.from_bytes(data[offset : offset + 2], "big")]
+""")
+    yield Part.Gap2
+    yield f"{event_type}: typing.TypeAlias = {' | '.join(event.class_name for event in context.events)}"
+    yield Part.Gap1
+    yield "# Decoders for each event, by the 4 byte selector that prefixes its logs"
+    yield f"EVENT_DECODERS: dict[bytes, typing.Callable[[bytes], {event_type}]] = {{"
+    yield Part.IncIndent
+    for event in context.events:
+        yield f"{event.class_name}.SELECTOR: {event.class_name}.decode,"
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield utils.indented(f"""
+def decode_event(log: bytes | str) -> {event_type} | None:
+    \"\"\"Decode an event from a log, which is base64 encoded if a str, or None if the log isn't one of the events\"\"\"
+    data = base64.b64decode(log) if isinstance(log, str) else log
+    decoder = EVENT_DECODERS.get(data[:4])
+    return decoder(data[4:]) if decoder else None
+
+
+def decode_events(logs: typing.Iterable[bytes | str]) -> list[{event_type}]:
+    \"\"\"Decode the events from logs, e.g. all the logs of a block, skipping logs that aren't events
+
+    Logs are base64 encoded if a str, as returned by algod and indexer
+    \"\"\"
+    decoders = EVENT_DECODERS
+    events = []
+    for log in logs:
+        data = base64.b64decode(log) if isinstance(log, str) else log
+        decoder = decoders.get(data[:4])
+        if decoder is not None:
+            events.append(decoder(data[4:]))
+    return events
+
+
+def decode_transaction_events(
+    transactions: typing.Iterable[typing.Mapping[str, typing.Any]], app_id: int | None = None
+) -> list[{event_type}]:
+    \"\"\"Decode the events from the logs of transactions, each followed by those of its inner transactions
+
+    :param transactions: Transactions as returned by indexer, e.g. a page of transactions from a search
+    :param app_id: If set, only decode the events logged by this app
+    \"\"\"
+    events: list[{event_type}] = []
+    pending = list(reversed(list(transactions)))
+    while pending:
+        transaction = pending.pop()
+        logs = transaction.get("logs")
+        app_transaction = transaction.get("application-transaction") or {{}}
+        # indexer reports an application-id of 0 for app creates, the created app is reported separately
+        logged_by = app_transaction.get("application-id") or transaction.get("created-application-index")
+        if logs and (app_id is None or logged_by == app_id):
+            events.extend(decode_events(logs))
+        pending.extend(reversed(transaction.get("inner-txns") or []))
+    return events
+""")
+
+
+def _generate_event_class(event: ContractEvent) -> DocumentParts:
+    head_format = _get_head_format(event.args)
+    if head_format is not None:
+        # Events of simple types are unpacked directly, which is much faster than decoding them generically
+        decoder = f'_HEAD: typing.ClassVar[struct.Struct] = struct.Struct(">{head_format}")'
+        values = "cls._HEAD.unpack_from(data)"
+    else:
+        decoder = (
+            "_ABI_TYPE: typing.ClassVar[algosdk.abi.ABIType] = algosdk.abi.ABIType.from_string("
+            f'"({",".join(arg.abi_type for arg in event.args)})")'
+        )
+        values = "cls._ABI_TYPE.decode(data)"
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True)
+class {event.class_name}:
+    \"\"\"ARC-28 event {event.signature}\"\"\"
+
+    SELECTOR: typing.ClassVar[bytes] = bytes.fromhex("{event.selector.hex()}")
+    {decoder}
+""")
+    yield Part.IncIndent
+    if event.args:
+        yield Part.Gap1
+    for arg in event.args:
+        yield f"{arg.name}: {arg.python_type}"
+    yield Part.Gap1
+    conversions = [
+        _get_arg_conversion(arg, f"values[{idx}]", unpacked=head_format is not None)
+        for idx, arg in enumerate(event.args)
+    ]
+    if any(conversions):
+        args = ",\n        ".join(conversion or f"values[{idx}]" for idx, conversion in enumerate(conversions))
+        body = f"""
+    values = {values}
+    return cls(
+        {args},
+    )"""
+    else:
+        body = f"\n    return cls(*{values})"
+    yield utils.indented(f"""
+@classmethod
+def decode(cls, data: bytes) -> "{event.class_name}":
+    \"\"\"Decode the event from its ABI encoded args, i.e. a log without its selector\"\"\"{body}
+""")
+    yield Part.DecIndent
+
+
+def _get_head_format(args: list[ContractEventArg]) -> str | None:
+    """Get the struct format of the head of an event's encoding, or None if it has types that can't be unpacked"""
+    head_format = ""
+    for arg in args:
+        static_bytes = _STATIC_BYTES.fullmatch(arg.abi_type)
+        if arg.struct:
+            return None
+        elif arg.abi_type in _HEAD_FORMATS:
+            head_format += _HEAD_FORMATS[arg.abi_type]
+        elif static_bytes:
+            head_format += f"{static_bytes.group(1)}s"
+        elif arg.abi_type in _DYNAMIC_TYPES:
+            head_format += "H"
+        else:
+            return None
+    return head_format
+
+
+def _get_arg_conversion(arg: ContractEventArg, value: str, *, unpacked: bool) -> str | None:
+    """Get the conversion from a decoded or unpacked ABI value to the arg's type, if any"""
+    if arg.struct:
+        struct = utils.string_literal(arg.struct)
+        return (
+            f"typing.cast({arg.python_type}, _init_dataclass({arg.python_type}, "
+            f"algokit_utils.applications.abi.get_abi_struct_from_abi_tuple("
+            f"{value}, APP_SPEC.structs[{struct}], APP_SPEC.structs)))"
+        )
+    if not unpacked:
+        # byte arrays are decoded as lists of ints
+        return f"bytes({value})" if arg.python_type == "bytes" else None
+    if arg.abi_type == "address":
+        return f"_encode_address({value})"
+    if arg.abi_type == "string":
+        return f'_decode_abi_bytes(data, {value}).decode("utf-8")'
+    if arg.abi_type == "byte[]":
+        return f"_decode_abi_bytes(data, {value})"
+    return None
@@ -10,7 +10,11 @@ def disable_linting() -> DocumentParts:
 
 
 def generate_header_comments(context: GeneratorContext) -> DocumentParts:
-    if context.disable_linting:
+    yield generate_file_header(disable_linting_comments=context.disable_linting)
+
+
+def generate_file_header(*, disable_linting_comments: bool = True) -> DocumentParts:
+    if disable_linting_comments:
         yield disable_linting()
     yield "# This file was automatically generated by algokit-client-generator."
     yield "# DO NOT MODIFY IT BY HAND."
@@ -64,29 +64,504 @@ def _init_dataclass(cls: type, data: dict) -> object:
     )
 
 
+def generate_abi_method_constants(context: GeneratorContext) -> DocumentParts:
+    """Generate a constant for each ABI method, which the call path uses rather than parsing its signature"""
+    methods = {m.abi.signature: m.abi for m in context.methods.all_abi_methods if m.abi}
+    yield utils.indented(
+        """
+@dataclasses.dataclass(frozen=True)
+class _AbiMethod:
+    \"\"\"An ABI method of the app, with its selector known when the client was generated
+
+    The parsed method and its types are created on first use, then reused by every call to the method.
+    \"\"\"
+
+    signature: str
+    selector: bytes
+
+    @functools.cached_property
+    def arc56_method(self) -> algokit_utils.applications.app_spec.arc56.Method:
+        return APP_SPEC.get_arc56_method(self.signature)
+
+    @property
+    def method(self) -> algosdk.abi.Method:
+        # the app spec's method is parsed once with the app spec, and is the one the app client passes
+        return self.arc56_method.to_abi_method()
+
+    @property
+    def arg_types(self) -> list[algosdk.abi.ABIType | str]:
+        \"\"\"The ABI type of each arg, or the name of its transaction or reference type\"\"\"
+        return [arg.type for arg in self.method.args]
+
+    @property
+    def return_type(self) -> algosdk.abi.ABIType | str:
+        return self.method.returns.type
+"""
+    )
+    yield Part.Gap2
+    for method in methods.values():
+        selector = f'bytes.fromhex("{method.selector.hex()}")'
+        yield f'{method.method_constant_name} = _AbiMethod("{method.signature}", {selector})'
+    yield Part.Gap1
+    yield "_ABI_METHODS: dict[str, _AbiMethod] = {"
+    yield Part.IncIndent
+    for method in methods.values():
+        yield f"{method.method_constant_name}.signature: {method.method_constant_name},"
+    yield Part.DecIndent
+    yield "}"
+    yield Part.Gap2
+    yield utils.indented(
+        """
+_MethodCallParamsT = typing.TypeVar(
+    "_MethodCallParamsT", algokit_utils.AppCallMethodCallParams, algokit_utils.AppDeleteMethodCallParams
+)
+
+
+def _method_call_params(  # noqa: PLR0913
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    args: list[object] | None,
+    params: algokit_utils.CommonAppCallParams,
+    on_complete: OnComplete,
+    params_type: type[_MethodCallParamsT],
+) -> _MethodCallParamsT:
+    \"\"\"Get the params for a call to an ABI method with its parsed method rather than looking it up by signature\"\"\"
+    on_complete = params.on_complete or on_complete
+    # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+    if len(args or []) != len(method.arc56_method.args) or any(
+        arg is None or isinstance(arg, dict) for arg in args or []
+    ):
+        resolved_params = app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(
+                **{**dataclasses.asdict(params), "method": method.signature, "args": args, "on_complete": on_complete}
+            )
+        )
+        return params_type(
+            **{field.name: getattr(resolved_params, field.name) for field in dataclasses.fields(params_type)}
+        )
+    # the bare call params resolve the app id, sender and signer the same way as a method call
+    bare_params = app_client.params.bare.call(
+        algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)), on_complete
+    )
+    return params_type(
+        **{
+            field.name: getattr(bare_params, field.name)
+            for field in dataclasses.fields(params_type)
+            if field.name not in ("method", "args")
+        },
+        method=method.method,
+        args=args or [],
+    )
+
+
+def _send_method_call(
+    app_client: algokit_utils.AppClient,
+    method: _AbiMethod,
+    params: algokit_utils.AppCallMethodCallParams | algokit_utils.AppDeleteMethodCallParams,
+    send_params: algokit_utils.SendParams | None,
+) -> algokit_utils.SendAppTransactionResult[typing.Any]:
+    \"\"\"Send a call to an ABI method and decode its return value, as with `client.send`\"\"\"
+    # logic errors are exposed with source maps by the error transformer the app client registers with `algorand`
+    response = (
+        app_client.algorand.send.app_delete_method_call(params, send_params)
+        if isinstance(params, algokit_utils.AppDeleteMethodCallParams)
+        else app_client.algorand.send.app_call_method_call(params, send_params)
+    )
+    abi_return = (
+        response.abi_return.get_arc56_value(method.arc56_method, app_client.app_spec.structs)
+        if isinstance(response.abi_return, algokit_utils.ABIReturn)
+        else None
+    )
+    return dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+"""
+    )
+
+
+def generate_readonly_call_cache(context: GeneratorContext) -> DocumentParts:
+    """Generate the cache for results of read-only method calls, which are simulated rather than sent"""
+    yield utils.indented(
+        """
+_T = typing.TypeVar("_T")
+
+
+class ReadonlyCallCache:
+    \"\"\"Caches the results of read-only method calls for a round
+
+    Read-only methods are simulated, so need no signing or fees, but still call algod. Set `round` whenever a new
+    round is seen, e.g. by a block subscriber, so repeated calls within the round are answered from the cache.
+    Results are keyed by method signature, ABI encoded args, sender and round, are only cached while `round` is set
+    and are dropped when it changes. Cached results are shared by every call that hits them, so shouldn't be
+    modified. Use with `client.send.readonly_cache = ReadonlyCallCache()`.
+    \"\"\"
+
+    def __init__(self, round: int | None = None) -> None:
+        self._lock = threading.Lock()
+        self._round = round
+        self._results: dict[tuple[object, ...], object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def round(self) -> int | None:
+        return self._round
+
+    @round.setter
+    def round(self, value: int | None) -> None:
+        with self._lock:
+            if value != self._round:
+                self._results.clear()
+                self._round = value
+
+    def get_or_send(
+        self, method: _AbiMethod, args: list[object] | None, sender: str | None, send: typing.Callable[[], _T]
+    ) -> _T:
+        \"\"\"Get the cached result of a call for the current round, or send it and cache the result\"\"\"
+        current_round = self._round
+        encoded_args = self._encode_args(method, args) if current_round is not None else None
+        if encoded_args is None:
+            return send()
+        key = (method.signature, encoded_args, sender, current_round)
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return typing.cast(_T, self._results[key])
+            self.misses += 1
+        result = send()
+        with self._lock:
+            if self._round == current_round:
+                self._results[key] = result
+        return result
+
+    def _encode_args(self, method: _AbiMethod, args: list[object] | None) -> tuple[bytes, ...] | None:
+        # None if the args can't be part of a key, e.g. transactions, so the call isn't cached
+        encoded_args = []
+        try:
+            for arg_type, value in zip(method.arg_types, args or [], strict=False):
+                if isinstance(arg_type, algosdk.abi.ABIType):
+                    encoded_args.append(arg_type.encode(value))
+                elif isinstance(value, int | str):  # reference types, e.g. an account or asset
+                    encoded_args.append(repr(value).encode())
+                else:
+                    return None
+        except Exception:
+            return None
+        return tuple(encoded_args)
+
+
+# Used when no cache is set, as a cache without a round sends every call
+_NO_READONLY_CACHE = ReadonlyCallCache()
+"""
+    )
+
+
+def generate_network_cache(context: GeneratorContext) -> DocumentParts:
+    """Generate the cache of suggested params and app lookups that factories and clients can share"""
+    yield utils.indented(
+        """
+class NetworkCache:
+    \"\"\"Caches suggested params and the apps created by each account, and can be shared by factories and clients
+
+    Every transaction is built with suggested params from algod, and finding an app by creator and name looks up every
+    app the creator made. Pass the same cache to many factories and clients, e.g. `{contract}Factory(..., cache=cache)`
+    and `{contract}Client(..., cache=cache)`, and for each algod the suggested params are fetched at most once per
+    `suggested_params_ttl` seconds (about a round), and the apps of each creator are looked up at most once per
+    `app_lookup_ttl` seconds. Factories and clients given a cache seed the suggested params cache of their
+    `AlgorandClient` from it before each send and deploy. The cache is thread-safe and counts the `hits` and `misses`
+    of both.
+    \"\"\"
+
+    def __init__(self, *, suggested_params_ttl: float = 3.0, app_lookup_ttl: float = 60.0) -> None:
+        self.suggested_params_ttl = suggested_params_ttl
+        self.app_lookup_ttl = app_lookup_ttl
+        self._lock = threading.Lock()
+        # entries are the `time.monotonic()` they expire at and their value
+        self._suggested_params: dict[str, tuple[float, algosdk.transaction.SuggestedParams]] = {}
+        self._app_lookups: dict[tuple[str, str], tuple[float, algokit_utils.ApplicationLookup]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def seed_suggested_params(self, algorand: _AlgoKitAlgorandClient) -> None:
+        \"\"\"Seed the suggested params cache of `algorand`, fetching the params of its algod if not cached\"\"\"
+        algod = algorand.client.algod
+        with self._lock:
+            entry = self._suggested_params.get(algod.algod_address)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+            else:
+                self.misses += 1
+                entry = None
+        if not entry:
+            entry = (time.monotonic() + self.suggested_params_ttl, algod.suggested_params())
+            with self._lock:
+                self._suggested_params[algod.algod_address] = entry
+        expiry, params = entry
+        # `algorand` hands out copies of the params, and fetches them itself if they expire before the next seed
+        algorand.set_suggested_params_cache(params, time.time() + expiry - time.monotonic())
+
+    def get_creator_apps_by_name(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str
+    ) -> algokit_utils.ApplicationLookup:
+        \"\"\"Get the apps created by `creator_address` by name, looking them up if not cached\"\"\"
+        key = (algorand.client.algod.algod_address, creator_address)
+        with self._lock:
+            entry = self._app_lookups.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return dataclasses.replace(entry[1], apps=dict(entry[1].apps))
+            self.misses += 1
+        lookup = algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address, ignore_cache=True)
+        with self._lock:
+            self._app_lookups[key] = (time.monotonic() + self.app_lookup_ttl, lookup)
+        # callers get their own copy, as `record_app` adds apps to the cached lookup
+        return dataclasses.replace(lookup, apps=dict(lookup.apps))
+
+    def record_app(
+        self, algorand: _AlgoKitAlgorandClient, creator_address: str, app: algokit_utils.ApplicationMetaData
+    ) -> None:
+        \"\"\"Record an app deployed by `creator_address`, so a cached lookup doesn't miss it until it expires\"\"\"
+        with self._lock:
+            entry = self._app_lookups.get((algorand.client.algod.algod_address, creator_address))
+            if entry:
+                entry[1].apps[app.name] = app
+
+    def clear(self) -> None:
+        with self._lock:
+            self._suggested_params.clear()
+            self._app_lookups.clear()
+""".replace("{contract}", context.contract_name)
+    )
+
+
+def generate_prepared_call(context: GeneratorContext) -> DocumentParts:
+    """Generate the template for calls to a method whose static params are resolved once, see `client.prepare`"""
+    # the network cache is generated with the factory, so minimal clients send without it
+    full = context.mode == "full"
+    cache_param = "\n        cache: NetworkCache | None = None," if full else ""
+    cache_attribute = "\n        self.cache = cache" if full else ""
+    seed_suggested_params = (
+        """
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_client.algorand)"""
+        if full
+        else ""
+    )
+    yield utils.indented(
+        """
+_ArgsT = typing.TypeVar("_ArgsT")
+_ReturnT = typing.TypeVar("_ReturnT")
+
+
+class PreparedCall(typing.Generic[_ArgsT, _ReturnT]):
+    \"\"\"A call to an ABI method with its method, sender, signer and other static params resolved once
+
+    Each call only fills in its args, then the transaction is built with fresh suggested params, so calling the same
+    method many times skips looking up the method by signature and copying the params. Omitted or `None` args are
+    resolved from their default values for each call, as with `client.send`. Created with `client.prepare`.
+    \"\"\"
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient,
+        method: _AbiMethod,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        result_struct: type | None = None,{cache_param}
+    ) -> None:
+        self.app_client = app_client{cache_attribute}
+        self.signature = method.signature
+        self._method = method
+        self._params = params or algokit_utils.CommonAppCallParams()
+        self._result_struct = result_struct
+        self._arc56_method = method.arc56_method
+        self._readonly = bool(self._arc56_method.readonly)
+        # the bare call params resolve the app id, sender, signer and on complete the same way as a method call
+        bare_params = app_client.params.bare.call(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(self._params)), self._params.on_complete
+        )
+        self._template = algokit_utils.AppCallMethodCallParams(
+            **{
+                field.name: getattr(bare_params, field.name)
+                for field in dataclasses.fields(algokit_utils.AppCallMethodCallParams)
+                if field.name not in ("method", "args")
+            },
+            method=method.method,
+        )
+
+    def params(self, args: _ArgsT | None = None) -> algokit_utils.AppCallMethodCallParams:
+        \"\"\"Get the params for a call with the given args\"\"\"
+        method_args = _parse_abi_args(args)
+        # args with default values, and structs given as dicts, are resolved by the app client as with `client.params`
+        if len(method_args or []) != len(self._arc56_method.args) or any(
+            arg is None or isinstance(arg, dict) for arg in method_args or []
+        ):
+            return self.app_client.params.call(self._method_call_params(method_args))
+        return dataclasses.replace(self._template, args=method_args)
+
+    def create_transaction(self, args: _ArgsT | None = None) -> algokit_utils.BuiltTransactions:
+        \"\"\"Build the transactions for a call with the given args\"\"\"
+        return self.app_client.algorand.create_transaction.app_call_method_call(self.params(args))
+
+    def send(
+        self, args: _ArgsT | None = None, send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[_ReturnT]:
+        \"\"\"Send a call with the given args, or simulate it if the method is read-only\"\"\"
+        response: algokit_utils.SendAppTransactionResult[typing.Any]
+        abi_return: object{seed_suggested_params}
+        if self._readonly:
+            # read-only calls are simulated by `client.send`, which resolves their params for each call
+            response = self.app_client.send.call(self._method_call_params(_parse_abi_args(args)), send_params)
+            abi_return = response.abi_return
+        else:
+            response = _send_method_call(self.app_client, self._method, self.params(args), send_params)
+            abi_return = response.abi_return
+        if self._result_struct and isinstance(abi_return, dict):
+            abi_return = _init_dataclass(self._result_struct, abi_return)
+        result = dataclasses.replace(response, abi_return=abi_return)  # type: ignore[arg-type]
+        return typing.cast(algokit_utils.SendAppTransactionResult[_ReturnT], result)
+
+    def _method_call_params(self, method_args: list[object] | None) -> algokit_utils.AppClientMethodCallParams:
+        return algokit_utils.AppClientMethodCallParams(
+            **{**dataclasses.asdict(self._params), "method": self.signature, "args": method_args}
+        )
+""".replace("{cache_param}", cache_param)
+        .replace("{cache_attribute}", cache_attribute)
+        .replace("{seed_suggested_params}", seed_suggested_params)
+    )
+
+
+def generate_state_helpers(context: GeneratorContext) -> DocumentParts:
+    """Generate the helpers for reading the state of many accounts or apps, and for decoding state into columns"""
+    yield utils.indented(
+        """
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
+
+
+def _fetch_many(
+    keys: typing.Iterable[_KeyT],
+    fetch: typing.Callable[[_KeyT], _ValueT | None],
+    concurrency: int,
+    progress: typing.Callable[[int, int], None] | None,
+) -> dict[_KeyT, _ValueT]:
+    \"\"\"Fetch the value for each key concurrently, omitting None values, in the order of `keys`\"\"\"
+    unique_keys = list(dict.fromkeys(keys))
+    results: dict[_KeyT, _ValueT | None] = {}
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {executor.submit(fetch, key): key for key in unique_keys}
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(done, len(unique_keys))
+    finally:
+        # on failure, the keys that haven't been fetched yet are abandoned rather than waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+    return {key: value for key in unique_keys if (value := results[key]) is not None}
+
+
+# The name of each column, the path to its value in each row, and its array typecode if it has a fixed size type
+_ColumnSpec = tuple[tuple[str, tuple[str, ...], str | None], ...]
+
+
+def _to_columns(rows: typing.Iterable[object], columns: _ColumnSpec) -> dict[str, typing.Any]:
+    \"\"\"Collect the values of each column from rows, without keeping the rows
+
+    Columns with a typecode are `array.array`s, or NumPy arrays sharing their memory if NumPy is installed, unless
+    they have values that don't fit the typecode, and other columns are lists.
+    \"\"\"
+    values: list[typing.Any] = [array.array(typecode) if typecode else [] for _, _, typecode in columns]
+    for row in rows:
+        for index, (_, path, _) in enumerate(columns):
+            value = row
+            for part in path:
+                if value is None:  # a struct key that isn't set has no fields
+                    break
+                value = value[part] if isinstance(value, dict) else getattr(value, part)
+            try:
+                values[index].append(value)
+            except (TypeError, OverflowError):  # e.g. a key that isn't set, so the column can't be a typed array
+                values[index] = [*values[index], value]
+    try:
+        numpy = importlib.import_module("numpy")
+    except ImportError:
+        return dict(zip((name for name, _, _ in columns), values, strict=True))
+    dtypes = {"Q": numpy.uint64, "B": numpy.bool_}
+    return {
+        name: numpy.frombuffer(column, dtype=dtypes[column.typecode]) if isinstance(column, array.array) else column
+        for (name, _, _), column in zip(columns, values, strict=True)
+    }
+"""
+    )
+
+
 def generate_helpers(context: GeneratorContext) -> DocumentParts:
     yield Part.Gap1
     yield generate_abi_args_parser()
     yield Part.Gap1
     yield generate_dataclass_initializer(context)
     yield Part.Gap1
+    if context.methods.has_abi_methods:
+        yield generate_abi_method_constants(context)
+        yield Part.Gap1
+    if context.mode == "full":
+        yield generate_network_cache(context)
+        yield Part.Gap1
+    if has_readonly_call_cache(context):
+        yield generate_readonly_call_cache(context)
+        yield Part.Gap1
+    if get_preparable_methods(context):
+        yield generate_prepared_call(context)
+        yield Part.Gap1
+    if has_state_columns(context):
+        yield generate_state_helpers(context)
+        yield Part.Gap1
+
+
+def get_methods_by_action(
+    context: GeneratorContext, on_complete: str, call_config: str = "call"
+) -> list[ContractMethod]:
+    return context.methods_by_action.get((on_complete, call_config), [])
+
+
+def get_no_op_abi_methods(context: GeneratorContext) -> list[ContractMethod]:
+    return [
+        m
+        for m in (*get_methods_by_action(context, "no_op"), *get_methods_by_action(context, "no_op", "create"))
+        if m.abi
+    ]
 
 
 def get_abi_method_operations(context: GeneratorContext) -> dict[str, list[ContractMethod]]:
     operations = {}
     if context.mode == "full":
-        operations["update"] = [
-            m for m in context.methods.all_methods if m.call_config == "call" and "update_application" in m.on_complete
-        ]
-        operations["delete"] = [
-            m for m in context.methods.all_methods if m.call_config == "call" and "delete_application" in m.on_complete
-        ]
-
-    operations["opt_in"] = [
-        m for m in context.methods.all_methods if m.call_config == "call" and "opt_in" in m.on_complete
-    ]
-    operations["close_out"] = [
-        m for m in context.methods.all_methods if m.call_config == "call" and "close_out" in m.on_complete
-    ]
+        operations["update"] = get_methods_by_action(context, "update_application")
+        operations["delete"] = get_methods_by_action(context, "delete_application")
+
+    operations["opt_in"] = get_methods_by_action(context, "opt_in")
+    operations["close_out"] = get_methods_by_action(context, "close_out")
 
     return operations
+
+
+def get_readonly_methods(context: GeneratorContext) -> list[ContractMethod]:
+    """Get the read-only methods that are called with a no-op, which are simulated rather than sent"""
+    return [m for m in get_no_op_abi_methods(context) if m.abi and m.abi.readonly and m.call_config == "call"]
+
+
+def has_readonly_call_cache(context: GeneratorContext) -> bool:
+    """Whether the client caches the results of read-only calls, which is only generated in full mode"""
+    return context.mode == "full" and bool(get_readonly_methods(context))
+
+
+def get_preparable_methods(context: GeneratorContext) -> list[ContractMethod]:
+    """Get the ABI methods that are called with a no-op on an existing app, which can be prepared in full mode"""
+    if context.mode != "full":
+        return []
+    return [m for m in get_no_op_abi_methods(context) if m.call_config == "call"]
+
+
+def has_state_columns(context: GeneratorContext) -> bool:
+    """Whether the app has maps, or global or local state keys, which can be decoded into columns in full mode"""
+    keys, maps = context.app_spec.state.keys, context.app_spec.state.maps
+    return context.mode == "full" and bool(
+        keys.global_state or keys.local_state or maps.global_state or maps.local_state or maps.box
+    )
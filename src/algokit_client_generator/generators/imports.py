@@ -1,13 +1,33 @@
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts
+from algokit_client_generator.generators.helpers import has_state_columns
 
 
 def generate_imports(context: GeneratorContext) -> DocumentParts:
     yield utils.lines("""
 # common
-import dataclasses
-import typing
+""")
+    full = context.mode == "full"
+    modules = {
+        "array": has_state_columns(context),
+        # box maps are only streamed in full mode
+        "base64": bool(context.events or (full and context.app_spec.state.maps.box)),
+        # bulk sends, deploys and reads are only generated in full mode
+        "concurrent.futures": full,
+        "copy": full,
+        "dataclasses": True,
+        "functools": bool(context.methods.has_abi_methods or context.events),
+        "importlib": has_state_columns(context),
+        "struct": bool(context.events),
+        # the network cache and read-only call cache are only generated in full mode
+        "threading": full,
+        "time": full,
+    }
+    for module, used in modules.items():
+        if used:
+            yield f"import {module}"
+    yield utils.lines("""import typing
 # core algosdk
 import algosdk
 from algosdk.transaction import OnComplete
@@ -19,3 +39,11 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 """)
+
+    if context.shared_structs and context.methods.has_abi_methods:
+        shared_struct_names = sorted(
+            struct.struct_class_name for struct in context.structs.values() if context.is_shared_struct(struct)
+        )
+        if shared_struct_names:
+            yield "# shared structs"
+            yield f"from {context.shared_structs.module} import {', '.join(shared_struct_names)}"
@@ -0,0 +1,18 @@
+from algokit_client_generator import utils
+from algokit_client_generator.document import DocumentParts, Part
+from algokit_client_generator.generators.header_comments import generate_file_header
+from algokit_client_generator.generators.typed_client import generate_struct_class
+from algokit_client_generator.spec import SharedStructs
+
+
+def generate_shared_structs(shared_structs: SharedStructs) -> DocumentParts:
+    """Generate a module containing the structs shared by several generated clients"""
+    yield generate_file_header()
+    yield utils.lines("""
+# common
+import dataclasses
+import typing
+""")
+    for struct in shared_structs.structs:
+        yield Part.Gap2
+        yield generate_struct_class(struct)
@@ -3,15 +3,19 @@
 from collections.abc import Generator, Iterator
 from enum import Enum
 
-import algosdk
+from algokit_utils import StorageMap, StructField
 
 from algokit_client_generator import utils
 from algokit_client_generator.context import GeneratorContext
 from algokit_client_generator.document import DocumentParts, Part
-from algokit_client_generator.generators.helpers import get_abi_method_operations
-from algokit_client_generator.spec import ABIStruct, ContractMethod
-
-APPL_TYPE_TXNS = [algosdk.abi.ABITransactionType.APPL, algosdk.abi.ABITransactionType.ANY]
+from algokit_client_generator.generators.helpers import (
+    get_abi_method_operations,
+    get_no_op_abi_methods,
+    get_preparable_methods,
+    has_readonly_call_cache,
+    has_state_columns,
+)
+from algokit_client_generator.spec import ABIStruct, ContractMethod, get_nested_struct_name
 
 
 class PropertyType(Enum):
@@ -40,6 +44,29 @@ OPERATION_TO_RETURN_PARAMS_TYPE = {
     "close_out": "algokit_utils.AppCallParams",
 }
 
+# Sends and created transactions seed the suggested params of their AlgorandClient from the network cache, which is
+# generated in full mode
+SEED_SUGGESTED_PARAMS = """
+    if self.cache:
+        self.cache.seed_suggested_params(self.app_client.algorand)"""
+
+# Array typecodes of the state values that are collected into typed arrays when decoding state into columns
+COLUMN_TYPECODES = {"AVMUint64": "Q", "bool": "B", "uint8": "Q", "uint16": "Q", "uint32": "Q", "uint64": "Q"}
+
+OPERATION_TO_ON_COMPLETE = {
+    "delete": "OnComplete.DeleteApplicationOC",
+    "opt_in": "OnComplete.OptInOC",
+    "close_out": "OnComplete.CloseOutOC",
+    "call": "OnComplete.NoOpOC",
+}
+
+OPERATION_TO_CREATE_TRANSACTION = {
+    "delete": "app_delete_method_call",
+    "opt_in": "app_call_method_call",
+    "close_out": "app_call_method_call",
+    "call": "app_call_method_call",
+}
+
 OPERATION_TO_METHOD_CALL_PARAMS_TYPE = {
     "update": "algokit_utils.AppUpdateMethodCallParams",
     "delete": "algokit_utils.AppDeleteMethodCallParams",
@@ -49,7 +76,13 @@ OPERATION_TO_METHOD_CALL_PARAMS_TYPE = {
 }
 
 
-def _generate_common_method_params(  # noqa: C901
+def _takes_cache(context: GeneratorContext, property_type: PropertyType) -> bool:
+    """Whether the classes of a property type are given the network cache, to seed suggested params before building
+    transactions"""
+    return context.mode == "full" and property_type in (PropertyType.CREATE_TRANSACTION, PropertyType.SEND)
+
+
+def _generate_common_method_params(
     context: GeneratorContext,
     method: ContractMethod,
     property_type: PropertyType,
@@ -59,36 +92,7 @@ def _generate_common_method_params(  # noqa: C901
     if not method.abi:  # Add early return if no ABI
         return "", False
 
-    args_type = None
-    if method.abi.args:
-        # Track if we've seen an appl arg to make previous txn args optional
-        has_appl_to_right = False
-
-        # Scan args from right to left
-        args_meta = []
-        for arg in reversed(method.abi.args):
-            # Make arg optional if it has default or is a transaction with appl to right
-            is_txn_type = algosdk.abi.is_abi_transaction_type(arg.abi_type)
-            is_appl_type = is_txn_type and arg.abi_type in APPL_TYPE_TXNS
-            is_optional = arg.has_default or (has_appl_to_right and is_txn_type)
-
-            arg_type = arg.python_type
-            if is_optional:
-                arg_type = f"{arg_type} | None"
-            args_meta.append(arg_type)
-
-            if not has_appl_to_right and is_appl_type:
-                has_appl_to_right = True
-
-        # Reverse back to original order
-        args_meta.reverse()
-
-        tuple_type = f"tuple[{', '.join(args_meta)}]"
-        args_type = f"{tuple_type} | {context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
-
-        # Make entire args parameter optional if all args have defaults
-        if all(arg.has_default for arg in method.abi.args):
-            args_type = f"{args_type} | None = None"
+    args_type = method.abi.args_type
 
     # Build parameters list
     params = []
@@ -112,7 +116,7 @@ def {method.abi.client_method_name}(
     # Add return type annotation if needed
     return_type = method.abi.python_type
     if property_type == PropertyType.SEND:
-        return_type = f"algokit_utils.SendAppTransactionResult[{return_type}]"
+        return_type = method.abi.send_return_type
     elif property_type == PropertyType.CREATE_TRANSACTION:
         return_type = "algokit_utils.BuiltTransactions"
     elif property_type == PropertyType.PARAMS:
@@ -138,28 +142,33 @@ def _generate_method_body(
     body += "\n    params = params or algokit_utils.CommonAppCallParams()"
     if operation == "update":
         body += "\n    compilation_params = compilation_params or algokit_utils.AppClientCompilationParams()"
-    method_sig = method.abi.method.get_signature() if method.abi else ""
+    method_constant = method.abi.method_constant_name if method.abi else ""
+    readonly = bool(
+        property_type == PropertyType.SEND
+        and operation == "call"
+        and method.abi
+        and method.abi.readonly
+        and method.call_config == "call"
+    )
 
     def alogkit_return_type(operation: str, method: ContractMethod) -> str:
-        return_type = f"{method.abi.python_type}" if method.abi else ""
-        if operation == "update":
-            return_type = f"algokit_utils.SendAppUpdateTransactionResult[{return_type}]"
-        else:
-            return_type = f"algokit_utils.SendAppTransactionResult[{return_type}]"
-        return return_type
-
-    def parse_struct_if_needed(method: ContractMethod) -> str:
+        if not method.abi:
+            return ""
+        return method.abi.update_send_return_type if operation == "update" else method.abi.send_return_type
+
+    def parse_struct_if_needed(method: ContractMethod, *, typed_response: bool) -> str:
         if method.abi and method.abi.result_struct:
+            # responses from the app client are typed with the ARC-56 return value rather than the struct
             return (
                 f"dataclasses.replace(response, "
                 f"abi_return=_init_dataclass({method.abi.result_struct.struct_class_name}, "
-                f"typing.cast(dict, response.abi_return))) # type: ignore"
+                f"typing.cast(dict, response.abi_return))){' # type: ignore' if typed_response else ''}"
             )
         return "response"
 
     call_params = f"""algokit_utils.AppClientMethodCallParams(**{{
         **dataclasses.asdict(params),
-        "method": "{method_sig}",{
+        "method": {method_constant}.signature,{
         '''
         "args": method_args, '''
         if include_args
@@ -169,17 +178,61 @@ def _generate_method_body(
     send_params = ", send_params=send_params" if property_type == PropertyType.SEND else ""
     compilation_params = ", compilation_params=compilation_params" if operation == "update" else ""
 
+    # calls are built with the constant's parsed method, other than updates which the app client compiles the app for
+    on_complete = OPERATION_TO_ON_COMPLETE.get(operation)
+    method_call_params = f"""_method_call_params(
+        self.app_client,
+        {method_constant},
+        {"method_args" if include_args else "None"},
+        params,
+        {on_complete},
+        {OPERATION_TO_METHOD_CALL_PARAMS_TYPE[operation]},
+    )"""
+    if on_complete and property_type != PropertyType.PARAMS and not readonly:
+        body += f"\n    call_params = {method_call_params}"
+    body += SEED_SUGGESTED_PARAMS if _takes_cache(context, property_type) else ""
+
     if property_type == PropertyType.PARAMS:
-        return f"{body}\n    return self.app_client.params.{operation}({call_params})"
+        params_call = method_call_params if on_complete else f"self.app_client.params.{operation}({call_params})"
+        return f"{body}\n    return {params_call}"
     elif property_type == PropertyType.CREATE_TRANSACTION:
-        return f"{body}\n    return self.app_client.create_transaction.{operation}({call_params})"
+        create_transaction_call = (
+            f"self.app_client.algorand.create_transaction.{OPERATION_TO_CREATE_TRANSACTION[operation]}(call_params)"
+            if on_complete
+            else f"self.app_client.create_transaction.{operation}({call_params})"
+        )
+        return f"{body}\n    return {create_transaction_call}"
+    elif readonly:
+        # read-only calls are simulated by the app client, and in full mode can be answered from the cache within a
+        # round
+        response_code = (
+            f"""
+    response = (self.readonly_cache or _NO_READONLY_CACHE).get_or_send(
+        {method_constant},
+        {"method_args" if include_args else "None"},
+        params.sender,
+        lambda: self.app_client.send.{operation}({call_params}{send_params}),
+    )
+"""
+            if has_readonly_call_cache(context)
+            else f"""
+    response = self.app_client.send.{operation}({call_params}{send_params})
+"""
+        )
     else:
+        send_call = (
+            f"_send_method_call(self.app_client, {method_constant}, call_params, send_params)"
+            if on_complete
+            else f"self.app_client.send.{operation}({call_params}{send_params}{compilation_params})"
+        )
         response_code = f"""
-    response = self.app_client.send.{operation}({call_params}{send_params}{compilation_params})
-    parsed_response = {parse_struct_if_needed(method)}
+    response = {send_call}
+"""
+    parsed_response = parse_struct_if_needed(method, typed_response=readonly or not on_complete)
+    response_code += f"""    parsed_response = {parsed_response}
     return typing.cast({alogkit_return_type(operation, method)}, parsed_response)
 """
-        return f"{body}{response_code}"
+    return f"{body}{response_code}"
 
 
 def generate_operation_class(
@@ -199,10 +252,12 @@ def generate_operation_class(
     elif property_type == PropertyType.SEND:
         class_name += "Send"
 
+    cache_param = ", cache: NetworkCache | None = None" if _takes_cache(context, property_type) else ""
+    cache_attribute = "\n        self.cache = cache" if cache_param else ""
     yield utils.indented(f"""
 class {class_name}:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    def __init__(self, app_client: algokit_utils.AppClient{cache_param}):
+        self.app_client = app_client{cache_attribute}
 """)
     yield Part.IncIndent
 
@@ -217,18 +272,20 @@ def bare(
     return self.app_client.params.bare.{operation}(params)
 """)
         elif property_type == PropertyType.CREATE_TRANSACTION:
+            seed_suggested_params = SEED_SUGGESTED_PARAMS if cache_param else ""
             yield utils.indented(f"""
-def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:
+def bare(self, params: algokit_utils.AppClientBareCallParams | None = None) -> Transaction:{seed_suggested_params}
     return self.app_client.create_transaction.bare.{operation}(params)
 """)
         else:  # SEND
+            seed_suggested_params = SEED_SUGGESTED_PARAMS if cache_param else ""
             yield utils.indented(f"""
 def bare(
     self,
     params: algokit_utils.AppClientBareCallParams | None = None,
     send_params: algokit_utils.SendParams | None = None,
     {"compilation_params: algokit_utils.AppClientCompilationParams | None = None" if operation == "update" else ""}
-) -> algokit_utils.SendAppTransactionResult:
+) -> algokit_utils.SendAppTransactionResult:{seed_suggested_params}
     return self.app_client.send.bare.{operation}(
         params=params,
         send_params=send_params,
@@ -282,10 +339,21 @@ def _generate_class_methods(
             yield Part.Gap2
 
     # Then generate the main class with properties
+    readonly_cache = (
+        """
+        self.readonly_cache: ReadonlyCallCache | None = None
+        \"\"\"Answers repeated read-only calls within a round, see `ReadonlyCallCache`\"\"\"
+"""
+        if property_type == PropertyType.SEND and has_readonly_call_cache(context)
+        else ""
+    )
+    takes_cache = _takes_cache(context, property_type)
+    cache_param = ", cache: NetworkCache | None = None" if takes_cache else ""
+    cache_attribute = "\n        self.cache = cache" if takes_cache else ""
     yield utils.indented(f"""
 class {class_name}:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    def __init__(self, app_client: algokit_utils.AppClient{cache_param}):
+        self.app_client = app_client{cache_attribute}{readonly_cache}
 """)
     yield Part.IncIndent
 
@@ -312,14 +380,11 @@ class {class_name}:
         yield utils.indented(f"""
 @property
 def {operation}(self) -> "{operation_class}":
-    return {operation_class}(self.app_client)
+    return {operation_class}(self.app_client{", self.cache" if takes_cache else ""})
 """)
 
     # Generate method for each ABI method
-    for method in context.methods.all_abi_methods:
-        if not method.abi or "no_op" not in method.on_complete:
-            continue
-
+    for method in get_no_op_abi_methods(context):
         if context.mode == "minimal" and (
             method.call_config == "create" or method.on_complete in (["update_application"], ["delete_application"])
         ):
@@ -349,7 +414,7 @@ def clear_state(
     self,
     params: algokit_utils.AppClientBareCallParams | None = None,
     {"send_params: algokit_utils.SendParams | None = None" if property_type == PropertyType.SEND else ""}
-) -> {CLEAR_STATE_PROPERTY_TO_RETURN_CLASS[property_type]}:
+) -> {CLEAR_STATE_PROPERTY_TO_RETURN_CLASS[property_type]}:{SEED_SUGGESTED_PARAMS if takes_cache else ""}
     return self.app_client.{property_type.value}.bare.clear_state(
         params,
         {"send_params=send_params," if property_type == PropertyType.SEND else ""}
@@ -359,6 +424,35 @@ def clear_state(
     yield Part.DecIndent
 
 
+def generate_prepare_class(context: GeneratorContext) -> DocumentParts:
+    """Generate the class that prepares calls to each no-op ABI method, see `PreparedCall`"""
+    takes_cache = _takes_cache(context, PropertyType.SEND)
+    cache_param = ", cache: NetworkCache | None = None" if takes_cache else ""
+    cache_attribute = "\n        self.cache = cache" if takes_cache else ""
+    cache_argument = ", cache=self.cache" if takes_cache else ""
+    yield utils.indented(f"""
+class {context.contract_name}Prepare:
+    def __init__(self, app_client: algokit_utils.AppClient{cache_param}):
+        self.app_client = app_client{cache_attribute}
+""")
+    yield Part.IncIndent
+    for method in get_preparable_methods(context):
+        assert method.abi
+        result_struct = (
+            f", result_struct={method.abi.result_struct.struct_class_name}" if method.abi.result_struct else ""
+        )
+        # args are always optional for the prepared call, so the default is part of its signature
+        args_type = (method.abi.args_type or "None").removesuffix(" | None = None")
+        yield Part.Gap1
+        yield utils.indented(f"""
+def {method.abi.client_method_name}(
+    self, params: algokit_utils.CommonAppCallParams | None = None
+) -> PreparedCall[{args_type}, {method.abi.python_type}]:
+    return PreparedCall(self.app_client, {method.abi.method_constant_name}, params{result_struct}{cache_argument})
+""")
+    yield Part.DecIndent
+
+
 def generate_structs_for_args(context: GeneratorContext) -> DocumentParts:
     """Generate dataclasses for each method's arguments"""
     for method in context.methods.all_abi_methods:
@@ -367,22 +461,7 @@ def generate_structs_for_args(context: GeneratorContext) -> DocumentParts:
 
         yield Part.Gap1
 
-        # Track appl args from right to left like in TypeScript
-        has_appl_to_right = False
-        optional_args = set()
-
-        # Scan right to left to determine which args should be optional
-        for arg in reversed(method.abi.args):
-            is_txn_type = algosdk.abi.is_abi_transaction_type(arg.abi_type)
-            is_appl_type = is_txn_type and arg.abi_type in APPL_TYPE_TXNS
-
-            if is_txn_type and has_appl_to_right:
-                optional_args.add(arg.name)
-
-            if not has_appl_to_right and is_appl_type:
-                has_appl_to_right = True
-
-        data_class_name = f"{context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
+        data_class_name = method.abi.args_dataclass_name
 
         yield utils.indented(f"""
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -392,14 +471,12 @@ class {data_class_name}:
         yield Part.IncIndent
 
         for arg in method.abi.args:
-            # Make arg optional if it has default or is in optional_args set
-            is_optional = arg.has_default or arg.name in optional_args
-            python_type = f"{arg.python_type} | None = None" if is_optional else arg.python_type
+            python_type = f"{arg.python_type} | None = None" if arg.is_optional else arg.python_type
             yield f"{arg.name}: {python_type}"
         yield Part.Gap1
         yield f"""@property
     def abi_method_signature(self) -> str:
-        return "{method.abi.method.get_signature()}"
+        return "{method.abi.signature}"
 """
         yield Part.DecIndent
 
@@ -417,9 +494,12 @@ class {context.contract_name}Client:
 
 def generate_constructor_overloads(context: GeneratorContext) -> DocumentParts:
     """Generate constructor overloads"""
-    yield utils.indented("""
+    # the network cache is generated with the factory, which shares it
+    cache_kwarg = ", *, cache: NetworkCache | None = None" if context.mode == "full" else ""
+    cache_param = "\n    cache: NetworkCache | None = None," if context.mode == "full" else ""
+    yield utils.indented(f"""
 @typing.overload
-def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+def __init__(self, app_client: algokit_utils.AppClient{cache_kwarg}) -> None: ...
 
 @typing.overload
 def __init__(
@@ -431,13 +511,22 @@ def __init__(
     default_sender: str | None = None,
     default_signer: TransactionSigner | None = None,
     approval_source_map: SourceMap | None = None,
-    clear_source_map: SourceMap | None = None,
+    clear_source_map: SourceMap | None = None,{cache_param}
 ) -> None: ...
 """)
 
 
 def generate_constructor(context: GeneratorContext) -> DocumentParts:
     """Generate the actual constructor implementation"""
+    full = context.mode == "full"
+    cache_param = "\n    cache: NetworkCache | None = None," if full else ""
+    cache_attribute = "\n    self.cache = cache" if full else ""
+    cache_argument = ", cache" if full else ""
+    prepare = (
+        f"\n    self.prepare = {context.contract_name}Prepare(self.app_client{cache_argument})"
+        if get_preparable_methods(context)
+        else ""
+    )
     yield utils.indented(f"""
 def __init__(
     self,
@@ -449,7 +538,7 @@ def __init__(
     default_sender: str | None = None,
     default_signer: TransactionSigner | None = None,
     approval_source_map: SourceMap | None = None,
-    clear_source_map: SourceMap | None = None,
+    clear_source_map: SourceMap | None = None,{cache_param}
 ) -> None:
     if app_client:
         self.app_client = app_client
@@ -468,16 +557,26 @@ def __init__(
         )
     else:
         raise ValueError("Either app_client or algorand and app_id must be provided")
-
+{cache_attribute}
     self.params = {context.contract_name}Params(self.app_client)
-    self.create_transaction = {context.contract_name}CreateTransactionParams(self.app_client)
-    self.send = {context.contract_name}Send(self.app_client)
+    self.create_transaction = {context.contract_name}CreateTransactionParams(self.app_client{cache_argument})
+    self.send = {context.contract_name}Send(self.app_client{cache_argument}){prepare}
     self.state = {context.contract_name}State(self.app_client)
 """)
 
 
 def generate_static_methods(context: GeneratorContext) -> DocumentParts:
     """Generate static factory methods"""
+    # the network cache is generated with the factory, which shares it
+    cache_param = "\n    cache: NetworkCache | None = None," if context.mode == "full" else ""
+    cache_argument = ",\n        cache=cache," if context.mode == "full" else ""
+    cache_lookup = (
+        """
+    if cache and not app_lookup_cache and not ignore_cache:
+        app_lookup_cache = cache.get_creator_apps_by_name(algorand, creator_address)"""
+        if context.mode == "full"
+        else ""
+    )
     yield utils.indented(f"""
 @staticmethod
 def from_creator_and_name(
@@ -489,8 +588,8 @@ def from_creator_and_name(
     approval_source_map: SourceMap | None = None,
     clear_source_map: SourceMap | None = None,
     ignore_cache: bool | None = None,
-    app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
-) -> \"{context.contract_name}Client\":
+    app_lookup_cache: algokit_utils.ApplicationLookup | None = None,{cache_param}
+) -> \"{context.contract_name}Client\":{cache_lookup}
     return {context.contract_name}Client(
         algokit_utils.AppClient.from_creator_and_name(
             creator_address=creator_address,
@@ -503,7 +602,7 @@ def from_creator_and_name(
             clear_source_map=clear_source_map,
             ignore_cache=ignore_cache,
             app_lookup_cache=app_lookup_cache,
-        )
+        ){cache_argument}
     )
 
 @staticmethod
@@ -513,7 +612,7 @@ def from_network(
     default_sender: str | None = None,
     default_signer: TransactionSigner | None = None,
     approval_source_map: SourceMap | None = None,
-    clear_source_map: SourceMap | None = None,
+    clear_source_map: SourceMap | None = None,{cache_param}
 ) -> \"{context.contract_name}Client\":
     return {context.contract_name}Client(
         algokit_utils.AppClient.from_network(
@@ -524,7 +623,7 @@ def from_network(
             default_signer=default_signer,
             approval_source_map=approval_source_map,
             clear_source_map=clear_source_map,
-        )
+        ){cache_argument}
     )
 """)
 
@@ -556,6 +655,7 @@ def algorand(self) -> _AlgoKitAlgorandClient:
 
 def generate_clone_method(context: GeneratorContext) -> DocumentParts:
     """Generate clone method"""
+    cache_argument = ",\n        cache=self.cache," if context.mode == "full" else ""
     yield utils.indented(f"""
 def clone(
     self,
@@ -572,7 +672,7 @@ def clone(
             default_signer=default_signer,
             approval_source_map=approval_source_map,
             clear_source_map=clear_source_map,
-        )
+        ){cache_argument}
     )
 """)
 
@@ -587,16 +687,9 @@ def generate_decode_return_value(context: GeneratorContext) -> DocumentParts:
         if not method.abi:
             continue
 
-        return_type = method.abi.python_type
-        signature = method.abi.method.get_signature()
-
-        # For void methods, return type should be None | None to match implementation
-        if return_type == "None":
-            overload_return = "None"
-            return_types.add("None")
-        else:
-            overload_return = f"{return_type} | None"
-            return_types.add(return_type)
+        signature = method.abi.signature
+        overload_return = method.abi.decode_return_type
+        return_types.add(method.abi.python_type)
 
         overloads.append(f"""
 
@@ -624,7 +717,13 @@ def decode_return_value(
 ) -> {base_union} | None: ...
 """)
 
-    # Then generate the actual implementation
+    # Then generate the actual implementation, apps without ABI methods have no method constants to look up
+    get_arc56_method = (
+        """abi_method = _ABI_METHODS.get(method)
+    arc56_method = abi_method.arc56_method if abi_method else self.app_spec.get_arc56_method(method)"""
+        if context.methods.has_abi_methods
+        else "arc56_method = self.app_spec.get_arc56_method(method)"
+    )
     implementation = f"""
 def decode_return_value(
     self,
@@ -635,7 +734,7 @@ def decode_return_value(
     if return_value is None:
         return None
 
-    arc56_method = self.app_spec.get_arc56_method(method)
+    {get_arc56_method}
     decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
 
     # If method returns a struct, convert the dict to appropriate dataclass
@@ -668,10 +767,26 @@ def new_group(self) -> "{context.contract_name}Composer":
 """)
 
 
-def generate_structs(context: GeneratorContext) -> DocumentParts:  # noqa: C901
+def generate_struct_class(struct: ABIStruct) -> DocumentParts:
+    """Generate the dataclass for an ABI struct"""
+    yield utils.indented(f"""
+@dataclasses.dataclass(frozen=True)
+class {struct.struct_class_name}:
+    \"\"\"Struct for {struct.abi_name}\"\"\"
+""")
+    yield Part.IncIndent
+    for field in struct.fields:
+        yield f"{field.name}: {field.python_type}"
+    yield Part.DecIndent
+
+
+def generate_structs(context: GeneratorContext) -> DocumentParts:
     """Generate struct classes for ABI structs"""
     # Track generated structs by their class name to avoid duplicates
     generated_structs: set[str] = set()
+    # Structs emitted in a shared structs module are imported instead
+    if context.shared_structs:
+        generated_structs.update(s.struct_class_name for s in context.structs.values() if context.is_shared_struct(s))
 
     for method in context.methods.all_abi_methods:
         if not method.abi:
@@ -683,40 +798,21 @@ def generate_structs(context: GeneratorContext) -> DocumentParts:  # noqa: C901
             # First generate any nested struct classes
             for field in struct.fields:
                 if field.is_nested:
-                    nested_struct = context.structs.get(field.python_type)
+                    nested_struct = context.structs.get(get_nested_struct_name(field))
                     if not nested_struct:
                         raise ValueError(f"Nested struct {field.python_type} not found in context")
                     # Only generate if we haven't seen this nested struct before
                     if nested_struct.struct_class_name not in generated_structs:
                         yield Part.Gap1
                         generated_structs.add(nested_struct.struct_class_name)
-                        yield utils.indented(f"""
-@dataclasses.dataclass(frozen=True)
-class {nested_struct.struct_class_name}:
-    \"\"\"Struct for {nested_struct.abi_name}\"\"\"
-""")
-                        yield Part.IncIndent
-                        for nested_field in nested_struct.fields:
-                            yield f"{nested_field.name}: {nested_field.python_type}"
-                        yield Part.DecIndent
+                        yield generate_struct_class(nested_struct)
                         yield Part.Gap1
 
             # Then generate the main struct class if we haven't already
             if struct.struct_class_name not in generated_structs:
                 yield Part.Gap1
                 generated_structs.add(struct.struct_class_name)
-                yield utils.indented(f"""
-@dataclasses.dataclass(frozen=True)
-class {struct.struct_class_name}:
-    \"\"\"Struct for {struct.abi_name}\"\"\"
-""")
-                yield Part.IncIndent
-                for field in struct.fields:
-                    if field.is_nested:
-                        yield f"{field.name}: {field.python_type}"
-                    else:
-                        yield f"{field.name}: {field.python_type}"
-                yield Part.DecIndent
+                yield generate_struct_class(struct)
 
 
 def _generate_state_typeddict(
@@ -792,6 +888,12 @@ class {class_name}:
             )
         return {"typing.cast(" + value_type_name + ", converted)" if value_type_name else "converted"}
 """)
+    # the readers of all keys are used to read many accounts or apps, which is only generated in full mode
+    if state_type in ("local_state", "global_state") and value_type_name and has_state_columns(context):
+        yield Part.Gap1
+        yield Part.IncIndent
+        yield _generate_state_reader(state_type, value_type_name)
+        yield Part.DecIndent
 
     # Generate methods for individual keys
     if keys:
@@ -817,6 +919,7 @@ class {class_name}:
             key_type = utils.map_abi_type_to_python(map_info.key_type, utils.IOType.INPUT, context.structs)
             value_type = utils.map_abi_type_to_python(map_info.value_type, utils.IOType.OUTPUT, context.structs)
             is_value_struct = map_info.value_type in context.structs
+            extra_args = _generate_map_state_args(context, state_type, map_info) if has_state_columns(context) else ""
             yield Part.Gap1
             yield Part.IncIndent
             yield utils.indented(f"""
@@ -826,12 +929,273 @@ def {utils.get_method_name(map_name)}(self) -> "_MapState[{key_type}, {value_typ
     return _MapState(
         self.app_client.state.{state_type}{"(self.address)" if extra_params else ""},
         "{map_name}",
-        {f'self._struct_classes.get("{map_info.value_type}")' if is_value_struct else "None"}
+        {f'self._struct_classes.get("{map_info.value_type}")' if is_value_struct else "None"},{extra_args}
     )
 """)
             yield Part.DecIndent
 
 
+def _generate_map_state_args(context: GeneratorContext, state_type: str, map_info: StorageMap) -> str:
+    """Generate the args of a map for streaming its boxes and decoding it into columns, which are in full mode"""
+    is_value_struct = map_info.value_type in context.structs
+    # box maps are streamed by `iter_items`, which reads and decodes the boxes directly
+    extra_args = "\n        box_app_client=self.app_client," if state_type == "box" else ""
+    if state_type == "box" and map_info.key_type in context.structs:
+        extra_args += f"\n        key_struct_class={context.structs[map_info.key_type].struct_class_name},"
+    # struct values have a column for each field, and other values a `value` column, which is a list by default
+    columns = _get_columns(context, map_info.value_type, "" if is_value_struct else "value")
+    if columns != [("value", (), None)]:
+        extra_args += f"\n        value_columns={_render_columns(columns, indent='        ')},"
+    return extra_args
+
+
+def _generate_state_reader(state_type: str, value_type_name: str) -> DocumentParts:
+    """Generate the methods that read all of the keys of an account's local state, or of another app's global state,
+    used when reading many accounts or apps"""
+    if state_type == "local_state":
+        yield utils.indented(f"""
+def _get_all_if_opted_in(self) -> {value_type_name} | None:
+    # reads the account's local state in one request, and is None rather than an error if it isn't opted in
+    try:
+        app_info = self.app_client.algorand.client.algod.account_application_info(
+            self.address, self.app_client.app_id
+        )
+    except algosdk.error.AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return self._decode_all(typing.cast(dict, app_info).get("app-local-state", {{}}).get("key-value", []))
+""")
+    else:
+        yield utils.indented(f"""
+def _get_all_of_app(self, app_id: int) -> {value_type_name} | None:
+    # reads the global state of an instance of the app in one request, and is None rather than an error if it
+    # doesn't exist
+    try:
+        app_info = self.app_client.algorand.client.algod.application_info(app_id)
+    except algosdk.error.AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return self._decode_all(typing.cast(dict, app_info)["params"].get("global-state", []))
+""")
+    yield Part.Gap1
+    yield utils.indented(f"""
+def _decode_all(self, key_values: list[typing.Any]) -> {value_type_name}:
+    state = {{value.key_base64: value for value in algokit_utils.AppManager.decode_app_state(key_values).values()}}
+    converted = {{}}
+    for key, key_info in self.app_client.app_spec.state.keys.{state_type}.items():
+        value = state.get(key_info.key)
+        decoded = (
+            algokit_utils.applications.abi.get_abi_decoded_value(
+                value.value_raw, key_info.value_type, self.app_client.app_spec.structs
+            )
+            if value and value.value_raw
+            else value.value if value else None
+        )
+        struct_class = self._struct_classes.get(key_info.value_type)
+        converted[key] = (
+            _init_dataclass(struct_class, decoded) if struct_class and isinstance(decoded, dict) else decoded
+        )
+    return typing.cast({value_type_name}, converted)
+""")
+
+
+def _get_columns(
+    context: GeneratorContext, abi_type: str | list[StructField], name: str, path: tuple[str, ...] = ()
+) -> list[tuple[str, tuple[str, ...], str | None]]:
+    """Get the name, path and array typecode of the columns for a value, with a column for each field of a struct"""
+    fields = abi_type if isinstance(abi_type, list) else context.app_spec.structs.get(abi_type)
+    if not fields:
+        return [(name, path, COLUMN_TYPECODES.get(str(abi_type)))]
+    return [
+        column
+        for field in fields
+        for column in _get_columns(
+            context, field.type, f"{name}.{field.name}" if name else field.name, (*path, field.name)
+        )
+    ]
+
+
+def _render_columns(columns: list[tuple[str, tuple[str, ...], str | None]], indent: str) -> str:
+    rendered = []
+    for name, path, typecode in columns:
+        rendered_path = "".join(f'"{part}", ' for part in path).rstrip(" ")
+        rendered_typecode = f'"{typecode}"' if typecode else "None"
+        rendered.append(f'\n{indent}    ("{name}", ({rendered_path}), {rendered_typecode}),')
+    return f"({''.join(rendered)}\n{indent})"
+
+
+def _generate_state_many_methods(
+    context: GeneratorContext, state_type: str, value_type: str, class_name: str, keys: dict
+) -> DocumentParts:
+    """Generate the methods that read the state of many accounts, or of many instances of the app"""
+    columns = _render_columns(
+        [
+            column
+            for key_name, key_info in keys.items()
+            for column in _get_columns(context, key_info.value_type, key_name, (key_name,))
+        ],
+        indent="    ",
+    )
+    if state_type == "local_state":
+        yield utils.indented(f"""
+def local_state_many(
+    self,
+    addresses: typing.Iterable[str],
+    *,
+    concurrency: int = 8,
+    progress: typing.Callable[[int, int], None] | None = None,
+) -> dict[str, {value_type}]:
+    \"\"\"Get the local state of many accounts, fetched concurrently
+
+    Returns the local state of each account by address, in the order of `addresses`, omitting accounts that aren't
+    opted in to the app. `progress` is called with the number of accounts fetched so far and the total number of
+    accounts as each account is fetched.
+    \"\"\"
+    return _fetch_many(
+        addresses,
+        lambda address: {class_name}(self.app_client, address)._get_all_if_opted_in(),
+        concurrency,
+        progress,
+    )
+
+def local_state_columns(
+    self,
+    addresses: typing.Iterable[str],
+    *,
+    concurrency: int = 8,
+    progress: typing.Callable[[int, int], None] | None = None,
+) -> dict[str, typing.Any]:
+    \"\"\"Get the local state of many accounts as columns, see `local_state_many`
+
+    Returns an `address` column and a column for each key, or for each field of keys with struct values. Columns
+    of uints up to 64 bits and bools are NumPy arrays if NumPy is installed, or `array.array`s otherwise.
+    \"\"\"
+    columns: _ColumnSpec = {columns}
+    states = self.local_state_many(addresses, concurrency=concurrency, progress=progress)
+    return {{"address": list(states), **_to_columns(states.values(), columns)}}
+""")
+    else:
+        yield utils.indented(f"""
+def global_state_columns(
+    self,
+    app_ids: typing.Iterable[int],
+    *,
+    concurrency: int = 8,
+    progress: typing.Callable[[int, int], None] | None = None,
+) -> dict[str, typing.Any]:
+    \"\"\"Get the global state of many instances of the app as columns, fetched concurrently
+
+    Returns an `app_id` column and a column for each key, or for each field of keys with struct values, in the
+    order of `app_ids`, omitting apps that don't exist. Columns of uints up to 64 bits and bools are NumPy arrays
+    if NumPy is installed, or `array.array`s otherwise.
+    \"\"\"
+    columns: _ColumnSpec = {columns}
+    states = _fetch_many(app_ids, {class_name}(self.app_client)._get_all_of_app, concurrency, progress)
+    return {{"app_id": list(states), **_to_columns(states.values(), columns)}}
+""")
+
+
+# The methods of `_MapState` that stream box maps and decode maps into columns, which are generated in full mode
+MAP_STATE_STREAMING_METHODS = """
+    def iter_items(self, page_size: int = 1000, prefetch: int = 8) -> typing.Iterator[tuple[_KeyType, _ValueType]]:
+        \"\"\"Iterate over the keys and values in the map
+
+        Box maps are streamed: box names are fetched `page_size` at a time and up to `prefetch` values are fetched
+        concurrently ahead of the item being consumed, so memory use is bounded and the first items are available
+        straight away. Boxes created or deleted during iteration may or may not be included. Other maps are read
+        in one call, as their state is.
+        \"\"\"
+        if self._box_app_client is None:
+            yield from self.get_map().items()
+            return
+        for key, value in self._iter_decoded(page_size, prefetch):
+            if self._key_struct_class and isinstance(key, dict):
+                key = _init_dataclass(self._key_struct_class, key)
+            if self._struct_class and isinstance(value, dict):
+                value = _init_dataclass(self._struct_class, value)
+            yield typing.cast(_KeyType, key), typing.cast(_ValueType, value)
+
+    def get_columns(self, page_size: int = 1000, prefetch: int = 8) -> dict[str, typing.Any]:
+        \"\"\"Get the keys and values in the map as columns, without creating an object for each value
+
+        Returns a `key` column and a column for each field of the map's struct values, or a `value` column for
+        other values. Columns of uints up to 64 bits and bools are NumPy arrays if NumPy is installed, or
+        `array.array`s otherwise, and other columns are lists. Box maps are streamed, as with `iter_items`.
+        \"\"\"
+        keys: list[typing.Any] = []
+
+        def values() -> typing.Iterator[typing.Any]:
+            for key, value in self._iter_decoded(page_size, prefetch):
+                keys.append(key)
+                yield value
+
+        columns = _to_columns(values(), self._value_columns)
+        return {"key": keys, **columns}
+
+    def _iter_decoded(self, page_size: int, prefetch: int) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        # the decoded ABI keys and values, with structs as dicts
+        if self._box_app_client is None:
+            yield from self._state_accessor.get_map(self._map_name).items()
+            return
+
+        app_client = self._box_app_client
+        metadata = app_client.app_spec.state.maps.box[self._map_name]
+        prefix = base64.b64decode(metadata.prefix or "")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+            pending: list[tuple[bytes, concurrent.futures.Future[bytes]]] = []
+            try:
+                for name in self._iter_box_names(prefix, page_size):
+                    value = executor.submit(app_client.algorand.app.get_box_value, app_client.app_id, name)
+                    pending.append((name, value))
+                    if len(pending) > prefetch:
+                        name, value = pending.pop(0)
+                        yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+                while pending:
+                    name, value = pending.pop(0)
+                    yield self._decode_box(name[len(prefix) :], value.result(), metadata)
+            finally:
+                for _, value in pending:
+                    value.cancel()
+
+    def _iter_box_names(self, prefix: bytes, page_size: int) -> typing.Iterator[bytes]:
+        # algod versions without paging of box names ignore `next` and `prefix`, and may truncate to `max` names
+        assert self._box_app_client is not None
+        algod = self._box_app_client.algorand.client.algod
+        path = f"/applications/{self._box_app_client.app_id}/boxes"
+        params: dict[str, typing.Any] = {"max": page_size}
+        if prefix:
+            params["prefix"] = "b64:" + base64.b64encode(prefix).decode()
+        seen: set[bytes] | None = None
+        while True:
+            response = typing.cast(dict[str, typing.Any], algod.algod_request("GET", path, params=params))
+            page = [base64.b64decode(box["name"]) for box in response.get("boxes", [])]
+            names = page if seen is None else [name for name in page if name not in seen]
+            yield from (name for name in names if name.startswith(prefix))
+            next_token = response.get("next-token")
+            if next_token:
+                params["next"] = next_token
+            elif "next" not in params and "next-token" not in response and len(page) == params["max"]:
+                # a full first page without a next token may have been truncated by a node that doesn't page, so
+                # list the names again with a larger `max`, until a page isn't full
+                seen = (seen or set()).union(page)
+                params["max"] *= 2
+            else:
+                return
+
+    def _decode_box(
+        self, key: bytes, value: bytes, metadata: algokit_utils.applications.app_spec.arc56.StorageMap
+    ) -> tuple[typing.Any, typing.Any]:
+        assert self._box_app_client is not None
+        structs = self._box_app_client.app_spec.structs
+        return (
+            algokit_utils.applications.abi.get_abi_decoded_value(key, metadata.key_type, structs),
+            algokit_utils.applications.abi.get_abi_decoded_value(value, metadata.value_type, structs),
+        )
+"""
+
+
 def generate_state_methods(context: GeneratorContext) -> DocumentParts:
     """Generate state methods for accessing global, local and box state"""
     if not context.app_spec.state:
@@ -861,7 +1225,7 @@ class {context.contract_name}State:
     yield Part.IncIndent
 
     # Generate state accessors
-    for state_type, _, class_name, _ in state_configs:
+    for state_type, value_type, class_name, _ in state_configs:
         keys = getattr(context.app_spec.state.keys, state_type)
         maps = getattr(context.app_spec.state.maps, state_type)
 
@@ -878,6 +1242,9 @@ def {state_type.split("_")[0]}{"_state" if state_type != "box" else ""}(
         \"\"\"Methods to access {state_type} for the current app\"\"\"
         return {class_name}(self.app_client{", address" if state_type == "local_state" else ""})
 """)
+        if state_type in ("local_state", "global_state") and keys and has_state_columns(context):
+            yield Part.Gap1
+            yield _generate_state_many_methods(context, state_type, value_type, class_name, keys)
 
     yield Part.DecIndent
     yield Part.Gap1
@@ -901,9 +1268,27 @@ def {state_type.split("_")[0]}{"_state" if state_type != "box" else ""}(
         )
         yield Part.Gap1
 
-    # Generate MapState class if needed
+    # Generate MapState class if needed, which streams box maps and decodes maps into columns in full mode
     if any(bool(getattr(context.app_spec.state.maps, t)) for t in ["global_state", "local_state", "box"]):
-        yield utils.indented("""
+        full = has_state_columns(context)
+        init_params = (
+            """,
+                 box_app_client: algokit_utils.AppClient | None = None,
+                 key_struct_class: typing.Type[typing.Any] | None = None,
+                 value_columns: _ColumnSpec = (("value", (), None),)"""
+            if full
+            else ""
+        )
+        init_attributes = (
+            """
+        self._box_app_client = box_app_client
+        self._key_struct_class = key_struct_class
+        self._value_columns = value_columns"""
+            if full
+            else ""
+        )
+        yield utils.indented(
+            """
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -917,10 +1302,10 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
     \"\"\"Generic class for accessing state maps with strongly typed keys and values\"\"\"
 
     def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
-                 struct_class: typing.Type[_ValueType] | None = None):
+                 struct_class: typing.Type[_ValueType] | None = None{init_params}):
         self._state_accessor = state_accessor
         self._map_name = map_name
-        self._struct_class = struct_class
+        self._struct_class = struct_class{init_attributes}
 
     def get_map(self) -> dict[_KeyType, _ValueType]:
         \"\"\"Get all current values in the map\"\"\"
@@ -937,7 +1322,10 @@ class _MapState(typing.Generic[_KeyType, _ValueType]):
         if value is not None and self._struct_class and isinstance(value, dict):
             return _init_dataclass(self._struct_class, value)  # type: ignore
         return typing.cast(_ValueType | None, value)
-""")
+{streaming_methods}""".replace("{init_params}", init_params)
+            .replace("{init_attributes}", init_attributes)
+            .replace("{streaming_methods}", MAP_STATE_STREAMING_METHODS if full else "")
+        )
 
 
 def generate_typed_client(context: GeneratorContext) -> DocumentParts:
@@ -951,6 +1339,17 @@ def generate_typed_client(context: GeneratorContext) -> DocumentParts:
     yield Part.Gap2
     yield generate_structs_for_args(context)
     yield Part.Gap2
+    yield generate_operation_classes(context)
+    yield Part.Gap2
+    yield generate_state_methods(context)
+    yield Part.Gap2
+
+    # Generate main client class
+    yield generate_client_class(context)
+
+
+def generate_operation_classes(context: GeneratorContext) -> DocumentParts:
+    """Generate the Params, CreateTransactionParams and Send classes used by the client"""
     yield from _generate_class_methods(context, f"{context.contract_name}Params", PropertyType.PARAMS)
     yield Part.Gap2
     yield from _generate_class_methods(
@@ -958,11 +1357,12 @@ def generate_typed_client(context: GeneratorContext) -> DocumentParts:
     )
     yield Part.Gap2
     yield from _generate_class_methods(context, f"{context.contract_name}Send", PropertyType.SEND)
-    yield Part.Gap2
-    yield generate_state_methods(context)
-    yield Part.Gap2
+    if get_preparable_methods(context):
+        yield Part.Gap2
+        yield generate_prepare_class(context)
 
-    # Generate main client class
+
+def generate_client_class(context: GeneratorContext) -> DocumentParts:
     yield generate_class_definition(context)
     yield Part.Gap1
     yield Part.IncIndent
@@ -10,6 +10,18 @@ from algokit_client_generator.spec import ContractMethod
 # Constants
 OPERATION_PREFIXES = {"create": "create", "update_application": "update", "delete_application": "delete"}
 OPERATION_SUFFIXES = {"create": "Create", "update_application": "Update", "delete_application": "Delete"}
+# Params of the factory deploy method before and after the create, update and delete params
+DEPLOY_LEADING_PARAMS = (
+    "on_update: algokit_utils.OnUpdate | None = None",
+    "on_schema_break: algokit_utils.OnSchemaBreak | None = None",
+)
+DEPLOY_TRAILING_PARAMS = (
+    "existing_deployments: algokit_utils.ApplicationLookup | None = None",
+    "ignore_cache: bool = False",
+    "app_name: str | None = None",
+    "compilation_params: algokit_utils.AppClientCompilationParams | None = None",
+    "send_params: algokit_utils.SendParams | None = None",
+)
 
 
 @dataclass
@@ -21,17 +33,9 @@ class TypeNames:
 
 def _generate_method_args_type(context: GeneratorContext, method: ContractMethod) -> str:
     """Generate the args type for a method"""
-    if not method.abi or not method.abi.args:
+    if not method.abi:
         return "None"
-
-    arg_types = [arg.python_type for arg in method.abi.args]
-    tuple_type = f"tuple[{', '.join(arg_types)}]"
-    args_type = f"{tuple_type} | {context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args"
-
-    if all(arg.has_default for arg in method.abi.args):
-        args_type = f"{args_type} | None = None"
-
-    return args_type
+    return method.abi.factory_args_type
 
 
 def _generate_method_params(
@@ -67,7 +71,7 @@ def _generate_abi_method(context: GeneratorContext, method: ContractMethod, oper
     method_params = _generate_method_params(
         method.abi.client_method_name, args_type, include_compilation_params=operation == "create"
     )
-    method_sig = method.abi.method.get_signature()
+    method_sig = method.abi.signature
 
     yield Part.IncIndent
     yield utils.indented(f"""
@@ -98,9 +102,9 @@ def _generate_abi_send_method(method: ContractMethod, context: GeneratorContext)
     method_name = method.abi.client_method_name
 
     # Handle multiple create methods case
-    create_methods = [m for m in context.methods.all_abi_methods if m.call_config == "create"]
+    create_methods = [m for m in context.methods.create if m.abi]
     if len(create_methods) > 1:
-        signature = method.abi.method.get_signature()
+        signature = method.abi.signature
         cleaned_sig = signature.replace("[]", "").replace(",", "_")
         method_name = utils.to_snake_case(cleaned_sig.replace("(", "_").replace(")", "_"))
 
@@ -110,13 +114,15 @@ def _generate_abi_send_method(method: ContractMethod, context: GeneratorContext)
 
     yield utils.indented(f"""
     {method_params} -> tuple[{context.contract_name}Client, algokit_utils.AppFactoryCreateMethodCallResult[{return_type}]]:
-        \"\"\"Creates and sends a transaction using the {method.abi.method.get_signature()} ABI method\"\"\"
+        \"\"\"Creates and sends a transaction using the {method.abi.signature} ABI method\"\"\"
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         client, result = self.app_factory.send.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{{
                 **dataclasses.asdict(params),
-                "method": "{method.abi.method.get_signature()}",
+                "method": "{method.abi.signature}",
                 "args": {"_parse_abi_args(args)" if args_type != "None" else "None"},
                 }}
             ),
@@ -125,7 +131,7 @@ def _generate_abi_send_method(method: ContractMethod, context: GeneratorContext)
         )
         return_value = None if result.abi_return is None else typing.cast({return_type}, result.abi_return)
 
-        return {context.contract_name}Client(client), algokit_utils.AppFactoryCreateMethodCallResult[{return_type}](
+        return {context.contract_name}Client(client, cache=self.cache), algokit_utils.AppFactoryCreateMethodCallResult[{return_type}](
             **{{
                 **result.__dict__,
                 "app_id": result.app_id,
@@ -259,7 +265,7 @@ def _generate_abi_params_class(
     args_dataclasses = []
     for method in abi_methods:
         if method.abi and method.abi.args:
-            args_dataclasses.append(f"{context.sanitizer.make_safe_type_identifier(method.abi.client_method_name)}Args")
+            args_dataclasses.append(method.abi.args_dataclass_name)
 
     # Get unique on_complete values
     on_completes = {
@@ -351,6 +357,7 @@ def __init__(
     default_signer: TransactionSigner | None = None,
     version: str | None = None,
     compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    cache: NetworkCache | None = None,
 ):
     self.app_factory = algokit_utils.AppFactory(
         params=algokit_utils.AppFactoryParams(
@@ -364,8 +371,10 @@ def __init__(
         )
     )
     self.params = {context.contract_name}FactoryParams(self.app_factory)
-    self.create_transaction = {context.contract_name}FactoryCreateTransaction(self.app_factory)
-    self.send = {context.contract_name}FactorySend(self.app_factory)
+    self.create_transaction = {context.contract_name}FactoryCreateTransaction(self.app_factory, cache)
+    self.send = {context.contract_name}FactorySend(self.app_factory, cache)
+    self.cache = cache
+    self._default_sender = default_sender
 """)
 
     # Properties
@@ -390,21 +399,20 @@ def algorand(self) -> _AlgoKitAlgorandClient:
     yield Part.IncIndent
     yield "self,"
     yield "*,"
-    yield "on_update: algokit_utils.OnUpdate | None = None,"
-    yield "on_schema_break: algokit_utils.OnSchemaBreak | None = None,"
-    for param in deploy_params:
+    for param in (*DEPLOY_LEADING_PARAMS, *deploy_params, *DEPLOY_TRAILING_PARAMS):
         yield f"{param},"
-    yield "existing_deployments: algokit_utils.ApplicationLookup | None = None,"
-    yield "ignore_cache: bool = False,"
-    yield "app_name: str | None = None,"
-    yield "compilation_params: algokit_utils.AppClientCompilationParams | None = None,"
-    yield "send_params: algokit_utils.SendParams | None = None,"
     yield Part.DecIndent
     yield f") -> tuple[{context.contract_name}Client, algokit_utils.AppFactoryDeployResult]:"
 
     yield Part.IncIndent
     yield utils.docstring("Deploy the application")
 
+    yield f"creator_address = {_get_creator_address(type_names, 'create_params')}"
+    yield utils.indented("""
+if self.cache:
+    self.cache.seed_suggested_params(self.algorand)
+    if creator_address and not existing_deployments and not ignore_cache:
+        existing_deployments = self.cache.get_creator_apps_by_name(self.algorand, creator_address)""")
     yield "deploy_response = self.app_factory.deploy("
     yield Part.IncIndent
     yield "on_update=on_update,"
@@ -418,10 +426,16 @@ def algorand(self) -> _AlgoKitAlgorandClient:
     yield "send_params=send_params,"
     yield Part.DecIndent
     yield ")"
+    yield utils.indented("""
+if self.cache and creator_address:
+    self.cache.record_app(self.algorand, creator_address, deploy_response[1].app)""")
     yield Part.NewLine
-    yield f"return {context.contract_name}Client(deploy_response[0]), deploy_response[1]"
+    yield f"return {context.contract_name}Client(deploy_response[0], cache=self.cache), deploy_response[1]"
     yield Part.DecIndent
 
+    yield Part.Gap1
+    yield _generate_deploy_many_method(context, type_names)
+
     # Get app client methods
     yield Part.Gap1
     yield utils.indented(f"""
@@ -439,6 +453,8 @@ def get_app_client_by_creator_and_name(
     yield Part.IncIndent
     yield utils.docstring("Get an app client by creator address and name")
     yield utils.indented(f"""
+if self.cache and not app_lookup_cache and not ignore_cache:
+    app_lookup_cache = self.cache.get_creator_apps_by_name(self.algorand, creator_address)
 return {context.contract_name}Client(
     self.app_factory.get_app_client_by_creator_and_name(
         creator_address,
@@ -449,7 +465,8 @@ return {context.contract_name}Client(
         app_lookup_cache,
         approval_source_map,
         clear_source_map,
-    )
+    ),
+    cache=self.cache,
 )
 """)
     yield Part.DecIndent
@@ -477,7 +494,8 @@ return {context.contract_name}Client(
         default_signer,
         approval_source_map,
         clear_source_map,
-    )
+    ),
+    cache=self.cache,
 )
 """
     )
@@ -485,6 +503,118 @@ return {context.contract_name}Client(
     yield Part.DecIndent
 
 
+def _get_creator_address(type_names: TypeNames, create_params: str) -> str:
+    """Get the expression for the account that deploys the app, which is the sender of its create params if any"""
+    if not type_names.create:
+        return "self._default_sender"
+    return f"({create_params}.sender if {create_params} else None) or self._default_sender"
+
+
+def _generate_deploy_kwargs_type(context: GeneratorContext, deploy_params: list[str]) -> DocumentParts:
+    yield f"class {context.contract_name}FactoryDeployKwargs(typing.TypedDict, total=False):"
+    yield Part.IncIndent
+    yield utils.docstring(f"Keyword arguments of `{context.contract_name}Factory.deploy`, e.g. for `deploy_many`")
+    for param in (*DEPLOY_LEADING_PARAMS, *deploy_params, *DEPLOY_TRAILING_PARAMS):
+        yield param.split(" = ")[0]
+    yield Part.DecIndent
+
+
+def _generate_deploy_many_error(context: GeneratorContext) -> DocumentParts:
+    yield utils.indented(f"""
+class {context.contract_name}DeployManyError(Exception):
+    \"\"\"Raised by `{context.contract_name}Factory.deploy_many` when any of the deploys fail\"\"\"
+
+    def __init__(
+        self, outcomes: list[tuple[{context.contract_name}Client, algokit_utils.AppFactoryDeployResult] | BaseException]
+    ):
+        self.outcomes = outcomes
+        \"\"\"The client and deploy result of each deployment in order, or the exception it raised\"\"\"
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        super().__init__(f"{{len(errors)}} of {{len(outcomes)}} deploys failed, the first with: {{errors[0]!r}}")
+
+    @property
+    def deployed(self) -> dict[int, tuple[{context.contract_name}Client, algokit_utils.AppFactoryDeployResult]]:
+        \"\"\"The client and deploy result of each deployment that succeeded, by its index\"\"\"
+        return {{idx: outcome for idx, outcome in enumerate(self.outcomes) if not isinstance(outcome, BaseException)}}
+""")
+
+
+def _generate_deploy_many_method(context: GeneratorContext, type_names: TypeNames) -> DocumentParts:
+    deployed = f"tuple[{context.contract_name}Client, algokit_utils.AppFactoryDeployResult]"
+    yield utils.indented(f"""
+def deploy_many(
+    self,
+    deployments: typing.Sequence[{context.contract_name}FactoryDeployKwargs],
+    *,
+    max_concurrency: int = 4,
+) -> list[{deployed}]:
+    \"\"\"Deploy many apps in parallel, returning their clients and deploy results in the order of `deployments`
+
+    Each item has the keyword arguments of `deploy` for one app, and up to `max_concurrency` apps are deployed at
+    once. The first app deployed with each distinct `compilation_params` is deployed before the rest, and compiles
+    the programs through the `AlgorandClient`, which caches them by source, so the rest reuse them. The apps of each
+    creator are looked up once, before any app is deployed, for the deploys that don't set `existing_deployments` or
+    `ignore_cache`. As deploys of the same app would race, each app must have a distinct name for its creator.
+
+    If any deploy fails, the deploys that haven't started are cancelled and a `{context.contract_name}DeployManyError`
+    is raised with the outcome of each deployment, so the apps that were deployed are known.
+    \"\"\"
+    first_indexes: dict[str, int] = {{}}
+    deployed_names: set[tuple[str, str | None]] = set()
+    creator_addresses: list[str | None] = []
+    for idx, deployment in enumerate(deployments):
+        first_indexes.setdefault(repr(deployment.get("compilation_params")), idx)
+        create_params = deployment.get("create_params")
+        creator_address = {_get_creator_address(type_names, "create_params")}
+        name = (deployment.get("app_name") or self.app_name, creator_address)
+        if name in deployed_names:
+            raise ValueError(f"App {{name[0]}} is deployed more than once by {{creator_address}}")
+        deployed_names.add(name)
+        creator_addresses.append(creator_address)
+
+    app_lookups: dict[str, algokit_utils.ApplicationLookup] = {{}}
+    deploy_kwargs: list[{context.contract_name}FactoryDeployKwargs] = []
+    for deployment, creator_address in zip(deployments, creator_addresses, strict=True):
+        if not creator_address or deployment.get("existing_deployments") or deployment.get("ignore_cache"):
+            deploy_kwargs.append(deployment)
+            continue
+        if creator_address not in app_lookups:
+            app_lookups[creator_address] = (
+                self.cache.get_creator_apps_by_name(self.algorand, creator_address)
+                if self.cache
+                else self.algorand.app_deployer.get_creator_apps_by_name(creator_address=creator_address)
+            )
+        # each deploy gets its own copy, as the cache adds deployed apps to its lookup from other threads
+        app_lookup = app_lookups[creator_address]
+        deploy_kwargs.append(
+            {{**deployment, "existing_deployments": dataclasses.replace(app_lookup, apps=dict(app_lookup.apps))}}
+        )
+
+    first = set(first_indexes.values())
+    outcomes: dict[int, {deployed} | BaseException] = {{}}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for indexes in (sorted(first), [idx for idx in range(len(deployments)) if idx not in first]):
+            futures = {{executor.submit(self.deploy, **deploy_kwargs[idx]): idx for idx in indexes}}
+            _, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            concurrent.futures.wait(not_done)
+            for future, idx in futures.items():
+                outcomes[idx] = (
+                    concurrent.futures.CancelledError()
+                    if future.cancelled()
+                    else future.exception() or future.result()
+                )
+            if any(isinstance(outcome, BaseException) for outcome in outcomes.values()):
+                break
+
+    results = [outcomes.get(idx) or concurrent.futures.CancelledError() for idx in range(len(deployments))]
+    if any(isinstance(outcome, BaseException) for outcome in results):
+        raise {context.contract_name}DeployManyError(results)
+    return typing.cast(list[{deployed}], results)
+""")
+
+
 def generate_factory_params(context: GeneratorContext) -> Iterator[DocumentParts]:
     """Generate factory params classes"""
     yield utils.indented(f"""
@@ -510,9 +640,9 @@ def _generate_factory_create_transaction(context: GeneratorContext) -> Iterator[
 class {context.contract_name}FactoryCreateTransaction:
     \"\"\"Create transactions for {context.contract_name} contract\"\"\"
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = {context.contract_name}FactoryCreateTransactionCreate(app_factory)
+        self.create = {context.contract_name}FactoryCreateTransactionCreate(app_factory, cache)
 """)
 
 
@@ -522,9 +652,9 @@ def _generate_factory_send(context: GeneratorContext) -> Iterator[DocumentParts]
 class {context.contract_name}FactorySend:
     \"\"\"Send calls to {context.contract_name} contract\"\"\"
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
-        self.create = {context.contract_name}FactorySendCreate(app_factory)
+        self.create = {context.contract_name}FactorySendCreate(app_factory, cache)
 """)
 
 
@@ -534,8 +664,9 @@ def _generate_create_transaction_class(context: GeneratorContext) -> Iterator[Do
 class {context.contract_name}FactoryCreateTransactionCreate:
     \"\"\"Create new instances of {context.contract_name} contract\"\"\"
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -543,6 +674,8 @@ class {context.contract_name}FactoryCreateTransactionCreate:
     ) -> Transaction:
         \"\"\"Creates a new instance using a bare call\"\"\"
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         return self.app_factory.create_transaction.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
         )
@@ -555,8 +688,9 @@ def _generate_send_class(context: GeneratorContext) -> Iterator[DocumentParts]:
 class {context.contract_name}FactorySendCreate:
     \"\"\"Send create calls to {context.contract_name} contract\"\"\"
 
-    def __init__(self, app_factory: algokit_utils.AppFactory):
+    def __init__(self, app_factory: algokit_utils.AppFactory, cache: NetworkCache | None = None):
         self.app_factory = app_factory
+        self.cache = cache
 
     def bare(
         self,
@@ -567,12 +701,14 @@ class {context.contract_name}FactorySendCreate:
     ) -> tuple[{context.contract_name}Client, algokit_utils.SendAppCreateTransactionResult]:
         \"\"\"Creates a new instance using a bare call\"\"\"
         params = params or algokit_utils.CommonAppCallCreateParams()
+        if self.cache:
+            self.cache.seed_suggested_params(self.app_factory.algorand)
         result = self.app_factory.send.bare.create(
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             send_params=send_params,
             compilation_params=compilation_params
         )
-        return {context.contract_name}Client(result[0]), result[1]
+        return {context.contract_name}Client(result[0], cache=self.cache), result[1]
 """)
 
     for method in [m for m in context.methods.all_abi_methods if m.call_config == "create"]:
@@ -594,6 +730,10 @@ def generate_typed_factory(context: GeneratorContext) -> DocumentParts:
 
     # Generate main factory components
     yield Part.Gap1
+    yield _generate_deploy_kwargs_type(context, deploy_param_types)
+    yield Part.Gap2
+    yield _generate_deploy_many_error(context)
+    yield Part.Gap2
     yield from generate_factory_class(context, deploy_param_types, argument_forwarding, type_names)
     yield Part.Gap2
     yield from generate_factory_params(context)
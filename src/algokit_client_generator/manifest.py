@@ -0,0 +1,105 @@
+import dataclasses
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from algokit_client_generator.filters import MethodFilter
+from algokit_client_generator.modes import MODES
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class ManifestEntry:
+    app_spec: Path
+    output: Path
+    mode: str = "full"
+    preserve_names: bool = False
+    include_methods: tuple[str, ...] = ()
+    exclude_methods: tuple[str, ...] = ()
+    on_complete: tuple[str, ...] = ()
+
+    @property
+    def method_filter(self) -> MethodFilter | None:
+        method_filter = MethodFilter(
+            include=self.include_methods, exclude=self.exclude_methods, on_complete=self.on_complete
+        )
+        return method_filter or None
+
+
+def load_manifest(path: Path) -> list[ManifestEntry]:
+    """Load the clients to generate from a JSON or TOML manifest.
+
+    The manifest has a `clients` list, where each entry has `app_spec` and `output` paths, relative to the
+    manifest's directory, and optional `mode` ("full" or "minimal") and `preserve_names` values, and
+    `include_methods`, `exclude_methods` and `on_complete` lists that select the methods to generate (see
+    `MethodFilter`), e.g.
+
+        [[clients]]
+        app_spec = "artifacts/hello_world/HelloWorld.arc56.json"
+        output = "clients/hello_world_client.py"
+        mode = "minimal"
+        include_methods = ["hello"]
+    """
+    try:
+        raw_manifest = _parse_manifest(path)
+        clients = raw_manifest["clients"]
+        if not isinstance(clients, list):
+            raise TypeError("'clients' must be a list")
+        return [_parse_entry(entry, path.parent) for entry in clients]
+    except Exception as ex:
+        raise ValueError(f"Invalid manifest {path}: {ex}") from ex
+
+
+def _parse_manifest(path: Path) -> dict[str, Any]:
+    raw_manifest = path.read_text(encoding="utf-8")
+    if path.suffix.lower() != ".toml":
+        return _as_object(json.loads(raw_manifest))
+    if sys.version_info >= (3, 11):
+        import tomllib  # noqa: PLC0415
+
+        return tomllib.loads(raw_manifest)
+    raise ValueError("TOML manifests require Python 3.11 or later, use a JSON manifest instead")
+
+
+def _as_object(value: object) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise TypeError("expected an object with a 'clients' list")
+    return value
+
+
+def _parse_entry(entry: object, base_path: Path) -> ManifestEntry:
+    if not isinstance(entry, dict):
+        raise TypeError(f"client entries must be objects: {entry!r}")
+    unknown_keys = set(entry) - {field.name for field in dataclasses.fields(ManifestEntry)}
+    if unknown_keys:
+        raise ValueError(f"unknown client entry keys: {', '.join(sorted(unknown_keys))}")
+    missing_keys = {"app_spec", "output"} - set(entry)
+    if missing_keys:
+        raise ValueError(f"client entries require {', '.join(sorted(missing_keys))}: {entry!r}")
+    mode = entry.get("mode", "full")
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}: {mode!r}")
+    preserve_names = entry.get("preserve_names", False)
+    if not isinstance(preserve_names, bool):
+        raise TypeError(f"preserve_names must be a boolean: {preserve_names!r}")
+    method_filter = MethodFilter(
+        include=_as_strings(entry, "include_methods"),
+        exclude=_as_strings(entry, "exclude_methods"),
+        on_complete=_as_strings(entry, "on_complete"),
+    )
+    return ManifestEntry(
+        app_spec=base_path / entry["app_spec"],
+        output=base_path / entry["output"],
+        mode=mode,
+        preserve_names=preserve_names,
+        include_methods=method_filter.include,
+        exclude_methods=method_filter.exclude,
+        on_complete=method_filter.on_complete,
+    )
+
+
+def _as_strings(entry: dict[str, Any], key: str) -> tuple[str, ...]:
+    value = entry.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise TypeError(f"{key} must be a list of strings: {value!r}")
+    return tuple(value)
@@ -0,0 +1,29 @@
+from collections.abc import Sequence
+from pathlib import Path
+
+MODES = ("full", "minimal")
+
+
+def parse_modes(value: str) -> tuple[str, ...]:
+    """Parse a comma separated list of generation modes, e.g. "full,minimal" """
+    modes = tuple(dict.fromkeys(mode.strip() for mode in value.split(",") if mode.strip()))
+    if not modes:
+        raise ValueError("at least one mode is required")
+    invalid_modes = [mode for mode in modes if mode not in MODES]
+    if invalid_modes:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}: {', '.join(invalid_modes)}")
+    return modes
+
+
+def get_mode_output_paths(output_path: Path, modes: Sequence[str]) -> dict[str, Path]:
+    """Get the output path of the client for each mode.
+
+    A single mode is written to output_path. When generating several modes, the full client is written to
+    output_path and the others alongside it with the mode as a suffix, e.g. client.py and client_minimal.py
+    """
+    if len(modes) == 1:
+        return {modes[0]: output_path}
+    return {
+        mode: output_path if mode == "full" else output_path.with_name(f"{output_path.stem}_{mode}{output_path.suffix}")
+        for mode in modes
+    }
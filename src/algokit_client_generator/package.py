@@ -0,0 +1,157 @@
+"""Rendering of a typed client as a package of modules rather than a single file.
+
+Each module only imports the modules it depends on, so e.g. a service that only reads state doesn't load the client,
+factory or composer. The package `__init__` exposes every public name and imports its module on first use.
+"""
+
+import ast
+
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.document import DocumentParts, Part, RenderContext, convert_part
+from algokit_client_generator.generators.app_spec import generate_app_spec
+from algokit_client_generator.generators.composer import generate_composer
+from algokit_client_generator.generators.events import generate_events
+from algokit_client_generator.generators.header_comments import generate_header_comments
+from algokit_client_generator.generators.helpers import generate_helpers
+from algokit_client_generator.generators.imports import generate_imports
+from algokit_client_generator.generators.typed_client import (
+    generate_client_class,
+    generate_operation_classes,
+    generate_state_methods,
+    generate_structs,
+    generate_structs_for_args,
+)
+from algokit_client_generator.generators.typed_factory import generate_typed_factory
+
+# Modules in dependency order, each module only imports from modules before it at runtime
+PACKAGE_MODULES = ("spec", "helpers", "structs", "events", "state", "composer", "client", "factory")
+
+
+def generate_package_modules(context: GeneratorContext) -> dict[str, DocumentParts]:
+    """Get the definitions that make up each module of the package, without imports"""
+    modules: dict[str, DocumentParts] = {
+        "spec": generate_app_spec(context),
+        "helpers": generate_helpers(context),
+        "structs": [generate_structs(context), Part.Gap2, generate_structs_for_args(context)],
+        "events": generate_events(context),
+        "state": generate_state_methods(context),
+        "composer": generate_composer(context),
+        "client": [generate_operation_classes(context), Part.Gap2, generate_client_class(context)],
+    }
+    if context.mode == "full":
+        modules["factory"] = generate_typed_factory(context)
+    return modules
+
+
+def render_package(context: GeneratorContext) -> dict[str, str]:
+    """Render the package for a typed client, returning the content of each file by file name"""
+    bodies = {module: _render(parts).strip("\n") for module, parts in generate_package_modules(context).items()}
+    # modules without any definitions, e.g. state for an app without state, are omitted
+    bodies = {module: body for module, body in bodies.items() if body}
+    symbols = {module: _get_defined_symbols(body) for module, body in bodies.items()}
+    header = _render([generate_header_comments(context), generate_imports(context)]).rstrip("\n")
+
+    files = {}
+    for module, body in bodies.items():
+        runtime_imports, type_checking_imports = [], []
+        used_identifiers = _get_used_names(body)
+        for other_module, other_symbols in symbols.items():
+            used_symbols = [symbol for symbol in other_symbols if symbol in used_identifiers]
+            if other_module == module or not used_symbols:
+                continue
+            import_line = f"from .{other_module} import {', '.join(used_symbols)}"
+            if PACKAGE_MODULES.index(other_module) < PACKAGE_MODULES.index(module):
+                runtime_imports.append(import_line)
+            else:  # only used in annotations, importing at runtime would be circular
+                type_checking_imports.append(import_line)
+
+        imports = "\n".join(runtime_imports)
+        if type_checking_imports:
+            imports += "\nif typing.TYPE_CHECKING:\n" + "\n".join(f"    {line}" for line in type_checking_imports)
+        if imports.strip():
+            imports = "\n# package modules\n" + imports.strip("\n")
+        files[f"{module}.py"] = f"{header}{imports}\n\n\n{body}\n"
+
+    files["__init__.py"] = _render_init(context, symbols)
+    return files
+
+
+def _render_init(context: GeneratorContext, symbols: dict[str, list[str]]) -> str:
+    exports = {
+        symbol: module
+        for module, module_symbols in symbols.items()
+        for symbol in module_symbols
+        if not symbol.startswith("_")
+    }
+    header = _render(generate_header_comments(context)).rstrip("\n")
+    type_checking_imports = "\n".join(
+        f"    from .{module} import {', '.join(symbol for symbol in module_symbols if symbol in exports)}"
+        for module, module_symbols in symbols.items()
+        if any(symbol in exports for symbol in module_symbols)
+    )
+    all_names = "\n".join(f'    "{symbol}",' for symbol in exports)
+    export_modules = "\n".join(f'    "{symbol}": "{module}",' for symbol, module in exports.items())
+    return f"""{header}
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+{type_checking_imports}
+
+__all__ = [
+{all_names}
+]
+
+_EXPORT_MODULES = {{
+{export_modules}
+}}
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Modules are imported on first use, so only the parts of the client that are used are loaded
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(f".{{module}}", __name__), name)
+    globals()[name] = value
+    return value
+"""
+
+
+def _render(parts: DocumentParts) -> str:
+    return "".join(convert_part(parts, RenderContext(indent_inc="    ")))
+
+
+def _get_defined_symbols(source: str) -> list[str]:
+    """Get the names defined at the top level of source, in order of definition"""
+    symbols: dict[str, None] = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef):
+            symbols[node.name] = None
+        elif isinstance(node, ast.Assign):
+            symbols.update((target.id, None) for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            symbols[node.target.id] = None
+    return list(symbols)
+
+
+def _get_used_names(source: str) -> set[str]:
+    """Get the names that source refers to, including in string annotations but not in other strings"""
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.arg | ast.AnnAssign) and node.annotation:
+            names.update(_get_annotation_names(node.annotation))
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef) and node.returns:
+            names.update(_get_annotation_names(node.returns))
+    return names
+
+
+def _get_annotation_names(annotation: ast.AST) -> set[str]:
+    """Get the names referred to by forward references, i.e. strings, within an annotation"""
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        return _get_used_names(annotation.value)
+    if isinstance(annotation, ast.Subscript) and ast.unparse(annotation.value) in ("typing.Literal", "Literal"):
+        return set()  # literal values aren't names
+    return {name for child in ast.iter_child_nodes(annotation) for name in _get_annotation_names(child)}
@@ -0,0 +1,95 @@
+import dataclasses
+import json
+import time
+import typing
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from algokit_client_generator import utils
+
+if typing.TYPE_CHECKING:
+    from algokit_utils.applications.app_spec.arc56 import Keys, Maps
+
+    from algokit_client_generator.context import GeneratorContext
+
+
+@dataclasses.dataclass(kw_only=True)
+class ClientReport:
+    """Metrics for generating a single typed client, e.g. for tracking generator cost and client size over time"""
+
+    app_spec: str
+    output: str
+    mode: str
+    written: bool = False
+    """False if the output already contained the identical client, so was left unchanged"""
+    timings: dict[str, float] = dataclasses.field(default_factory=dict)
+    """Seconds spent in each phase: load, context, render and write. In low memory mode the client is written as it is
+    rendered, so write is included in render. When several clients are generated from one load of an application.json,
+    the load and context phases are included in the first client's report only"""
+    output_bytes: int = 0
+    spec_bytes: int = 0
+    """Size of the application.json"""
+    shrunk_spec_bytes: int = 0
+    """Size of the application spec embedded in the client, after removing data the client doesn't need"""
+    methods: int = 0
+    structs: int = 0
+    state_keys: int = 0
+    maps: int = 0
+    identifier_cache_hits: int = 0
+    identifier_cache_misses: int = 0
+
+    def add_context_metrics(self, context: "GeneratorContext") -> None:
+        """Record the size of the app spec and what is generated for it"""
+        app_spec = context.app_spec
+        self.shrunk_spec_bytes = len(app_spec.to_json(indent=None).encode("utf-8"))
+        self.methods = len(app_spec.methods)
+        self.structs = len(context.structs)
+        self.state_keys = sum(len(keys) for keys in _keys_by_storage(app_spec.state.keys))
+        self.maps = sum(len(maps) for maps in _keys_by_storage(app_spec.state.maps))
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+class Measurements:
+    """Measures the time spent in each phase of generation, and identifier cache use, until taken for a report"""
+
+    def __init__(self) -> None:
+        self._timings: dict[str, float] = {}
+        self._cache_info = utils.get_identifier_cache_info()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = self._timings.get(name, 0.0) + time.perf_counter() - start
+
+    def take(self, report: ClientReport) -> None:
+        """Record the measurements in report, and start measuring again"""
+        hits, misses = utils.get_identifier_cache_info()
+        report.timings = self._timings
+        report.identifier_cache_hits = hits - self._cache_info[0]
+        report.identifier_cache_misses = misses - self._cache_info[1]
+        self._timings = {}
+        self._cache_info = (hits, misses)
+
+
+def format_reports(reports: Iterable[ClientReport]) -> str:
+    """Format reports as a JSON document with a "clients" list"""
+    return json.dumps({"clients": [report.to_dict() for report in reports]}, indent=2)
+
+
+def new_report(input_path: Path, output_path: Path, mode: str) -> ClientReport:
+    try:
+        spec_bytes = input_path.stat().st_size
+    except OSError:
+        spec_bytes = 0
+    return ClientReport(app_spec=str(input_path), output=str(output_path), mode=mode, spec_bytes=spec_bytes)
+
+
+def _keys_by_storage(storage: "Keys | Maps") -> list[dict[str, Any]]:
+    return [storage.global_state, storage.local_state, storage.box]
@@ -0,0 +1,118 @@
+"""Long-lived generation server, which keeps the generator and its dependencies loaded between requests.
+
+Requests and responses are JSON objects, one per line. A request has the same options as `generate_client`:
+
+    {"app_spec": "/path/to/application.json", "output": "/path/to/client.py", "mode": "full", "preserve_names": false}
+
+and is answered with either `{"ok": true, "output": "/path/to/client.py", "written": true}` (where `written` is
+false if the output already contained the identical client) or `{"ok": false, "error": "..."}`.
+Relative paths are resolved against the working directory of the server.
+"""
+
+import json
+import logging
+import socket
+import socketserver
+import sys
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STDIO = "-"
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    # Imported here so the thin client doesn't pay for loading the generator
+    from algokit_client_generator.writer import generate_client  # noqa: PLC0415
+
+    try:
+        output = request["output"]
+        written = generate_client(
+            Path(request["app_spec"]),
+            Path(output),
+            preserve_names=bool(request.get("preserve_names", False)),
+            mode=request.get("mode", "full"),
+        )
+    except Exception as ex:
+        return {"ok": False, "error": f"{type(ex).__name__}: {ex}"}
+    return {"ok": True, "output": output, "written": written}
+
+
+def serve_lines(lines: Iterable[str], write: Callable[[str], None]) -> None:
+    """Answer each JSON request line with a JSON response line"""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as ex:
+            response = {"ok": False, "error": f"Invalid request: {ex}"}
+        else:
+            if isinstance(request, dict):
+                response = handle_request(request)
+            else:
+                response = {"ok": False, "error": "Invalid request: expected a JSON object"}
+        write(json.dumps(response) + "\n")
+
+
+def serve_stdio() -> None:
+    """Serve requests read from stdin, writing responses to stdout"""
+
+    def write(response: str) -> None:
+        sys.stdout.write(response)
+        sys.stdout.flush()
+
+    serve_lines(sys.stdin, write)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        def write(response: str) -> None:
+            self.wfile.write(response.encode("utf-8"))
+            self.wfile.flush()
+
+        serve_lines((line.decode("utf-8") for line in self.rfile), write)
+
+
+def serve_socket(socket_path: Path) -> None:
+    """Serve requests on a Unix socket until interrupted"""
+    if socket_path.exists():
+        if _is_listening(socket_path):
+            raise RuntimeError(f"A server is already listening on {socket_path}")
+        socket_path.unlink()  # stale socket from a previous server
+    server = socketserver.ThreadingUnixStreamServer(str(socket_path), _RequestHandler)
+    logger.info(f"Listening for generation requests on {socket_path}, press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopped server")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def send_requests(socket_path: Path, requests: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Send requests to a server listening on a Unix socket, returning its responses"""
+    responses = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            for request in requests:
+                stream.write((json.dumps(request) + "\n").encode("utf-8"))
+                stream.flush()
+                response = stream.readline()
+                if not response:
+                    raise ConnectionError(f"Server on {socket_path} closed the connection")
+                responses.append(json.loads(response))
+    return responses
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+        return True
@@ -1,15 +1,36 @@
+import collections
 import copy
 import dataclasses
+import hashlib
+import itertools
 import json
+import keyword
+import logging
 import typing
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Collection, Iterable
 from pathlib import Path
 
-from algokit_utils import Arc32Contract, Arc56Contract, CallEnum, CreateEnum, StructField
+from algokit_utils import (
+    Arc32Contract,
+    Arc56Contract,
+    CallEnum,
+    CreateEnum,
+    Keys,
+    Maps,
+    StorageKey,
+    StorageMap,
+    StructField,
+)
 from algokit_utils import Method as Arc56Method
-from algosdk.abi import Method
+from algokit_utils.applications.abi import get_abi_tuple_type_from_abi_struct_definition
+from algosdk.abi import ABITransactionType, Method, is_abi_transaction_type
 
 from algokit_client_generator import utils
+from algokit_client_generator.filters import MethodFilter, match_method
+
+logger = logging.getLogger(__name__)
+
+APPL_TYPE_TXNS = [ABITransactionType.APPL, ABITransactionType.ANY]
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -19,6 +40,7 @@ class ContractArg:
     python_type: str
     desc: str | None
     has_default: bool = False
+    is_optional: bool = False
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -50,6 +72,38 @@ class ABIContractMethod:
     client_method_name: str
     deploy_args_class_name: str
     deploy_create_args_class_name: str
+    args_dataclass_name: str
+    # Derived data below is computed once, as every generator pass renders each method
+    signature: str = dataclasses.field(init=False)
+    selector: bytes = dataclasses.field(init=False)
+    method_constant_name: str = dataclasses.field(init=False)
+    args_type: str | None = dataclasses.field(init=False)
+    factory_args_type: str = dataclasses.field(init=False)
+    send_return_type: str = dataclasses.field(init=False)
+    update_send_return_type: str = dataclasses.field(init=False)
+    decode_return_type: str = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self.signature = self.method.get_signature()
+        self.selector = self.method.get_selector()
+        self.method_constant_name = f"_{self.client_method_name.upper()}_METHOD"
+        self.args_type = None
+        self.factory_args_type = "None"
+        if self.args:
+            optional_args_tuple_type = "tuple[{}]".format(
+                ", ".join(f"{arg.python_type} | None" if arg.is_optional else arg.python_type for arg in self.args)
+            )
+            args_tuple_type = "tuple[{}]".format(", ".join(arg.python_type for arg in self.args))
+            self.args_type = f"{optional_args_tuple_type} | {self.args_dataclass_name}"
+            self.factory_args_type = f"{args_tuple_type} | {self.args_dataclass_name}"
+            # Make entire args parameter optional if all args have defaults
+            if all(arg.has_default for arg in self.args):
+                self.args_type = f"{self.args_type} | None = None"
+                self.factory_args_type = f"{self.factory_args_type} | None = None"
+        self.send_return_type = f"algokit_utils.SendAppTransactionResult[{self.python_type}]"
+        self.update_send_return_type = f"algokit_utils.SendAppUpdateTransactionResult[{self.python_type}]"
+        # For void methods, return type should be None | None to match implementation
+        self.decode_return_type = "None" if self.python_type == "None" else f"{self.python_type} | None"
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -112,6 +166,47 @@ class ContractMethods:
             self.create.append(contract_method)
 
 
+@dataclasses.dataclass(kw_only=True)
+class ContractEventArg:
+    name: str
+    abi_type: str
+    python_type: str
+    struct: str | None
+    """The name of the struct in the app spec, if the arg is a struct"""
+
+
+@dataclasses.dataclass(kw_only=True)
+class ContractEvent:
+    """An ARC-28 event emitted by the app"""
+
+    name: str
+    signature: str
+    selector: bytes
+    """The first 4 bytes of the SHA-512/256 hash of the signature, which prefix the event's logs"""
+    class_name: str
+    args: list[ContractEventArg]
+
+
+def group_methods_by_action(methods: ContractMethods) -> dict[tuple[str, str], list[ContractMethod]]:
+    """Index methods by (on_complete action, call config) in a single pass, preserving method order"""
+    result: dict[tuple[str, str], list[ContractMethod]] = {}
+    for method in methods.all_methods:
+        for on_complete in method.on_complete:
+            result.setdefault((on_complete, method.call_config), []).append(method)
+    return result
+
+
+def mark_optional_args(args: list[ContractArg]) -> None:
+    """Mark args with defaults, and transaction args to the left of an app call arg, as optional"""
+    has_appl_to_right = False
+    # Scan args from right to left
+    for arg in reversed(args):
+        is_txn_type = is_abi_transaction_type(arg.abi_type)
+        arg.is_optional = arg.has_default or (has_appl_to_right and is_txn_type)
+        if is_txn_type and arg.abi_type in APPL_TYPE_TXNS:
+            has_appl_to_right = True
+
+
 def group_by_overloads(methods: list[Arc56Method]) -> Iterable[list[Arc56Method]]:
     result: dict[str, list[Arc56Method]] = {}
     for method in methods:
@@ -136,7 +231,7 @@ def find_naming_strategy(methods: list[Arc56Method]) -> Callable[[Arc56Method],
 
 def process_struct_field(  # noqa: PLR0913
     field_def: StructField,
-    used_module_symbols: set[str],
+    used_module_symbols: utils.SymbolScope,
     parent_name: str = "",
     io_type: utils.IOType = utils.IOType.OUTPUT,
     structs: dict[str, "ABIStruct"] | None = None,
@@ -182,7 +277,7 @@ def process_struct_field(  # noqa: PLR0913
 def process_struct(  # noqa: PLR0913
     struct_name: str,
     struct_def: list[StructField],
-    used_module_symbols: set[str],
+    used_module_symbols: utils.SymbolScope,
     io_type: utils.IOType = utils.IOType.OUTPUT,
     structs: dict[str, "ABIStruct"] | None = None,
     sanitizer: utils.Sanitizer | None = None,
@@ -205,9 +300,15 @@ def process_struct(  # noqa: PLR0913
     )
 
 
+def get_nested_struct_name(field: ABIStructField) -> str:
+    """Get the key of the struct a nested field refers to in the structs returned by get_all_structs"""
+    # structs referenced by name are keyed by their ABI name, implicit nested structs by their class name
+    return field.abi_type if isinstance(field.abi_type, str) else field.python_type
+
+
 def get_all_structs(  # noqa: C901
     app_spec: Arc56Contract,
-    used_module_symbols: set[str],
+    used_module_symbols: utils.SymbolScope,
     sanitizer: utils.Sanitizer | None = None,
 ) -> dict[str, ABIStruct]:
     """Extract all structs from app spec, whether used in methods or not"""
@@ -228,7 +329,7 @@ def get_all_structs(  # noqa: C901
     for struct in flat_structs.values():
         for field in struct.fields:
             if field.is_nested and field.is_implicit and isinstance(field.abi_type, list):
-                name_identifier = sanitizer.make_safe_type_identifier(f"{struct.abi_name}_{field.name}")
+                name_identifier = get_nested_struct_name(field)
                 nested_struct = ABIStruct(
                     abi_name=name_identifier,
                     struct_class_name=name_identifier,
@@ -255,13 +356,95 @@ def get_all_structs(  # noqa: C901
     return dict(sorted(structs.items(), key=lambda x: x[0]))
 
 
-def get_contract_methods(
+StructShape = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def get_struct_shape(struct: ABIStruct) -> StructShape:
+    """Identify a struct by its class name and the names and types of its fields"""
+    return struct.struct_class_name, tuple((field.name, field.python_type) for field in struct.fields)
+
+
+@dataclasses.dataclass(kw_only=True)
+class SharedStructs:
+    """Structs emitted once in a shared module and imported by each generated client"""
+
+    module: str
+    structs: list[ABIStruct]  # ordered so nested structs are defined before the structs that use them
+    shapes: set[StructShape] = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        self.shapes = {get_struct_shape(struct) for struct in self.structs}
+
+    def __contains__(self, struct: object) -> bool:
+        return isinstance(struct, ABIStruct) and get_struct_shape(struct) in self.shapes
+
+
+def find_shared_structs(struct_sets: Iterable[dict[str, ABIStruct]], module: str) -> SharedStructs:  # noqa: C901
+    """Find structs with an identical shape in more than one set of structs"""
+    struct_sets = list(struct_sets)
+    occurrences: dict[StructShape, list[tuple[int, ABIStruct]]] = {}
+    for idx, structs in enumerate(struct_sets):
+        for struct in structs.values():
+            occurrences.setdefault(get_struct_shape(struct), []).append((idx, struct))
+
+    candidates = {shape for shape, found in occurrences.items() if len({idx for idx, _ in found}) > 1}
+
+    # Different shapes can't share a class name in the same module, so leave those local to each client
+    class_names: dict[str, int] = {}
+    for class_name, _ in candidates:
+        class_names[class_name] = class_names.get(class_name, 0) + 1
+    candidates = {shape for shape in candidates if class_names[shape[0]] == 1}
+
+    def get_nested_shapes(shape: StructShape) -> Iterable[StructShape | None]:
+        for idx, struct in occurrences[shape]:
+            for field in struct.fields:
+                if field.is_nested:
+                    nested = struct_sets[idx].get(get_nested_struct_name(field))
+                    yield get_struct_shape(nested) if nested else None
+
+    # A struct can only be shared if every struct it references is shared too
+    changed = True
+    while changed:
+        changed = False
+        for shape in sorted(candidates):
+            if any(nested not in candidates for nested in get_nested_shapes(shape)):
+                candidates.remove(shape)
+                changed = True
+
+    ordered: list[ABIStruct] = []
+    visited: set[StructShape] = set()
+
+    def visit(shape: StructShape) -> None:
+        if shape in visited:
+            return
+        visited.add(shape)
+        for nested in get_nested_shapes(shape):
+            if nested:
+                visit(nested)
+        ordered.append(occurrences[shape][0][1])
+
+    for shape in sorted(candidates):
+        visit(shape)
+
+    return SharedStructs(module=module, structs=ordered)
+
+
+def get_contract_methods(  # noqa: PLR0913
     app_spec: Arc56Contract,
     structs: dict[str, ABIStruct],
-    used_module_symbols: set[str],
-    used_client_symbols: set[str],
+    used_module_symbols: utils.SymbolScope,
+    used_client_symbols: utils.SymbolScope,
+    sanitizer: utils.Sanitizer | None = None,
+    *,
+    overloaded_method_names: Collection[str] = (),
 ) -> ContractMethods:
+    """Get the methods of the app spec
+
+    :param overloaded_method_names: Names of methods that are named by their signature even when the app spec only
+        has one method with that name, e.g. because its overloads were filtered out
+    """
     result = ContractMethods()
+    sanitizer = sanitizer or utils.get_sanitizer(preserve_names=False)
 
     def get_type_for_value(value_type: str, io_type: utils.IOType = utils.IOType.OUTPUT) -> str:
         """Helper to get Python type for a value, handling struct references"""
@@ -279,7 +462,9 @@ def get_contract_methods(
         methods_by_name.setdefault(method.name, []).append(method)
 
     for methods in methods_by_name.values():
-        naming_strategy = find_naming_strategy(methods)
+        naming_strategy = (
+            use_method_signature if methods[0].name in overloaded_method_names else find_naming_strategy(methods)
+        )
         for method in methods:
             method_name = naming_strategy(method)
             args_class_name = utils.get_unique_symbol_by_incrementing(
@@ -303,6 +488,22 @@ def get_contract_methods(
                     method_structs.append(abi_struct)
                     parameter_type_map[arg.name or f"arg{len(parameter_type_map)}"] = abi_struct.struct_class_name
 
+            contract_args = [
+                ContractArg(
+                    name=arg.name or f"arg{idx}",
+                    abi_type=arg.type,
+                    python_type=parameter_type_map.get(arg.name or f"arg{idx}")
+                    or get_type_for_value(arg.type, utils.IOType.INPUT),
+                    desc=arg.desc,
+                    has_default=arg.default_value is not None,
+                )
+                for idx, arg in enumerate(method.args)
+            ]
+            mark_optional_args(contract_args)
+            client_method_name = utils.get_unique_symbol_by_incrementing(
+                used_client_symbols, utils.get_method_name(method_name)
+            )
+
             # Create ABIContractMethod
             abi = ABIContractMethod(
                 method=method.to_abi_method(),
@@ -313,23 +514,12 @@ def get_contract_methods(
                 else get_type_for_value(method.returns.type),
                 result_struct=result_struct,
                 structs=method_structs,
-                args=[
-                    ContractArg(
-                        name=arg.name or f"arg{idx}",
-                        abi_type=arg.type,
-                        python_type=parameter_type_map.get(arg.name or f"arg{idx}")
-                        or get_type_for_value(arg.type, utils.IOType.INPUT),
-                        desc=arg.desc,
-                        has_default=arg.default_value is not None,
-                    )
-                    for idx, arg in enumerate(method.args)
-                ],
+                args=contract_args,
                 args_class_name=args_class_name,
                 deploy_args_class_name=f"Deploy[{args_class_name}]",
                 deploy_create_args_class_name=f"DeployCreate[{args_class_name}]",
-                client_method_name=utils.get_unique_symbol_by_incrementing(
-                    used_client_symbols, utils.get_method_name(method_name)
-                ),
+                client_method_name=client_method_name,
+                args_dataclass_name=f"{sanitizer.make_safe_type_identifier(client_method_name)}Args",
             )
 
             # Get method actions
@@ -338,15 +528,137 @@ def get_contract_methods(
     return result
 
 
+def get_contract_events(
+    app_spec: Arc56Contract,
+    structs: dict[str, ABIStruct],
+    used_module_symbols: utils.SymbolScope,
+    sanitizer: utils.Sanitizer | None = None,
+) -> list[ContractEvent]:
+    """Get the ARC-28 events of the app spec, and those emitted by its methods, once per signature"""
+    sanitizer = sanitizer or utils.get_sanitizer(preserve_names=False)
+    events: dict[str, ContractEvent] = {}
+    for event in itertools.chain(app_spec.events or [], *(method.events or [] for method in app_spec.methods)):
+        args = []
+        arg_names = utils.SymbolScope()
+        for idx, arg in enumerate(event.args):
+            arg_name = sanitizer.make_safe_variable_identifier(arg.name or f"arg{idx}")
+            abi_type = arg.type
+            # Struct args are usually their tuple type with the struct name alongside, but can be the struct name
+            if abi_type in app_spec.structs:
+                abi_type = str(
+                    get_abi_tuple_type_from_abi_struct_definition(app_spec.structs[abi_type], app_spec.structs)
+                )
+            struct = structs.get(arg.struct or arg.type)
+            args.append(
+                ContractEventArg(
+                    name=arg_names.allocate(f"{arg_name}_" if keyword.iskeyword(arg_name) else arg_name),
+                    abi_type=abi_type,
+                    python_type=struct.struct_class_name if struct else utils.map_abi_type_to_python(abi_type),
+                    struct=struct.abi_name if struct else None,
+                )
+            )
+        signature = f"{event.name}({','.join(arg.abi_type for arg in args)})"
+        if signature in events:
+            continue
+        events[signature] = ContractEvent(
+            name=event.name,
+            signature=signature,
+            selector=hashlib.new("sha512_256", signature.encode("utf-8")).digest()[:4],
+            class_name=utils.get_unique_symbol_by_incrementing(
+                used_module_symbols, sanitizer.make_safe_type_identifier(f"{event.name}_event"), sanitizer=sanitizer
+            ),
+            args=args,
+        )
+    return list(events.values())
+
+
+def get_overloaded_method_names(methods: Iterable[Arc56Method]) -> set[str]:
+    """Get the names shared by more than one method"""
+    name_counts = collections.Counter(method.name for method in methods)
+    return {name for name, count in name_counts.items() if count > 1}
+
+
+def filter_methods(app_spec: Arc56Contract, method_filter: MethodFilter) -> None:
+    """Remove the methods that aren't selected by method_filter from app_spec, along with the structs that only
+    those methods use"""
+    kept_methods: list[Arc56Method] = []
+    removed_methods: list[Arc56Method] = []
+    signatures: dict[int, str] = {}
+    for method in app_spec.methods:
+        signature = method.to_abi_method().get_signature()
+        signatures[id(method)] = signature
+        actions = [
+            _map_enum_to_property(action.value if isinstance(action, CallEnum | CreateEnum) else action)
+            for action in itertools.chain(method.actions.call or [], method.actions.create or [])
+        ]
+        if method_filter.matches(method.name, signature, actions):
+            kept_methods.append(method)
+        else:
+            removed_methods.append(method)
+
+    for pattern in method_filter.include:
+        if not any(match_method(pattern, method.name, signatures[id(method)]) for method in app_spec.methods):
+            logger.warning(f"Method filter '{pattern}' doesn't match any methods of {app_spec.name}")
+    if not removed_methods:
+        return
+
+    removed_struct_names = {name for method in removed_methods for name in _get_method_struct_names(method)}
+    struct_roots = (set(app_spec.structs) - removed_struct_names).union(
+        (name for method in kept_methods for name in _get_method_struct_names(method)),
+        (
+            type_name
+            for storage in itertools.chain(_get_storage(app_spec.state.keys), _get_storage(app_spec.state.maps))
+            for type_name in (storage.key_type, storage.value_type)
+        ),
+        (arg.struct for event in app_spec.events or [] for arg in event.args if arg.struct),
+    )
+    used_struct_names = _get_referenced_struct_names(app_spec.structs, struct_roots)
+    app_spec.methods = kept_methods
+    app_spec.structs = {name: fields for name, fields in app_spec.structs.items() if name in used_struct_names}
+
+
+def _get_method_struct_names(method: Arc56Method) -> Iterable[str]:
+    if method.returns.struct:
+        yield method.returns.struct
+    yield from (arg.struct for arg in method.args if arg.struct)
+    yield from (arg.struct for event in method.events or [] for arg in event.args if arg.struct)
+
+
+def _get_storage(storage: Keys | Maps) -> Iterable[StorageKey | StorageMap]:
+    return itertools.chain(storage.global_state.values(), storage.local_state.values(), storage.box.values())
+
+
+def _get_referenced_struct_names(struct_defs: dict[str, list[StructField]], roots: Iterable[str]) -> set[str]:
+    """Get the names of the structs in roots, and those their fields reference, recursively"""
+    referenced: set[str] = set()
+    pending = [name for name in roots if name in struct_defs]
+    while pending:
+        name = pending.pop()
+        if name in referenced:
+            continue
+        referenced.add(name)
+        fields = list(struct_defs[name])
+        while fields:
+            field = fields.pop()
+            if isinstance(field.type, list):
+                fields.extend(field.type)
+            elif field.type in struct_defs:
+                pending.append(field.type)
+    return referenced
+
+
 def load_from_json(path: Path) -> Arc56Contract:
     try:
         raw_json = path.read_text()
+        json_spec = json.loads(raw_json)
 
-        if "contract" in json.loads(raw_json):
+        if "contract" in json_spec:
             arc32 = Arc32Contract.from_json(raw_json)
             return Arc56Contract.from_arc32(arc32)
         else:
-            return Arc56Contract.from_json(raw_json)
+            # Use the already parsed spec rather than parsing the JSON again
+            del raw_json
+            return Arc56Contract.from_dict(json_spec)
     except Exception as ex:
         raise ValueError("Invalid application.json") from ex
 
@@ -367,7 +679,7 @@ def _map_enum_to_property(enum_value: str) -> str:
     return result
 
 
-def _flatten_structs_from_spec(app_spec: Arc56Contract, used_module_symbols: set[str]) -> dict[str, ABIStruct]:
+def _flatten_structs_from_spec(app_spec: Arc56Contract, used_module_symbols: utils.SymbolScope) -> dict[str, ABIStruct]:
     structs: dict[str, ABIStruct] = {}
     unprocessed_structs = set(app_spec.structs.keys())
 
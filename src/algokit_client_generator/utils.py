@@ -1,5 +1,6 @@
+import functools
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from enum import Enum
 from typing import TYPE_CHECKING, Protocol
 
@@ -13,6 +14,13 @@ if TYPE_CHECKING:
 
 NEW_LINE = "\n"
 
+_INVALID_IDENTIFIER_CHARS = re.compile(r"[^a-z0-9_$]+", re.IGNORECASE)
+_QUOTE_CHARS = re.compile(r'[\'"]')
+_ENCLOSING_QUOTES = re.compile(r'^"|"$')
+_SAFE_VARIABLE_IDENTIFIER = re.compile(r"^[a-z$_][a-z0-9_$]*$", re.IGNORECASE)
+_WORD_PARTS = re.compile("[A-Z][a-z]+|[0-9A-Z]+(?=[A-Z][a-z])|[0-9A-Z]{2,}|[a-z0-9]{2,}|[a-zA-Z0-9]")
+_IDENTIFIER_CACHE_SIZE = 4096
+
 
 class Sanitizer(Protocol):
     def make_safe_type_identifier(self, value: str) -> str:
@@ -46,34 +54,30 @@ class Sanitizer(Protocol):
 
 class BaseSanitizer:
     def replace_invalid_with_underscore(self, value: str) -> str:
-        return re.sub(r"[^a-z0-9_$]+", "_", value, flags=re.IGNORECASE)
+        return _INVALID_IDENTIFIER_CHARS.sub("_", value)
 
     def escape_quotes(self, value: str) -> str:
-        return re.sub(r'[\'"]', lambda m: f"\\{m.group(0)}", value)
+        return _QUOTE_CHARS.sub(lambda m: f"\\{m.group(0)}", value)
 
     def remove_enclosing_quotes(self, value: str) -> str:
-        return re.sub(r'^"|"$', "", value)
+        return _ENCLOSING_QUOTES.sub("", value)
 
     def is_safe_variable_identifier(self, value: str) -> bool:
-        return bool(re.match(r"^[a-z$_][a-z0-9_$]*$", value, re.IGNORECASE))
+        return _is_safe_variable_identifier(value)
 
 
 class DefaultSanitizer(BaseSanitizer):
     def make_safe_property_identifier(self, value: str) -> str:
-        safe_value = self.replace_invalid_with_underscore(value)
-        return to_snake_case(safe_value)
+        return _to_safe_snake_case(value)
 
     def make_safe_type_identifier(self, value: str) -> str:
-        safe_value = self.replace_invalid_with_underscore(value)
-        return to_pascal_case(safe_value)
+        return _to_safe_pascal_case(value)
 
     def make_safe_method_identifier(self, value: str) -> str:
-        safe_value = self.replace_invalid_with_underscore(value)
-        return to_snake_case(safe_value)
+        return _to_safe_snake_case(value)
 
     def make_safe_variable_identifier(self, value: str) -> str:
-        safe_value = self.replace_invalid_with_underscore(value)
-        return to_snake_case(safe_value)
+        return _to_safe_snake_case(value)
 
     def make_safe_string_type_literal(self, value: str) -> str:
         return self.escape_quotes(value)
@@ -110,12 +114,34 @@ class PreservingSanitizer(BaseSanitizer):
         return f"['{self.remove_enclosing_quotes(value)}']"
 
 
+# Sanitizers are stateless, so a single instance of each is shared
+_DEFAULT_SANITIZER = DefaultSanitizer()
+_PRESERVING_SANITIZER = PreservingSanitizer()
+
+
 def get_sanitizer(*, preserve_names: bool = False) -> Sanitizer:
     """Get appropriate sanitizer based on configuration"""
-    return PreservingSanitizer() if preserve_names else DefaultSanitizer()
+    return _PRESERVING_SANITIZER if preserve_names else _DEFAULT_SANITIZER
+
+
+# Identifier conversions are repeated for every method by each generator, so their results are memoized
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
+def _is_safe_variable_identifier(value: str) -> bool:
+    return bool(_SAFE_VARIABLE_IDENTIFIER.match(value))
+
+
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
+def _to_safe_snake_case(value: str) -> str:
+    return to_snake_case(_INVALID_IDENTIFIER_CHARS.sub("_", value))
+
+
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
+def _to_safe_pascal_case(value: str) -> str:
+    return to_pascal_case(_INVALID_IDENTIFIER_CHARS.sub("_", value))
 
 
 # Helper functions
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def to_pascal_case(value: str) -> str:
     """Convert string to PascalCase, handling both snake_case and existing PascalCase inputs"""
     # First split on underscores
@@ -128,6 +154,7 @@ def to_pascal_case(value: str) -> str:
     return "".join(word.capitalize() for word in split_words)
 
 
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def to_snake_case(text: str) -> str:
     """Convert string to snake_case"""
     return "_".join([c.lower() for c in get_parts(text)]).lstrip("_")
@@ -140,33 +167,49 @@ class IOType(Enum):
 
 def get_parts(value: str) -> list[str]:
     """Splits value into a list of words, with boundaries at _, and transitions between casing"""
-    return re.findall("[A-Z][a-z]+|[0-9A-Z]+(?=[A-Z][a-z])|[0-9A-Z]{2,}|[a-z0-9]{2,}|[a-zA-Z0-9]", value)
+    return _WORD_PARTS.findall(value)
 
 
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def get_class_name(name: str, string_suffix: str = "") -> str:
-    sanitizer = get_sanitizer(preserve_names=False)
-    base_name = sanitizer.make_safe_type_identifier(name)
+    base_name = _DEFAULT_SANITIZER.make_safe_type_identifier(name)
     if string_suffix:
-        suffix = sanitizer.make_safe_type_identifier(string_suffix)
+        suffix = _DEFAULT_SANITIZER.make_safe_type_identifier(string_suffix)
         return f"{base_name}{suffix}"
     return base_name
 
 
+@functools.lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def get_method_name(name: str, string_suffix: str = "") -> str:
-    sanitizer = get_sanitizer(preserve_names=False)
-    base_name = sanitizer.make_safe_method_identifier(name)
+    base_name = _DEFAULT_SANITIZER.make_safe_method_identifier(name)
     if string_suffix:
-        suffix = sanitizer.make_safe_method_identifier(string_suffix)
+        suffix = _DEFAULT_SANITIZER.make_safe_method_identifier(string_suffix)
         return f"{base_name}_{suffix}"
     return base_name
 
 
+def get_identifier_cache_info() -> tuple[int, int]:
+    """Get the total (hits, misses) of the memoized identifier conversions"""
+    infos = [
+        function.cache_info()
+        for function in (
+            _is_safe_variable_identifier,
+            _to_safe_snake_case,
+            _to_safe_pascal_case,
+            to_pascal_case,
+            to_snake_case,
+            get_class_name,
+            get_method_name,
+        )
+    ]
+    return sum(info.hits for info in infos), sum(info.misses for info in infos)
+
+
 def get_struct_name(struct_name: str) -> str:
     if not struct_name.startswith("{"):
         return struct_name
-    sanitizer = get_sanitizer(preserve_names=False)
     cleaned = struct_name.replace("{", "").replace("}", "").strip()
-    return sanitizer.make_safe_type_identifier(cleaned)
+    return _DEFAULT_SANITIZER.make_safe_type_identifier(cleaned)
 
 
 def abi_type_to_python(abi_type: abi.ABIType, io_type: IOType = IOType.OUTPUT) -> str:  # noqa: PLR0911, C901, PLR0912  # type: ignore[PLR0911]
@@ -232,13 +275,58 @@ def map_abi_type_to_python(  # noqa: C901, PLR0911
                 raise ValueError(f"Unknown ABI type: {abi_type_str}") from e
 
 
+class SymbolScope:
+    """A set of used symbols that hands out unique names by incrementing a number suffix.
+
+    The next candidate suffix is remembered per base name, so repeated requests for the same base name
+    don't re-probe every previously allocated symbol.
+    """
+
+    def __init__(self, symbols: Iterable[str] = ()):
+        self._symbols = set(symbols)
+        self._next_suffix: dict[str, int] = {}
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._symbols
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def add(self, symbol: str) -> None:
+        self._symbols.add(symbol)
+
+    def allocate(self, base_name: str) -> str:
+        """Reserve and return `base_name`, or `base_name` with the lowest free number suffix"""
+        # symbols are never released, so every suffix below the remembered one is already taken
+        suffix = self._next_suffix.get(base_name, 0)
+        while True:
+            symbol = f"{base_name}{suffix or ''}"
+            if symbol not in self._symbols:
+                break
+            suffix += 1
+        self._symbols.add(symbol)
+        self._next_suffix[base_name] = suffix + 1
+        return symbol
+
+
+class SymbolAllocator:
+    """Tracks the module level and client level symbol scopes of a generated client"""
+
+    def __init__(self, *, module_symbols: Iterable[str] = (), client_symbols: Iterable[str] = ()):
+        self.module = SymbolScope(module_symbols)
+        self.client = SymbolScope(client_symbols)
+
+
 def get_unique_symbol_by_incrementing(
-    existing_symbols: set[str], base_name: str, sanitizer: Sanitizer | None = None
+    existing_symbols: set[str] | SymbolScope, base_name: str, sanitizer: Sanitizer | None = None
 ) -> str:
     """Get a unique symbol by incrementing a number suffix if needed"""
-    if sanitizer is None:
-        sanitizer = get_sanitizer(preserve_names=False)
-    base_name = sanitizer.make_safe_string_type_literal(base_name)
+    base_name = (sanitizer or _DEFAULT_SANITIZER).make_safe_string_type_literal(base_name)
+    if isinstance(existing_symbols, SymbolScope):
+        return existing_symbols.allocate(base_name)
     suffix = 0
     while True:
         suffix_str = str(suffix) if suffix else ""
@@ -0,0 +1,84 @@
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+FileState = tuple[int, int]  # (modified time in ns, size in bytes)
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+
+
+def get_file_states(paths: Iterable[Path]) -> dict[Path, FileState]:
+    """Get the modified time and size of each path that currently exists"""
+    states = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        states[path] = (stat.st_mtime_ns, stat.st_size)
+    return states
+
+
+def get_changed_paths(previous: Mapping[Path, FileState], current: Mapping[Path, FileState]) -> list[Path]:
+    """Get the paths that are new or modified in current compared to previous"""
+    return [path for path, state in current.items() if previous.get(path) != state]
+
+
+def watch(
+    get_targets: Callable[[], Mapping[Path, Path]],
+    regenerate: Callable[[Mapping[Path, Path]], None],
+    *,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+    sleep: Callable[[float], None] = time.sleep,
+) -> None:
+    """Regenerate clients whenever their application specifications change, until interrupted
+
+    :param get_targets: Returns the application specifications to watch, mapped to their output paths. Called on
+        every poll so new specifications are picked up
+    :param regenerate: Generates the clients for the given application specifications and output paths
+    :param float poll_interval: Seconds between checks for changes
+    :param float debounce: Seconds a changed file must remain unchanged before it is regenerated, so that bursts of
+        writes from a compiler only trigger a single regeneration
+    :param sleep: Waits for the given number of seconds, e.g. a fake clock in tests
+    """
+    targets = get_targets()
+    states = get_file_states(targets)
+    _regenerate(regenerate, targets)
+    logger.info(f"Watching {len(targets)} application specification(s) for changes, press Ctrl+C to stop")
+
+    try:
+        while True:
+            sleep(poll_interval)
+            targets = get_targets()
+            current = get_file_states(targets)
+            changed = get_changed_paths(states, current)
+            if not changed:
+                states = current
+                continue
+            # Wait for writes to settle before regenerating
+            while True:
+                sleep(debounce)
+                settled = get_file_states(targets)
+                if settled == current:
+                    break
+                changed.extend(path for path in get_changed_paths(current, settled) if path not in changed)
+                current = settled
+            states = current
+            _regenerate(regenerate, {path: targets[path] for path in changed if path in current})
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+
+
+def _regenerate(regenerate: Callable[[Mapping[Path, Path]], None], targets: Mapping[Path, Path]) -> None:
+    if not targets:
+        return
+    try:
+        regenerate(targets)
+    except Exception as ex:
+        # Keep watching, the specification may be fixed by a subsequent write
+        logger.error(f"Failed to generate client: {ex}")
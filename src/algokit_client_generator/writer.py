@@ -1,27 +1,507 @@
+import filecmp
+import functools
 import logging
+import shutil
+import sys
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from algokit_client_generator.context import GeneratorContext
-from algokit_client_generator.document import DocumentParts, RenderContext, convert_part
+from algokit_client_generator.document import DocumentParts, RenderContext, convert_part, iter_converted_parts
+from algokit_client_generator.filters import MethodFilter
 from algokit_client_generator.generator import generate
-from algokit_client_generator.spec import load_from_json
+from algokit_client_generator.generators.shared_structs import generate_shared_structs
+from algokit_client_generator.manifest import ManifestEntry
+from algokit_client_generator.modes import get_mode_output_paths
+from algokit_client_generator.package import PACKAGE_MODULES, render_package
+from algokit_client_generator.report import ClientReport, Measurements, new_report
+from algokit_client_generator.spec import (
+    SharedStructs,
+    StructShape,
+    find_shared_structs,
+    get_struct_shape,
+    load_from_json,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def generate_client(input_path: Path, output_path: Path, *, preserve_names: bool = False, mode: str = "full") -> None:
+def generate_client(  # noqa: PLR0913
+    input_path: Path,
+    output_path: Path,
+    *,
+    preserve_names: bool = False,
+    mode: str = "full",
+    low_memory: bool = False,
+    method_filter: MethodFilter | None = None,
+    reports: list[ClientReport] | None = None,
+) -> bool:
     """Given a path to an ARC-32 application.json, output a typed python client
 
     :param Path input_path: Path to an ARC-32 application.json
     :param Path output_path: Path to write a typed python client to
     :param bool preserve_names: Preserve original names for structs and methods
     :param str mode: Generation mode - "full" or "minimal"
+    :param bool low_memory: Reduce peak memory usage at the cost of speed, by not copying the app spec and
+        streaming the client to output_path rather than rendering it in memory first
+    :param MethodFilter | None method_filter: If provided, only generate the selected methods, along with the structs
+        they use
+    :param reports: If provided, a report with metrics for generating the client is appended to it
+    :return: True if the client was written, False if output_path already contained the identical client
     """
-    app_spec = load_from_json(input_path)
-    context = GeneratorContext(app_spec, preserve_names=preserve_names, mode=mode)
-    output = render(generate(context))
-    output_path.write_text(output, encoding="utf-8")
-    logger.info(f"Output typed client for {app_spec.name} to {output_path}")
+    written = generate_client_modes(
+        input_path,
+        {mode: output_path},
+        preserve_names=preserve_names,
+        low_memory=low_memory,
+        method_filter=method_filter,
+        reports=reports,
+    )
+    return written[mode]
+
+
+def generate_client_modes(  # noqa: PLR0913
+    input_path: Path,
+    output_paths: Mapping[str, Path],
+    *,
+    preserve_names: bool = False,
+    low_memory: bool = False,
+    method_filter: MethodFilter | None = None,
+    reports: list[ClientReport] | None = None,
+) -> dict[str, bool]:
+    """Given a path to an ARC-32 application.json, output a typed python client for each of several modes
+
+    The application.json is only loaded and processed once, and shared by the clients for each mode.
+
+    :param Path input_path: Path to an ARC-32 application.json
+    :param output_paths: The path to write a typed python client to for each generation mode, e.g.
+        {"full": Path("client.py"), "minimal": Path("client_minimal.py")}
+    :param bool preserve_names: Preserve original names for structs and methods
+    :param bool low_memory: Reduce peak memory usage at the cost of speed, see `generate_client`
+    :param MethodFilter | None method_filter: If provided, only generate the selected methods, see `generate_client`
+    :param reports: If provided, a report with metrics for generating each client is appended to it
+    :return: Whether the client for each mode was written
+    """
+    if not output_paths:
+        return {}
+    modes = list(output_paths)
+    measurements = Measurements()
+    context = _load_context(
+        input_path,
+        measurements,
+        preserve_names=preserve_names,
+        mode=modes[0],
+        low_memory=low_memory,
+        method_filter=method_filter,
+    )
+    return {
+        mode: _write_client(context.with_mode(mode), output_paths[mode], measurements, input_path, reports)
+        for mode in modes
+    }
+
+
+def generate_client_package(
+    input_path: Path,
+    output_dir: Path,
+    *,
+    preserve_names: bool = False,
+    mode: str = "full",
+    method_filter: MethodFilter | None = None,
+) -> bool:
+    """Given a path to an ARC-32 application.json, output a typed python client as a package of modules
+
+    The package has separate modules for the app spec, structs, state, client, composer and factory, and its
+    `__init__` imports each module when one of its names is first used, so only the parts that are used are loaded.
+
+    :param Path input_path: Path to an ARC-32 application.json
+    :param Path output_dir: Path to the package directory to write the modules to
+    :param bool preserve_names: Preserve original names for structs and methods
+    :param str mode: Generation mode - "full" or "minimal"
+    :param MethodFilter | None method_filter: If provided, only generate the selected methods, see `generate_client`
+    :return: True if any module was written or removed, False if output_dir already contained the identical package
+    """
+    context = GeneratorContext(
+        load_from_json(input_path), preserve_names=preserve_names, mode=mode, method_filter=method_filter
+    )
+    files = render_package(context)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = [write_if_changed(output_dir / file_name, content) for file_name, content in files.items()]
+    # Remove modules from a previous generation that are no longer generated, e.g. the factory in minimal mode
+    for module in PACKAGE_MODULES:
+        stale_path = output_dir / f"{module}.py"
+        if stale_path.name not in files and stale_path.exists():
+            stale_path.unlink()
+            written.append(True)
+    if any(written):
+        logger.info(f"Output typed client package for {context.app_spec.name} to {output_dir}")
+    else:
+        logger.info(f"Typed client package for {context.app_spec.name} in {output_dir} is unchanged")
+    return any(written)
+
+
+def generate_clients(  # noqa: PLR0913
+    clients: Iterable[tuple[Path, Path]],
+    *,
+    preserve_names: bool = False,
+    mode: str | Sequence[str] = "full",
+    shared_structs_path: Path | None = None,
+    shared_structs_module: str | None = None,
+    low_memory: bool = False,
+    method_filter: MethodFilter | None = None,
+    reports: list[ClientReport] | None = None,
+) -> None:
+    """Given pairs of application.json and output paths, output a typed python client for each
+
+    :param clients: Pairs of paths to an application.json and the typed python client to write for it
+    :param bool preserve_names: Preserve original names for structs and methods
+    :param str | Sequence[str] mode: Generation mode - "full" or "minimal", or several modes to generate a client
+        for each, see `get_mode_output_paths` for where each is written
+    :param Path | None shared_structs_path: If provided, structs with an identical shape in more than one
+        application.json are written once to this path and imported by the clients instead
+    :param str | None shared_structs_module: The module name clients use to import the shared structs,
+        required when shared_structs_path is provided
+    :param bool low_memory: Reduce peak memory usage at the cost of speed, see `generate_client`. Without shared
+        structs, each application.json is released before the next is loaded
+    :param MethodFilter | None method_filter: If provided, only generate the selected methods, see `generate_client`
+    :param reports: If provided, a report with metrics for generating each client is appended to it
+    """
+    modes = [mode] if isinstance(mode, str) else list(mode)
+    if shared_structs_path is None:
+        written: list[bool] = []
+        for input_path, output_path in clients:
+            output_paths = get_mode_output_paths(output_path, modes)
+            written.extend(
+                generate_client_modes(
+                    input_path,
+                    output_paths,
+                    preserve_names=preserve_names,
+                    low_memory=low_memory,
+                    method_filter=method_filter,
+                    reports=reports,
+                ).values()
+            )
+        _log_summary(written)
+        return
+    if not shared_structs_module:
+        raise ValueError("shared_structs_module is required when shared_structs_path is provided")
+
+    contexts = []
+    for input_path, output_path in clients:
+        measurements = Measurements()
+        context = _load_context(
+            input_path,
+            measurements,
+            preserve_names=preserve_names,
+            mode=modes[0],
+            low_memory=low_memory,
+            method_filter=method_filter,
+        )
+        contexts.append((context, input_path, output_path, measurements))
+    # structs are only emitted by clients with ABI methods
+    shared_structs = _find_shared_structs([context for context, *_ in contexts], shared_structs_module)
+    _write_shared_structs(shared_structs_path, shared_structs)
+
+    written = []
+    for context, input_path, output_path, measurements in contexts:
+        context.shared_structs = shared_structs
+        for client_mode, mode_output_path in get_mode_output_paths(output_path, modes).items():
+            written.append(
+                _write_client(context.with_mode(client_mode), mode_output_path, measurements, input_path, reports)
+            )
+    _log_summary(written)
+
+
+class WatchedClients:
+    """Generates the clients of watched application specifications, keeping each parsed specification between runs
+
+    Only the specifications that changed are parsed again. With shared structs, the shared structs module depends
+    on every specification, so each run also regenerates the clients that use a shared struct whose shape changed,
+    but not the other clients.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        get_targets: Callable[[], Mapping[Path, Path]],
+        *,
+        preserve_names: bool = False,
+        modes: Sequence[str] = ("full",),
+        shared_structs_path: Path | None = None,
+        shared_structs_module: str | None = None,
+        method_filter: MethodFilter | None = None,
+    ):
+        """
+        :param get_targets: Returns every watched application specification, mapped to its output path
+        :param bool preserve_names: Preserve original names for structs and methods
+        :param Sequence[str] modes: The modes to generate each client in, see `generate_clients`
+        :param Path | None shared_structs_path: If provided, structs shared by several clients are written here, see
+            `generate_clients`
+        :param str | None shared_structs_module: The module name clients import the shared structs from
+        :param MethodFilter | None method_filter: If provided, only generate the selected methods
+        """
+        if shared_structs_path is not None and not shared_structs_module:
+            raise ValueError("shared_structs_module is required when shared_structs_path is provided")
+        self._get_targets = get_targets
+        self._preserve_names = preserve_names
+        self._modes = list(modes)
+        self._shared_structs_path = shared_structs_path
+        self._shared_structs_module = shared_structs_module
+        self._method_filter = method_filter
+        self._contexts: dict[Path, GeneratorContext] = {}
+        self._shared_structs: SharedStructs | None = None
+
+    def regenerate(self, changed: Mapping[Path, Path]) -> None:
+        """Regenerate the clients of the changed application specifications, and the clients that depend on them"""
+        if self._shared_structs_path is None or self._shared_structs_module is None:
+            generate_clients(
+                changed.items(),
+                preserve_names=self._preserve_names,
+                mode=self._modes,
+                method_filter=self._method_filter,
+            )
+            return
+
+        targets = self._get_targets()
+        reloaded = {input_path for input_path in targets if input_path in changed or input_path not in self._contexts}
+        contexts = {
+            input_path: self._load(input_path) if input_path in reloaded else self._contexts[input_path]
+            for input_path in targets
+        }
+        self._contexts = contexts
+        previous_shared_structs = self._shared_structs
+        shared_structs = _find_shared_structs(list(contexts.values()), self._shared_structs_module)
+        _write_shared_structs(self._shared_structs_path, shared_structs)
+        self._shared_structs = shared_structs
+
+        written = []
+        for input_path, output_path in targets.items():
+            context = contexts[input_path]
+            if input_path not in reloaded and _get_shared_shapes(context, previous_shared_structs) == (
+                _get_shared_shapes(context, shared_structs)
+            ):
+                continue
+            context.shared_structs = shared_structs
+            for client_mode, mode_output_path in get_mode_output_paths(output_path, self._modes).items():
+                written.append(
+                    _write_client(context.with_mode(client_mode), mode_output_path, Measurements(), input_path, None)
+                )
+        _log_summary(written)
+
+    def _load(self, input_path: Path) -> GeneratorContext:
+        return _load_context(
+            input_path,
+            Measurements(),
+            preserve_names=self._preserve_names,
+            mode=self._modes[0],
+            low_memory=False,
+            method_filter=self._method_filter,
+        )
+
+
+def _find_shared_structs(contexts: Sequence[GeneratorContext], shared_structs_module: str) -> SharedStructs:
+    # structs are only emitted by clients with ABI methods
+    return find_shared_structs(
+        (context.structs for context in contexts if context.methods.has_abi_methods), shared_structs_module
+    )
+
+
+def _write_shared_structs(shared_structs_path: Path, shared_structs: SharedStructs) -> None:
+    shared_structs_path.parent.mkdir(parents=True, exist_ok=True)
+    if write_if_changed(shared_structs_path, render(generate_shared_structs(shared_structs))):
+        logger.info(f"Output {len(shared_structs.structs)} shared structs to {shared_structs_path}")
+    else:
+        logger.info(f"Shared structs in {shared_structs_path} are unchanged")
+
+
+def _get_shared_shapes(context: GeneratorContext, shared_structs: SharedStructs | None) -> frozenset[StructShape]:
+    """Get the shapes of the structs of a client that are imported from the shared structs module"""
+    if shared_structs is None:
+        return frozenset()
+    return frozenset(get_struct_shape(struct) for struct in context.structs.values() if struct in shared_structs)
+
+
+def generate_manifest_clients(
+    entries: Sequence[ManifestEntry], *, jobs: int = 1, reports: list[ClientReport] | None = None
+) -> list[bool]:
+    """Generate a typed python client for each manifest entry within one process, or a pool of processes
+
+    Entries for the same application.json, e.g. in different modes or to different outputs, share a single load of it.
+
+    :param entries: The clients to generate, e.g. from `load_manifest`
+    :param int jobs: The number of worker processes to generate clients with, 1 generates in this process
+    :param reports: If provided, a report with metrics for generating each client is appended to it, in the order of
+        entries
+    :return: Whether each client was written, in the order of entries
+    """
+    # Entries can only share a load if the app spec is processed the same way for each
+    groups: dict[tuple[Path, bool, MethodFilter | None], list[int]] = {}
+    for idx, entry in enumerate(entries):
+        groups.setdefault((entry.app_spec, entry.preserve_names, entry.method_filter), []).append(idx)
+    batches = [[entries[idx] for idx in indexes] for indexes in groups.values()]
+    generate_batch = functools.partial(_generate_manifest_clients, report=reports is not None)
+    if jobs <= 1 or len(batches) <= 1:
+        results = [generate_batch(batch) for batch in batches]
+    else:
+        # Each worker generates a batch of clients, so it only loads the generator and its dependencies once
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(logging.getLogger().level,)
+        ) as executor:
+            results = list(executor.map(generate_batch, batches, chunksize=max(1, len(batches) // (jobs * 4))))
+
+    entry_results = {
+        idx: result
+        for indexes, batch_results in zip(groups.values(), results, strict=True)
+        for idx, result in zip(indexes, batch_results, strict=True)
+    }
+    written = [entry_results[idx][0] for idx in range(len(entries))]
+    if reports is not None:
+        reports.extend(report for idx in range(len(entries)) if (report := entry_results[idx][1]))
+    _log_summary(written)
+    return written
+
+
+def _generate_manifest_clients(
+    entries: Sequence[ManifestEntry], *, report: bool
+) -> list[tuple[bool, ClientReport | None]]:
+    """Generate the clients of entries that share an application.json, loading it once"""
+    first = entries[0]
+    measurements = Measurements()
+    context = _load_context(
+        first.app_spec,
+        measurements,
+        preserve_names=first.preserve_names,
+        mode=first.mode,
+        low_memory=False,
+        method_filter=first.method_filter,
+    )
+    results: list[tuple[bool, ClientReport | None]] = []
+    for entry in entries:
+        entry.output.parent.mkdir(parents=True, exist_ok=True)
+        reports: list[ClientReport] = []
+        written = _write_client(
+            context.with_mode(entry.mode), entry.output, measurements, entry.app_spec, reports if report else None
+        )
+        results.append((written, reports[0] if reports else None))
+    return results
+
+
+def _init_worker(log_level: int) -> None:
+    logging.basicConfig(level=log_level, format="%(message)s")
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path, unless path already has identical content.
+
+    The content is written to a temporary file which then replaces path, so readers never see a partial file.
+    Leaving identical files untouched preserves their modified time for downstream caches.
+
+    :return: True if path was written, False if it was unchanged
+    """
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        temp_path.write_text(content, encoding="utf-8")
+        if path.exists():
+            shutil.copymode(path, temp_path)
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_chunks_if_changed(path: Path, chunks: Iterable[str]) -> bool:
+    """Write chunks of content to path as they are produced, unless path already has identical content.
+
+    Like `write_if_changed`, but the content is never held in memory all at once.
+
+    :return: True if path was written, False if it was unchanged
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as temp_file:
+            temp_file.writelines(chunks)
+        if path.exists():
+            if filecmp.cmp(path, temp_path, shallow=False):
+                temp_path.unlink()
+                return False
+            shutil.copymode(path, temp_path)
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def get_peak_memory_usage() -> int | None:
+    """Get the peak resident set size of this process in bytes, or None if it isn't available on this platform"""
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # e.g. Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and kilobytes on Linux and other platforms
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _load_context(  # noqa: PLR0913
+    input_path: Path,
+    measurements: Measurements,
+    *,
+    preserve_names: bool,
+    mode: str,
+    low_memory: bool,
+    method_filter: MethodFilter | None,
+) -> GeneratorContext:
+    with measurements.phase("load"):
+        app_spec = load_from_json(input_path)
+    with measurements.phase("context"):
+        return GeneratorContext(
+            app_spec, preserve_names=preserve_names, mode=mode, low_memory=low_memory, method_filter=method_filter
+        )
+
+
+def _write_client(
+    context: GeneratorContext,
+    output_path: Path,
+    measurements: Measurements,
+    input_path: Path,
+    reports: list[ClientReport] | None,
+) -> bool:
+    output = None
+    if context.low_memory:
+        with measurements.phase("render"):
+            written = write_chunks_if_changed(
+                output_path, iter_converted_parts(generate(context), RenderContext(indent_inc="    "))
+            )
+    else:
+        with measurements.phase("render"):
+            output = render(generate(context))
+        with measurements.phase("write"):
+            written = write_if_changed(output_path, output)
+    if reports is not None:
+        report = new_report(input_path, output_path, context.mode)
+        report.written = written
+        report.output_bytes = output_path.stat().st_size if output is None else len(output.encode("utf-8"))
+        report.add_context_metrics(context)
+        measurements.take(report)
+        reports.append(report)
+    if written:
+        logger.info(f"Output typed client for {context.app_spec.name} to {output_path}")
+    else:
+        logger.info(f"Typed client for {context.app_spec.name} in {output_path} is unchanged")
+    return written
+
+
+def _log_summary(written: list[bool]) -> None:
+    if len(written) > 1:
+        logger.info(f"Generated {len(written)} typed clients: {sum(written)} written, {written.count(False)} unchanged")
 
 
 def render(parts: DocumentParts) -> str:
@@ -0,0 +1,18 @@
+# mypy: disable-error-code="no-untyped-call"
+import algokit_utils
+import pytest
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+
+@pytest.fixture
+def algorand() -> algokit_utils.AlgorandClient:
+    """An AlgorandClient whose algod can't be reached, with suggested params cached so transactions can be built"""
+    algorand = algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("a" * 64, "http://localhost:1"))
+    suggested_params = SuggestedParams(fee=1000, first=1, last=1001, gh="A" * 43 + "=", gen="test", flat_fee=True)
+    return algorand.set_suggested_params_cache(suggested_params, until=float("inf"))
+
+
+@pytest.fixture
+def sender(algorand: algokit_utils.AlgorandClient) -> str:
+    return algorand.account.random().address
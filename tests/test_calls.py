@@ -0,0 +1,117 @@
+# mypy: disable-error-code="no-untyped-call"
+import dataclasses
+import importlib
+import typing
+
+import algokit_utils
+import algosdk
+import pytest
+from algosdk.transaction import OnComplete
+
+client_module = importlib.import_module("examples.smart_contracts.artifacts.arc56_test.arc56_test_arc56_client")
+APP_ID = 1234
+FOO_SIGNATURE = "foo(((uint64,uint64),(uint64,uint64)))(uint64,uint64)"
+INPUTS = client_module.Inputs(add=client_module.InputsAdd(a=1, b=2), subtract=client_module.InputsSubtract(a=5, b=3))
+
+
+def test_params_match_the_app_client_for_struct_args_and_opt_ins(
+    algorand: algokit_utils.AlgorandClient, sender: str
+) -> None:
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    struct_baseline_params = algokit_utils.AppClientMethodCallParams(
+        method=FOO_SIGNATURE, args=[typing.cast(typing.Any, {"add": {"a": 1, "b": 2}, "subtract": {"a": 5, "b": 3}})]
+    )
+    struct_params = client.params.foo(args=client_module.FooArgs(inputs=INPUTS))
+    struct_baseline = client.app_client.params.call(struct_baseline_params)
+    struct_transaction = client.create_transaction.foo(args=client_module.FooArgs(inputs=INPUTS)).transactions[0]
+    struct_baseline_transaction = client.app_client.create_transaction.call(struct_baseline_params).transactions[0]
+    opt_in_params = client.params.opt_in.opt_in_to_application()
+    opt_in_baseline = client.app_client.params.opt_in(
+        algokit_utils.AppClientMethodCallParams(method="optInToApplication()void")
+    )
+
+    # the app client converts structs given as dicts to lists, which are encoded the same as tuples
+    assert dataclasses.replace(struct_params, args=None) == dataclasses.replace(struct_baseline, args=None)
+    assert struct_params.args == [((1, 2), (5, 3))]
+    assert struct_transaction.dictify() == struct_baseline_transaction.dictify()
+    assert opt_in_params == opt_in_baseline
+    assert opt_in_params.on_complete == OnComplete.OptInOC
+
+
+def test_composer_adds_copies_of_queued_transactions(algorand: algokit_utils.AlgorandClient, sender: str) -> None:
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    payments = [
+        algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(sender=sender, receiver=sender, amount=algokit_utils.AlgoAmount(micro_algo=idx))
+        )
+        for idx in range(2)
+    ]
+    composer = client.new_group()
+    for payment in payments:
+        composer.add_transaction(payment)
+
+    built = composer.composer().build()
+
+    # the composer assigns a group to its own copies, so the queued transactions can be sent again in other groups
+    assert all(transaction.txn.group for transaction in built.transactions)
+    assert [payment.group for payment in payments] == [None, None]
+
+
+def test_repeated_calls_use_the_parsed_method(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    client.create_transaction.foo(args=client_module.FooArgs(inputs=INPUTS))
+
+    def fail(*_: object) -> typing.NoReturn:
+        raise AssertionError("the method was parsed again")
+
+    monkeypatch.setattr(algosdk.abi.Method, "from_signature", fail)
+    monkeypatch.setattr(algokit_utils.Arc56Contract, "get_arc56_method", fail)
+    transactions = [client.create_transaction.foo(args=client_module.FooArgs(inputs=INPUTS)) for _ in range(2)]
+
+    assert [len(built.transactions) for built in transactions] == [1, 1]
+    assert transactions[0].method_calls[0].get_signature() == FOO_SIGNATURE
+
+
+@dataclasses.dataclass(frozen=True)
+class _SendResult:
+    abi_return: object = None
+
+
+def test_prepared_calls_reuse_their_params_and_apply_send_overrides(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    prepared = client.prepare.foo(params=algokit_utils.CommonAppCallParams(note=b"prepared"))
+    other_inputs = client_module.Inputs(
+        add=client_module.InputsAdd(a=3, b=4), subtract=client_module.InputsSubtract(a=9, b=1)
+    )
+    sends: list[tuple[algokit_utils.AppCallMethodCallParams, algokit_utils.SendParams | None]] = []
+
+    def fail(*_: object, **__: object) -> typing.NoReturn:
+        raise AssertionError("the prepared params were resolved again")
+
+    def send(
+        params: algokit_utils.AppCallMethodCallParams, send_params: algokit_utils.SendParams | None = None
+    ) -> _SendResult:
+        sends.append((params, send_params))
+        return _SendResult()
+
+    monkeypatch.setattr(algosdk.abi.Method, "from_signature", fail)
+    monkeypatch.setattr(algokit_utils.Arc56Contract, "get_arc56_method", fail)
+    monkeypatch.setattr(client.app_client.params, "call", fail)
+    monkeypatch.setattr(client.app_client.params.bare, "call", fail)
+    monkeypatch.setattr(algorand.send, "app_call_method_call", send)
+    send_params = algokit_utils.SendParams(max_rounds_to_wait=3, populate_app_call_resources=False)
+    prepared.send(args=(INPUTS,))
+    prepared.send(args=client_module.FooArgs(inputs=other_inputs), send_params=send_params)
+
+    (first, first_send_params), (second, second_send_params) = sends
+    assert first.method is second.method is client_module._ABI_METHODS[FOO_SIGNATURE].method  # noqa: SLF001
+    assert (first.sender, first.note, first.app_id) == (sender, b"prepared", APP_ID)
+    assert dataclasses.replace(first, args=None) == dataclasses.replace(second, args=None)
+    assert first.args == [((1, 2), (5, 3))]
+    assert second.args == [((3, 4), (9, 1))]
+    assert first_send_params is None
+    assert second_send_params is send_params
@@ -0,0 +1,80 @@
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from algokit_client_generator import server
+
+SRC_PATH = pathlib.Path(__file__).parent.parent / "src"
+# Generous enough for slow CI runners, while still catching eager imports of algokit_utils / algosdk
+CLI_IMPORT_BUDGET_US = 300_000
+HEAVY_MODULES = ("algokit_utils", "algosdk")
+
+
+def _get_import_times(*args: str) -> dict[str, int]:
+    """Run python with -X importtime, returning the cumulative import time in microseconds of each module"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_PATH), os.environ.get("PYTHONPATH", "")])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, env=env, check=True
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = (part.strip() for part in line.split("|"))
+        if cumulative.isdigit():
+            import_times[module] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import algokit_client_generator.cli"),
+        ("-m", "algokit_client_generator", "--help"),
+    ],
+)
+def test_cli_startup_is_within_import_budget(args: tuple[str, ...]) -> None:
+    import_times = _get_import_times(*args)
+
+    heavy_imports = [module for module in import_times if module.split(".")[0] in HEAVY_MODULES]
+    assert not heavy_imports, f"CLI startup should not import {', '.join(HEAVY_MODULES)}"
+    assert import_times["algokit_client_generator.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_connect_exits_with_error_when_generation_fails(tmp_path: pathlib.Path) -> None:
+    app_spec = tmp_path / "application.json"
+    app_spec.write_text("not json")
+    # Unix socket paths are limited to ~100 characters, which tmp_path may exceed
+    socket_path = pathlib.Path(tempfile.mkdtemp()) / "algokitgen.sock"
+    threading.Thread(target=server.serve_socket, args=(socket_path,), daemon=True).start()
+    while not socket_path.exists():
+        time.sleep(0.01)
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_PATH), os.environ.get("PYTHONPATH", "")])}
+    args = ["-a", str(app_spec), "-o", str(tmp_path / "client.py"), "--connect", str(socket_path)]
+    result = subprocess.run(
+        [sys.executable, "-m", "algokit_client_generator", *args], capture_output=True, text=True, env=env, check=False
+    )
+
+    assert result.returncode == 1
+    assert "Failed to generate client" in result.stderr
+
+
+def test_jobs_requires_manifest(tmp_path: pathlib.Path) -> None:
+    app_spec = SRC_PATH.parent / "examples" / "smart_contracts" / "artifacts" / "hello_world" / "HelloWorld.arc32.json"
+    output = tmp_path / "client.py"
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_PATH), os.environ.get("PYTHONPATH", "")])}
+    args = ["-a", str(app_spec), "-o", str(output), "--jobs", "4"]
+    result = subprocess.run(
+        [sys.executable, "-m", "algokit_client_generator", *args], capture_output=True, text=True, env=env, check=False
+    )
+
+    assert "The --jobs option can only be used with the --manifest option" in result.stdout + result.stderr
+    assert not output.exists()
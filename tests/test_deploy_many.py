@@ -0,0 +1,108 @@
+import concurrent.futures
+import importlib
+import threading
+import time
+import typing
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+
+client_module = importlib.import_module("examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client")
+
+
+class _FakeAppFactory:
+    """Stands in for the algokit_utils factory, deploying each app under the id in its name"""
+
+    def __init__(self, algorand: algokit_utils.AlgorandClient, fail: set[str] | None = None) -> None:
+        self.algorand = algorand
+        self.app_name = "HelloWorld"
+        self.fail = fail or set()
+        self.lookups: list[algokit_utils.ApplicationLookup] = []
+        self.lock = threading.Lock()
+
+    def deploy(self, **kwargs: typing.Any) -> tuple[algokit_utils.AppClient, typing.Any]:
+        app_name = kwargs["app_name"]
+        with self.lock:
+            self.lookups.append(kwargs["existing_deployments"])
+        # later apps finish first, so results complete out of order
+        time.sleep(0.01 / int(app_name))
+        if app_name in self.fail:
+            raise RuntimeError(f"failed to deploy {app_name}")
+        app_client = algokit_utils.AppClient(
+            algokit_utils.AppClientParams(
+                algorand=self.algorand, app_spec=client_module.APP_SPEC, app_id=int(app_name), app_name=app_name
+            )
+        )
+        return app_client, SimpleNamespace(app=None)
+
+
+def _factory(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch, fail: set[str] | None = None
+) -> tuple[typing.Any, _FakeAppFactory, list[str]]:
+    lookups: list[str] = []
+
+    def get_creator_apps_by_name(*, creator_address: str) -> algokit_utils.ApplicationLookup:
+        lookups.append(creator_address)
+        return algokit_utils.ApplicationLookup(creator_address)
+
+    monkeypatch.setattr(algorand.app_deployer, "get_creator_apps_by_name", get_creator_apps_by_name)
+    factory = client_module.HelloWorldFactory(algorand, default_sender=sender)
+    fake = _FakeAppFactory(algorand, fail)
+    factory.app_factory = fake
+    return factory, fake, lookups
+
+
+def test_deploy_many_returns_clients_in_order_with_one_lookup_per_creator(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    factory, fake, lookups = _factory(algorand, sender, monkeypatch)
+
+    results = factory.deploy_many([{"app_name": str(idx)} for idx in range(1, 9)], max_concurrency=4)
+
+    assert [client.app_id for client, _ in results] == list(range(1, 9))
+    assert lookups == [sender]
+    # each deploy gets its own copy of the lookup
+    assert len({id(lookup) for lookup in fake.lookups}) == 8
+
+
+def test_deploy_many_rejects_apps_deployed_more_than_once(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    factory, fake, lookups = _factory(algorand, sender, monkeypatch)
+
+    with pytest.raises(ValueError, match="App 1 is deployed more than once"):
+        factory.deploy_many([{"app_name": "1"}, {"app_name": "2"}, {"app_name": "1"}])
+    assert (lookups, fake.lookups) == ([], [])
+
+
+def test_deploy_many_reports_the_outcome_of_each_deploy(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    factory, _, _ = _factory(algorand, sender, monkeypatch, fail={"2"})
+    # each app is compiled differently, so they are all deployed at once
+    deployments = [
+        {"app_name": str(idx), "compilation_params": {"deploy_time_params": {"N": idx}}} for idx in range(1, 4)
+    ]
+
+    with pytest.raises(client_module.HelloWorldDeployManyError) as exc_info:
+        factory.deploy_many(deployments, max_concurrency=3)
+
+    assert isinstance(exc_info.value.outcomes[1], RuntimeError)
+    assert [client.app_id for client, _ in exc_info.value.deployed.values()] == [1, 3]
+
+
+def test_deploy_many_cancels_the_rest_when_the_first_deploy_fails(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    factory, fake, _ = _factory(algorand, sender, monkeypatch, fail={"1"})
+
+    with pytest.raises(client_module.HelloWorldDeployManyError) as exc_info:
+        factory.deploy_many([{"app_name": str(idx)} for idx in range(1, 4)])
+
+    assert [type(outcome) for outcome in exc_info.value.outcomes] == [
+        RuntimeError,
+        concurrent.futures.CancelledError,
+        concurrent.futures.CancelledError,
+    ]
+    assert len(fake.lookups) == 1
@@ -0,0 +1,90 @@
+# mypy: disable-error-code="no-untyped-call"
+import base64
+import importlib.util
+import json
+import pathlib
+import types
+
+from algosdk import abi, encoding
+
+from algokit_client_generator.writer import generate_client
+
+STRUCTS_APP_SPEC = (
+    pathlib.Path(__file__).parent.parent
+    / "examples"
+    / "smart_contracts"
+    / "artifacts"
+    / "structs"
+    / "Structs.arc56.json"
+)
+ADDRESS = encoding.encode_address(bytes(range(32)))
+
+
+def _generate_client_with_events(tmp_path: pathlib.Path) -> types.ModuleType:
+    raw_spec = json.loads(STRUCTS_APP_SPEC.read_text())
+    raw_spec["events"] = [
+        {
+            "name": "Transferred",
+            "args": [
+                {"type": "address", "name": "from"},
+                {"type": "uint64", "name": "amount"},
+                {"type": "string", "name": "memo"},
+                {"type": "byte[]", "name": "data"},
+                {"type": "byte[4]", "name": "tag"},
+            ],
+        }
+    ]
+    # events emitted by methods are included once, and use the generic decoder for types that can't be unpacked
+    raw_spec["methods"][0]["events"] = [
+        {"name": "Updated", "args": [{"type": "(string,string)", "struct": "Vector"}, {"type": "bool"}]},
+        raw_spec["events"][0],
+    ]
+    app_spec_path = tmp_path / "Events.arc56.json"
+    app_spec_path.write_text(json.dumps(raw_spec))
+    output_path = tmp_path / "events_client.py"
+    generate_client(app_spec_path, output_path)
+
+    module_spec = importlib.util.spec_from_file_location("events_client", output_path)
+    assert module_spec
+    assert module_spec.loader
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+def _log(signature: str, values: list[object]) -> bytes:
+    abi_type = abi.ABIType.from_string(signature[signature.index("(") :])
+    selector: bytes = encoding.checksum(signature.encode())[:4]
+    return selector + abi_type.encode(values)
+
+
+def test_decode_events(tmp_path: pathlib.Path) -> None:
+    client = _generate_client_with_events(tmp_path)
+    transferred = _log("Transferred(address,uint64,string,byte[],byte[4])", [ADDRESS, 5, "hi", b"\x01\x02", b"abcd"])
+    updated = _log("Updated((string,string),bool)", [["x", "y"], True])
+
+    assert len(client.EVENT_DECODERS) == 2
+    events = client.decode_events([transferred, b"not an event", base64.b64encode(updated).decode()])
+
+    assert events == [
+        client.TransferredEvent(from_=ADDRESS, amount=5, memo="hi", data=b"\x01\x02", tag=b"abcd"),
+        client.UpdatedEvent(arg0=client.Vector(x="x", y="y"), arg1=True),
+    ]
+
+
+def test_decode_transaction_events_by_app(tmp_path: pathlib.Path) -> None:
+    client = _generate_client_with_events(tmp_path)
+    log = base64.b64encode(_log("Updated((string,string),bool)", [["x", "y"], False])).decode()
+    transactions = [
+        {
+            "logs": [log],
+            "application-transaction": {"application-id": 1},
+            "inner-txns": [{"logs": [log, log], "application-transaction": {"application-id": 2}}],
+        },
+        {"tx-type": "pay"},
+        {"logs": [log], "application-transaction": {"application-id": 0}, "created-application-index": 3},
+    ]
+
+    assert len(client.decode_transaction_events(transactions)) == 4
+    assert len(client.decode_transaction_events(transactions, app_id=2)) == 2
+    assert len(client.decode_transaction_events(transactions, app_id=3)) == 1
@@ -0,0 +1,67 @@
+import json
+import pathlib
+
+import algokit_utils
+import pytest
+
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.filters import MethodFilter
+
+STRUCTS_APP_SPEC = (
+    pathlib.Path(__file__).parent.parent
+    / "examples"
+    / "smart_contracts"
+    / "artifacts"
+    / "structs"
+    / "Structs.arc56.json"
+)
+
+
+def _load_app_spec_without_state() -> algokit_utils.Arc56Contract:
+    raw_spec = json.loads(STRUCTS_APP_SPEC.read_text())
+    # state keys and maps reference every struct, so remove them to leave structs that are only used by methods
+    raw_spec["state"]["keys"] = {"global": {}, "local": {}, "box": {}}
+    raw_spec["state"]["maps"] = {"global": {}, "local": {}, "box": {}}
+    hello = next(method for method in raw_spec["methods"] if method["name"] == "hello")
+    raw_spec["methods"].append({**hello, "args": [{"type": "uint64", "name": "count"}]})  # overload hello
+    return algokit_utils.Arc56Contract.from_dict(raw_spec)
+
+
+@pytest.mark.parametrize(
+    ("method_filter", "expected_methods"),
+    [
+        (MethodFilter(include=("hello",)), ["hello", "hello"]),
+        (MethodFilter(include=("hello(uint64)string",)), ["hello"]),
+        (MethodFilter(include=("give_me_*",), exclude=("*name_variations",)), ["give_me_root_struct"]),
+        (MethodFilter(on_complete=("opt_in",)), ["opt_in"]),
+        (
+            MethodFilter(exclude=("*(string)*",)),
+            ["give_me_root_struct", "give_me_struct_with_name_variations", "opt_in", "hello"],
+        ),
+    ],
+)
+def test_method_filter_selects_methods(method_filter: MethodFilter, expected_methods: list[str]) -> None:
+    context = GeneratorContext(_load_app_spec_without_state(), method_filter=method_filter)
+
+    assert [method.name for method in context.app_spec.methods] == expected_methods
+
+
+def test_method_filter_prunes_structs_and_keeps_names() -> None:
+    unfiltered = GeneratorContext(_load_app_spec_without_state())
+    context = GeneratorContext(
+        _load_app_spec_without_state(),
+        method_filter=MethodFilter(include=("hello(uint64)string", "give_me_root_struct")),
+    )
+
+    # RootStruct and the structs it is composed of are kept, the struct only returned by an excluded method isn't
+    assert set(context.app_spec.structs) == {"RootStruct", "NestedStruct", "Vector"}
+    assert set(unfiltered.app_spec.structs) - set(context.app_spec.structs) == {"Struct_WithNameVariations"}
+    # the remaining hello overload keeps the name it has in the unfiltered client
+    method_names = {method.abi.client_method_name for method in context.methods.all_abi_methods if method.abi}
+    assert method_names < {method.abi.client_method_name for method in unfiltered.methods.all_abi_methods if method.abi}
+    assert "hello_uint64_string" in method_names
+
+
+def test_method_filter_rejects_unknown_on_complete_action() -> None:
+    with pytest.raises(ValueError, match="on_complete actions must be one of"):
+        MethodFilter(on_complete=("clear_state",))
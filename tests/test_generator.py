@@ -1,9 +1,24 @@
+import importlib
+import json
 import pathlib
+import sys
 from itertools import chain, product
+from types import SimpleNamespace
 
 import pytest
+from algokit_utils import Arc56Contract
 
-from algokit_client_generator import generate_client
+from algokit_client_generator import (
+    generate_client,
+    generate_client_modes,
+    generate_client_package,
+    generate_clients,
+    generate_manifest_clients,
+)
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.manifest import ManifestEntry, load_manifest
+from algokit_client_generator.report import ClientReport
+from algokit_client_generator.spec import load_from_json
 from algokit_client_generator.utils import to_pascal_case, to_snake_case
 from scripts._helpers import enable_mypy
 
@@ -51,3 +66,303 @@ def test_generate_clients(app: str, extension: str) -> None:
     generate_client(app_spec, generated_minimal_client_path, mode="minimal")
     enable_mypy(generated_minimal_client_path)
     assert generated_minimal_client_path.read_text() == approved_minimal_client_path.read_text()
+
+
+@pytest.mark.parametrize(("app", "extension"), [("hello_world", "arc32"), ("structs", "arc56"), ("reti", "arc56")])
+def test_generate_client_modes(tmp_path: pathlib.Path, app: str, extension: str) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    app_path = artifacts / app
+    output_paths = {"minimal": tmp_path / "client_minimal.py", "full": tmp_path / "client.py"}
+
+    written = generate_client_modes(app_path / f"{to_pascal_case(app)}.{extension}.json", output_paths)
+
+    assert written == {"minimal": True, "full": True}
+    enable_mypy(output_paths["full"])
+    assert output_paths["full"].read_text() == (app_path / f"{to_snake_case(app)}_{extension}_client.py").read_text()
+    enable_mypy(output_paths["minimal"])
+    assert (
+        output_paths["minimal"].read_text()
+        == (app_path / f"{to_snake_case(app)}_{extension}_client_minimal.py").read_text()
+    )
+
+
+def test_generate_clients_with_shared_structs(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    clients = []
+    for extension in ("arc32", "arc56"):
+        app_path = tmp_path / f"shared_{extension}"
+        app_path.mkdir()
+        app_spec = app_path / "application.json"
+        app_spec.write_text((artifacts / "state" / f"State.{extension}.json").read_text())
+        clients.append((app_spec, app_path / "client.py"))
+
+    generate_clients(clients, shared_structs_path=tmp_path / "structs.py", shared_structs_module="structs")
+
+    shared_structs = (tmp_path / "structs.py").read_text()
+    assert "class Input:" in shared_structs
+    assert "class Output:" in shared_structs
+    for _, client_path in clients:
+        client = client_path.read_text()
+        assert "from structs import Input, Output" in client
+        assert "class Input:" not in client
+        assert "class Output:" not in client
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    structs_module = importlib.import_module("structs")
+    client_module = importlib.import_module("shared_arc56.client")
+    assert client_module.Input is structs_module.Input
+
+
+def test_generate_clients_shares_structs_nesting_renamed_structs(tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    # the ABI name of the nested struct differs from the name of its class, VectorPoint
+    app_spec_json = (artifacts / "structs" / "Structs.arc56.json").read_text().replace('"Vector"', '"vector_point"')
+    clients = []
+    for name in ("first", "second"):
+        app_path = tmp_path / name
+        app_path.mkdir()
+        app_spec = app_path / "application.json"
+        app_spec.write_text(app_spec_json)
+        clients.append((app_spec, app_path / "client.py"))
+
+    generate_clients(clients, shared_structs_path=tmp_path / "structs.py", shared_structs_module="structs")
+
+    shared_structs = (tmp_path / "structs.py").read_text()
+    for class_name in ("VectorPoint", "NestedStruct", "RootStruct"):
+        assert f"class {class_name}:" in shared_structs
+        for _, client_path in clients:
+            assert f"class {class_name}:" not in client_path.read_text()
+
+
+def test_generate_client_skips_unchanged_output(tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    app_spec = artifacts / "minimal" / "Minimal.arc32.json"
+    output = tmp_path / "client.py"
+
+    assert generate_client(app_spec, output)
+    first_write = output.stat().st_mtime_ns
+    assert not generate_client(app_spec, output)
+    assert output.stat().st_mtime_ns == first_write
+    assert generate_client(app_spec, output, mode="minimal")
+    assert [path.name for path in tmp_path.iterdir()] == ["client.py"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_manifest_clients(tmp_path: pathlib.Path, jobs: int) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "clients": [
+                    {"app_spec": str(artifacts / "hello_world" / "HelloWorld.arc32.json"), "output": "hello.py"},
+                    {
+                        "app_spec": str(artifacts / "structs" / "Structs.arc56.json"),
+                        "output": "nested/structs.py",
+                        "mode": "minimal",
+                    },
+                ]
+            }
+        )
+    )
+
+    reports: list[ClientReport] = []
+    written = generate_manifest_clients(load_manifest(manifest), jobs=jobs, reports=reports)
+
+    assert written == [True, True]
+    assert [(report.output, report.mode) for report in reports] == [
+        (str(tmp_path / "hello.py"), "full"),
+        (str(tmp_path / "nested" / "structs.py"), "minimal"),
+    ]
+    enable_mypy(tmp_path / "hello.py")
+    assert (tmp_path / "hello.py").read_text() == (
+        artifacts / "hello_world" / "hello_world_arc32_client.py"
+    ).read_text()
+    enable_mypy(tmp_path / "nested" / "structs.py")
+    assert (tmp_path / "nested" / "structs.py").read_text() == (
+        artifacts / "structs" / "structs_arc56_client_minimal.py"
+    ).read_text()
+
+
+def test_generate_manifest_clients_load_each_app_spec_once(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    hello_world = artifacts / "hello_world" / "HelloWorld.arc32.json"
+    structs = artifacts / "structs" / "Structs.arc56.json"
+    entries = [
+        ManifestEntry(app_spec=hello_world, output=tmp_path / "hello.py"),
+        ManifestEntry(app_spec=structs, output=tmp_path / "structs.py"),
+        ManifestEntry(app_spec=hello_world, output=tmp_path / "hello_minimal.py", mode="minimal"),
+        ManifestEntry(app_spec=hello_world, output=tmp_path / "other" / "hello.py"),
+    ]
+    loaded: list[pathlib.Path] = []
+
+    def load(path: pathlib.Path) -> Arc56Contract:
+        loaded.append(path)
+        return load_from_json(path)
+
+    monkeypatch.setattr("algokit_client_generator.writer.load_from_json", load)
+
+    reports: list[ClientReport] = []
+    written = generate_manifest_clients(entries, reports=reports)
+
+    assert loaded == [hello_world, structs]
+    assert written == [True, True, True, True]
+    assert [report.output for report in reports] == [str(entry.output) for entry in entries]
+    assert (tmp_path / "other" / "hello.py").read_text() == (tmp_path / "hello.py").read_text()
+
+
+def test_generate_client_low_memory(tmp_path: pathlib.Path) -> None:
+    app_path = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts" / "nfd"
+    output_paths = {"full": tmp_path / "client.py", "minimal": tmp_path / "client_minimal.py"}
+
+    assert generate_client_modes(app_path / "Nfd.arc56.json", output_paths, low_memory=True) == {
+        "full": True,
+        "minimal": True,
+    }
+    assert generate_client_modes(app_path / "Nfd.arc56.json", output_paths, low_memory=True) == {
+        "full": False,
+        "minimal": False,
+    }
+    # no temporary files are left behind
+    assert set(tmp_path.iterdir()) == set(output_paths.values())
+    enable_mypy(output_paths["full"])
+    assert output_paths["full"].read_text() == (app_path / "nfd_arc56_client.py").read_text()
+    enable_mypy(output_paths["minimal"])
+    assert output_paths["minimal"].read_text() == (app_path / "nfd_arc56_client_minimal.py").read_text()
+
+
+def test_generate_client_report(tmp_path: pathlib.Path) -> None:
+    app_path = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts" / "state"
+    output_paths = {"full": tmp_path / "client.py", "minimal": tmp_path / "client_minimal.py"}
+    reports: list[ClientReport] = []
+
+    generate_client_modes(app_path / "State.arc56.json", output_paths, reports=reports)
+    generate_client(app_path / "State.arc56.json", output_paths["full"], reports=reports)
+
+    full, minimal, unchanged = reports
+    assert (full.mode, full.written, minimal.mode, minimal.written) == ("full", True, "minimal", True)
+    assert list(full.timings) == ["load", "context", "render", "write"]
+    assert list(minimal.timings) == ["render", "write"]  # the spec was only loaded once
+    assert full.output_bytes == output_paths["full"].stat().st_size
+    assert full.spec_bytes == (app_path / "State.arc56.json").stat().st_size
+    assert full.spec_bytes > full.shrunk_spec_bytes > minimal.shrunk_spec_bytes
+    assert (full.methods, full.structs, full.state_keys, full.maps) == (
+        minimal.methods,
+        minimal.structs,
+        minimal.state_keys,
+        minimal.maps,
+    )
+    assert full.methods > 0
+    assert full.state_keys > 0
+    assert not unchanged.written
+
+
+def test_generate_client_package(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app_spec = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts" / "state"
+    package_path = tmp_path / "state_client"
+
+    assert generate_client_package(app_spec / "State.arc56.json", package_path)
+    assert not generate_client_package(app_spec / "State.arc56.json", package_path)
+    assert {path.name for path in package_path.iterdir()} == {
+        "__init__.py",
+        "spec.py",
+        "helpers.py",
+        "structs.py",
+        "state.py",
+        "composer.py",
+        "client.py",
+        "factory.py",
+    }
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    state = importlib.import_module("state_client.state")
+    assert "StateState" in dir(state)
+    # reading state doesn't load the client, composer or factory
+    assert "state_client.client" not in sys.modules
+    assert "state_client.factory" not in sys.modules
+
+    package = importlib.import_module("state_client")
+    assert package.StateClient is importlib.import_module("state_client.client").StateClient
+    assert "state_client.factory" not in sys.modules
+    assert package.APP_SPEC.name == "State"
+
+    # modules that are no longer generated are removed
+    assert generate_client_package(app_spec / "State.arc56.json", package_path, mode="minimal")
+    assert not (package_path / "factory.py").exists()
+
+
+@pytest.mark.parametrize(("app", "spec_name"), [("arc56_test", "Arc56Test.arc56.json"), ("state", "State.arc32.json")])
+def test_generate_client_package_modules_import_in_isolation(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, app: str, spec_name: str
+) -> None:
+    app_spec = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts" / app / spec_name
+    package_name = f"{app}_isolated_client"
+    generate_client_package(app_spec, tmp_path / package_name)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    for module_path in sorted((tmp_path / package_name).glob("*.py")):
+        for name in [name for name in sys.modules if name.split(".")[0] == package_name]:
+            monkeypatch.delitem(sys.modules, name)
+        module = importlib.import_module(f"{package_name}.{module_path.stem}")
+        assert module.__file__ == str(module_path)
+    # names in docstrings and the embedded app spec aren't imported
+    assert "from .client import" not in (tmp_path / package_name / "helpers.py").read_text()
+
+
+def test_structs_do_not_shadow_generated_symbols() -> None:
+    app_spec = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts" / "state"
+    raw_spec = json.loads((app_spec / "State.arc56.json").read_text())
+    raw_spec["structs"]["ReadonlyCallCache"] = raw_spec["structs"].pop("Input")
+    raw_spec["structs"]["StateFactoryDeployKwargs"] = raw_spec["structs"].pop("Output")
+    for method in raw_spec["methods"]:
+        for arg in [*method["args"], method["returns"]]:
+            if arg.get("struct") in ("Input", "Output"):
+                arg["struct"] = {"Input": "ReadonlyCallCache", "Output": "StateFactoryDeployKwargs"}[arg["struct"]]
+
+    context = GeneratorContext(Arc56Contract.from_dict(raw_spec))
+
+    assert sorted(struct.struct_class_name for struct in context.structs.values()) == [
+        "ReadonlyCallCache1",
+        "StateFactoryDeployKwargs1",
+    ]
+
+
+def test_state_columns_fall_back_to_lists_for_unset_struct_keys() -> None:
+    client = importlib.import_module("examples.smart_contracts.artifacts.reti.reti_arc56_client")
+    columns = (("config.id", ("config", "id"), "Q"), ("config.owner", ("config", "owner"), None))
+
+    to_columns = client._to_columns  # noqa: SLF001
+
+    assert to_columns([{"config": {"id": 1, "owner": "A"}}, {"config": None}], columns) == {
+        "config.id": [1, None],
+        "config.owner": ["A", None],
+    }
+
+
+def test_state_columns_fall_back_to_lists_for_values_that_overflow() -> None:
+    client = importlib.import_module("examples.smart_contracts.artifacts.reti.reti_arc56_client")
+    columns = (("negative", ("negative",), "Q"), ("large", ("large",), "Q"))
+
+    to_columns = client._to_columns  # noqa: SLF001
+
+    assert to_columns([{"negative": 1, "large": 1}, {"negative": -1, "large": 2**64}], columns) == {
+        "negative": [1, -1],
+        "large": [1, 2**64],
+    }
+
+
+def test_state_columns_are_numpy_arrays_of_the_dtype_of_their_typecode(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = importlib.import_module("examples.smart_contracts.artifacts.reti.reti_arc56_client")
+    columns = (("id", ("id",), "Q"), ("enabled", ("enabled",), "B"), ("owner", ("owner",), None))
+    numpy = SimpleNamespace(uint64="uint64", bool_="bool_", frombuffer=lambda column, dtype: (dtype, list(column)))
+    monkeypatch.setitem(sys.modules, "numpy", numpy)
+
+    to_columns = client._to_columns  # noqa: SLF001
+
+    assert to_columns([{"id": 1, "enabled": True, "owner": "A"}], columns) == {
+        "id": ("uint64", [1]),
+        "enabled": ("bool_", [1]),
+        "owner": ["A"],
+    }
@@ -0,0 +1,144 @@
+# mypy: disable-error-code="no-untyped-call"
+import importlib
+from urllib.error import URLError
+
+import algokit_utils
+import pytest
+from algokit_utils.applications.app_deployer import AppDeploymentMetaData, ApplicationReference
+from algosdk import logic
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+client_module = importlib.import_module("examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client")
+
+
+def _app(app_id: int, name: str) -> algokit_utils.ApplicationMetaData:
+    return algokit_utils.ApplicationMetaData(
+        reference=ApplicationReference(app_id=app_id, app_address=logic.get_application_address(app_id)),
+        deploy_metadata=AppDeploymentMetaData(name=name, version="1.0", deletable=None, updatable=None),
+        created_round=1,
+        updated_round=1,
+    )
+
+
+def test_network_cache_looks_up_each_creator_once_per_ttl(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [100.0]
+    lookups: list[str] = []
+
+    def get_creator_apps_by_name(
+        *, creator_address: str, ignore_cache: bool = False
+    ) -> algokit_utils.ApplicationLookup:
+        assert ignore_cache
+        lookups.append(creator_address)
+        return algokit_utils.ApplicationLookup(creator_address, {"HelloWorld": _app(1234, "HelloWorld")})
+
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(algorand.app_deployer, "get_creator_apps_by_name", get_creator_apps_by_name)
+    cache = client_module.NetworkCache(app_lookup_ttl=60)
+    factory = client_module.HelloWorldFactory(algorand, default_sender=sender, cache=cache)
+    other_creator = algorand.account.random().address
+
+    clients = [factory.get_app_client_by_creator_and_name(sender, "HelloWorld") for _ in range(2)]
+    client = client_module.HelloWorldClient.from_creator_and_name(sender, "HelloWorld", algorand, cache=cache)
+    cache.get_creator_apps_by_name(algorand, other_creator)
+    now[0] += 59
+    cache.get_creator_apps_by_name(algorand, sender)
+    now[0] += 1
+    cache.get_creator_apps_by_name(algorand, sender)
+
+    assert [c.app_id for c in (*clients, client)] == [1234, 1234, 1234]
+    assert lookups == [sender, other_creator, sender]
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_network_cache_records_deployed_apps(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        algorand.app_deployer,
+        "get_creator_apps_by_name",
+        lambda *, creator_address, ignore_cache: algokit_utils.ApplicationLookup(creator_address),
+    )
+    cache = client_module.NetworkCache()
+    cache.get_creator_apps_by_name(algorand, sender)
+
+    cache.record_app(algorand, sender, _app(1, "First"))
+    # apps of creators that haven't been looked up are left to their first lookup
+    cache.record_app(algorand, algorand.account.random().address, _app(2, "Uncached"))
+
+    lookup = cache.get_creator_apps_by_name(algorand, sender)
+    cache.record_app(algorand, sender, _app(3, "Second"))
+    lookup.apps.pop("First")
+
+    # each caller gets its own copy of the cached lookup
+    assert lookup.apps == {}
+    assert list(cache.get_creator_apps_by_name(algorand, sender).apps) == ["First", "Second"]
+    cache.clear()
+    assert cache.get_creator_apps_by_name(algorand, sender).apps == {}
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def _count_suggested_params_fetches(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    fetches: list[str] = []
+
+    def suggested_params(algod: AlgodClient) -> SuggestedParams:
+        fetches.append(algod.algod_address)
+        first = len(fetches)
+        return SuggestedParams(fee=1000, first=first, last=first + 1000, gh="A" * 43 + "=", gen="test", flat_fee=True)
+
+    monkeypatch.setattr(AlgodClient, "suggested_params", suggested_params)
+    return fetches
+
+
+def test_network_cache_seeds_suggested_params_once_per_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    fetches = _count_suggested_params_fetches(monkeypatch)
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    # separate AlgorandClients for the same algod, whose sends fail as it can't be reached
+    algorands = [
+        algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("a" * 64, "http://localhost:1")) for _ in range(2)
+    ]
+    sender = algorands[0].account.random()
+    algorands[1].account.set_signer_from_account(sender)
+    cache = client_module.NetworkCache(suggested_params_ttl=3)
+    client = client_module.HelloWorldClient(
+        algorand=algorands[0], app_id=1234, default_sender=sender.address, cache=cache
+    )
+    factory = client_module.HelloWorldFactory(algorands[1], default_sender=sender.address, cache=cache)
+
+    with pytest.raises(URLError):
+        client.send.hello(args=("World",))
+    with pytest.raises(URLError):
+        factory.deploy(existing_deployments=algokit_utils.ApplicationLookup(sender.address))
+    with pytest.raises(URLError):
+        factory.get_app_client_by_id(1234).new_group().hello(args=("World",)).send()
+    now[0] += 3
+    with pytest.raises(URLError):
+        client.prepare.hello().send(args=("World",))
+
+    assert fetches == ["http://localhost:1"] * 2
+    assert [algorand.get_suggested_params().first for algorand in algorands] == [2, 1]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_network_cache_seeds_suggested_params_of_created_transactions(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetches = _count_suggested_params_fetches(monkeypatch)
+    algorands = [
+        algokit_utils.AlgorandClient.from_clients(algod=AlgodClient("a" * 64, "http://localhost:1")) for _ in range(2)
+    ]
+    sender = algorands[0].account.random().address
+    cache = client_module.NetworkCache()
+    client = client_module.HelloWorldClient(algorand=algorands[0], app_id=1234, default_sender=sender, cache=cache)
+    factory = client_module.HelloWorldFactory(algorands[1], default_sender=sender, cache=cache)
+
+    result = client.create_transaction.hello(args=("World",))
+    # the programs are compiled by algod, which can't be reached, after the suggested params are seeded
+    with pytest.raises(URLError):
+        factory.create_transaction.create.bare()
+
+    assert fetches == ["http://localhost:1"]
+    assert result.transactions[0].first_valid_round == 1
+    assert algorands[1].get_suggested_params().first == 1
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,139 @@
+import concurrent.futures
+import importlib
+import threading
+import time
+import typing
+from types import SimpleNamespace
+
+import algokit_utils
+import pytest
+from algosdk.transaction import ApplicationCallTxn, PaymentTxn
+
+client_module = importlib.import_module("examples.smart_contracts.artifacts.hello_world.hello_world_arc32_client")
+APP_ID = 1234
+
+
+class _FakeNode:
+    """Stands in for algod, committing each group unless it has a call with a name to fail"""
+
+    def __init__(self, fail: set[str] | None = None, delays: dict[str, float] | None = None) -> None:
+        self.fail = fail or set()
+        self.delays = delays or {}
+        self.groups: list[list[str]] = []
+        """The names in each group that was sent, in the order they finished"""
+        self.lock = threading.Lock()
+
+    def send(self, composer: algokit_utils.TransactionComposer, _: object = None) -> SimpleNamespace:
+        names = []
+        for transaction in composer.build().transactions:
+            txn = transaction.txn
+            if isinstance(txn, PaymentTxn):
+                names.append(f"pay {txn.amt}")
+            else:
+                assert isinstance(txn, ApplicationCallTxn)
+                # hello's only arg is an ABI string, which is prefixed by its 2 byte length
+                names.append(txn.app_args[1][2:].decode())
+        time.sleep(max((self.delays.get(name, 0) for name in names), default=0))
+        with self.lock:
+            self.groups.append(names)
+        if self.fail & set(names):
+            raise RuntimeError(f"failed to send {names}")
+        returns = [
+            SimpleNamespace(get_arc56_value=lambda *_, name=name: f"Hello, {name}")
+            for name in names
+            if not name.startswith("pay")
+        ]
+        return SimpleNamespace(returns=returns, tx_ids=names)
+
+
+def _queue(
+    algorand: algokit_utils.AlgorandClient,
+    sender: str,
+    monkeypatch: pytest.MonkeyPatch,
+    calls: list[str | int],
+    node: _FakeNode | None = None,
+) -> tuple[typing.Any, _FakeNode]:
+    """Queue a hello call for each name, and a payment of each amount, on a composer that sends to a fake node"""
+    node = node or _FakeNode()
+    monkeypatch.setattr(
+        algokit_utils.TransactionComposer, "send", lambda composer, params=None: node.send(composer, params)
+    )
+    client = client_module.HelloWorldClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    composer = client.new_group()
+    for call in calls:
+        if isinstance(call, str):
+            composer.hello(args=(call,))
+        else:
+            composer.add_transaction(
+                algorand.create_transaction.payment(
+                    algokit_utils.PaymentParams(
+                        sender=sender, receiver=sender, amount=algokit_utils.AlgoAmount(micro_algo=call)
+                    )
+                )
+            )
+    return composer, node
+
+
+def test_send_bulk_packs_calls_into_groups_in_queue_order(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    composer, node = _queue(algorand, sender, monkeypatch, ["a", 1, "b", "c", 2])
+
+    results = composer.send_bulk(max_group_size=2)
+
+    assert node.groups == [["a", "pay 1"], ["b", "c"], ["pay 2"]]
+    assert [group.tx_ids for group in results.groups] == node.groups
+    assert results.returns == ["Hello, a", None, "Hello, b", "Hello, c", None]
+
+
+def test_send_bulk_returns_in_queue_order_when_groups_finish_out_of_order(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    composer, node = _queue(algorand, sender, monkeypatch, ["a", "b", "c"], _FakeNode(delays={"a": 0.05, "b": 0.02}))
+
+    results = composer.send_bulk(max_concurrency=3, max_group_size=1)
+
+    assert node.groups == [["c"], ["b"], ["a"]]
+    assert [group.tx_ids for group in results.groups] == [["a"], ["b"], ["c"]]
+    assert results.returns == ["Hello, a", "Hello, b", "Hello, c"]
+
+
+def test_send_bulk_cancels_the_groups_after_a_failed_group(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    composer, node = _queue(algorand, sender, monkeypatch, ["a", "b", "c", "d", "e"], _FakeNode(fail={"c"}))
+
+    with pytest.raises(client_module.BulkSendError) as error:
+        composer.send_bulk(max_group_size=2)
+
+    committed, failed, cancelled = error.value.outcomes
+    assert node.groups == [["a", "b"], ["c", "d"]]
+    assert committed.tx_ids == ["a", "b"]
+    assert isinstance(failed, RuntimeError)
+    assert isinstance(cancelled, concurrent.futures.CancelledError)
+    assert error.value.returns == {0: "Hello, a", 1: "Hello, b"}
+    assert str(error.value).startswith("1 of 3 groups failed")
+
+
+def test_send_bulk_keeps_the_returns_of_concurrent_groups_that_were_committed(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    composer, node = _queue(algorand, sender, monkeypatch, ["a", "b"], _FakeNode(fail={"a"}, delays={"a": 0.05}))
+
+    with pytest.raises(client_module.BulkSendError) as error:
+        composer.send_bulk(max_concurrency=2, max_group_size=1)
+
+    failed, committed = error.value.outcomes
+    assert isinstance(failed, RuntimeError)
+    assert committed.tx_ids == ["b"]
+    assert error.value.returns == {1: "Hello, b"}
+
+
+def test_send_bulk_requires_a_concurrency_of_at_least_one(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    composer, node = _queue(algorand, sender, monkeypatch, ["a"])
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        composer.send_bulk(max_concurrency=0)
+    assert node.groups == []
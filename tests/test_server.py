@@ -0,0 +1,28 @@
+import json
+import pathlib
+
+from algokit_client_generator.server import serve_lines
+
+
+def test_serve_lines(tmp_path: pathlib.Path) -> None:
+    artifacts = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+    app_spec = artifacts / "hello_world" / "HelloWorld.arc32.json"
+    output = tmp_path / "client.py"
+    requests = [
+        json.dumps({"app_spec": str(app_spec), "output": str(output), "mode": "minimal"}),
+        "",
+        json.dumps({"app_spec": str(tmp_path / "missing.json"), "output": str(output)}),
+        "not json",
+    ]
+    responses: list[str] = []
+
+    serve_lines(requests, responses.append)
+
+    results = [json.loads(response) for response in responses]
+    assert results[0] == {"ok": True, "output": str(output), "written": True}
+    assert output.read_text() == (
+        artifacts / "hello_world" / "hello_world_arc32_client_minimal.py"
+    ).read_text().replace(
+        '# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"', "# mypy: ignore-errors"
+    )
+    assert [result["ok"] for result in results[1:]] == [False, False]
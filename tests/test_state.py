@@ -0,0 +1,129 @@
+# mypy: disable-error-code="no-untyped-call"
+import base64
+import importlib
+import time
+import typing
+
+import algokit_utils
+import algosdk
+import pytest
+
+client_module = importlib.import_module("examples.smart_contracts.artifacts.arc56_test.arc56_test_arc56_client")
+APP_ID = 1234
+PREFIX = b"p"
+
+
+def _box_names(
+    algorand: algokit_utils.AlgorandClient,
+    sender: str,
+    monkeypatch: pytest.MonkeyPatch,
+    respond: typing.Callable[[dict[str, typing.Any]], dict[str, typing.Any]],
+    page_size: int,
+) -> tuple[list[bytes], list[dict[str, typing.Any]]]:
+    requests: list[dict[str, typing.Any]] = []
+
+    def algod_request(method: str, path: str, params: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        assert (method, path) == ("GET", f"/applications/{APP_ID}/boxes")
+        requests.append(dict(params))
+        return respond(params)
+
+    monkeypatch.setattr(algorand.client.algod, "algod_request", algod_request)
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+    return list(client.state.box.box_map._iter_box_names(PREFIX, page_size)), requests  # noqa: SLF001
+
+
+def _boxes(names: list[bytes]) -> list[dict[str, str]]:
+    return [{"name": base64.b64encode(name).decode()} for name in names]
+
+
+NAMES = [PREFIX + bytes([i]) for i in range(4)]
+ENCODED_PREFIX = "b64:" + base64.b64encode(PREFIX).decode()
+
+
+def test_box_names_stop_at_a_full_last_page_of_a_paging_node(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def respond(params: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        # like algod, the next token is omitted from the last page
+        if "next" in params:
+            return {"boxes": _boxes(NAMES[2:])}
+        return {"boxes": _boxes(NAMES[:2]), "next-token": "page-2"}
+
+    names, requests = _box_names(algorand, sender, monkeypatch, respond, page_size=2)
+
+    assert names == NAMES
+    assert requests == [
+        {"max": 2, "prefix": ENCODED_PREFIX},
+        {"max": 2, "prefix": ENCODED_PREFIX, "next": "page-2"},
+    ]
+
+
+def test_box_names_of_a_single_full_page_are_listed_again_with_a_larger_max(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # exactly a page of names, which a paging node returns without a next token
+    names, requests = _box_names(
+        algorand, sender, monkeypatch, lambda params: {"boxes": _boxes(NAMES[:2])}, page_size=2
+    )
+
+    assert names == NAMES[:2]
+    assert requests == [{"max": 2, "prefix": ENCODED_PREFIX}, {"max": 4, "prefix": ENCODED_PREFIX}]
+
+
+def test_box_names_of_a_node_that_does_not_page_are_listed_until_a_page_is_not_full(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # nodes that don't page ignore the prefix, and truncate to max names
+    other_names = [b"other"]
+    names, requests = _box_names(
+        algorand,
+        sender,
+        monkeypatch,
+        lambda params: {"boxes": _boxes((NAMES[:3] + other_names + NAMES[3:])[: params["max"]])},
+        page_size=1,
+    )
+
+    assert names == NAMES
+    assert [request["max"] for request in requests] == [1, 2, 4, 8]
+    assert all(request["prefix"] == ENCODED_PREFIX for request in requests)
+
+
+def test_local_state_many_omits_accounts_that_are_not_opted_in_in_order(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    addresses = [algorand.account.random().address for _ in range(4)]
+    opted_in = {addresses[0]: 1, addresses[2]: 3, addresses[3]: 4}
+    progress: list[tuple[int, int]] = []
+
+    def account_application_info(address: str, app_id: int) -> dict[str, typing.Any]:
+        assert app_id == APP_ID
+        # later accounts are fetched first, so results complete out of order
+        time.sleep(0.01 / (addresses.index(address) + 1))
+        if address not in opted_in:
+            raise algosdk.error.AlgodHTTPError("account application not found", code=404)
+        key_value = {"key": base64.b64encode(b"localKey").decode(), "value": {"type": 2, "uint": opted_in[address]}}
+        return {"app-local-state": {"id": APP_ID, "key-value": [key_value]}}
+
+    monkeypatch.setattr(algorand.client.algod, "account_application_info", account_application_info)
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    states = client.state.local_state_many(
+        [*reversed(addresses), addresses[0]], concurrency=4, progress=lambda *args: progress.append(args)
+    )
+
+    assert list(states) == [addresses[3], addresses[2], addresses[0]]
+    assert [state["localKey"] for state in states.values()] == [4, 3, 1]
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_local_state_many_raises_errors_other_than_not_opted_in(
+    algorand: algokit_utils.AlgorandClient, sender: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def account_application_info(address: str, app_id: int) -> typing.NoReturn:
+        raise algosdk.error.AlgodHTTPError("internal error", code=500)
+
+    monkeypatch.setattr(algorand.client.algod, "account_application_info", account_application_info)
+    client = client_module.Arc56TestClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    with pytest.raises(algosdk.error.AlgodHTTPError, match="internal error"):
+        client.state.local_state_many([sender])
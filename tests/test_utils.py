@@ -0,0 +1,63 @@
+import random
+
+from algokit_client_generator import utils
+
+
+def _get_unique_symbol_by_probing(existing_symbols: set[str], base_name: str) -> str:
+    suffix = 0
+    while True:
+        symbol = f"{base_name}{suffix or ''}"
+        if symbol not in existing_symbols:
+            existing_symbols.add(symbol)
+            return symbol
+        suffix += 1
+
+
+def test_symbol_scope_matches_linear_probing() -> None:
+    rng = random.Random(42)
+    base_names = ["Args", "Args1", "Struct", "Struct2", "get", "get1", "get11", "It's"]
+    reserved = {"Args", "Struct3", "get1"}
+    scope = utils.SymbolScope(reserved)
+    expected_symbols = set(reserved)
+
+    for _ in range(5_000):
+        base_name = rng.choice(base_names)
+        if rng.random() < 0.1:
+            # symbols added outside the allocator must still be respected
+            external = f"{base_name}{rng.randint(0, 50)}"
+            scope.add(external)
+            expected_symbols.add(external)
+            continue
+        expected = _get_unique_symbol_by_probing(expected_symbols, base_name.replace("'", "\\'"))
+        assert utils.get_unique_symbol_by_incrementing(scope, base_name) == expected
+
+    assert set(scope) == expected_symbols
+
+
+def test_symbol_scope_stress() -> None:
+    symbol_count = 50_000
+    allocator = utils.SymbolAllocator(module_symbols={"Composer"}, client_symbols={"clone"})
+
+    module_symbols = [allocator.module.allocate("Composer") for _ in range(symbol_count)]
+    client_symbols = [allocator.client.allocate("clone") for _ in range(symbol_count)]
+
+    assert module_symbols[0] == "Composer1"
+    assert module_symbols[-1] == f"Composer{symbol_count}"
+    assert client_symbols[-1] == f"clone{symbol_count}"
+    assert len(allocator.module) == len(set(module_symbols)) + 1
+    assert "clone" not in allocator.module
+
+
+def test_memoized_identifiers_match_unmemoized() -> None:
+    names = ["hello_world", "HelloWorld", "getHTTPResponse", "It's a name", "__init__", "v2_Struct", "snake_case_2"]
+    conversions = (utils.to_snake_case, utils.to_pascal_case, utils.get_class_name, utils.get_method_name)
+    hits, _ = utils.get_identifier_cache_info()
+
+    for _ in range(2):
+        for name in names:
+            for conversion in conversions:
+                assert conversion(name) == conversion.__wrapped__(name)
+    assert utils.get_class_name("hello", "args") == utils.get_class_name.__wrapped__("hello", "args")
+
+    # every conversion is answered from the cache the second time round
+    assert utils.get_identifier_cache_info()[0] >= hits + len(names) * len(conversions)
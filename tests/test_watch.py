@@ -0,0 +1,118 @@
+import json
+import os
+import pathlib
+import typing
+from collections.abc import Callable, Iterator
+
+import pytest
+from algokit_utils import Arc56Contract
+
+from algokit_client_generator import writer
+from algokit_client_generator.context import GeneratorContext
+from algokit_client_generator.spec import load_from_json
+from algokit_client_generator.watch import get_changed_paths, get_file_states, watch
+
+ARTIFACTS = pathlib.Path(__file__).parent.parent / "examples" / "smart_contracts" / "artifacts"
+
+
+def test_get_changed_paths(tmp_path: pathlib.Path) -> None:
+    unchanged, modified, created = (tmp_path / name for name in ("unchanged.json", "modified.json", "created.json"))
+    unchanged.write_text("{}")
+    modified.write_text("{}")
+    previous = get_file_states([unchanged, modified, created])
+
+    modified.write_text('{"name": "changed"}')
+    os.utime(modified, ns=(previous[modified][0] + 1_000_000, previous[modified][0] + 1_000_000))
+    created.write_text("{}")
+    current = get_file_states([unchanged, modified, created])
+
+    assert created not in previous
+    assert get_changed_paths(previous, current) == [modified, created]
+
+
+def test_watch_debounces_writes(tmp_path: pathlib.Path) -> None:
+    app_spec, output = tmp_path / "application.json", tmp_path / "client.py"
+    app_spec.write_text("{}")
+    regenerated: list[dict[pathlib.Path, pathlib.Path]] = []
+
+    def write(content: str) -> None:
+        app_spec.write_text(content)
+        modified = app_spec.stat().st_mtime_ns + len(content) * 1_000_000
+        os.utime(app_spec, ns=(modified, modified))
+
+    # each sleep of the fake clock runs the next step instead of waiting
+    steps: Iterator[Callable[[], None]] = iter(
+        [
+            lambda: write('{"a": 1}'),  # poll, sees a change
+            lambda: write('{"a": 12}'),  # debounce, still being written
+            lambda: None,  # debounce, settled
+            lambda: None,  # poll, unchanged
+            lambda: write('{"a": 123}'),  # poll, sees a change
+            lambda: None,  # debounce, settled
+        ]
+    )
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        next(steps, _stop)()
+
+    watch(lambda: {app_spec: output}, lambda targets: regenerated.append(dict(targets)), sleep=sleep)
+
+    assert regenerated == [{app_spec: output}] * 3
+    assert sleeps == [0.5, 0.3, 0.3, 0.5, 0.5, 0.3, 0.5]
+
+
+def _stop() -> None:
+    raise KeyboardInterrupt
+
+
+def test_watched_clients_only_regenerate_dependent_clients(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    targets = {}
+    for app, extension in (("state", "arc32"), ("state", "arc56"), ("minimal", "arc32")):
+        app_spec = tmp_path / f"{app}_{extension}" / "application.json"
+        app_spec.parent.mkdir()
+        app_spec.write_text((ARTIFACTS / app / f"{app.title()}.{extension}.json").read_text())
+        targets[app_spec] = app_spec.parent / "client.py"
+    state_arc32, state_arc56, minimal = targets
+    loaded: list[pathlib.Path] = []
+    written: list[pathlib.Path] = []
+    write_client = writer._write_client  # noqa: SLF001
+
+    def load(path: pathlib.Path) -> Arc56Contract:
+        loaded.append(path)
+        return load_from_json(path)
+
+    def write(context: GeneratorContext, path: pathlib.Path, *args: typing.Any) -> bool:
+        written.append(path)
+        return write_client(context, path, *args)
+
+    monkeypatch.setattr("algokit_client_generator.writer.load_from_json", load)
+    monkeypatch.setattr(writer, "_write_client", write)
+    clients = writer.WatchedClients(
+        lambda: targets, shared_structs_path=tmp_path / "structs.py", shared_structs_module="structs"
+    )
+
+    clients.regenerate(targets)
+    assert loaded == [state_arc32, state_arc56, minimal]
+    assert written == [targets[state_arc32], targets[state_arc56], targets[minimal]]
+    assert "from structs import Input, Output" in targets[state_arc32].read_text()
+
+    loaded.clear()
+    written.clear()
+    clients.regenerate({minimal: targets[minimal]})
+    assert loaded == [minimal]
+    assert written == [targets[minimal]]
+
+    # renaming a field of a shared struct in one app means the other app defines its own struct again
+    raw_spec = json.loads(state_arc56.read_text())
+    raw_spec["structs"]["Input"][1]["name"] = "years"
+    state_arc56.write_text(json.dumps(raw_spec))
+    loaded.clear()
+    written.clear()
+    clients.regenerate({state_arc56: targets[state_arc56]})
+    assert loaded == [state_arc56]
+    assert written == [targets[state_arc32], targets[state_arc56]]
+    assert "class Input:" in targets[state_arc32].read_text()